@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+import path_util  # noqa: F401
+import yaml
+
+from hummingbot.client.settings import CONTROLLERS_CONF_DIR_PATH, CONTROLLERS_MODULE
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.parameter_sweep import (
+    BacktestingSweep,
+    ParameterGrid,
+    RandomSearch,
+    load_candles_from_csv,
+    load_candles_from_store,
+    required_candles_configs,
+)
+
+
+def parse_parameter(parameter: str) -> Tuple[str, str]:
+    name, separator, values = parameter.partition("=")
+    if separator == "" or name == "" or values == "":
+        raise argparse.ArgumentTypeError(f"Invalid parameter '{parameter}', expected NAME=VALUES.")
+    return name, values
+
+
+def parse_values(values: str) -> List[Any]:
+    return [yaml.safe_load(value) for value in values.split(",")]
+
+
+def parse_range(values: str) -> Tuple[Any, Any]:
+    low, high = values.split(":")
+    return yaml.safe_load(low), yaml.safe_load(high)
+
+
+def build_parameters(args: argparse.Namespace):
+    if args.grid:
+        return ParameterGrid({name: parse_values(values) for name, values in args.grid})
+    return RandomSearch({name: parse_range(values) if ":" in values else parse_values(values)
+                         for name, values in args.random},
+                        samples=args.samples,
+                        seed=args.seed)
+
+
+async def fetch_trading_rules(connector_names: List[str]) -> Dict[str, Dict]:
+    data_provider = BacktestingDataProvider(connectors={})
+    for connector_name in connector_names:
+        await data_provider.initialize_trading_rules(connector_name)
+    return {connector_name: data_provider.trading_rules[connector_name] for connector_name in connector_names}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest a controller configuration for many parameter sets, in "
+                                                 "parallel, with the candles of a local store or of CSV files.")
+    parser.add_argument("config", type=str,
+                        help=f"The controller configuration file, relative to {CONTROLLERS_CONF_DIR_PATH}.")
+    parser.add_argument("--start", type=int, required=True, help="The start of the backtests (timestamp in seconds).")
+    parser.add_argument("--end", type=int, required=True, help="The end of the backtests (timestamp in seconds).")
+    search = parser.add_mutually_exclusive_group(required=True)
+    search.add_argument("--grid", type=parse_parameter, action="append",
+                        help="A parameter and its values, e.g. stop_loss=0.01,0.02. Can be repeated.")
+    search.add_argument("--random", type=parse_parameter, action="append",
+                        help="A parameter and its values, or its range, e.g. stop_loss=0.01:0.05. Can be repeated.")
+    parser.add_argument("--samples", type=int, default=100, help="The number of parameter sets of a random search.")
+    parser.add_argument("--seed", type=int, default=None, help="The seed of a random search.")
+    parser.add_argument("--resolution", type=str, default="1m", help="The backtesting resolution.")
+    parser.add_argument("--trade-cost", type=float, default=0.0006, help="The cost per trade.")
+    parser.add_argument("--candles-path", type=str, default=None,
+                        help="A folder with the candles CSV files. By default, the candles store of the data folder.")
+    parser.add_argument("--workers", type=int, default=None, help="The number of processes. Default: CPU count.")
+    parser.add_argument("--output", type=str, default="backtesting_sweep.csv",
+                        help="The results file, CSV (written as the backtests complete) or Parquet (.parquet).")
+    args = parser.parse_args()
+
+    controller_config = BacktestingEngineBase.load_controller_config(args.config, CONTROLLERS_CONF_DIR_PATH)
+    parameters = list(build_parameters(args))
+    candles_configs = required_candles_configs(controller_config, parameters, args.resolution, CONTROLLERS_MODULE)
+    candles_store = CandlesStore()
+    candles = {}
+    for candles_config in candles_configs:
+        key = MarketDataProvider._generate_candle_feed_key(candles_config)
+        if args.candles_path is not None:
+            candles[key] = load_candles_from_csv(args.candles_path, candles_config)
+        else:
+            candles_buffer = candles_config.max_records * CandlesBase.interval_to_seconds[candles_config.interval]
+            candles[key] = load_candles_from_store(candles_store, candles_config, args.start - candles_buffer,
+                                                   args.end)
+        if len(candles[key]) == 0:
+            raise SystemExit(f"No candles found for {key}.")
+    connector_names = sorted({run_parameters.get("connector_name", controller_config.get("connector_name"))
+                              for run_parameters in parameters})
+    trading_rules = asyncio.get_event_loop().run_until_complete(fetch_trading_rules(connector_names))
+
+    sweep = BacktestingSweep(controller_config=controller_config,
+                             candles=candles,
+                             trading_rules=trading_rules,
+                             start=args.start,
+                             end=args.end,
+                             backtesting_resolution=args.resolution,
+                             trade_cost=args.trade_cost,
+                             controllers_module=CONTROLLERS_MODULE,
+                             max_workers=args.workers)
+    results = sweep.run(parameters, output_path=args.output)
+    print(results.sort_values("net_pnl_quote", ascending=False).head(10).to_string(index=False))
+    print(f"{len(results)} backtests, results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
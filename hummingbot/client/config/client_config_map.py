@@ -141,6 +141,11 @@ class MQTTBridgeConfigMap(BaseClientModel):
         title = "mqtt_bridge"
 
 
+class MarketDataCollectionStorageEnum(str, ClientConfigEnum):
+    sql = "sql"
+    columnar = "columnar"
+
+
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
         default=False,
@@ -168,10 +173,26 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_collection_storage: MarketDataCollectionStorageEnum = Field(
+        default=MarketDataCollectionStorageEnum.sql,
+        description="Where the market data is recorded: in the trades database (sql), or in compressed columnar files"
+                    " partitioned by exchange, trading pair and day in the data folder (columnar)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Set the market data storage ({'/'.join(list(MarketDataCollectionStorageEnum))}) (Default=sql)"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
+    @validator("market_data_collection_storage", pre=True)
+    def validate_market_data_collection_storage(cls, v: Union[str, MarketDataCollectionStorageEnum]):
+        if isinstance(v, str) and v not in MarketDataCollectionStorageEnum.__members__:
+            raise ValueError(f"The value must be one of {', '.join(list(MarketDataCollectionStorageEnum))}.")
+        return v
+
 
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
@@ -317,6 +338,24 @@ class PaperTradeConfigMap(BaseClientModel):
         ),
     )
 
+    paper_trade_queue_position_simulation: bool = Field(
+        default=False,
+        description=("Fill the paper limit orders according to their position in the queue of their price level,"
+                     "\npartially when the trades and the depth only reach part of them, instead of entirely as soon"
+                     "\nas the price goes through them"),
+    )
+    paper_trade_order_entry_latency: float = Field(
+        default=0.0,
+        ge=0.0,
+        description=("Seconds before the paper orders reach the order book, with queue position simulation"),
+    )
+    paper_trade_cancel_latency: float = Field(
+        default=0.0,
+        ge=0.0,
+        description=("Seconds before the paper orders are removed from the order book once cancelled, with queue"
+                     "\nposition simulation"),
+    )
+
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
         if isinstance(v, str):
@@ -1103,6 +1142,18 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    rate_limits_budget_name: Optional[str] = Field(
+        default=None,
+        description=("Name of the API rate limits budget shared with other bots running on this host."
+                     "\nBots configured with the same budget name (i.e. trading with the same API key) share the "
+                     "\nlimits of each exchange, each of them using the capacity the others leave free."
+                     "\nLeave empty to not share the limits"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the name of the API rate limits budget to share with other bots (leave empty to not share)"
+            ),
+        ),
+    )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
@@ -1,9 +1,9 @@
 import asyncio
 import logging
 from collections import defaultdict
+from collections.abc import Mapping
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
 
 from cachetools import TTLCache
 
@@ -29,6 +29,95 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersView(Mapping):
+    """
+    Read-only view of orders by client order id over one or more of the collections of the tracker, the last
+    collection having precedence. Lookups don't copy the collections. Iterating goes over a snapshot, so the orders
+    can be updated (and stop being tracked) while iterating.
+    """
+
+    def __init__(self, *collections: Mapping):
+        self._collections = collections
+
+    def __getitem__(self, client_order_id: str) -> InFlightOrder:
+        for collection in reversed(self._collections):
+            order = collection.get(client_order_id)
+            if order is not None:
+                return order
+        raise KeyError(client_order_id)
+
+    def __contains__(self, client_order_id) -> bool:
+        return any(client_order_id in collection for collection in self._collections)
+
+    def __len__(self) -> int:
+        # The collections of the tracker don't share orders
+        return sum(len(collection) for collection in self._collections)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.copy())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.copy()})"
+
+    def keys(self):
+        return self.copy().keys()
+
+    def values(self):
+        return self.copy().values()
+
+    def items(self):
+        return self.copy().items()
+
+    def copy(self) -> Dict[str, InFlightOrder]:
+        orders = {}
+        for collection in self._collections:
+            orders.update(collection.items())
+        return orders
+
+
+class ExchangeOrderIdView(Mapping):
+    """
+    Read-only view of the orders of an `OrdersView` by exchange order id, using the exchange order id index of the
+    tracker. Like `OrdersView`, iterating goes over a snapshot.
+    """
+
+    def __init__(self, orders: OrdersView, orders_by_exchange_order_id: Dict[str, InFlightOrder]):
+        self._orders = orders
+        self._orders_by_exchange_order_id = orders_by_exchange_order_id
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if (order is None
+                or order.exchange_order_id != exchange_order_id
+                or self._orders.get(order.client_order_id) is not order):
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __contains__(self, exchange_order_id) -> bool:
+        return self.get(exchange_order_id) is not None
+
+    def __len__(self) -> int:
+        return len(self.copy())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.copy())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.copy()})"
+
+    def keys(self):
+        return self.copy().keys()
+
+    def values(self):
+        return self.copy().values()
+
+    def items(self):
+        return self.copy().items()
+
+    def copy(self) -> Dict[str, InFlightOrder]:
+        return {order.exchange_order_id: order for order in self._orders.values()}
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -56,12 +145,26 @@ class ClientOrderTracker:
         self._lost_order_count_limit = lost_order_count_limit
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
-        self._lost_orders: Dict[str, InFlightOrder] = {}
+        self._lost_orders: Dict[str, InFlightOrder] = self._create_lost_orders_collection()
+
+        # Secondary indexes, maintained when the orders are tracked and when their exchange order id or state change.
+        # The exchange order id index keeps the orders that left the tracker (like expired cached orders) until the
+        # index is pruned, the views check the orders are still tracked.
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = defaultdict(dict)
+        self._active_orders_by_state: Dict[OrderState, Dict[str, InFlightOrder]] = defaultdict(dict)
+        self._all_orders_view = OrdersView(self._in_flight_orders, self._cached_orders)
+        self._all_fillable_orders_view = OrdersView(self._in_flight_orders, self._cached_orders, self._lost_orders)
+        self._all_updatable_orders_view = OrdersView(self._in_flight_orders, self._lost_orders)
 
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
 
+    def _create_lost_orders_collection(self) -> Dict[str, InFlightOrder]:
+        # Created once, the views of the tracker keep a reference to it
+        return {}
+
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
         """
@@ -70,53 +173,58 @@ class ClientOrderTracker:
         return self._in_flight_orders
 
     @property
-    def cached_orders(self) -> Dict[str, InFlightOrder]:
+    def cached_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return OrdersView(self._cached_orders)
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return self._all_orders_view
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return self._all_fillable_orders_view
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return ExchangeOrderIdView(self._all_fillable_orders_view, self._orders_by_exchange_order_id)
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return self._all_updatable_orders_view
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return ExchangeOrderIdView(self._all_updatable_orders_view, self._orders_by_exchange_order_id)
+
+    def active_orders_by_trading_pair(self, trading_pair: str) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the orders of the trading pair that are actively tracked
+        """
+        return OrdersView(self._active_orders_by_trading_pair.get(trading_pair, {}))
+
+    def active_orders_by_state(self, state: OrderState) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the orders that are actively tracked and currently in the state
+        """
+        return OrdersView(self._active_orders_by_state.get(state, {}))
 
     @property
     def current_timestamp(self) -> int:
@@ -126,11 +234,11 @@ class ClientOrderTracker:
         return self._connector.current_timestamp
 
     @property
-    def lost_orders(self) -> Dict[str, InFlightOrder]:
+    def lost_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns a dictionary of all orders marked as failed after not being found more times than the configured limit
+        Returns all orders marked as failed after not being found more times than the configured limit
         """
-        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+        return OrdersView(self._lost_orders)
 
     @property
     def lost_order_count_limit(self) -> int:
@@ -142,11 +250,15 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._active_orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+        self._active_orders_by_state[order.current_state][order.client_order_id] = order
+        self._index_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
-            del self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders.pop(client_order_id)
+            self._cached_orders[client_order_id] = order
+            self._remove_from_active_indexes(order, order.current_state)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
@@ -161,7 +273,7 @@ class ClientOrderTracker:
                 self.start_tracking_order(order)
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
-                self._lost_orders[order.client_order_id] = order
+                self._start_tracking_lost_order(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -174,12 +286,11 @@ class ClientOrderTracker:
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
+        if client_order_id in self._all_orders_view:
+            found_order = self._all_orders_view[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+            found_order = ExchangeOrderIdView(
+                self._all_orders_view, self._orders_by_exchange_order_id).get(exchange_order_id)
 
         return found_order
 
@@ -191,9 +302,7 @@ class ClientOrderTracker:
         if client_order_id in self._lost_orders:
             found_order = self._lost_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+            found_order = ExchangeOrderIdView(self.lost_orders, self._orders_by_exchange_order_id).get(exchange_order_id)
 
         return found_order
 
@@ -203,7 +312,7 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self._all_fillable_orders_view.get(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -248,7 +357,7 @@ class ClientOrderTracker:
                     )
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
-                    self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._start_tracking_lost_order(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -304,6 +413,46 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _start_tracking_lost_order(self, order: InFlightOrder):
+        self._lost_orders[order.client_order_id] = order
+        self._index_order(order)
+
+    def _index_order(self, order: InFlightOrder):
+        order.update_listener = self._on_order_updated
+        if order.exchange_order_id is not None:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+            if len(self._orders_by_exchange_order_id) > 2 * (len(self._all_fillable_orders_view) + self.MAX_CACHE_SIZE):
+                self._prune_exchange_order_id_index()
+
+    def _prune_exchange_order_id_index(self):
+        self._orders_by_exchange_order_id = {
+            exchange_order_id: order
+            for exchange_order_id, order in self._orders_by_exchange_order_id.items()
+            if order.exchange_order_id == exchange_order_id
+            and self._all_fillable_orders_view.get(order.client_order_id) is order
+        }
+
+    def _remove_from_active_indexes(self, order: InFlightOrder, state: OrderState):
+        self._active_orders_by_trading_pair[order.trading_pair].pop(order.client_order_id, None)
+        if self._active_orders_by_state[state].pop(order.client_order_id, None) is None:
+            # The state changed without the tracker being notified, like for orders not tracked with the tracker API
+            for orders_in_state in self._active_orders_by_state.values():
+                orders_in_state.pop(order.client_order_id, None)
+
+    def _on_order_updated(self, order: InFlightOrder, previous_exchange_order_id: Optional[str],
+                          previous_state: OrderState):
+        if self._all_fillable_orders_view.get(order.client_order_id) is not order:
+            # A copy of a tracked order, or an order that left the tracker
+            return
+        if order.exchange_order_id != previous_exchange_order_id:
+            if self._orders_by_exchange_order_id.get(previous_exchange_order_id) is order:
+                del self._orders_by_exchange_order_id[previous_exchange_order_id]
+            self._index_order(order)
+        if order.current_state != previous_state and self._in_flight_orders.get(order.client_order_id) is order:
+            self._remove_from_active_indexes(order, previous_state)
+            self._active_orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+            self._active_orders_by_state[order.current_state][order.client_order_id] = order
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
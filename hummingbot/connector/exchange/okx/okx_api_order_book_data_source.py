@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 
 class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    RAW_ORDER_BOOK_LEVELS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -40,8 +41,8 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         order_book_message_content = {
             "trading_pair": trading_pair,
             "update_id": update_id,
-            "bids": [(bid[0], bid[1]) for bid in snapshot_data["bids"]],
-            "asks": [(ask[0], ask[1]) for ask in snapshot_data["asks"]],
+            "bids": snapshot_data["bids"],
+            "asks": snapshot_data["asks"],
         }
         snapshot_msg: OrderBookMessage = OrderBookMessage(
             OrderBookMessageType.SNAPSHOT,
@@ -82,8 +83,8 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         order_book_message_content = {
             "trading_pair": trading_pair,
             "update_id": update_id,
-            "bids": [(bid[0], bid[1]) for bid in snapshot_data["bids"]],
-            "asks": [(ask[0], ask[1]) for ask in snapshot_data["asks"]],
+            "bids": snapshot_data["bids"],
+            "asks": snapshot_data["asks"],
         }
         snapshot_msg: OrderBookMessage = OrderBookMessage(
             OrderBookMessageType.SNAPSHOT,
@@ -124,8 +125,8 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             order_book_message_content = {
                 "trading_pair": trading_pair,
                 "update_id": update_id,
-                "bids": [(bid[0], bid[1]) for bid in diff_data["bids"]],
-                "asks": [(ask[0], ask[1]) for ask in diff_data["asks"]],
+                "bids": diff_data["bids"],
+                "asks": diff_data["asks"],
             }
             diff_message: OrderBookMessage = OrderBookMessage(
                 OrderBookMessageType.DIFF,
@@ -24,9 +24,12 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 
 # Auth required
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
+OKX_BATCH_PLACE_ORDER_PATH = "/api/v5/trade/batch-orders"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
+# Orders per batch creation or cancelation request
+OKX_MAX_ORDERS_PER_BATCH = 20
 OKX_BALANCE_PATH = '/api/v5/account/balance'
 OKX_TRADE_FILLS_PATH = "/api/v5/trade/fills"
 
@@ -77,7 +80,9 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=20, time_interval=2),
-    RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
+    # The batch limits are 300 orders every 2 seconds
+    RateLimit(limit_id=OKX_BATCH_PLACE_ORDER_PATH, limit=300 // OKX_MAX_ORDERS_PER_BATCH, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300 // OKX_MAX_ORDERS_PER_BATCH, time_interval=2),
     RateLimit(limit_id=OKX_BALANCE_PATH, limit=10, time_interval=2),
     RateLimit(limit_id=OKX_TRADE_FILLS_PATH, limit=60, time_interval=2),
 ]
@@ -15,6 +15,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_results import CancelOrderResult, PlaceOrderResult
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.estimate_fee import build_trade_fee
@@ -96,6 +97,14 @@ class OkxExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.OKX_MAX_ORDERS_PER_BATCH
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.OKX_MAX_ORDERS_PER_BATCH
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
@@ -185,6 +194,34 @@ class OkxExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
 
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+
+        exchange_order_id = await self._api_request(
+            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
+        )
+        data = exchange_order_id["data"][0]
+        if data["sCode"] != "0":
+            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
+        return str(data["ordId"]), self.current_timestamp
+
+    async def _order_request_data(self,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  trade_type: TradeType,
+                                  order_type: OrderType,
+                                  price: Decimal) -> Dict[str, str]:
         data = {
             "clOrdId": order_id,
             "tdMode": "cash",
@@ -198,18 +235,40 @@ class OkxExchange(ExchangePyBase):
         else:
             # Specify that the the order quantity for market orders is denominated in base currency
             data["tgtCcy"] = "base_ccy"
-
-        exchange_order_id = await self._api_request(
-            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
+        return data
+
+    async def _place_orders_batch(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders_to_create
+        ]
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_PLACE_ORDER_PATH,
             method=RESTMethod.POST,
             data=data,
             is_auth_required=True,
-            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
+            limit_id=CONSTANTS.OKX_BATCH_PLACE_ORDER_PATH,
         )
-        data = exchange_order_id["data"][0]
-        if data["sCode"] != "0":
-            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
-        return str(data["ordId"]), self.current_timestamp
+        trading_pairs = {order.client_order_id: order.trading_pair for order in orders_to_create}
+        return [
+            PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order_data["clOrdId"],
+                exchange_order_id=order_data["ordId"] or None,
+                trading_pair=trading_pairs.get(order_data["clOrdId"]),
+                exception=(None
+                           if order_data["sCode"] == "0"
+                           else IOError(f"Error submitting order {order_data['clOrdId']}: {order_data['sMsg']}")),
+            )
+            for order_data in response["data"]
+        ]
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -237,6 +296,26 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _place_cancels_batch(self, orders_to_cancel: List[InFlightOrder]) -> List[CancelOrderResult]:
+        data = [{"clOrdId": order.client_order_id, "instId": order.trading_pair} for order in orders_to_cancel]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        trading_pairs = {order.client_order_id: order.trading_pair for order in orders_to_cancel}
+        # The orders that don't exist or are already cancelled are cancelled, as for single cancelations
+        return [
+            CancelOrderResult(
+                client_order_id=order_data["clOrdId"],
+                trading_pair=trading_pairs.get(order_data["clOrdId"]),
+                exception=(None
+                           if order_data["sCode"] in ("0", "51400", "51401")
+                           else IOError(f"Error cancelling order {order_data['clOrdId']}: {order_data['sMsg']}")),
+            )
+            for order_data in response["data"]
+        ]
+
     async def get_last_traded_prices(self, trading_pairs: List[str] = None) -> Dict[str, float]:
         params = {"instType": "SPOT"}
 
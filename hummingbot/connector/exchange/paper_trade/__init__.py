@@ -2,6 +2,7 @@ from typing import List
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.connector.exchange.paper_trade.matching_engine import QueuePositionMatchingEngine
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
@@ -18,7 +19,14 @@ def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> Ord
 
 def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfigAdapter, trading_pairs: List[str]):
     tracker = get_order_book_tracker(connector_name=exchange_name, trading_pairs=trading_pairs)
-    return PaperTradeExchange(client_config_map,
-                              tracker,
-                              get_connector_class(exchange_name),
-                              exchange_name=exchange_name)
+    paper_trade_exchange = PaperTradeExchange(client_config_map,
+                                              tracker,
+                                              get_connector_class(exchange_name),
+                                              exchange_name=exchange_name)
+    paper_trade_config = client_config_map.paper_trade
+    if paper_trade_config.paper_trade_queue_position_simulation:
+        paper_trade_exchange.set_matching_engine(QueuePositionMatchingEngine(
+            order_entry_latency=paper_trade_config.paper_trade_order_entry_latency,
+            cancel_latency=paper_trade_config.paper_trade_cancel_latency,
+        ))
+    return paper_trade_exchange
@@ -0,0 +1,66 @@
+# distutils: language=c++
+
+from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook, OrderBookLevelListener
+
+
+cdef class SimulatedOrder:
+    cdef:
+        readonly str order_id
+        readonly str trading_pair
+        readonly bint is_buy
+        readonly object price
+        readonly object amount
+        public object remaining_amount
+        public object paid_amount
+        public object acquired_amount
+        readonly double live_timestamp
+        readonly double cancel_timestamp
+        readonly double queue_ahead
+        readonly bint is_live
+        double c_price
+        bint _is_taker
+
+
+cdef class PairOrderQueues(OrderBookLevelListener):
+    cdef:
+        str _trading_pair
+        CompositeOrderBook _order_book
+        dict _bid_levels
+        dict _ask_levels
+        double _bid_cross_consumed
+        double _ask_cross_consumed
+
+    cdef c_add_order(self, SimulatedOrder order)
+    cdef c_remove_order(self, SimulatedOrder order)
+    cdef list c_orders_by_priority(self, bint is_bid)
+    cdef bint c_has_orders(self)
+
+
+cdef class PaperTradeMatchingEngine:
+    cdef c_add_order(self,
+                     str order_id,
+                     str trading_pair,
+                     bint is_buy,
+                     object price,
+                     object amount,
+                     double timestamp,
+                     CompositeOrderBook order_book)
+    cdef bint c_request_cancel(self, str order_id, double timestamp)
+    cdef c_remove_order(self, str order_id)
+    cdef list c_due_cancels(self, double timestamp)
+    cdef list c_match_trade(self, object trade_event)
+    cdef list c_process(self, double timestamp)
+
+
+cdef class QueuePositionMatchingEngine(PaperTradeMatchingEngine):
+    cdef:
+        double _order_entry_latency
+        double _cancel_latency
+        object _trade_fee_schema
+        dict _orders
+        object _pending_activations
+        object _pending_cancels
+        dict _pair_queues
+
+    cdef c_activate_order(self, SimulatedOrder order)
+    cdef c_match_crossed_orders(self, PairOrderQueues queues, bint is_bid, list fills)
@@ -0,0 +1,399 @@
+# distutils: language=c++
+
+import math
+from collections import deque
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook, OrderBookLevelListener
+from hummingbot.core.data_type.order_book cimport DepthLevel
+from hummingbot.core.data_type.trade_fee import TradeFeeBase, TradeFeeSchema
+
+s_decimal_0 = Decimal(0)
+
+
+cdef inline object c_to_decimal(double value):
+    return Decimal(repr(value))
+
+
+cdef class SimulatedOrder:
+    """
+    Matching state of a paper limit order: when it reaches the book, its position in the queue of its price level and
+    how much of it is left.
+    """
+
+    def __init__(self,
+                 str order_id,
+                 str trading_pair,
+                 bint is_buy,
+                 object price,
+                 object amount,
+                 double live_timestamp):
+        self.order_id = order_id
+        self.trading_pair = trading_pair
+        self.is_buy = is_buy
+        self.price = price
+        self.c_price = float(price)
+        self.amount = amount
+        self.remaining_amount = amount
+        self.paid_amount = s_decimal_0
+        self.acquired_amount = s_decimal_0
+        self.live_timestamp = live_timestamp
+        self.cancel_timestamp = math.nan
+        self.queue_ahead = 0
+        self.is_live = False
+        self._is_taker = False
+
+    def __repr__(self) -> str:
+        return (f"SimulatedOrder('{self.order_id}', '{self.trading_pair}', {self.is_buy}, {self.price}, "
+                f"{self.remaining_amount}/{self.amount}, queue_ahead={self.queue_ahead}, live={self.is_live})")
+
+
+cdef class PairOrderQueues(OrderBookLevelListener):
+    """
+    The live simulated orders of a trading pair, grouped by price level in arrival order. Listens to the diffs of the
+    pair's order book for the levels it has orders on.
+    """
+
+    def __init__(self, str trading_pair, CompositeOrderBook order_book):
+        self._trading_pair = trading_pair
+        self._order_book = order_book
+        self._bid_levels = {}
+        self._ask_levels = {}
+        self._bid_cross_consumed = 0
+        self._ask_cross_consumed = 0
+        order_book.level_listener = self
+
+    cdef c_add_order(self, SimulatedOrder order):
+        cdef dict levels = self._bid_levels if order.is_buy else self._ask_levels
+        if order.c_price not in levels:
+            levels[order.c_price] = []
+            self.c_watch_level(order.is_buy, order.c_price)
+        levels[order.c_price].append(order)
+
+    cdef c_remove_order(self, SimulatedOrder order):
+        cdef:
+            dict levels = self._bid_levels if order.is_buy else self._ask_levels
+            list level = levels.get(order.c_price)
+        if level is None or order not in level:
+            return
+        level.remove(order)
+        if len(level) == 0:
+            del levels[order.c_price]
+            self.c_unwatch_level(order.is_buy, order.c_price)
+
+    cdef list c_orders_by_priority(self, bint is_bid):
+        """
+        The orders of a side best price first, in arrival order within a price level
+        """
+        cdef:
+            dict levels = self._bid_levels if is_bid else self._ask_levels
+            list orders = []
+        for price in sorted(levels, reverse=is_bid):
+            orders.extend(levels[price])
+        return orders
+
+    cdef bint c_has_orders(self):
+        return len(self._bid_levels) > 0 or len(self._ask_levels) > 0
+
+    cdef c_level_updated(self, bint is_bid, double price, double amount):
+        cdef SimulatedOrder order
+        # A level can only shrink in front of the orders when what is ahead of them trades or is cancelled. Without
+        # the order ids of the level, the orders assume every decrease happens ahead of them only when it has to.
+        for order in (self._bid_levels if is_bid else self._ask_levels).get(price, ()):
+            if amount < order.queue_ahead:
+                order.queue_ahead = amount
+
+    cdef c_levels_reset(self, CompositeOrderBook order_book):
+        cdef:
+            SimulatedOrder order
+            double amount
+        for is_bid, levels in ((True, self._bid_levels), (False, self._ask_levels)):
+            for price, orders in levels.items():
+                amount = order_book.c_get_level_amount(is_bid, price)
+                for order in orders:
+                    if amount < order.queue_ahead:
+                        order.queue_ahead = amount
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    def orders_by_priority(self, is_bid: bool) -> List[SimulatedOrder]:
+        return self.c_orders_by_priority(is_bid)
+
+
+cdef class PaperTradeMatchingEngine:
+    """
+    Decides when and how much of the paper trade limit orders fill. The exchange keeps the orders and the balances,
+    and reports to the engine the orders created, cancel requests and the trades of the order books. The fills the
+    engine returns are (SimulatedOrder, amount, is_maker) tuples, applied by the exchange in that order.
+    """
+
+    @property
+    def order_entry_latency(self) -> float:
+        return 0.0
+
+    @property
+    def cancel_latency(self) -> float:
+        return 0.0
+
+    def trade_fee(self, is_maker: bool, order_side: TradeType) -> Optional[TradeFeeBase]:
+        """
+        Fee of a fill, None to use the fee schema of the exchange
+        """
+        return None
+
+    cdef c_add_order(self,
+                     str order_id,
+                     str trading_pair,
+                     bint is_buy,
+                     object price,
+                     object amount,
+                     double timestamp,
+                     CompositeOrderBook order_book):
+        raise NotImplementedError
+
+    cdef bint c_request_cancel(self, str order_id, double timestamp):
+        """
+        Returns whether the order is to be cancelled right away, otherwise it is returned by c_due_cancels later
+        """
+        raise NotImplementedError
+
+    cdef c_remove_order(self, str order_id):
+        raise NotImplementedError
+
+    cdef list c_due_cancels(self, double timestamp):
+        raise NotImplementedError
+
+    cdef list c_match_trade(self, object trade_event):
+        raise NotImplementedError
+
+    cdef list c_process(self, double timestamp):
+        raise NotImplementedError
+
+
+cdef class QueuePositionMatchingEngine(PaperTradeMatchingEngine):
+    """
+    Simulates the position of the paper orders in the queues of their price levels.
+    - Orders reach the book order_entry_latency seconds after being placed, and leave it cancel_latency seconds after
+      the cancel request. They can fill in between.
+    - An order joins the back of its level: the amount of the level at that time is ahead of it. Trades at the order
+      price consume that amount first, and the level shrinking below it (cancels ahead, observed in the diffs) moves
+      the order up.
+    - Trades through the order price fill it, up to the trade amount left by the better priced orders.
+    - When the other side of the book crosses the order price, the crossed depth fills the orders, each unit of depth
+      once. Orders crossing the book when they reach it are takers for that part.
+    Fills can be partial. Taker fills are priced at the order price rather than at the crossed levels, which
+    overstates their cost.
+    """
+
+    def __init__(self,
+                 order_entry_latency: float = 0.0,
+                 cancel_latency: float = 0.0,
+                 trade_fee_schema: Optional[TradeFeeSchema] = None):
+        """
+        :param order_entry_latency: seconds between the creation of an order and its arrival in the book
+        :param cancel_latency: seconds between a cancel request and the removal of the order from the book
+        :param trade_fee_schema: maker and taker fees, the fee schema of the exchange is used if not provided
+        """
+        if order_entry_latency < 0 or cancel_latency < 0:
+            raise ValueError("The order entry and cancel latencies can't be negative.")
+        self._order_entry_latency = order_entry_latency
+        self._cancel_latency = cancel_latency
+        self._trade_fee_schema = trade_fee_schema
+        self._orders = {}
+        # The latencies are constant, so the orders become due in the order they are queued
+        self._pending_activations = deque()
+        self._pending_cancels = deque()
+        self._pair_queues = {}
+
+    @property
+    def order_entry_latency(self) -> float:
+        return self._order_entry_latency
+
+    @property
+    def cancel_latency(self) -> float:
+        return self._cancel_latency
+
+    @property
+    def trade_fee_schema(self) -> Optional[TradeFeeSchema]:
+        return self._trade_fee_schema
+
+    def trade_fee(self, is_maker: bool, order_side: TradeType) -> Optional[TradeFeeBase]:
+        schema = self._trade_fee_schema
+        if schema is None:
+            return None
+        return TradeFeeBase.new_spot_fee(
+            fee_schema=schema,
+            trade_type=order_side,
+            percent=schema.maker_percent_fee_decimal if is_maker else schema.taker_percent_fee_decimal,
+            percent_token=schema.percent_fee_token,
+            flat_fees=(schema.maker_fixed_fees if is_maker else schema.taker_fixed_fees).copy(),
+        )
+
+    def get_order(self, order_id: str) -> Optional[SimulatedOrder]:
+        return self._orders.get(order_id)
+
+    def get_pair_queues(self, trading_pair: str) -> Optional[PairOrderQueues]:
+        return self._pair_queues.get(trading_pair)
+
+    cdef c_add_order(self,
+                     str order_id,
+                     str trading_pair,
+                     bint is_buy,
+                     object price,
+                     object amount,
+                     double timestamp,
+                     CompositeOrderBook order_book):
+        cdef SimulatedOrder order = SimulatedOrder(order_id, trading_pair, is_buy, price, amount,
+                                                   timestamp + self._order_entry_latency)
+        if trading_pair not in self._pair_queues:
+            self._pair_queues[trading_pair] = PairOrderQueues(trading_pair, order_book)
+        self._orders[order_id] = order
+        self._pending_activations.append(order)
+
+    cdef bint c_request_cancel(self, str order_id, double timestamp):
+        cdef SimulatedOrder order = self._orders.get(order_id)
+        if order is None or self._cancel_latency <= 0:
+            return True
+        if math.isnan(order.cancel_timestamp):
+            order.cancel_timestamp = timestamp + self._cancel_latency
+            self._pending_cancels.append(order)
+        return False
+
+    cdef c_remove_order(self, str order_id):
+        cdef SimulatedOrder order = self._orders.pop(order_id, None)
+        if order is not None and order.is_live:
+            (<PairOrderQueues>self._pair_queues[order.trading_pair]).c_remove_order(order)
+            order.is_live = False
+
+    cdef list c_due_cancels(self, double timestamp):
+        cdef:
+            list due_orders = []
+            SimulatedOrder order
+        while len(self._pending_cancels) > 0:
+            order = self._pending_cancels[0]
+            if order.cancel_timestamp > timestamp:
+                break
+            self._pending_cancels.popleft()
+            # Orders filled while the cancel was in flight are gone already
+            if order.order_id in self._orders:
+                due_orders.append(order)
+        return due_orders
+
+    cdef c_activate_order(self, SimulatedOrder order):
+        cdef:
+            PairOrderQueues queues = self._pair_queues[order.trading_pair]
+            CompositeOrderBook order_book = queues._order_book
+        order.queue_ahead = order_book.c_get_level_amount(order.is_buy, order.c_price)
+        try:
+            # Crossing the book on arrival, the order takes liquidity for the crossed depth
+            order._is_taker = ((order.c_price >= order_book.c_get_price(True))
+                               if order.is_buy
+                               else (order.c_price <= order_book.c_get_price(False)))
+        except EnvironmentError:
+            order._is_taker = False
+        order.is_live = True
+        queues.c_add_order(order)
+
+    cdef list c_match_trade(self, object trade_event):
+        """
+        Fills the orders the trade went through, and moves forward the queue of the trade price level.
+        """
+        cdef:
+            PairOrderQueues queues = self._pair_queues.get(trade_event.trading_pair)
+            bint is_bid = trade_event.type is TradeType.SELL
+            double trade_price = trade_event.price
+            double trade_amount = trade_event.amount
+            double amount_left = trade_amount
+            double reached_amount
+            double fill_amount
+            list fills = []
+            SimulatedOrder order
+
+        if queues is None or not queues.c_has_orders():
+            return fills
+
+        for order in queues.c_orders_by_priority(is_bid):
+            if (order.c_price < trade_price) if is_bid else (order.c_price > trade_price):
+                break
+            if order.c_price == trade_price:
+                # Only the part of the trade beyond the queue ahead reaches the order
+                reached_amount = trade_amount - order.queue_ahead
+                order.queue_ahead = max(order.queue_ahead - trade_amount, 0)
+            else:
+                reached_amount = trade_amount
+            fill_amount = min(reached_amount, amount_left, float(order.remaining_amount))
+            if fill_amount <= 0:
+                continue
+            amount_left -= fill_amount
+            fills.append((order, min(c_to_decimal(fill_amount), order.remaining_amount), True))
+        return fills
+
+    cdef c_match_crossed_orders(self, PairOrderQueues queues, bint is_bid, list fills):
+        cdef:
+            CompositeOrderBook order_book = queues._order_book
+            double opposite_price
+            double consumed = queues._bid_cross_consumed if is_bid else queues._ask_cross_consumed
+            double fill_amount
+            DepthLevel depth
+            SimulatedOrder order
+            list orders = queues.c_orders_by_priority(is_bid)
+
+        if len(orders) == 0:
+            return
+        order = orders[0]
+        try:
+            opposite_price = order_book.c_get_price(is_bid)
+        except EnvironmentError:
+            return
+        if (order.c_price < opposite_price) if is_bid else (order.c_price > opposite_price):
+            # Not crossed anymore, the depth crossing the orders next time is new liquidity
+            consumed = 0
+        else:
+            for order in orders:
+                if (order.c_price < opposite_price) if is_bid else (order.c_price > opposite_price):
+                    break
+                depth = order_book.c_depth_to_price(is_bid, order.c_price)
+                fill_amount = min(depth.base_after - consumed, float(order.remaining_amount))
+                if fill_amount <= 0:
+                    continue
+                consumed += fill_amount
+                fills.append((order, min(c_to_decimal(fill_amount), order.remaining_amount), not order._is_taker))
+        for order in orders:
+            order._is_taker = False
+        if is_bid:
+            queues._bid_cross_consumed = consumed
+        else:
+            queues._ask_cross_consumed = consumed
+
+    cdef list c_process(self, double timestamp):
+        """
+        Brings the orders due to the book, then fills the orders crossed by the other side of the book.
+        """
+        cdef:
+            list fills = []
+            SimulatedOrder order
+            PairOrderQueues queues
+
+        while len(self._pending_activations) > 0:
+            order = self._pending_activations[0]
+            if order.live_timestamp > timestamp:
+                break
+            self._pending_activations.popleft()
+            if order.order_id in self._orders:
+                self.c_activate_order(order)
+
+        for queues in self._pair_queues.values():
+            if queues.c_has_orders():
+                self.c_match_crossed_orders(queues, True, fills)
+                self.c_match_crossed_orders(queues, False, fills)
+        return fills
+
+    def match_trade(self, trade_event) -> List[Tuple[SimulatedOrder, Decimal, bool]]:
+        return self.c_match_trade(trade_event)
+
+    def process(self, timestamp: float) -> List[Tuple[SimulatedOrder, Decimal, bool]]:
+        return self.c_process(timestamp)
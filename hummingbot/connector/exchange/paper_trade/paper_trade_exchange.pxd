@@ -7,6 +7,7 @@ from hummingbot.core.data_type.LimitOrder cimport LimitOrder as CPPLimitOrder
 from hummingbot.core.data_type.OrderExpirationEntry cimport OrderExpirationEntry as CPPOrderExpirationEntry
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.exchange.paper_trade.matching_engine cimport PaperTradeMatchingEngine, SimulatedOrder
 
 
 ctypedef cpp_set[CPPLimitOrder] SingleTradingPairLimitOrders
@@ -38,6 +39,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         object _order_book_trade_listener
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
+        dict _on_hold_balances
+        dict _on_hold_order_counts
+        PaperTradeMatchingEngine _matching_engine
         object _target_market
         str _exchange_name
 
@@ -53,6 +57,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                           object amount,
                           object price,
                           object is_maker=*)
+    cdef c_update_on_hold_balance(self, const CPPLimitOrder *cpp_limit_order_ptr, bint add)
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
@@ -76,6 +81,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef c_process_matching_engine(self)
+    cdef c_apply_matching_engine_fill(self, SimulatedOrder order, object amount, bint is_maker)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
@@ -14,6 +14,7 @@ from libcpp.vector cimport vector
 
 from hummingbot.connector.budget_checker import BudgetChecker
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector
+from hummingbot.connector.exchange.paper_trade.matching_engine cimport PaperTradeMatchingEngine, SimulatedOrder
 from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock cimport Clock
@@ -165,6 +166,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._exchange_name = exchange_name
         self._account_balances = {}
         self._account_available_balances = {}
+        # Balances held by the resting limit orders, updated as orders are created and removed
+        self._on_hold_balances = {}
+        self._on_hold_order_counts = {}
+        self._matching_engine = None
         self._paper_trade_market_initialized = False
         self._trading_pairs = {}
         self._queued_orders = deque()
@@ -276,23 +281,28 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
-        _on_hold_balances = defaultdict(Decimal)
-        for limit_order in self.limit_orders:
-            if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
-            else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
-        return _on_hold_balances
+        return defaultdict(Decimal, self._on_hold_balances)
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
-        _available_balances = self._account_balances.copy()
-        for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
-        return _available_balances
+        return {currency: balance - self._on_hold_balances.get(currency, s_decimal_0)
+                for currency, balance in self._account_balances.items()}
+
+    @property
+    def matching_engine(self) -> Optional[PaperTradeMatchingEngine]:
+        return self._matching_engine
 
     # </editor-fold>
 
+    def set_matching_engine(self, matching_engine: Optional[PaperTradeMatchingEngine]):
+        """
+        Sets the engine simulating the fills of the limit orders (i.e. QueuePositionMatchingEngine). Without engine, the
+        limit orders fill entirely as soon as a trade or the other side of the book goes through their price.
+        """
+        if self._bid_limit_orders.size() > 0 or self._ask_limit_orders.size() > 0:
+            raise ValueError("The matching engine can't be changed while there are limit orders in the book.")
+        self._matching_engine = matching_engine
+
     cdef c_start(self, Clock clock, double timestamp):
         ExchangeBase.c_start(self, clock, timestamp)
 
@@ -318,7 +328,10 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
-        self.c_process_crossed_limit_orders()
+        if self._matching_engine is None:
+            self.c_process_crossed_limit_orders()
+        else:
+            self.c_process_matching_engine()
 
     cdef str c_buy(self,
                    str trading_pair_str,
@@ -340,6 +353,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrdersIterator map_it
             SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
             pair[LimitOrders.iterator, cppbool] insert_result
+            pair[SingleTradingPairLimitOrders.iterator, cppbool] orders_insert_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -357,7 +371,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
+            orders_insert_result = limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
                 True,
@@ -370,6 +384,12 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            if orders_insert_result.second:
+                self.c_update_on_hold_balance(address(deref(orders_insert_result.first)), True)
+                if self._matching_engine is not None:
+                    self._matching_engine.c_add_order(order_id, trading_pair_str, True, quantized_price,
+                                                      quantized_amount, self._current_timestamp,
+                                                      <CompositeOrderBook>self.c_get_order_book(trading_pair_str))
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -401,6 +421,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrdersIterator map_it
             SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
             pair[LimitOrders.iterator, cppbool] insert_result
+            pair[SingleTradingPairLimitOrders.iterator, cppbool] orders_insert_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -417,7 +438,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
+            orders_insert_result = limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
                 False,
@@ -430,6 +451,12 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            if orders_insert_result.second:
+                self.c_update_on_hold_balance(address(deref(orders_insert_result.first)), True)
+                if self._matching_engine is not None:
+                    self._matching_engine.c_add_order(order_id, trading_pair_str, False, quantized_price,
+                                                      quantized_amount, self._current_timestamp,
+                                                      <CompositeOrderBook>self.c_get_order_book(trading_pair_str))
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -608,9 +635,12 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_market_orders(self):
         cdef:
             QueuedOrder front_order = None
+            double execution_delay = (self.TRADE_EXECUTION_DELAY
+                                      if self._matching_engine is None
+                                      else self._matching_engine.order_entry_latency)
         while len(self._queued_orders) > 0:
             front_order = self._queued_orders[0]
-            if front_order.create_timestamp <= self._current_timestamp - self.TRADE_EXECUTION_DELAY:
+            if front_order.create_timestamp <= self._current_timestamp - execution_delay:
                 self._queued_orders.popleft()
                 try:
                     if front_order.is_buy:
@@ -622,6 +652,33 @@ cdef class PaperTradeExchange(ExchangeBase):
             else:
                 return
 
+    cdef c_update_on_hold_balance(self, const CPPLimitOrder *cpp_limit_order_ptr, bint add):
+        cdef:
+            bint is_buy = cpp_limit_order_ptr.getIsBuy()
+            str currency
+            object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_amount = <object> cpp_limit_order_ptr.getFilledQuantity()
+            int order_count
+
+        if filled_amount is not None:
+            amount = amount - filled_amount
+
+        if is_buy:
+            currency = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
+            amount = amount * <object> cpp_limit_order_ptr.getPrice()
+        else:
+            currency = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
+
+        order_count = self._on_hold_order_counts.get(currency, 0) + (1 if add else -1)
+        if order_count <= 0:
+            # Nothing held anymore, dropping the entry also drops any rounding left by the additions and subtractions
+            self._on_hold_order_counts.pop(currency, None)
+            self._on_hold_balances.pop(currency, None)
+        else:
+            self._on_hold_order_counts[currency] = order_count
+            self._on_hold_balances[currency] = (self._on_hold_balances.get(currency, s_decimal_0)
+                                                + (amount if add else -amount))
+
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
@@ -629,6 +686,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            self.c_update_on_hold_balance(address(deref(orders_it)), False)
+            if self._matching_engine is not None:
+                self._matching_engine.c_remove_order(deref(orders_it).getClientOrderID().decode("utf8"))
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -915,6 +975,11 @@ cdef class PaperTradeExchange(ExchangeBase):
         if map_it == limit_orders_map_ptr.end():
             return
 
+        if self._matching_engine is not None:
+            for order, amount, is_maker in self._matching_engine.c_match_trade(order_book_trade_event):
+                self.c_apply_matching_engine_fill(order, amount, is_maker)
+            return
+
         orders_collection_ptr = address(deref(map_it).second)
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
@@ -939,8 +1004,153 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     # </editor-fold>
 
+    cdef c_process_matching_engine(self):
+        cdef:
+            SimulatedOrder order
+            LimitOrders *limit_orders_map_ptr
+
+        for order in self._matching_engine.c_due_cancels(self._current_timestamp):
+            limit_orders_map_ptr = address(self._bid_limit_orders) if order.is_buy else address(self._ask_limit_orders)
+            self.c_cancel_order_from_orders_map(limit_orders_map_ptr, order.trading_pair, False, order.order_id)
+        for order, amount, is_maker in self._matching_engine.c_process(self._current_timestamp):
+            self.c_apply_matching_engine_fill(order, amount, is_maker)
+
+    cdef c_apply_matching_engine_fill(self, SimulatedOrder order, object amount, bint is_maker):
+        """
+        Fills amount of a limit order as decided by the matching engine. The order stays in the book with its filled
+        quantity updated until nothing is left of it.
+        """
+        cdef:
+            str trading_pair_str = order.trading_pair
+            str base_asset = self._trading_pairs[trading_pair_str].base_asset
+            str quote_asset = self._trading_pairs[trading_pair_str].quote_asset
+            string cpp_trading_pair_str = trading_pair_str.encode("utf8")
+            string cpp_order_id = order.order_id.encode("utf8")
+            object trade_type = TradeType.BUY if order.is_buy else TradeType.SELL
+            LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
+                                                 if order.is_buy
+                                                 else address(self._ask_limit_orders))
+            LimitOrdersIterator map_it = limit_orders_map_ptr.find(cpp_trading_pair_str)
+            SingleTradingPairLimitOrders *orders_collection_ptr = NULL
+            SingleTradingPairLimitOrdersIterator orders_it
+            CPPLimitOrder cpp_limit_order
+            object quote_balance = self.c_get_balance(quote_asset)
+            object base_balance = self.c_get_balance(base_asset)
+            object remaining_amount
+            object filled_amount
+
+        amount = self.c_quantize_order_amount(trading_pair_str, amount)
+        if amount <= s_decimal_0 or map_it == limit_orders_map_ptr.end():
+            return
+        orders_collection_ptr = address(deref(map_it).second)
+        # The orders are sorted by price and client order id, which is all the search key needs
+        orders_it = orders_collection_ptr.find(CPPLimitOrder(cpp_order_id,
+                                                             cpp_trading_pair_str,
+                                                             order.is_buy,
+                                                             base_asset.encode("utf8"),
+                                                             quote_asset.encode("utf8"),
+                                                             <PyObject *> order.price,
+                                                             <PyObject *> amount))
+        if orders_it == orders_collection_ptr.end():
+            return
+
+        order_candidate = OrderCandidate(
+            trading_pair=trading_pair_str,
+            is_maker=is_maker,
+            order_type=OrderType.LIMIT,
+            order_side=trade_type,
+            amount=amount,
+            price=order.price,
+            from_total_balances=True
+        )
+        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+        # Buys pay quote and acquire base currency, sells the other way around, fees included.
+        paid_amount = adjusted_order_candidate.order_collateral.amount
+        acquired_amount = adjusted_order_candidate.potential_returns.amount
+
+        if paid_amount > (quote_balance if order.is_buy else base_balance):
+            paid_asset = quote_asset if order.is_buy else base_asset
+            self.logger().warning(f"Not enough {paid_asset} balance to fill limit {trade_type.name.lower()} order on "
+                                  f"{trading_pair_str}. {paid_amount:.8g} {paid_asset} needed vs. "
+                                  f"{quote_balance if order.is_buy else base_balance:.8g} {paid_asset} available.")
+            self.c_delete_limit_order(limit_orders_map_ptr, address(map_it), orders_it)
+            self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
+                                 OrderCancelledEvent(self._current_timestamp, order.order_id))
+            return
+
+        if order.is_buy:
+            self.c_set_balance(quote_asset, quote_balance - paid_amount)
+            self.c_set_balance(base_asset, base_balance + acquired_amount)
+        else:
+            self.c_set_balance(base_asset, base_balance - paid_amount)
+            self.c_set_balance(quote_asset, quote_balance + acquired_amount)
+        order.paid_amount += paid_amount
+        order.acquired_amount += acquired_amount
+        order.remaining_amount -= amount
+
+        self.c_trigger_event(
+            self.ORDER_FILLED_EVENT_TAG,
+            OrderFilledEvent(
+                self._current_timestamp,
+                order.order_id,
+                trading_pair_str,
+                trade_type,
+                OrderType.LIMIT,
+                order.price,
+                amount,
+                self.c_get_fee(base_asset, quote_asset, OrderType.LIMIT, trade_type, amount, order.price, is_maker),
+                exchange_trade_id=str(int(self._time() * 1e6))
+            ))
+
+        remaining_amount = self.c_quantize_order_amount(trading_pair_str, order.remaining_amount)
+        if remaining_amount > s_decimal_0:
+            # Replace the order with its filled quantity updated, the set elements can't be modified in place
+            self.c_update_on_hold_balance(address(deref(orders_it)), False)
+            cpp_limit_order = deref(orders_it)
+            orders_collection_ptr.erase(orders_it)
+            filled_amount = order.amount - order.remaining_amount
+            cpp_limit_order = CPPLimitOrder(cpp_limit_order.getClientOrderID(),
+                                            cpp_limit_order.getTradingPair(),
+                                            cpp_limit_order.getIsBuy(),
+                                            cpp_limit_order.getBaseCurrency(),
+                                            cpp_limit_order.getQuoteCurrency(),
+                                            cpp_limit_order.getPrice(),
+                                            cpp_limit_order.getQuantity(),
+                                            <PyObject *> filled_amount,
+                                            cpp_limit_order.getCreationTimestamp(),
+                                            cpp_limit_order.getStatus(),
+                                            cpp_limit_order.getPosition())
+            orders_it = orders_collection_ptr.insert(cpp_limit_order).first
+            self.c_update_on_hold_balance(address(deref(orders_it)), True)
+            return
+
+        if order.is_buy:
+            self.c_trigger_event(
+                self.BUY_ORDER_COMPLETED_EVENT_TAG,
+                BuyOrderCompletedEvent(self._current_timestamp,
+                                       order.order_id,
+                                       base_asset,
+                                       quote_asset,
+                                       order.acquired_amount,
+                                       order.paid_amount,
+                                       OrderType.LIMIT))
+        else:
+            self.c_trigger_event(
+                self.SELL_ORDER_COMPLETED_EVENT_TAG,
+                SellOrderCompletedEvent(self._current_timestamp,
+                                        order.order_id,
+                                        base_asset,
+                                        quote_asset,
+                                        order.paid_amount,
+                                        order.acquired_amount,
+                                        OrderType.LIMIT))
+        self.c_delete_limit_order(limit_orders_map_ptr, address(map_it), orders_it)
+
     cdef object c_get_available_balance(self, str currency):
-        return self.available_balances.get(currency.upper(), s_decimal_0)
+        currency = currency.upper()
+        if currency not in self._account_balances:
+            return s_decimal_0
+        return self._account_balances[currency] - self._on_hold_balances.get(currency, s_decimal_0)
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         cdef:
@@ -1007,6 +1217,10 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
+        if (self._matching_engine is not None
+                and not self._matching_engine.c_request_cancel(client_order_id, self._current_timestamp)):
+            # Cancelled once the request reaches the exchange, it can still fill until then
+            return
         self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, False, client_order_id)
 
     cdef object c_get_fee(self,
@@ -1017,9 +1231,15 @@ cdef class PaperTradeExchange(ExchangeBase):
                           object amount,
                           object price,
                           object is_maker = None):
+        if is_maker is None:
+            is_maker = order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]
+        if self._matching_engine is not None:
+            trade_fee = self._matching_engine.trade_fee(is_maker, order_side)
+            if trade_fee is not None:
+                return trade_fee
         return build_trade_fee(
             self.name,
-            is_maker=is_maker if is_maker is not None else order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER],
+            is_maker=is_maker,
             base_currency=base_asset,
             quote_currency=quote_asset,
             order_type=order_type,
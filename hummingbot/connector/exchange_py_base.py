@@ -2,27 +2,32 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.status_polling_metrics import StatusPollingMetrics
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import throttler_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, ThrottlePriority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_results import CancelOrderResult, PlaceOrderResult
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -45,6 +50,7 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    ORDER_STATUS_UPDATE_CONCURRENCY = 10
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -61,10 +67,12 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
+        self._status_polling_metrics = StatusPollingMetrics()
+        self._fills_cursor_timestamp: Optional[float] = None
+        self._fills_cursor_order_ids: Set[str] = set()
+
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
-            rate_limits=self.rate_limits_rules,
-            limits_share_percentage=client_config_map.rate_limits_share_pct)
+        self._throttler = self._create_throttler(client_config_map)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -149,6 +157,20 @@ class ExchangePyBase(ExchangeBase, ABC):
     def is_trading_required(self) -> bool:
         raise NotImplementedError
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        """
+        The maximum number of orders the exchange accepts in a batch creation request, 0 if it has no batch endpoint
+        """
+        return 0
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        """
+        The maximum number of orders the exchange accepts in a batch cancelation request, 0 if it has no batch endpoint
+        """
+        return 0
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self.order_book_tracker.order_books
@@ -161,6 +183,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     def trading_rules(self) -> Dict[str, TradingRule]:
         return self._trading_rules
 
+    @property
+    def status_polling_metrics(self) -> StatusPollingMetrics:
+        """
+        Latency of the last order fills and order status passes of the status polling loop
+        """
+        return self._status_polling_metrics
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         return [in_flight_order.to_limit_order() for in_flight_order in self.in_flight_orders.values()]
@@ -357,6 +386,72 @@ class ExchangePyBase(ExchangeBase, ABC):
         safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
+    def batch_order_create(
+        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Issues a batch order creation as a single API request for exchanges that implement this feature, in chunks
+        of batch_order_create_max_size orders. The orders are sent discretely (one by one) otherwise.
+
+        :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The
+            order IDs can be blanc.
+
+        :return: A list of LimitOrder or MarketOrder objects representing the created orders, complete with the
+            generated order IDs.
+        """
+        if self.batch_order_create_max_size == 0:
+            return super().batch_order_create(orders_to_create=orders_to_create)
+
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length
+            )
+            if isinstance(order, LimitOrder):
+                orders_with_ids_to_create.append(
+                    LimitOrder(
+                        client_order_id=client_order_id,
+                        trading_pair=order.trading_pair,
+                        is_buy=order.is_buy,
+                        base_currency=order.base_currency,
+                        quote_currency=order.quote_currency,
+                        price=order.price,
+                        quantity=order.quantity,
+                        filled_quantity=order.filled_quantity,
+                        creation_timestamp=order.creation_timestamp,
+                        status=order.status,
+                    )
+                )
+            else:
+                orders_with_ids_to_create.append(
+                    MarketOrder(
+                        order_id=client_order_id,
+                        trading_pair=order.trading_pair,
+                        is_buy=order.is_buy,
+                        base_asset=order.base_asset,
+                        quote_asset=order.quote_asset,
+                        amount=order.amount,
+                        timestamp=order.timestamp,
+                    )
+                )
+        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Issues a batch order cancelation as a single API request for exchanges that implement this feature, in chunks
+        of batch_order_cancel_max_size orders. The cancelations are sent discretely (one by one) otherwise.
+
+        :param orders_to_cancel: A list of the orders to cancel.
+        """
+        if self.batch_order_cancel_max_size == 0:
+            super().batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        else:
+            safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         Cancels all currently active orders. The cancellations are performed in parallel tasks.
@@ -407,6 +502,32 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = self._start_tracking_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is not None:
+            await self._place_order_and_handle_failure(order=order, **kwargs)
+
+    def _start_tracking_and_validate_order(self,
+                                           trade_type: TradeType,
+                                           order_id: str,
+                                           trading_pair: str,
+                                           amount: Decimal,
+                                           order_type: OrderType,
+                                           price: Optional[Decimal] = None,
+                                           **kwargs) -> Optional[InFlightOrder]:
+        """
+        Starts tracking an order and checks it against the trading rules. The orders that can't be created are marked
+        as failed.
+
+        :return: the tracked order if it can be sent to the exchange, None otherwise
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -433,34 +554,38 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif quantized_amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
                                   f"size {trading_rule.min_order_size}. The order will not be created, increase the "
                                   f"amount to be higher than the minimum order size.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif notional_size < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {notional_size} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. The order will not be "
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
+        return order
+
+    async def _place_order_and_handle_failure(self, order: InFlightOrder, **kwargs):
         try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
+            with throttler_priority(ThrottlePriority.CREATE):
+                await self._place_order_and_process_update(order=order, **kwargs,)
 
         except asyncio.CancelledError:
             raise
         except Exception as ex:
             self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
                 exception=ex,
                 **kwargs,
             )
@@ -487,6 +612,74 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return exchange_order_id
 
+    async def _execute_batch_order_create(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        in_flight_orders_to_create = []
+        for order in orders_to_create:
+            is_limit_order = isinstance(order, LimitOrder)
+            in_flight_order = self._start_tracking_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id if is_limit_order else order.order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity if is_limit_order else order.amount,
+                order_type=OrderType.LIMIT if is_limit_order else OrderType.MARKET,
+                price=order.price if is_limit_order else s_decimal_NaN,
+            )
+            if in_flight_order is not None:
+                in_flight_orders_to_create.append(in_flight_order)
+
+        chunk_size = self.batch_order_create_max_size
+        await safe_gather(*[
+            self._place_orders_batch_and_process_update(orders=in_flight_orders_to_create[index:index + chunk_size])
+            for index in range(0, len(in_flight_orders_to_create), chunk_size)
+        ])
+
+    async def _place_orders_batch_and_process_update(self, orders: List[InFlightOrder]):
+        try:
+            with throttler_priority(ThrottlePriority.CREATE):
+                place_order_results = await self._place_orders_batch(orders_to_create=orders)
+        except asyncio.CancelledError:
+            raise
+        except NotImplementedError:
+            await safe_gather(*[self._place_order_and_handle_failure(order=order) for order in orders])
+            return
+        except Exception as ex:
+            for order in orders:
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=ex,
+                )
+            return
+
+        results_by_order_id = {result.client_order_id: result for result in place_order_results}
+        for order in orders:
+            place_order_result = results_by_order_id.get(order.client_order_id)
+            if place_order_result is None or place_order_result.exception is not None:
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=(IOError(f"The order {order.client_order_id} is missing in the batch response.")
+                               if place_order_result is None
+                               else place_order_result.exception),
+                )
+            else:
+                self._order_tracker.process_order_update(OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(place_order_result.exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=place_order_result.update_timestamp,
+                    new_state=OrderState.OPEN,
+                    misc_updates=place_order_result.misc_updates or None,
+                ))
+
     def _on_order_failure(
         self,
         order_id: str,
@@ -517,7 +710,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _execute_order_cancel(self, order: InFlightOrder) -> str:
         try:
-            cancelled = await self._execute_order_cancel_and_process_update(order=order)
+            with throttler_priority(ThrottlePriority.CANCEL):
+                cancelled = await self._execute_order_cancel_and_process_update(order=order)
             if cancelled:
                 return order.client_order_id
         except asyncio.CancelledError:
@@ -567,6 +761,68 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        results = []
+        tracked_orders_to_cancel = []
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_tracked_order(client_order_id=order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders_to_cancel.append(tracked_order)
+            else:
+                results.append(CancellationResult(order_id=order.client_order_id, success=False))
+
+        chunk_size = self.batch_order_cancel_max_size
+        chunks_results = await safe_gather(*[
+            self._place_cancels_batch_and_process_update(orders=tracked_orders_to_cancel[index:index + chunk_size])
+            for index in range(0, len(tracked_orders_to_cancel), chunk_size)
+        ])
+        for chunk_results in chunks_results:
+            results.extend(chunk_results)
+        return results
+
+    async def _place_cancels_batch_and_process_update(self, orders: List[InFlightOrder]) -> List[CancellationResult]:
+        try:
+            with throttler_priority(ThrottlePriority.CANCEL):
+                cancel_order_results = await self._place_cancels_batch(orders_to_cancel=orders)
+        except asyncio.CancelledError:
+            raise
+        except NotImplementedError:
+            cancelled_order_ids = await safe_gather(*[self._execute_order_cancel(order=order) for order in orders])
+            return [CancellationResult(order_id=order.client_order_id, success=cancelled_order_id is not None)
+                    for order, cancelled_order_id in zip(orders, cancelled_order_ids)]
+        except Exception:
+            self.logger().error("Failed to cancel a batch of orders", exc_info=True)
+            return [CancellationResult(order_id=order.client_order_id, success=False) for order in orders]
+
+        results_by_order_id = {result.client_order_id: result for result in cancel_order_results}
+        cancelation_results = []
+        for order in orders:
+            cancel_order_result = results_by_order_id.get(order.client_order_id)
+            success = False
+            if cancel_order_result is None:
+                self.logger().error(f"Failed to cancel order {order.client_order_id} (missing in the batch response)")
+            elif cancel_order_result.not_found:
+                self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+                await self._order_tracker.process_order_not_found(order.client_order_id)
+            elif cancel_order_result.exception is not None:
+                self.logger().error(f"Failed to cancel order {order.client_order_id}",
+                                    exc_info=cancel_order_result.exception)
+            else:
+                update_timestamp = self.current_timestamp
+                if update_timestamp is None or math.isnan(update_timestamp):
+                    update_timestamp = self._time()
+                self._order_tracker.process_order_update(OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=(OrderState.CANCELED
+                               if self.is_cancel_request_in_exchange_synchronous
+                               else OrderState.PENDING_CANCEL),
+                ))
+                success = True
+            cancelation_results.append(CancellationResult(order_id=order.client_order_id, success=success))
+        return cancelation_results
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -640,6 +896,27 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_orders_batch(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        """
+        Sends the orders to the exchange in a single request, called with at most batch_order_create_max_size orders.
+
+        :param orders_to_create: the orders to create
+
+        :return: the result of each order, matched to the orders by client order id
+        """
+        raise NotImplementedError
+
+    async def _place_cancels_batch(self, orders_to_cancel: List[InFlightOrder]) -> List[CancelOrderResult]:
+        """
+        Sends the cancelations to the exchange in a single request, called with at most batch_order_cancel_max_size
+        orders.
+
+        :param orders_to_cancel: the orders to cancel
+
+        :return: the result of each cancelation, matched to the orders by client order id
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -729,7 +1006,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with throttler_priority(ThrottlePriority.HOUSEKEEPING):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -749,7 +1027,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with throttler_priority(ThrottlePriority.HOUSEKEEPING):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -774,10 +1053,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                with throttler_priority(ThrottlePriority.USER_DATA):
+                    await self._update_time_synchronizer()
 
-                # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                    # the following method is implementation-specific
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -949,19 +1229,73 @@ class ExchangePyBase(ExchangeBase, ABC):
                 exc_info=request_error,
             )
 
+    async def _process_orders_with_bounded_concurrency(
+            self, orders: List[InFlightOrder], process_order: Callable[[InFlightOrder], Awaitable]):
+        """
+        Runs process_order for all the orders, with at most ORDER_STATUS_UPDATE_CONCURRENCY of them waiting for the
+        exchange at the same time. The requests still go through the throttler, with the priority of the caller.
+        """
+        semaphore = asyncio.Semaphore(self.ORDER_STATUS_UPDATE_CONCURRENCY)
+
+        async def process_order_when_allowed(order: InFlightOrder):
+            async with semaphore:
+                await process_order(order)
+
+        await safe_gather(*[process_order_when_allowed(order) for order in orders])
+
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        orders = await self._update_orders_fills_in_bulk(orders=orders)
+        await self._process_orders_with_bounded_concurrency(orders=orders, process_order=self._update_order_fills)
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
+
+    async def _update_orders_fills_in_bulk(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Fetches the fills of all the orders with a single fills-since-cursor request, when the connector implements
+        `_all_trade_updates_since`. The cursor goes back to the creation of the orders it did not cover yet, and moves
+        to the start of the pass after each successful request (trades seen twice are ignored by the order tracker).
+
+        :return: the orders that still have to be reconciled one by one (all of them if the bulk request failed)
+        """
+        if len(orders) == 0:
+            return orders
+        pass_timestamp = self.current_timestamp
+        since_timestamp = min(
+            [order.creation_timestamp for order in orders if order.client_order_id not in self._fills_cursor_order_ids]
+            + ([self._fills_cursor_timestamp] if self._fills_cursor_timestamp is not None else []))
+        try:
+            trade_updates = await self._all_trade_updates_since(timestamp=since_timestamp)
+        except asyncio.CancelledError:
+            raise
+        except NotImplementedError:
+            return orders
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the trade updates since {since_timestamp}. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return orders
+
+        for trade_update in trade_updates:
+            self._order_tracker.process_trade_update(trade_update)
+        # The request returned the trades of all the orders: the orders covered by the previous passes (e.g. the active
+        # orders when this is a lost orders pass) stay covered. Only the orders still tracked are kept.
+        covered_order_ids = self._fills_cursor_order_ids.union(order.client_order_id for order in orders)
+        fillable_orders = self._order_tracker.all_fillable_orders
+        self._fills_cursor_timestamp = pass_timestamp
+        self._fills_cursor_order_ids = {order_id for order_id in covered_order_ids if order_id in fillable_orders}
+        return []
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -990,7 +1324,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
+        async def update_order(order: InFlightOrder):
             try:
                 order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
@@ -999,12 +1333,41 @@ class ExchangePyBase(ExchangeBase, ABC):
             except Exception as request_error:
                 await error_handler(order, request_error)
 
+        await self._process_orders_with_bounded_concurrency(orders=orders, process_order=update_order)
+
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
+        orders = await self._update_open_orders_in_bulk(orders=list(orders_to_update.values()))
         await self._update_orders_with_error_handler(
-            orders=list(orders_to_update.values()), error_handler=self._handle_update_error_for_active_order
+            orders=orders, error_handler=self._handle_update_error_for_active_order
         )
 
+    async def _update_open_orders_in_bulk(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Updates the orders reported by a single all-open-orders request, when the connector implements
+        `_request_all_open_order_updates`. The orders missing from the response are no longer open (filled, canceled,
+        or not yet acknowledged by the exchange) and need their own status request.
+
+        :return: the orders that still have to be reconciled one by one (all of them if the bulk request failed)
+        """
+        if len(orders) == 0:
+            return orders
+        try:
+            order_updates = await self._request_all_open_order_updates()
+        except asyncio.CancelledError:
+            raise
+        except NotImplementedError:
+            return orders
+        except Exception as request_error:
+            self.logger().warning(f"Failed to fetch the open orders. Error: {request_error}", exc_info=request_error)
+            return orders
+
+        updated_order_ids = set()
+        for order_update in order_updates:
+            self._order_tracker.process_order_update(order_update)
+            updated_order_ids.add(order_update.client_order_id)
+        return [order for order in orders if order.client_order_id not in updated_order_ids]
+
     async def _update_lost_orders(self):
         orders_to_update = self._order_tracker.lost_orders.copy()
         await self._update_orders_with_error_handler(
@@ -1012,8 +1375,25 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
-        await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
+        orders = list(self._order_tracker.all_fillable_orders.values())
+        start = time.perf_counter()
+        await self._update_orders_fills(orders=orders)
+        self._status_polling_metrics.record_pass(
+            kind=StatusPollingMetrics.ORDER_FILLS,
+            timestamp=self.current_timestamp,
+            duration=time.perf_counter() - start,
+            orders_count=len(orders),
+        )
+
+        orders_count = len(self.in_flight_orders)
+        start = time.perf_counter()
         await self._update_orders()
+        self._status_polling_metrics.record_pass(
+            kind=StatusPollingMetrics.ORDER_STATUS,
+            timestamp=self.current_timestamp,
+            duration=time.perf_counter() - start,
+            orders_count=orders_count,
+        )
 
     async def _update_lost_orders_status(self):
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
@@ -1049,6 +1429,26 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _all_trade_updates_since(self, timestamp: float) -> List[TradeUpdate]:
+        """
+        Requests all the trades of the account executed since the timestamp, for exchanges with a my-trades-since
+        endpoint. Used instead of `_all_trade_updates_for_order` for each order when implemented.
+
+        :param timestamp: the cursor, in seconds
+
+        :return: the trade updates, trades of untracked orders included
+        """
+        raise NotImplementedError
+
+    async def _request_all_open_order_updates(self) -> List[OrderUpdate]:
+        """
+        Requests all the open orders of the account, for exchanges with an open-orders endpoint. The orders not
+        reported are then updated with `_request_order_status`.
+
+        :return: the order updates of the open orders, with their client order id
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1068,6 +1468,20 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
+    def _create_throttler(self, client_config_map: "ClientConfigAdapter") -> AsyncThrottler:
+        budget_name: Optional[str] = client_config_map.rate_limits_budget_name
+        if budget_name:
+            # The bots configured with the same budget name share the limits of the exchange. Imported here as the
+            # shared budgets need POSIX file locks, the other throttlers work on every platform.
+            from hummingbot.core.api_throttler.shared_async_throttler import SharedAsyncThrottler
+            return SharedAsyncThrottler(
+                rate_limits=self.rate_limits_rules,
+                budget_name=f"{budget_name}_{self.name}",
+                limits_share_percentage=client_config_map.rate_limits_share_pct)
+        return AsyncThrottler(
+            rate_limits=self.rate_limits_rules,
+            limits_share_percentage=client_config_map.rate_limits_share_pct)
+
     async def _initialize_trading_pair_symbol_map(self):
         try:
             exchange_info = await self._make_trading_pairs_request()
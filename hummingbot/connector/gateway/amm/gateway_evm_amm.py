@@ -223,10 +223,8 @@ class GatewayEVMAMM(ConnectorBase):
         Updates inflight order statuses from API results
         This is used by the MarketsRecorder class to orchestrate market classes at a higher level.
         """
-        self._order_tracker._in_flight_orders.update({
-            key: GatewayInFlightOrder.from_json(value)
-            for key, value in saved_states.items()
-        })
+        for serialized_order in saved_states.values():
+            self._order_tracker.start_tracking_order(GatewayInFlightOrder.from_json(serialized_order))
 
     def create_approval_order_id(self, token_symbol: str) -> str:
         return f"approve-{self.connector_name}-{token_symbol}"
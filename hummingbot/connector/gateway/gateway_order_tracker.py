@@ -21,8 +21,10 @@ class GatewayOrderTracker(ClientOrderTracker):
         (3) Error thrown by exchange when fetching order status
         """
         super().__init__(connector=connector, lost_order_count_limit=lost_order_count_limit)
+
+    def _create_lost_orders_collection(self) -> Dict[str, GatewayInFlightOrder]:
         # For some DEXes it is important to process orders in the same order they were created
-        self._lost_orders: Dict[str, GatewayInFlightOrder] = OrderedDict()
+        return OrderedDict()
 
     @property
     def all_fillable_orders_by_hash(self) -> Dict[str, GatewayInFlightOrder]:
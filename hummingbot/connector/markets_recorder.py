@@ -5,14 +5,16 @@ import os.path
 import threading
 import time
 from decimal import Decimal
+from functools import partial
+from itertools import islice
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
-from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap, MarketDataCollectionStorageEnum
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
@@ -35,6 +37,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.columnar_market_data import ColumnarMarketDataWriter
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
@@ -45,6 +48,7 @@ from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -76,7 +80,15 @@ class MarketsRecorder:
         config_file_path: str,
         strategy_name: str,
         market_data_collection: MarketDataCollectionConfigMap,
+        write_behind: bool = False,
+        write_flush_interval: float = 1.0,
     ):
+        """
+        :param write_behind: if True, the order and trade records are written to the database in batches from a
+        dedicated thread (see `SQLWriteBehindQueue`), and the market states are saved at most once per flush interval.
+        Otherwise they are written on the event loop when the events happen.
+        :param write_flush_interval: the maximum delay (in seconds) before a record is written, with write_behind
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -87,6 +99,18 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._columnar_market_data_writer: Optional[ColumnarMarketDataWriter] = None
+        if market_data_collection.market_data_collection_storage == MarketDataCollectionStorageEnum.columnar:
+            self._columnar_market_data_writer = ColumnarMarketDataWriter(
+                base_path=os.path.join(data_path(), "market_data"),
+                depth=market_data_collection.market_data_collection_depth,
+            )
+        self._write_flush_interval = write_flush_interval
+        self._write_queue: Optional[SQLWriteBehindQueue] = (
+            SQLWriteBehindQueue(sql, flush_interval=write_flush_interval) if write_behind else None
+        )
+        self._markets_with_unsaved_states: Dict[str, ConnectorBase] = {}
+        self._market_states_save_handle: Optional[asyncio.TimerHandle] = None
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -137,32 +161,10 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    balance = market.get_all_balances()
-                                    balance_serializable = {k: round(float(v), 2) for k, v in balance.items()}
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth],
-                                        },
-                                        balance=balance_serializable,
-                                    )
-                                    session.add(market_data)
+                    if self._columnar_market_data_writer is not None:
+                        self._record_market_data_in_files()
+                    else:
+                        self._record_market_data_in_db()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -170,6 +172,53 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _record_market_data_in_db(self):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for market in self._markets:
+                    exchange = market.display_name
+                    for trading_pair in market.trading_pairs:
+                        mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                        best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                        best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                        order_book = market.get_order_book(trading_pair)
+                        balance = market.get_all_balances()
+                        balance_serializable = {k: round(float(v), 2) for k, v in balance.items()}
+                        depth = self._market_data_collection_config.market_data_collection_depth + 1
+                        market_data = MarketData(
+                            timestamp=self.db_timestamp,
+                            exchange=exchange,
+                            trading_pair=trading_pair,
+                            mid_price=mid_price,
+                            best_bid=best_bid,
+                            best_ask=best_ask,
+                            order_book={
+                                "bid": list(islice(order_book.bid_entries(), depth)),
+                                "ask": list(islice(order_book.ask_entries(), depth)),
+                            },
+                            balance=balance_serializable,
+                        )
+                        session.add(market_data)
+
+    def _record_market_data_in_files(self):
+        timestamp = time.time()
+        for market in self._markets:
+            exchange = market.display_name
+            for trading_pair in market.trading_pairs:
+                order_book = market.get_order_book(trading_pair)
+                self._columnar_market_data_writer.append(
+                    timestamp=timestamp,
+                    exchange=exchange,
+                    trading_pair=trading_pair,
+                    mid_price=float(market.get_price_by_type(trading_pair, PriceType.MidPrice)),
+                    best_bid=float(market.get_price_by_type(trading_pair, PriceType.BestBid)),
+                    best_ask=float(market.get_price_by_type(trading_pair, PriceType.BestAsk)),
+                    bid_entries=order_book.bid_entries(),
+                    ask_entries=order_book.ask_entries(),
+                )
+            # The balances are recorded once per exchange, not with each trading pair
+            self._columnar_market_data_writer.append_balances(timestamp, exchange, market.get_all_balances())
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -186,10 +235,26 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_queue_depth(self) -> int:
+        """
+        Returns the number of records waiting to be written to the database (always 0 without write behind)
+        """
+        return self._write_queue.queue_depth if self._write_queue is not None else 0
+
+    @property
+    def write_commit_latency(self) -> Dict[str, float]:
+        """
+        Returns the last, mean and max commit durations of the last batches written (empty without write behind)
+        """
+        return self._write_queue.commit_latency if self._write_queue is not None else {}
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
+        if self._write_queue is not None:
+            self._write_queue.start()
         if self._market_data_collection_config.market_data_collection_enabled:
             self._start_market_data_recording()
 
@@ -199,6 +264,64 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._columnar_market_data_writer is not None:
+            self._columnar_market_data_writer.flush()
+        if self._write_queue is not None:
+            self._save_unsaved_market_states()
+            self._write_queue.stop()
+
+    def flush(self, models: Optional[Tuple[type, ...]] = None):
+        """
+        Writes the records and market states waiting in the write behind queue, if any. This blocks until the writer
+        thread has committed them.
+
+        :param models: writes only the pending records of these models (and the ones queued before them)
+        """
+        if self._write_queue is not None:
+            if models is None or MarketState in models:
+                self._save_unsaved_market_states()
+            self._write_queue.flush(models=models)
+
+    def _write(self, *operations: Callable[[Session], Any], models: Tuple[type, ...] = ()):
+        """
+        Writes the operations in a single transaction, or queues them to be written from the writer thread.
+
+        :param models: the models of the records written by the operations
+        """
+        if self._write_queue is None:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    for operation in operations:
+                        operation(session)
+        else:
+            for operation in operations:
+                self._write_queue.put(operation, models=models)
+
+    def _save_market_states_later(self, market: ConnectorBase):
+        """
+        Saves the tracking states of the market with the records being written. With write behind, the states are
+        serialized and saved once for all the events of the flush interval.
+        """
+        if self._write_queue is None:
+            self._write(partial(self.save_market_states, self._config_file_path, market))
+        else:
+            self._markets_with_unsaved_states[market.display_name] = market
+            if self._market_states_save_handle is None:
+                self._market_states_save_handle = self._ev_loop.call_later(
+                    self._write_flush_interval, self._save_unsaved_market_states)
+
+    def _save_unsaved_market_states(self):
+        if self._market_states_save_handle is not None:
+            self._market_states_save_handle.cancel()
+            self._market_states_save_handle = None
+        markets = list(self._markets_with_unsaved_states.values())
+        self._markets_with_unsaved_states.clear()
+        for market in markets:
+            self._write_queue.put(
+                partial(self._write_market_states, self._config_file_path, market.display_name, market.tracking_states),
+                key=(MarketState, self._config_file_path, market.display_name),
+                models=(MarketState,),
+            )
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -250,6 +373,11 @@ class MarketsRecorder:
         with_exchange_order_id_present: Optional[bool] = False,
         number_of_rows: Optional[int] = None,
     ) -> List[Order]:
+        """
+        Returns the orders recorded for the config and market. With write behind, this blocks until the pending order
+        records are written.
+        """
+        self.flush(models=(Order,))
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path, Order.market == market.display_name]
             if with_exchange_order_id_present:
@@ -261,6 +389,11 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        """
+        Returns the trade fills recorded for the config, the latest first. With write behind, this blocks until the
+        pending trade fill records are written.
+        """
+        self.flush(models=(TradeFill,))
         with self._sql_manager.get_new_session() as session:
             query: Query = (
                 session.query(TradeFill)
@@ -273,22 +406,33 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        self._write_market_states(config_file_path, market.display_name, market.tracking_states, session=session)
+
+    def _write_market_states(self, config_file_path: str, market_name: str, saved_state: Dict[str, Any],
+                             session: Session):
+        market_states: Optional[MarketState] = session.query(MarketState).filter(
+            MarketState.config_file_path == config_file_path, MarketState.market == market_name
+        ).one_or_none()
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(
                 config_file_path=config_file_path,
-                market=market.display_name,
+                market=market_name,
                 timestamp=timestamp,
-                saved_state=market.tracking_states,
+                saved_state=saved_state,
             )
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        """
+        Restores the tracking states saved for the market. With write behind, this blocks until the pending market
+        states are written.
+        """
+        self.flush(models=(MarketState,))
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
 
@@ -315,31 +459,33 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(
-                    id=evt.order_id,
-                    config_file_path=self._config_file_path,
-                    strategy=self._strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    creation_timestamp=timestamp,
-                    order_type=evt.type.name,
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                    last_status=event_type.name,
-                    last_update_timestamp=timestamp,
-                    exchange_order_id=evt.exchange_order_id,
-                )
-                order_status: OrderStatus = OrderStatus(order=order_record, timestamp=timestamp, status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        def write_order(session: Session):
+            order_record: Order = Order(
+                id=evt.order_id,
+                config_file_path=self._config_file_path,
+                strategy=self._strategy_name,
+                market=market_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                creation_timestamp=timestamp,
+                order_type=evt.type.name,
+                amount=Decimal(evt.amount),
+                leverage=evt.leverage if evt.leverage else 1,
+                price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                position=evt.position if evt.position else PositionAction.NIL.value,
+                last_status=event_type.name,
+                last_update_timestamp=timestamp,
+                exchange_order_id=evt.exchange_order_id,
+            )
+            order_status: OrderStatus = OrderStatus(order=order_record, timestamp=timestamp, status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+
+        market_name = market.display_name
+        self._write(write_order, models=(Order, OrderStatus))
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._save_market_states_later(market)
 
     def _did_fill_order(self, event_tag: int, market: ConnectorBase, evt: OrderFilledEvent):
         if threading.current_thread() != threading.main_thread():
@@ -351,58 +497,58 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id, timestamp=timestamp, status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market,
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
+        # The fee is calculated on the event loop, it can require the market and the rate oracle
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market,
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fee_json = evt.trade_fee.to_json()
+        market_name = market.display_name
+
+        def write_fill(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id, timestamp=timestamp, status=event_type.name)
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=self.config_file_path,
+                strategy=self.strategy_name,
+                market=market_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=evt.price,
+                amount=evt.amount,
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=trade_fee_json,
+                trade_fee_in_quote=fee_in_quote,
+                exchange_trade_id=evt.exchange_trade_id,
+                position=evt.position if evt.position else PositionAction.NIL.value,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
 
-                market.add_trade_fills_from_market_recorder(
-                    {
-                        TradeFillOrderDetails(
-                            trade_fill_record.market, trade_fill_record.exchange_trade_id, trade_fill_record.symbol
-                        )
-                    }
-                )
+        self._write(write_fill, models=(Order, OrderStatus, TradeFill))
+        self._save_market_states_later(market)
+        market.add_trade_fills_from_market_recorder(
+            {TradeFillOrderDetails(market_name, evt.exchange_trade_id, evt.trading_pair)}
+        )
 
     def _did_complete_funding_payment(self, event_tag: int, market: ConnectorBase, evt: FundingPaymentCompletedEvent):
         if threading.current_thread() != threading.main_thread():
@@ -410,23 +556,25 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
+        market_name = market.display_name
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = (
-                    session.query(FundingPayment).filter(FundingPayment.timestamp == timestamp).one_or_none()
+        def write_funding_payment(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = (
+                session.query(FundingPayment).filter(FundingPayment.timestamp == timestamp).one_or_none()
+            )
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(
+                    timestamp=timestamp,
+                    config_file_path=self.config_file_path,
+                    market=market_name,
+                    rate=evt.funding_rate,
+                    symbol=evt.trading_pair,
+                    amount=float(evt.amount),
                 )
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(
-                        timestamp=timestamp,
-                        config_file_path=self.config_file_path,
-                        market=market.display_name,
-                        rate=evt.funding_rate,
-                        symbol=evt.trading_pair,
-                        amount=float(evt.amount),
-                    )
-                    session.add(funding_payment_record)
+                session.add(funding_payment_record)
+
+        self._write(write_funding_payment, models=(FundingPayment,))
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -481,18 +629,19 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        def write_order_status(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(
-                        order_id=order_id, timestamp=timestamp, status=event_type.name
-                    )
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(
+                    order_id=order_id, timestamp=timestamp, status=event_type.name
+                )
+                session.add(order_status)
+
+        self._write(write_order_status, models=(Order, OrderStatus))
+        self._save_market_states_later(market)
 
     def _did_cancel_order(self, event_tag: int, market: ConnectorBase, evt: OrderCancelledEvent):
         self._update_order_status(event_tag, market, evt)
@@ -522,36 +671,40 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(
-                    hb_id=evt.order_id,
-                    timestamp=timestamp,
-                    tx_hash=evt.exchange_order_id,
-                    token_id=evt.token_id,
-                    trade_fee=evt.trade_fee.to_json(),
-                )
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        trade_fee_json = evt.trade_fee.to_json()
+
+        def write_range_position_update(session: Session):
+            rp_update: RangePositionUpdate = RangePositionUpdate(
+                hb_id=evt.order_id,
+                timestamp=timestamp,
+                tx_hash=evt.exchange_order_id,
+                token_id=evt.token_id,
+                trade_fee=trade_fee_json,
+            )
+            session.add(rp_update)
+
+        self._write(write_range_position_update, models=(RangePositionUpdate,))
+        self._save_market_states_later(connector)
 
     def _did_close_position(self, event_tag: int, connector: ConnectorBase, evt: RangePositionClosedEvent):
         if threading.current_thread() != threading.main_thread():
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(
-                    config_file_path=self._config_file_path,
-                    strategy=self._strategy_name,
-                    token_id=evt.token_id,
-                    token_0=evt.token_0,
-                    token_1=evt.token_1,
-                    claimed_fee_0=Decimal(evt.claimed_fee_0),
-                    claimed_fee_1=Decimal(evt.claimed_fee_1),
-                )
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write_range_position_fees(session: Session):
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(
+                config_file_path=self._config_file_path,
+                strategy=self._strategy_name,
+                token_id=evt.token_id,
+                token_0=evt.token_0,
+                token_1=evt.token_1,
+                claimed_fee_0=Decimal(evt.claimed_fee_0),
+                claimed_fee_1=Decimal(evt.claimed_fee_1),
+            )
+            session.add(rp_fees)
+
+        self._write(write_range_position_fees, models=(RangePositionCollectedFees,))
+        self._save_market_states_later(connector)
 
     @staticmethod
     async def _sleep(delay):
@@ -0,0 +1,56 @@
+from collections import deque
+from typing import Deque, Dict, NamedTuple, Optional
+
+import numpy
+
+
+class StatusPollingPass(NamedTuple):
+    timestamp: float
+    duration: float
+    orders_count: int
+
+
+class StatusPollingMetrics:
+    """
+    Keeps the latency of the last passes of the status polling loop of a connector, by kind of pass (order fills,
+    order status). A pass is the reconciliation of all the tracked orders, whether it was done with one request per
+    order or with the bulk endpoints of the exchange.
+    """
+
+    ORDER_FILLS = "order_fills"
+    ORDER_STATUS = "order_status"
+
+    def __init__(self, max_passes: int = 100):
+        self._max_passes = max_passes
+        self._passes: Dict[str, Deque[StatusPollingPass]] = {}
+
+    def record_pass(self, kind: str, timestamp: float, duration: float, orders_count: int):
+        passes = self._passes.get(kind)
+        if passes is None:
+            passes = deque(maxlen=self._max_passes)
+            self._passes[kind] = passes
+        passes.append(StatusPollingPass(timestamp, duration, orders_count))
+
+    def last_pass(self, kind: str) -> Optional[StatusPollingPass]:
+        passes = self._passes.get(kind)
+        return passes[-1] if passes else None
+
+    def summary(self, kind: str) -> Dict[str, float]:
+        """
+        Returns the number of passes kept, and the last, mean, 95th percentile and max durations of the passes (in
+        seconds)
+        """
+        passes = self._passes.get(kind)
+        if not passes:
+            return {}
+        durations = numpy.array([polling_pass.duration for polling_pass in passes])
+        return {
+            "passes": len(durations),
+            "last": float(durations[-1]),
+            "mean": float(durations.mean()),
+            "p95": float(numpy.percentile(durations, 95)),
+            "max": float(durations.max()),
+        }
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {kind: self.summary(kind) for kind in self._passes}
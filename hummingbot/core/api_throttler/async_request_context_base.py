@@ -2,10 +2,9 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from decimal import Decimal
-from typing import List, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RateLimit, TaskLog, TaskLogs, ThrottlePriority
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -28,12 +27,14 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 task_logs: TaskLogs,
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 priority: ThrottlePriority = DEFAULT_PRIORITY,
+                 wait_times: Optional[Dict[ThrottlePriority, Deque[float]]] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -41,51 +42,86 @@ class AsyncRequestContextBase(ABC):
         :param rate_limit: The RateLimit associated with this API Request
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
+        :param retry_interval: Time between each limit check, when the time capacity frees up is not known
+        :param priority: Priority of the task, tasks waiting with a more urgent priority are served first
+        :param wait_times: Shared record of the time waited for capacity by the tasks of each priority
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._task_logs: TaskLogs = task_logs
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._priority: ThrottlePriority = priority
+        self._wait_times: Optional[Dict[ThrottlePriority, Deque[float]]] = wait_times
 
     def flush(self):
         """
         Remove task logs that have passed rate limit periods
         :return:
         """
-        now: Decimal = Decimal(str(time.time()))
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: Decimal = now - Decimal(str(task.timestamp))
-            if elapsed > Decimal(str(task_limit.time_interval * (1 + self._safety_margin_pct))):
-                self._task_logs.remove(task)
+        self._task_logs.flush_all(self._time(), self._safety_margin_pct)
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def seconds_until_capacity(self) -> float:
+        """
+        Time to wait before checking the capacity again, after within_capacity() returned False
+        """
+        return self._retry_interval
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
-
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
-        async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
-
-            # Log the acquired rate limit into the tasks log
-            self._task_logs.append(TaskLog(timestamp=now,
-                                           rate_limit=self._rate_limit,
-                                           weight=self._rate_limit.weight))
-
-            # Log its related limits into the tasks log as individual tasks
-            for limit, weight in self._related_limits:
-                self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+        start_time: float = self._time()
+        waiting: bool = False
+        try:
+            while True:
+                async with self._lock:
+                    self.flush()
+
+                    if self.within_capacity():
+                        self._log_task()
+                        break
+                    wait_time: float = self.seconds_until_capacity()
+                    if not waiting:
+                        # Lets less urgent tasks know about the capacity this task is waiting for
+                        self._update_pending_weights(add=True)
+                        waiting = True
+                await asyncio.sleep(wait_time)
+        finally:
+            if waiting:
+                self._update_pending_weights(add=False)
+        if self._wait_times is not None:
+            self._wait_times[self._priority].append(self._time() - start_time)
+
+    def _limits_with_weights(self) -> List[Tuple[RateLimit, int]]:
+        return [(self._rate_limit, self._rate_limit.weight)] + self._related_limits
+
+    def _update_pending_weights(self, add: bool):
+        for rate_limit, weight in self._limits_with_weights():
+            if add:
+                self._task_logs.add_pending(rate_limit.limit_id, self._priority, weight)
+            else:
+                self._task_logs.remove_pending(rate_limit.limit_id, self._priority, weight)
+
+    def _log_task(self):
+        # Logged in the same lock block as the capacity check, so no other task can take the capacity in between
+        now = self._time()
+        # Each related limit is represented as it own individual TaskLog
+
+        # Log the acquired rate limit into the tasks log
+        self._task_logs.append(TaskLog(timestamp=now,
+                                       rate_limit=self._rate_limit,
+                                       weight=self._rate_limit.weight))
+
+        # Log its related limits into the tasks log as individual tasks
+        for limit, weight in self._related_limits:
+            self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+
+    def _time(self) -> float:
+        # Monotonic, so the windows are not affected by system clock adjustments
+        return time.monotonic()
 
     async def __aenter__(self):
         await self.acquire()
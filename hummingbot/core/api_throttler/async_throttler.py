@@ -1,13 +1,12 @@
-import time
-from decimal import Decimal
-from typing import List, Tuple
+import math
+from typing import Optional
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, ThrottlePriority
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -23,16 +22,14 @@ class AsyncRequestContext(AsyncRequestContextBase):
         :return: True if it is within capacity to add a new task
         """
         if self._rate_limit is not None:
-            list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
-                                                            self._rate_limit.weight)] + self._related_limits
             now: float = self._time()
-            for rate_limit, weight in list_of_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in self._task_logs
-                                          if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
+            for rate_limit, weight in self._limits_with_weights():
+                self._task_logs.flush(rate_limit.limit_id, now, self._safety_margin_pct)
+                # The capacity more urgent waiting tasks need is considered used
+                capacity_used: int = (self._task_logs.capacity_used(rate_limit.limit_id)
+                                      + self._task_logs.pending_weight_before(rate_limit.limit_id, self._priority))
 
-                if capacity_used + weight > rate_limit.limit:
+                if capacity_used + weight > self._available_capacity(rate_limit, weight):
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
                         msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
                               f"{rate_limit.time_interval}s) has almost reached. Limits used " \
@@ -43,8 +40,31 @@ class AsyncRequestContext(AsyncRequestContextBase):
                     return False
         return True
 
-    def _time(self):
-        return time.time()
+    def seconds_until_capacity(self) -> float:
+        """
+        Time until the tasks holding the capacity of every limit have expired. Falls back to the retry interval when
+        the task does not fit a limit at all.
+        """
+        release_time: float = 0.0
+        for rate_limit, weight in self._limits_with_weights():
+            pending_weight: int = self._task_logs.pending_weight_before(rate_limit.limit_id, self._priority)
+            limit_release_time: Optional[float] = self._task_logs.release_time(
+                rate_limit.limit_id, weight + pending_weight, self._available_capacity(rate_limit, weight),
+                self._safety_margin_pct)
+            if limit_release_time is None:
+                return self._retry_interval
+            release_time = max(release_time, limit_release_time)
+        return max(0.0, release_time - self._time())
+
+    def _available_capacity(self, rate_limit: RateLimit, weight: int) -> float:
+        # The limit minus the capacity reserved to more urgent priorities, in whole units of weight. It is never lower
+        # than the weight of the task, so that a task of any priority can run once the limit is free.
+        reserved: float = sum(fraction
+                              for priority, fraction in (rate_limit.priority_reserves or {}).items()
+                              if priority < self._priority)
+        limit: float = float(rate_limit.limit)
+        reserved_capacity: int = math.floor(limit * reserved + 1e-9)
+        return max(limit - reserved_capacity, float(weight))
 
 
 class AsyncThrottler(AsyncThrottlerBase):
@@ -59,11 +79,12 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: Optional[ThrottlePriority] = None) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the task, by default the one set by the caller or the one of the limit
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
@@ -74,4 +95,6 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            priority=self.get_task_priority(rate_limit, priority),
+            wait_times=self._wait_times,
         )
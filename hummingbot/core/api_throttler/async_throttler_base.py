@@ -3,13 +3,37 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RateLimit, TaskLogs, ThrottlePriority
 from hummingbot.logger.logger import HummingbotLogger
 
+# Priority set by the callers for the tasks they execute, see throttler_priority()
+_task_priority: ContextVar[Optional[ThrottlePriority]] = ContextVar("throttler_task_priority", default=None)
+
+
+@contextmanager
+def throttler_priority(priority: ThrottlePriority):
+    """
+    Executes the throttled tasks (API requests) started within the context with the given priority, unless the task
+    explicitly requests another one. Applies to the tasks created within the context too.
+    (i.e)
+        with throttler_priority(ThrottlePriority.CANCEL):
+            await self._place_cancel(order_id, tracked_order)
+    """
+    token = _task_priority.set(priority)
+    try:
+        yield
+    finally:
+        _task_priority.reset(token)
+
 
 class AsyncThrottlerBase(ABC):
     """
@@ -30,24 +54,28 @@ class AsyncThrottlerBase(ABC):
                  rate_limits: List[RateLimit],
                  retry_interval: float = 0.1,
                  safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
-                 limits_share_percentage: Optional[Decimal] = None
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_reserves: Optional[Dict[ThrottlePriority, float]] = None,
                  ):
         """
         :param rate_limits: List of RateLimit(s).
-        :param retry_interval: Time between every capacity check.
+        :param retry_interval: Time between capacity checks, when the time capacity frees up is not known.
         :param safety_margin_pct: Percentage of limit to be added as a safety margin when calculating capacity to ensure
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
             bots operate with the same account)
+        :param priority_reserves: Fraction of each limit reserved to each priority class, for the limits that don't
+            define their own reserves (i.e. {ThrottlePriority.CANCEL: 0.1} keeps 10% of every limit for cancels)
         """
         # If configured, users can define the percentage of rate limits to allocate to the throttler.
         share_percentage = limits_share_percentage or Decimal("100")
         self.limits_pct: Decimal = share_percentage / 100
+        self._priority_reserves: Dict[ThrottlePriority, float] = priority_reserves or {}
 
-        self.set_rate_limits(rate_limits)
+        # TaskLogs used to determine the API requests within a set time window.
+        self._task_logs: TaskLogs = self._create_task_logs()
 
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
+        self.set_rate_limits(rate_limits)
 
         # Throttler Parameters
         self._retry_interval: float = retry_interval
@@ -56,12 +84,20 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        # Recent times waited for capacity by the tasks of each priority
+        self._wait_times: Dict[ThrottlePriority, Deque[float]] = defaultdict(lambda: deque(maxlen=1000))
+
+    def _create_task_logs(self) -> TaskLogs:
+        return TaskLogs()
+
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
 
         for rate_limit in self._rate_limits:
             rate_limit.limit = max(Decimal("1"), math.floor(Decimal(str(rate_limit.limit)) * self.limits_pct))
+            if rate_limit.priority_reserves is None:
+                rate_limit.priority_reserves = self._priority_reserves
 
         # Dictionary of path_url to RateLimit
         self._id_to_limit_map: Dict[str, RateLimit] = {limit.limit_id: limit for limit in self._rate_limits}
@@ -85,6 +121,31 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def get_task_priority(self, rate_limit: Optional[RateLimit], priority: Optional[ThrottlePriority] = None) -> ThrottlePriority:
+        """
+        Priority of a task: the one requested for the task, or else the one set by the caller with
+        throttler_priority(), or else the one of its rate limit
+        """
+        priority = priority or _task_priority.get()
+        if priority is None and rate_limit is not None:
+            priority = rate_limit.priority
+        return priority or DEFAULT_PRIORITY
+
+    def wait_time_stats(self) -> Dict[ThrottlePriority, Dict[str, float]]:
+        """
+        Statistics (in seconds) of the time the recent tasks of each priority waited for capacity
+        """
+        stats = {}
+        for priority, wait_times in sorted(self._wait_times.items()):
+            if len(wait_times) > 0:
+                stats[priority] = {
+                    "count": len(wait_times),
+                    "mean": float(np.mean(wait_times)),
+                    "p99": float(np.percentile(wait_times, 99)),
+                    "max": max(wait_times),
+                }
+        return stats
+
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[ThrottlePriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
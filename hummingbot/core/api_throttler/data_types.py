@@ -1,8 +1,7 @@
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import (
-    List,
-    Optional,
-)
+from enum import IntEnum
+from typing import Deque, Dict, Iterable, Iterator, List, Optional
 
 DEFAULT_PATH = ""
 DEFAULT_WEIGHT = 1
@@ -13,6 +12,21 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class ThrottlePriority(IntEnum):
+    """
+    Priority classes of throttled tasks, from the most to the least urgent. While tasks of a class are waiting for
+    capacity, tasks of less urgent classes do not take the capacity they are waiting for.
+    """
+    CANCEL = 1
+    CREATE = 2
+    USER_DATA = 3
+    MARKET_DATA = 4
+    HOUSEKEEPING = 5
+
+
+DEFAULT_PRIORITY = ThrottlePriority.USER_DATA
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -30,6 +44,8 @@ class RateLimit:
                  time_interval: float,
                  weight: int = DEFAULT_WEIGHT,
                  linked_limits: Optional[List[LinkedLimitWeightPair]] = None,
+                 priority: Optional[ThrottlePriority] = None,
+                 priority_reserves: Optional[Dict[ThrottlePriority, float]] = None,
                  ):
         """
         :param limit_id: A unique identifier for this RateLimit object, this is usually an API request path url
@@ -37,16 +53,21 @@ class RateLimit:
         :param time_interval: The time interval in seconds
         :param weight: The weight (in integer) of each call. Defaults to 1
         :param linked_limits: Optional list of LinkedLimitWeightPairs. Used to associate a weight to the linked rate limit.
+        :param priority: Priority of the tasks executed with this limit_id, unless the caller sets one
+        :param priority_reserves: Fraction of the limit reserved to each priority class. Tasks can't use the capacity
+            reserved to more urgent classes. If not set, the throttler reserves are used.
         """
         self.limit_id = limit_id
         self.limit = limit
         self.time_interval = time_interval
         self.weight = weight
         self.linked_limits = linked_limits or []
+        self.priority = priority
+        self.priority_reserves = priority_reserves
 
     def __repr__(self):
         return f"limit_id: {self.limit_id}, limit: {self.limit}, time interval: {self.time_interval}, " \
-               f"weight: {self.weight}, linked_limits: {self.linked_limits}"
+               f"weight: {self.weight}, linked_limits: {self.linked_limits}, priority: {self.priority}"
 
 
 @dataclass
@@ -54,3 +75,88 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+class TaskLogs:
+    """
+    Task logs kept per limit_id, oldest first, along with the total weight logged for each limit. This way the
+    capacity used by a RateLimit is known without going through the logs of every other limit.
+    Tasks of the same limit are expected to be appended in timestamp order.
+    """
+
+    def __init__(self, task_logs: Optional[Iterable[TaskLog]] = None):
+        self._logs: Dict[str, Deque[TaskLog]] = defaultdict(deque)
+        self._weights: Dict[str, int] = defaultdict(int)
+        self._pending_weights: Dict[str, Dict[ThrottlePriority, int]] = defaultdict(lambda: defaultdict(int))
+        for task in task_logs or []:
+            self.append(task)
+
+    def __len__(self) -> int:
+        return sum(len(logs) for logs in self._logs.values())
+
+    def __iter__(self) -> Iterator[TaskLog]:
+        for logs in list(self._logs.values()):
+            yield from logs
+
+    def append(self, task: TaskLog):
+        limit_id: str = task.rate_limit.limit_id
+        self._logs[limit_id].append(task)
+        self._weights[limit_id] += task.weight
+
+    def capacity_used(self, limit_id: str) -> int:
+        return self._weights.get(limit_id, 0)
+
+    def add_pending(self, limit_id: str, priority: ThrottlePriority, weight: int):
+        """
+        Registers the weight of a task waiting for capacity on the limit
+        """
+        self._pending_weights[limit_id][priority] += weight
+
+    def remove_pending(self, limit_id: str, priority: ThrottlePriority, weight: int):
+        pending_weights: Dict[ThrottlePriority, int] = self._pending_weights[limit_id]
+        pending_weights[priority] -= weight
+        if pending_weights[priority] <= 0:
+            del pending_weights[priority]
+
+    def pending_weight_before(self, limit_id: str, priority: ThrottlePriority) -> int:
+        """
+        Total weight of the tasks waiting for capacity on the limit with a more urgent priority
+        """
+        pending_weights: Optional[Dict[ThrottlePriority, int]] = self._pending_weights.get(limit_id)
+        if not pending_weights:
+            return 0
+        return sum(weight for pending_priority, weight in pending_weights.items() if pending_priority < priority)
+
+    def flush(self, limit_id: str, now: float, safety_margin_pct: float):
+        """
+        Removes the tasks of the limit that are older than the limit time interval (plus the safety margin)
+        """
+        logs: Optional[Deque[TaskLog]] = self._logs.get(limit_id)
+        while logs and now > self.expiration_time(logs[0], safety_margin_pct):
+            self._weights[limit_id] -= logs.popleft().weight
+
+    def flush_all(self, now: float, safety_margin_pct: float):
+        for limit_id in list(self._logs):
+            self.flush(limit_id, now, safety_margin_pct)
+
+    def release_time(self, limit_id: str, weight: int, limit: int, safety_margin_pct: float) -> Optional[float]:
+        """
+        Returns when enough of the logged tasks will have expired for a task of `weight` to fit within `limit`,
+        or None if it will never fit
+        """
+        if weight > limit:
+            return None
+        weight_to_release: int = self.capacity_used(limit_id) + weight - limit
+        if weight_to_release <= 0:
+            return 0.0
+        for task in self._logs.get(limit_id, ()):
+            weight_to_release -= task.weight
+            if weight_to_release <= 0:
+                return self.expiration_time(task, safety_margin_pct)
+        return None
+
+    @staticmethod
+    def expiration_time(task: TaskLog, safety_margin_pct: float) -> float:
+        # Adding the interval to the timestamp (instead of comparing elapsed times) keeps the result exact enough
+        # for intervals expressed in milliseconds
+        return task.timestamp + task.rate_limit.time_interval * (1 + safety_margin_pct)
@@ -0,0 +1,287 @@
+import asyncio
+import hashlib
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog, TaskLogs
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, where the budgets can't be shared
+    fcntl = None
+
+SHARED_LOG_MAGIC = 0x48425254
+# magic, capacity, head and count (uint32), followed by the total weight logged (int64)
+SHARED_LOG_HEADER_SIZE = 64
+SHARED_LOG_MIN_CAPACITY = 64
+SHARED_LOG_MAX_CAPACITY = 1 << 20
+PROCESS_LOCK_RETRY_INTERVAL = 0.001
+
+
+def default_budget_directory() -> str:
+    """
+    Directory of the shared rate limit budgets, in memory (/dev/shm) when the host provides it
+    """
+    base_directory: str = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base_directory, "hummingbot_rate_limits")
+
+
+class SharedLimitLog:
+    """
+    Task logs of a single limit, kept in a memory mapped file as a ring of (timestamp, weight) entries, oldest first.
+    The file is shared by every process using the budget, the callers are expected to hold the budget lock.
+    """
+
+    def __init__(self, path: str, rate_limit: RateLimit):
+        capacity: int = int(min(max(2 * int(rate_limit.limit), SHARED_LOG_MIN_CAPACITY), SHARED_LOG_MAX_CAPACITY))
+        fd: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            created: bool = os.fstat(fd).st_size == 0
+            if created:
+                os.ftruncate(fd, SHARED_LOG_HEADER_SIZE + capacity * 16)
+            self._mmap: mmap.mmap = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+
+        self._header: np.ndarray = np.ndarray((4,), dtype=np.uint32, buffer=self._mmap, offset=0)
+        self._total_weight: np.ndarray = np.ndarray((1,), dtype=np.int64, buffer=self._mmap, offset=16)
+        if created:
+            self._header[:] = (SHARED_LOG_MAGIC, capacity, 0, 0)
+        elif self._header[0] != SHARED_LOG_MAGIC:
+            raise ValueError(f"{path} is not a rate limit budget file.")
+        capacity = int(self._header[1])
+        self._timestamps: np.ndarray = np.ndarray(
+            (capacity,), dtype=np.float64, buffer=self._mmap, offset=SHARED_LOG_HEADER_SIZE)
+        self._weights: np.ndarray = np.ndarray(
+            (capacity,), dtype=np.int64, buffer=self._mmap, offset=SHARED_LOG_HEADER_SIZE + capacity * 8)
+        self.rate_limit: RateLimit = rate_limit
+
+    def __len__(self) -> int:
+        return int(self._header[3])
+
+    def __iter__(self) -> Iterator[TaskLog]:
+        capacity, head, count = (int(value) for value in self._header[1:4])
+        for index in range(count):
+            position: int = (head + index) % capacity
+            yield TaskLog(timestamp=float(self._timestamps[position]),
+                          rate_limit=self.rate_limit,
+                          weight=int(self._weights[position]))
+
+    @property
+    def capacity_used(self) -> int:
+        return int(self._total_weight[0])
+
+    def append(self, timestamp: float, weight: int):
+        capacity, head, count = (int(value) for value in self._header[1:4])
+        if count == capacity:
+            # Only happens when the processes sharing the budget use much larger limits than the one that created
+            # the file. The oldest task is forgotten rather than growing a file other processes have mapped.
+            self._total_weight[0] -= self._weights[head]
+            head = (head + 1) % capacity
+            count -= 1
+        position: int = (head + count) % capacity
+        self._timestamps[position] = timestamp
+        self._weights[position] = weight
+        self._total_weight[0] += weight
+        self._header[2] = head
+        self._header[3] = count + 1
+
+    def flush(self, now: float, safety_margin_pct: float):
+        capacity, head, count = (int(value) for value in self._header[1:4])
+        interval: float = self.rate_limit.time_interval * (1 + safety_margin_pct)
+        released: int = 0
+        while count > 0 and now > self._timestamps[head] + interval:
+            released += int(self._weights[head])
+            head = (head + 1) % capacity
+            count -= 1
+        if released > 0:
+            self._total_weight[0] -= released
+            self._header[2] = head
+            self._header[3] = count
+
+    def release_time(self, weight_to_release: int, safety_margin_pct: float) -> Optional[float]:
+        capacity, head, count = (int(value) for value in self._header[1:4])
+        for index in range(count):
+            position: int = (head + index) % capacity
+            weight_to_release -= int(self._weights[position])
+            if weight_to_release <= 0:
+                return float(self._timestamps[position]) + self.rate_limit.time_interval * (1 + safety_margin_pct)
+        return None
+
+    def close(self):
+        self._header = self._total_weight = self._timestamps = self._weights = None
+        self._mmap.close()
+
+
+class SharedTaskLogs(TaskLogs):
+    """
+    TaskLogs shared by all the processes using the same budget directory (i.e. several bots trading with the same API
+    key), so the capacity used is the combined consumption of all of them.
+    Each limit is logged in its own memory mapped file, the file name being a digest of the limit_id. Only the
+    pending weights of the waiting tasks stay local to the process: shared ones would be left behind by a process
+    that is killed while its tasks wait, holding back the capacity of the others for good.
+    """
+
+    def __init__(self, budget_path: str, rate_limits: Optional[List[RateLimit]] = None):
+        if fcntl is None:
+            raise NotImplementedError("Shared rate limit budgets (rate_limits_budget_name) rely on POSIX file locks "
+                                      "and are not supported on this platform.")
+        super().__init__()
+        self._budget_path: str = budget_path
+        os.makedirs(budget_path, exist_ok=True)
+        self._lock_fd: int = os.open(os.path.join(budget_path, "budget.lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        self._limit_logs: Dict[str, SharedLimitLog] = {}
+        self.set_rate_limits(rate_limits or [])
+
+    @property
+    def budget_path(self) -> str:
+        return self._budget_path
+
+    @contextmanager
+    def process_lock(self):
+        """
+        Excludes the other processes using the budget while the logs are read and updated, waiting for the lock.
+        Only meant for the setup of the logs, the throttled tasks take the lock with try_acquire_process_lock.
+        """
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            self.release_process_lock()
+
+    def try_acquire_process_lock(self) -> bool:
+        """
+        Takes the lock excluding the other processes using the budget if it is free, without waiting for it
+        """
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def release_process_lock(self):
+        fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        with self.process_lock():
+            for rate_limit in rate_limits:
+                limit_log: Optional[SharedLimitLog] = self._limit_logs.get(rate_limit.limit_id)
+                if limit_log is None:
+                    self._limit_logs[rate_limit.limit_id] = SharedLimitLog(self._limit_file(rate_limit.limit_id),
+                                                                           rate_limit)
+                else:
+                    limit_log.rate_limit = rate_limit
+
+    def close(self):
+        for limit_log in self._limit_logs.values():
+            limit_log.close()
+        self._limit_logs.clear()
+        os.close(self._lock_fd)
+
+    def __len__(self) -> int:
+        return sum(len(limit_log) for limit_log in self._limit_logs.values())
+
+    def __iter__(self) -> Iterator[TaskLog]:
+        for limit_log in list(self._limit_logs.values()):
+            yield from limit_log
+
+    def append(self, task: TaskLog):
+        limit_log: Optional[SharedLimitLog] = self._limit_logs.get(task.rate_limit.limit_id)
+        if limit_log is None:
+            raise KeyError(f"Rate limit {task.rate_limit.limit_id} is not registered in the shared budget.")
+        limit_log.append(task.timestamp, task.weight)
+
+    def capacity_used(self, limit_id: str) -> int:
+        limit_log: Optional[SharedLimitLog] = self._limit_logs.get(limit_id)
+        return 0 if limit_log is None else limit_log.capacity_used
+
+    def flush(self, limit_id: str, now: float, safety_margin_pct: float):
+        limit_log: Optional[SharedLimitLog] = self._limit_logs.get(limit_id)
+        if limit_log is not None:
+            limit_log.flush(now, safety_margin_pct)
+
+    def flush_all(self, now: float, safety_margin_pct: float):
+        for limit_log in self._limit_logs.values():
+            limit_log.flush(now, safety_margin_pct)
+
+    def release_time(self, limit_id: str, weight: int, limit: int, safety_margin_pct: float) -> Optional[float]:
+        if weight > limit:
+            return None
+        weight_to_release: int = self.capacity_used(limit_id) + weight - limit
+        if weight_to_release <= 0:
+            return 0.0
+        limit_log: Optional[SharedLimitLog] = self._limit_logs.get(limit_id)
+        return None if limit_log is None else limit_log.release_time(weight_to_release, safety_margin_pct)
+
+    def _limit_file(self, limit_id: str) -> str:
+        # A digest keeps the file names valid for any limit_id (they are usually URL paths)
+        return os.path.join(self._budget_path, f"{hashlib.sha1(limit_id.encode()).hexdigest()}.limit")
+
+
+class SharedBudgetLock:
+    """
+    Lock of a shared budget: the asyncio.Lock serializes the tasks of this process, the file lock the processes.
+    The file lock is only held while the logs are checked and updated, which takes microseconds. It is taken without
+    blocking the event loop: while another process holds it, the task sleeps and tries again.
+    """
+
+    def __init__(self, task_logs: SharedTaskLogs):
+        self._task_logs: SharedTaskLogs = task_logs
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self._lock.acquire()
+        try:
+            while not self._task_logs.try_acquire_process_lock():
+                await asyncio.sleep(PROCESS_LOCK_RETRY_INTERVAL)
+        except BaseException:
+            self._lock.release()
+            raise
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            self._task_logs.release_process_lock()
+        finally:
+            self._lock.release()
+
+
+class SharedAsyncThrottler(AsyncThrottler):
+    """
+    AsyncThrottler sharing its rate limit budget with the throttlers of the other processes on the host that use the
+    same budget name. Each of them can use the whole limits, as long as their combined consumption stays within them,
+    instead of being allocated a fixed share (see limits_share_percentage).
+    The task logs are timestamped with the monotonic clock, which is the same for every process of the host.
+    (i.e)
+        throttler = SharedAsyncThrottler(rate_limits=CONSTANTS.RATE_LIMITS, budget_name="binance_main_account")
+        async with throttler.execute_task(limit_id=CONSTANTS.ORDER_PATH_URL):
+            ...
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 budget_name: str,
+                 budget_directory: Optional[str] = None,
+                 **kwargs):
+        """
+        :param rate_limits: List of RateLimit(s).
+        :param budget_name: Name of the budget, the throttlers using the same name share their limits
+        :param budget_directory: Directory of the budget files, by default in memory when possible
+        :param kwargs: AsyncThrottler parameters
+        """
+        self._budget_path: str = os.path.join(budget_directory or default_budget_directory(), budget_name)
+        super().__init__(rate_limits=rate_limits, **kwargs)
+        self._lock = SharedBudgetLock(self._task_logs)
+
+    def _create_task_logs(self) -> SharedTaskLogs:
+        return SharedTaskLogs(self._budget_path)
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        self._task_logs.set_rate_limits(self._rate_limits)
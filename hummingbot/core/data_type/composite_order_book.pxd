@@ -1,8 +1,39 @@
 # distutils: language=c++
-from hummingbot.core.data_type.order_book cimport OrderBook
+from libc.stdint cimport int64_t
+from libcpp.set cimport set
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport DepthLevel, OrderBook
+
+
+cdef class CompositeOrderBook
+
+
+cdef class OrderBookLevelListener:
+    cdef:
+        set[double] _watched_bid_prices
+        set[double] _watched_ask_prices
+
+    cdef c_watch_level(self, bint is_bid, double price)
+    cdef c_unwatch_level(self, bint is_bid, double price)
+    cdef c_level_updated(self, bint is_bid, double price, double amount)
+    cdef c_levels_reset(self, CompositeOrderBook order_book)
+
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
+        OrderBookLevelListener _level_listener
+
+    cdef double c_get_level_amount(self, bint is_bid, double price)
+    cdef c_notify_level_listener(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks)
 
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_copy_from(self, OrderBook other)
+    cdef c_swap_books(self, OrderBook other)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef list c_simulate_fills(self, bint is_buy, double amount)
+    cdef DepthLevel c_find_depth(self, bint is_buy, double target, bint is_quote)
+    cdef DepthLevel c_depth_to_price(self, bint is_buy, double price)
@@ -5,12 +5,51 @@ from typing import Iterator
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport (
+    DepthLevel,
+    c_advance_depth_level,
+    c_empty_depth_level,
+    c_include_depth_level,
+)
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+cdef class OrderBookLevelListener:
+    """
+    Notified of the changes to a few price levels of a CompositeOrderBook, e.g. the levels where simulated orders
+    rest. The watched prices are kept in C++ sets so the diffs of the other levels are skipped without touching Python
+    objects.
+    """
+
+    cdef c_watch_level(self, bint is_bid, double price):
+        if is_bid:
+            self._watched_bid_prices.insert(price)
+        else:
+            self._watched_ask_prices.insert(price)
+
+    cdef c_unwatch_level(self, bint is_bid, double price):
+        if is_bid:
+            self._watched_bid_prices.erase(price)
+        else:
+            self._watched_ask_prices.erase(price)
+
+    cdef c_level_updated(self, bint is_bid, double price, double amount):
+        """
+        Called with the new amount of a watched level (0 once removed) after each diff touching it.
+        """
+        pass
+
+    cdef c_levels_reset(self, CompositeOrderBook order_book):
+        """
+        Called after the whole book is replaced (snapshot, copy or swap), the watched levels may all have changed.
+        """
+        pass
+
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
@@ -20,6 +59,62 @@ cdef class CompositeOrderBook(OrderBook):
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
         self._traded_order_book = OrderBook()
+        self._level_listener = None
+
+    @property
+    def level_listener(self) -> OrderBookLevelListener:
+        return self._level_listener
+
+    @level_listener.setter
+    def level_listener(self, OrderBookLevelListener listener):
+        self._level_listener = listener
+
+    cdef double c_get_level_amount(self, bint is_bid, double price):
+        """
+        Amount of the original (not composite) book at exactly price, 0 if there is no such level.
+        """
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = deref(book).find(OrderBookEntry(price, 0, 0))
+        if it == deref(book).end():
+            return 0
+        return deref(it).getAmount()
+
+    def get_level_amount(self, is_bid: bool, price: float) -> float:
+        return self.c_get_level_amount(is_bid, price)
+
+    cdef c_notify_level_listener(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks):
+        cdef:
+            OrderBookLevelListener listener = self._level_listener
+            OrderBookEntry entry
+
+        for entry in bids:
+            if listener._watched_bid_prices.count(entry.getPrice()) > 0:
+                listener.c_level_updated(True, entry.getPrice(), self.c_get_level_amount(True, entry.getPrice()))
+        for entry in asks:
+            if listener._watched_ask_prices.count(entry.getPrice()) > 0:
+                listener.c_level_updated(False, entry.getPrice(), self.c_get_level_amount(False, entry.getPrice()))
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_diffs(self, bids, asks, update_id)
+        if self._level_listener is not None:
+            # The amounts are read back from the book, overlapping entries may have been truncated by the diffs
+            self.c_notify_level_listener(bids, asks)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_snapshot(self, bids, asks, update_id)
+        if self._level_listener is not None:
+            self._level_listener.c_levels_reset(self)
+
+    cdef c_copy_from(self, OrderBook other):
+        OrderBook.c_copy_from(self, other)
+        if self._level_listener is not None:
+            self._level_listener.c_levels_reset(self)
+
+    cdef c_swap_books(self, OrderBook other):
+        OrderBook.c_swap_books(self, other)
+        if self._level_listener is not None:
+            self._level_listener.c_levels_reset(self)
 
     @property
     def traded_order_book(self) -> OrderBook:
@@ -192,3 +287,30 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef list c_simulate_fills(self, bint is_buy, double amount):
+        # The native walk over the C++ sets would skip the recorded fills, so walk the composite entries instead.
+        amount_left = amount
+        retval = []
+        for entry in (self.ask_entries() if is_buy else self.bid_entries()):
+            if entry.amount < amount_left:
+                retval.append(entry)
+                amount_left -= entry.amount
+            else:
+                retval.append(OrderBookRow(entry.price, amount_left, entry.update_id))
+                break
+        return retval
+
+    cdef DepthLevel c_find_depth(self, bint is_buy, double target, bint is_quote):
+        cdef DepthLevel level = c_empty_depth_level()
+        for entry in (self.ask_entries() if is_buy else self.bid_entries()):
+            if c_advance_depth_level(&level, entry.price, entry.amount, target, is_quote):
+                break
+        return level
+
+    cdef DepthLevel c_depth_to_price(self, bint is_buy, double price):
+        cdef DepthLevel level = c_empty_depth_level()
+        for entry in (self.ask_entries() if is_buy else self.bid_entries()):
+            if not c_include_depth_level(&level, is_buy, entry.price, entry.amount, price):
+                break
+        return level
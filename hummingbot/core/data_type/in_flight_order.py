@@ -5,7 +5,7 @@ import math
 import typing
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, NamedTuple, Optional, Tuple
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -112,8 +112,10 @@ class InFlightOrder:
         self.trade_type = trade_type
         self.price = price
         self.amount = amount
-        self.exchange_order_id = exchange_order_id
-        self.current_state = initial_state
+        # Notified of the changes of exchange order id and state, with the previous values, by the order tracker
+        self.update_listener: Optional[Callable[["InFlightOrder", Optional[str], OrderState], None]] = None
+        self._exchange_order_id = exchange_order_id
+        self._current_state = initial_state
         self.leverage = leverage
         self.position = position
 
@@ -161,6 +163,28 @@ class InFlightOrder:
     def __eq__(self, other: object) -> bool:
         return type(self) is type(other) and self.attributes == other.attributes
 
+    @property
+    def exchange_order_id(self) -> Optional[str]:
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id: Optional[str]):
+        previous_exchange_order_id = self._exchange_order_id
+        self._exchange_order_id = exchange_order_id
+        if self.update_listener is not None and previous_exchange_order_id != exchange_order_id:
+            self.update_listener(self, previous_exchange_order_id, self._current_state)
+
+    @property
+    def current_state(self) -> OrderState:
+        return self._current_state
+
+    @current_state.setter
+    def current_state(self, current_state: OrderState):
+        previous_state = self._current_state
+        self._current_state = current_state
+        if self.update_listener is not None and previous_state != current_state:
+            self.update_listener(self, self._exchange_order_id, previous_state)
+
     @property
     def base_asset(self):
         return self.trading_pair.split("-")[0]
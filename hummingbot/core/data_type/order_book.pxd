@@ -1,5 +1,6 @@
 # distutils: language=c++
 
+from libc.math cimport NAN
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
@@ -9,6 +10,51 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+ctypedef struct DepthLevel:
+    # Result of a native depth walk. `price` is the level the walk stopped at (NaN if none), `*_before` are the
+    # cumulative base / quote volumes before that level and `*_after` include it (or the whole side if not found).
+    bint found
+    double price
+    double base_before
+    double quote_before
+    double base_after
+    double quote_after
+
+
+cdef inline DepthLevel c_empty_depth_level() nogil:
+    cdef DepthLevel level
+    level.found = False
+    level.price = NAN
+    level.base_before = level.quote_before = level.base_after = level.quote_after = 0
+    return level
+
+
+cdef inline bint c_advance_depth_level(DepthLevel *level,
+                                       double price,
+                                       double amount,
+                                       double target,
+                                       bint is_quote) nogil:
+    level.base_before = level.base_after
+    level.quote_before = level.quote_after
+    level.base_after += amount
+    level.quote_after += amount * price
+    if (level.quote_after if is_quote else level.base_after) >= target:
+        level.found = True
+        level.price = price
+        return True
+    return False
+
+
+cdef inline bint c_include_depth_level(DepthLevel *level, bint is_buy, double price, double amount, double limit) nogil:
+    if (price > limit) if is_buy else (price < limit):
+        return False
+    level.found = True
+    level.price = price
+    level.base_after += amount
+    level.quote_after += amount * price
+    return True
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -20,16 +66,30 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_cache_enabled
+    cdef bint _depth_cache_valid
+    cdef vector[double] _bid_depth_prices
+    cdef vector[double] _bid_depth_base
+    cdef vector[double] _bid_depth_quote
+    cdef vector[double] _ask_depth_prices
+    cdef vector[double] _ask_depth_base
+    cdef vector[double] _ask_depth_quote
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_copy_from(self, OrderBook other)
+    cdef c_swap_books(self, OrderBook other)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_build_depth_cache(self)
+    cdef DepthLevel c_find_depth(self, bint is_buy, double target, bint is_quote)
+    cdef DepthLevel c_depth_to_price(self, bint is_buy, double price)
+    cdef list c_simulate_fills(self, bint is_buy, double amount)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
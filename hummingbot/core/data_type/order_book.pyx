@@ -4,7 +4,9 @@ import bisect
 import logging
 import time
 from typing import (
+    Any,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -36,6 +38,44 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef inline void _parse_raw_levels(object levels, int64_t update_id, vector[OrderBookEntry] *entries) except *:
+    # Exchange levels are sequences starting with price and amount, either as strings or numbers.
+    for level in levels:
+        entries.push_back(OrderBookEntry(float(level[0]), float(level[1]), update_id))
+
+
+cdef inline size_t _lower_bound(const double *values, size_t size, double target) nogil:
+    # Index of the first cumulative value >= target. NaN targets never match, as in a linear walk.
+    cdef:
+        size_t low = 0
+        size_t high = size
+        size_t mid
+    if target != target:
+        return size
+    while low < high:
+        mid = (low + high) >> 1
+        if values[mid] < target:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+cdef inline size_t _levels_within_price(const double *prices, size_t size, double limit, bint is_buy) nogil:
+    # Number of best-first levels priced at or better than limit (asks ascending, bids descending).
+    cdef:
+        size_t low = 0
+        size_t high = size
+        size_t mid
+    while low < high:
+        mid = (low + high) >> 1
+        if (not (prices[mid] > limit)) if is_buy else (not (prices[mid] < limit)):
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -46,7 +86,7 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, depth_cache=False):
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -55,6 +95,8 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_cache_enabled = depth_cache
+        self._depth_cache_valid = False
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,36 +107,41 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            OrderBookEntry bid
+            OrderBookEntry ask
+
+        # The GIL is released while mutating the C++ sets, so threads maintaining other books keep running.
+        with nogil:
+            # Apply the diffs. Diffs with 0 amounts mean deletion.
+            for bid in bids:
+                result = self._bid_book.find(bid)
+                if result != bid_book_end:
+                    self._bid_book.erase(result)
+                if bid.getAmount() > 0:
+                    self._bid_book.insert(bid)
+            for ask in asks:
+                result = self._ask_book.find(ask)
+                if result != ask_book_end:
+                    self._ask_book.erase(result)
+                if ask.getAmount() > 0:
+                    self._ask_book.insert(ask)
+
+            # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+            truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
 
-        # Apply the diffs. Diffs with 0 amounts mean deletion.
-        for bid in bids:
-            result = self._bid_book.find(bid)
-            if result != bid_book_end:
-                self._bid_book.erase(result)
-            if bid.getAmount() > 0:
-                self._bid_book.insert(bid)
-        for ask in asks:
-            result = self._ask_book.find(ask)
-            if result != ask_book_end:
-                self._ask_book.erase(result)
-            if ask.getAmount() > 0:
-                self._ask_book.insert(ask)
-
-        # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
-        truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
-
-        # Record the current best prices, for faster c_get_price() calls.
-        bid_iterator = self._bid_book.rbegin()
-        ask_iterator = self._ask_book.begin()
-        if bid_iterator != self._bid_book.rend():
-            top_bid = deref(bid_iterator)
-            self._best_bid = top_bid.getPrice()
-        if ask_iterator != self._ask_book.end():
-            top_ask = deref(ask_iterator)
-            self._best_ask = top_ask.getPrice()
+            # Record the current best prices, for faster c_get_price() calls.
+            bid_iterator = self._bid_book.rbegin()
+            ask_iterator = self._ask_book.begin()
+            if bid_iterator != self._bid_book.rend():
+                top_bid = deref(bid_iterator)
+                self._best_bid = top_bid.getPrice()
+            if ask_iterator != self._ask_book.end():
+                top_ask = deref(ask_iterator)
+                self._best_ask = top_ask.getPrice()
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._depth_cache_valid = False
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -104,30 +151,33 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
             OrderBookEntry top_ask
-
-        # Start with an empty order book, and then insert all entries.
-        self._bid_book.clear()
-        self._ask_book.clear()
-        for bid in bids:
-            self._bid_book.insert(bid)
-            if not (bid.getPrice() <= best_bid_price):
-                best_bid_price = bid.getPrice()
-        for ask in asks:
-            self._ask_book.insert(ask)
-            if not (ask.getPrice() >= best_ask_price):
-                best_ask_price = ask.getPrice()
-
-        if self._dex:
-            truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
-            # Record the current best prices, for faster c_get_price() calls.
-            bid_iterator = self._bid_book.rbegin()
-            ask_iterator = self._ask_book.begin()
-            if bid_iterator != self._bid_book.rend():
-                top_bid = deref(bid_iterator)
-                best_bid_price = top_bid.getPrice()
-            if ask_iterator != self._ask_book.end():
-                top_ask = deref(ask_iterator)
-                best_ask_price = top_ask.getPrice()
+            OrderBookEntry bid
+            OrderBookEntry ask
+
+        with nogil:
+            # Start with an empty order book, and then insert all entries.
+            self._bid_book.clear()
+            self._ask_book.clear()
+            for bid in bids:
+                self._bid_book.insert(bid)
+                if not (bid.getPrice() <= best_bid_price):
+                    best_bid_price = bid.getPrice()
+            for ask in asks:
+                self._ask_book.insert(ask)
+                if not (ask.getPrice() >= best_ask_price):
+                    best_ask_price = ask.getPrice()
+
+            if self._dex:
+                truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+                # Record the current best prices, for faster c_get_price() calls.
+                bid_iterator = self._bid_book.rbegin()
+                ask_iterator = self._ask_book.begin()
+                if bid_iterator != self._bid_book.rend():
+                    top_bid = deref(bid_iterator)
+                    best_bid_price = top_bid.getPrice()
+                if ask_iterator != self._ask_book.end():
+                    top_ask = deref(ask_iterator)
+                    best_ask_price = top_ask.getPrice()
 
         # Record the current best prices, for faster c_get_price() calls.
         self._best_bid = best_bid_price
@@ -135,6 +185,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._depth_cache_valid = False
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -161,6 +212,26 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def depth_cache_enabled(self) -> bool:
+        """
+        When enabled, depth queries are answered by binary search over cumulative base / quote volumes that are
+        rebuilt lazily after the book changes. Worth it for books that are queried more often than they are updated.
+        """
+        return self._depth_cache_enabled
+
+    @depth_cache_enabled.setter
+    def depth_cache_enabled(self, value: bool):
+        self._depth_cache_enabled = value
+        self._depth_cache_valid = False
+        if not value:
+            self._bid_depth_prices.clear()
+            self._bid_depth_base.clear()
+            self._bid_depth_quote.clear()
+            self._ask_depth_prices.clear()
+            self._ask_depth_base.clear()
+            self._ask_depth_quote.clear()
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -197,9 +268,64 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: Iterable[Any], asks: Iterable[Any], update_id: int):
+        """
+        Applies diffs straight from the exchange levels, e.g. [["0.0024", "10"], ...], parsing price and amount into
+        C++ entries in a single pass without building OrderBookRow objects. Extra fields in each level are ignored.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        _parse_raw_levels(bids, update_id, &cpp_bids)
+        _parse_raw_levels(asks, update_id, &cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_raw_snapshot(self, bids: Iterable[Any], asks: Iterable[Any], update_id: int):
+        """
+        Snapshot counterpart of apply_raw_diffs.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        _parse_raw_levels(bids, update_id, &cpp_bids)
+        _parse_raw_levels(asks, update_id, &cpp_asks)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
+    cdef c_copy_from(self, OrderBook other):
+        with nogil:
+            self._bid_book = other._bid_book
+            self._ask_book = other._ask_book
+        self._snapshot_uid = other._snapshot_uid
+        self._last_diff_uid = other._last_diff_uid
+        self._best_bid = other._best_bid
+        self._best_ask = other._best_ask
+        self._dex = other._dex
+        self._depth_cache_valid = False
+
+    def copy_from(self, other: OrderBook):
+        """
+        Replaces the price levels of this book with the ones of `other`. Trades and event listeners are kept.
+        """
+        self.c_copy_from(other)
+
+    cdef c_swap_books(self, OrderBook other):
+        self._bid_book.swap(other._bid_book)
+        self._ask_book.swap(other._ask_book)
+        self._snapshot_uid, other._snapshot_uid = other._snapshot_uid, self._snapshot_uid
+        self._last_diff_uid, other._last_diff_uid = other._last_diff_uid, self._last_diff_uid
+        self._best_bid, other._best_bid = other._best_bid, self._best_bid
+        self._best_ask, other._best_ask = other._best_ask, self._best_ask
+        self._depth_cache_valid = other._depth_cache_valid = False
+
+    def swap_books(self, other: OrderBook):
+        """
+        Exchanges the price levels of this book and `other` in constant time. Trades and event listeners are kept.
+        """
+        self.c_swap_books(other)
+
     def apply_pandas_diffs(self, bids_df: pd.DataFrame, asks_df: pd.DataFrame):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id], and a UNIX timestamp index.
@@ -280,32 +406,65 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    def top_levels(self, int depth) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the best `depth` bid and ask levels as (n, 2) float64 arrays of [price, amount], best first.
+        """
+        cdef:
+            size_t max_levels = <size_t>max(depth, 0)
+            np.ndarray[np.float64_t, ndim=2] bids = np.empty((min(max_levels, self._bid_book.size()), 2))
+            np.ndarray[np.float64_t, ndim=2] asks = np.empty((min(max_levels, self._ask_book.size()), 2))
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            Py_ssize_t i
+
+        for i in range(bids.shape[0]):
+            entry = deref(bid_it)
+            bids[i, 0] = entry.getPrice()
+            bids[i, 1] = entry.getAmount()
+            inc(bid_it)
+        for i in range(asks.shape[0]):
+            entry = deref(ask_it)
+            asks[i, 0] = entry.getPrice()
+            asks[i, 1] = entry.getAmount()
+            inc(ask_it)
+        return bids, asks
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
-        retval = []
-        for ask_entry in self.ask_entries():
-            ask_entry = ask_entry
-            if ask_entry.amount < amount_left:
-                retval.append(ask_entry)
-                amount_left -= ask_entry.amount
-            else:
-                retval.append(OrderBookRow(ask_entry.price, amount_left, ask_entry.update_id))
-                amount_left = 0.0
-                break
-        return retval
+        return self.c_simulate_fills(True, amount)
 
     def simulate_sell(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
-        retval = []
-        for bid_entry in self.bid_entries():
-            bid_entry = bid_entry
-            if bid_entry.amount < amount_left:
-                retval.append(bid_entry)
-                amount_left -= bid_entry.amount
-            else:
-                retval.append(OrderBookRow(bid_entry.price, amount_left, bid_entry.update_id))
-                amount_left = 0.0
-                break
+        return self.c_simulate_fills(False, amount)
+
+    cdef list c_simulate_fills(self, bint is_buy, double amount):
+        cdef:
+            double amount_left = amount
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            list retval = []
+
+        if is_buy:
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                if entry.getAmount() < amount_left:
+                    retval.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+                    amount_left -= entry.getAmount()
+                else:
+                    retval.append(OrderBookRow(entry.getPrice(), amount_left, entry.getUpdateId()))
+                    break
+                inc(ask_it)
+        else:
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                if entry.getAmount() < amount_left:
+                    retval.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+                    amount_left -= entry.getAmount()
+                else:
+                    retval.append(OrderBookRow(entry.getPrice(), amount_left, entry.getUpdateId()))
+                    break
+                inc(bid_it)
         return retval
 
     cdef double c_get_price(self, bint is_buy) except? -1:
@@ -318,144 +477,188 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
-    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+    cdef c_build_depth_cache(self):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-
-        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
-
-    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            double cumulative_base = 0
+            double cumulative_quote = 0
+
+        self._bid_depth_prices.clear()
+        self._bid_depth_base.clear()
+        self._bid_depth_quote.clear()
+        self._ask_depth_prices.clear()
+        self._ask_depth_base.clear()
+        self._ask_depth_quote.clear()
+        self._bid_depth_prices.reserve(self._bid_book.size())
+        self._bid_depth_base.reserve(self._bid_book.size())
+        self._bid_depth_quote.reserve(self._bid_book.size())
+        self._ask_depth_prices.reserve(self._ask_book.size())
+        self._ask_depth_base.reserve(self._ask_book.size())
+        self._ask_depth_quote.reserve(self._ask_book.size())
+
+        while ask_it != self._ask_book.end():
+            entry = deref(ask_it)
+            cumulative_base += entry.getAmount()
+            cumulative_quote += entry.getAmount() * entry.getPrice()
+            self._ask_depth_prices.push_back(entry.getPrice())
+            self._ask_depth_base.push_back(cumulative_base)
+            self._ask_depth_quote.push_back(cumulative_quote)
+            inc(ask_it)
+
+        cumulative_base = cumulative_quote = 0
+        while bid_it != self._bid_book.rend():
+            entry = deref(bid_it)
+            cumulative_base += entry.getAmount()
+            cumulative_quote += entry.getAmount() * entry.getPrice()
+            self._bid_depth_prices.push_back(entry.getPrice())
+            self._bid_depth_base.push_back(cumulative_base)
+            self._bid_depth_quote.push_back(cumulative_quote)
+            inc(bid_it)
+
+        self._depth_cache_valid = True
+
+    cdef DepthLevel c_find_depth(self, bint is_buy, double target, bint is_quote):
+        """
+        Walks the book from the best price until the cumulative base (or quote, if is_quote) volume reaches target.
+        Uses the prefix sum cache in O(log n) when enabled, otherwise walks the C++ sets directly in O(k).
+        """
         cdef:
-            double total_cost = 0
-            double total_volume = 0
-            double result_vwap = NaN
+            DepthLevel level = c_empty_depth_level()
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            vector[double] *prices
+            vector[double] *cumulative_base
+            vector[double] *cumulative_quote
+            vector[double] *cumulative_target
+            size_t size
+            size_t index
+
+        if self._depth_cache_enabled:
+            if not self._depth_cache_valid:
+                self.c_build_depth_cache()
+            prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+            cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+            cumulative_target = cumulative_quote if is_quote else cumulative_base
+            size = deref(prices).size()
+            if size == 0:
+                return level
+            index = _lower_bound(deref(cumulative_target).data(), size, target)
+            if index < size:
+                level.found = True
+                level.price = deref(prices)[index]
+                level.base_after = deref(cumulative_base)[index]
+                level.quote_after = deref(cumulative_quote)[index]
+                if index > 0:
+                    level.base_before = deref(cumulative_base)[index - 1]
+                    level.quote_before = deref(cumulative_quote)[index - 1]
+            else:
+                level.base_after = level.base_before = deref(cumulative_base)[size - 1]
+                level.quote_after = level.quote_before = deref(cumulative_quote)[size - 1]
+            return level
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                if c_advance_depth_level(&level, entry.getPrice(), entry.getAmount(), target, is_quote):
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                if c_advance_depth_level(&level, entry.getPrice(), entry.getAmount(), target, is_quote):
                     break
+                inc(bid_it)
+        return level
 
-        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
-
-    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+    cdef DepthLevel c_depth_to_price(self, bint is_buy, double price):
+        """
+        Accumulates the levels priced at or better than price: asks up to it when buying, bids down to it when selling.
+        """
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            DepthLevel level = c_empty_depth_level()
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            vector[double] *prices
+            size_t count
+
+        if self._depth_cache_enabled:
+            if not self._depth_cache_valid:
+                self.c_build_depth_cache()
+            prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            count = _levels_within_price(deref(prices).data(), deref(prices).size(), price, is_buy)
+            if count > 0:
+                level.found = True
+                level.price = deref(prices)[count - 1]
+                if is_buy:
+                    level.base_after = self._ask_depth_base[count - 1]
+                    level.quote_after = self._ask_depth_quote[count - 1]
+                else:
+                    level.base_after = self._bid_depth_base[count - 1]
+                    level.quote_after = self._bid_depth_quote[count - 1]
+            return level
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                if not c_include_depth_level(&level, is_buy, entry.getPrice(), entry.getAmount(), price):
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                if not c_include_depth_level(&level, is_buy, entry.getPrice(), entry.getAmount(), price):
                     break
+                inc(bid_it)
+        return level
 
-        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef DepthLevel level = self.c_find_depth(is_buy, volume, False)
+        return OrderBookQueryResult(NaN, volume, level.price, min(level.base_after, volume))
 
-    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
-            double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
+            DepthLevel level = self.c_find_depth(is_buy, volume, False)
+            double incremental_amount
+            double total_volume
+
+        if not level.found:
+            return OrderBookQueryResult(NaN, volume, NaN, min(level.base_after, volume))
+        incremental_amount = volume - level.base_before
+        total_volume = level.base_before + incremental_amount
+        return OrderBookQueryResult(NaN,
+                                    volume,
+                                    (level.quote_before + incremental_amount * level.price) / total_volume,
+                                    min(total_volume, volume))
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef DepthLevel level = self.c_find_depth(is_buy, quote_volume, True)
+        return OrderBookQueryResult(NaN, quote_volume, level.price, min(level.quote_after, quote_volume))
 
-        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef DepthLevel level = self.c_find_depth(is_buy, base_amount, False)
+        if not level.found:
+            return OrderBookQueryResult(NaN, base_amount, NaN, level.quote_after)
+        return OrderBookQueryResult(NaN,
+                                    base_amount,
+                                    NaN,
+                                    level.quote_before + (base_amount - level.base_before) * level.price)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
-        cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        cdef DepthLevel level = self.c_depth_to_price(is_buy, price)
+        return OrderBookQueryResult(price, NaN, level.price, level.base_after)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
-        cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        cdef DepthLevel level = self.c_depth_to_price(is_buy, price)
+        return OrderBookQueryResult(price, NaN, level.price, level.quote_after)
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -475,9 +678,20 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
+    def restore_from_snapshot_and_diffs(self,
+                                        snapshot: OrderBookMessage,
+                                        diffs: List[OrderBookMessage],
+                                        raw_levels: bool = False):
+        """
+        :param raw_levels: if True, the messages content levels are loaded with apply_raw_snapshot / apply_raw_diffs
+        """
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
-        for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+        if raw_levels:
+            self.apply_raw_snapshot(snapshot.content["bids"], snapshot.content["asks"], snapshot.update_id)
+            for diff in replay_diffs:
+                self.apply_raw_diffs(diff.content["bids"], diff.content["asks"], diff.update_id)
+        else:
+            self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+            for diff in replay_diffs:
+                self.apply_diffs(diff.bids, diff.asks, diff.update_id)
@@ -1,7 +1,8 @@
-from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -12,28 +13,69 @@ class OrderBookMessageType(Enum):
     TRADE = 3
 
 
+_NOT_PARSED = object()
+
+
 @total_ordering
-class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp")):
+class OrderBookMessage:
+    """
+    Order book snapshot, diff or trade message. The update id, trading pair and price levels are read from the
+    content only once, on first access, and kept in the message. The content must not be modified afterwards.
+    Levels are kept as (n, 2) float64 arrays of [price, amount].
+    """
+    __slots__ = (
+        "type",
+        "content",
+        "timestamp",
+        "_update_id",
+        "_trading_pair",
+        "_bids_array",
+        "_asks_array",
+        "_bids",
+        "_asks",
+    )
+
     type: OrderBookMessageType
-    content: Dict[str, any]
+    content: Dict[str, Any]
     timestamp: float
 
     def __new__(
         cls,
         message_type: OrderBookMessageType,
-        content: Dict[str, any],
+        content: Dict[str, Any],
         timestamp: Optional[float] = None,
         *args,
         **kwargs,
     ):
-        return super(OrderBookMessage, cls).__new__(cls, message_type, content, timestamp, *args, **kwargs)
+        # Fields are set in __new__ (and not in __init__) because subclasses adjust the arguments in their own __new__
+        message = super(OrderBookMessage, cls).__new__(cls)
+        message.type = message_type
+        message.content = content
+        message.timestamp = timestamp
+        message._update_id = _NOT_PARSED
+        message._trading_pair = _NOT_PARSED
+        message._bids_array = None
+        message._asks_array = None
+        message._bids = None
+        message._asks = None
+        return message
+
+    def __reduce__(self):
+        return self.__class__, (self.type, self.content, self.timestamp)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(type={self.type!r}, content={self.content!r}, timestamp={self.timestamp!r})"
 
     @property
     def update_id(self) -> int:
-        if self.type in [OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT]:
-            return self.content["update_id"]
-        else:
-            return -1
+        update_id = self._update_id
+        if update_id is _NOT_PARSED:
+            if self.type is OrderBookMessageType.DIFF or self.type is OrderBookMessageType.SNAPSHOT:
+                update_id = self.content["update_id"]
+            else:
+                update_id = -1
+            self._update_id = update_id
+        return update_id
 
     @property
     def first_update_id(self) -> int:
@@ -50,48 +92,67 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
 
     @property
     def trading_pair(self) -> str:
-        return self.content["trading_pair"]
+        trading_pair = self._trading_pair
+        if trading_pair is _NOT_PARSED:
+            trading_pair = self._trading_pair = self.content["trading_pair"]
+        return trading_pair
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        if self._asks_array is None:
+            self._asks_array = self._levels_array(self.content["asks"])
+        return self._asks_array
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        if self._bids_array is None:
+            self._bids_array = self._levels_array(self.content["bids"])
+        return self._bids_array
 
     @property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        if self._asks is None:
+            self._asks = self._levels_rows(self.asks_array)
+        return self._asks
 
     @property
     def bids(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
-        ]
+        if self._bids is None:
+            self._bids = self._levels_rows(self.bids_array)
+        return self._bids
 
     @property
     def has_update_id(self) -> bool:
-        return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
+        return self.type is OrderBookMessageType.DIFF or self.type is OrderBookMessageType.SNAPSHOT
 
     @property
     def has_trade_id(self) -> bool:
-        return self.type == OrderBookMessageType.TRADE
+        return self.type is OrderBookMessageType.TRADE
+
+    @staticmethod
+    def _levels_array(levels: List[Any]) -> np.ndarray:
+        return np.array([(price, amount) for price, amount, *trash in levels], dtype=np.float64).reshape(-1, 2)
+
+    def _levels_rows(self, levels: np.ndarray) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount in levels.tolist()]
 
     def __eq__(self, other: "OrderBookMessage") -> bool:
-        eq = (
-            (self.type == other.type)
-            and (
-                (self.has_update_id and (self.update_id == other.update_id))
-                or (self.trade_id == other.trade_id)
-            )
-        )
-        return eq
+        if self.type != other.type:
+            return False
+        if self.has_update_id:
+            return self.update_id == other.update_id
+        return self.trade_id == other.trade_id
 
     def __hash__(self):
-        return hash(self.type, self.update_id, self.trade_id)
+        return hash((self.type, self.update_id, self.trade_id))
 
     def __lt__(self, other: "OrderBookMessage") -> bool:
-        eq = (
-            (self.has_update_id and other.has_update_id and self.update_id < other.update_id)
-            or (self.has_trade_id and other.has_trade_id and self.trade_id < other.trade_id)
-            or (
-                ((self.timestamp != other.timestamp) and self.timestamp < other.timestamp)
-                or self.has_update_id  # if same timestamp, order book messages < trade messages.
-            )
-        )
-        return eq
+        if self.has_update_id and other.has_update_id:
+            return self.update_id < other.update_id
+        if self.has_trade_id and other.has_trade_id:
+            return self.trade_id < other.trade_id
+        if self.timestamp != other.timestamp:
+            return self.timestamp < other.timestamp
+        # if same timestamp, order book messages < trade messages.
+        return self.has_update_id and not other.has_update_id
@@ -1,10 +1,13 @@
 import asyncio
 import logging
+import queue
+import threading
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, NamedTuple, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
@@ -12,7 +15,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +24,39 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookTrackerRoutingMode(Enum):
+    # One message queue and tracking task per trading pair
+    PER_PAIR = 1
+    # Messages are applied by the routers themselves, without any intermediate queue
+    INLINE = 2
+    # A fixed pool of tracking tasks, each one owning the trading pairs assigned to it by hash
+    SHARDED = 3
+    # A dedicated thread applies the messages to private copies of the order books. The order books exposed by the
+    # tracker are swapped with those copies on the event loop (in constant time), at most once per batch of messages.
+    THREADED = 4
+
+
+class OrderBookView(NamedTuple):
+    """
+    Immutable top of the order book, safe to read at any time. Bids and asks are (n, 2) float64 arrays of
+    [price, amount], best first.
+    """
+    trading_pair: str
+    update_id: int
+    best_bid: float
+    best_ask: float
+    bids: np.ndarray
+    asks: np.ndarray
+    timestamp: float
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Snapshots requested at the same time while initializing the order books. The requests themselves are paced by
+    # the connector throttler, so this only caps the number of in-flight requests.
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
+    # Maximum number of queued messages processed in one go by the INLINE and SHARDED routing modes
+    MAX_MESSAGES_BATCH_SIZE: int = 100
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +65,24 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 routing_mode: OrderBookTrackerRoutingMode = OrderBookTrackerRoutingMode.PER_PAIR,
+                 shards_count: int = 4,
+                 view_depth: int = 20):
+        """
+        :param routing_mode: how the diff and snapshot messages reach the order books (see OrderBookTrackerRoutingMode)
+        :param shards_count: number of tracking tasks used in SHARDED routing mode
+        :param view_depth: number of price levels per side kept in the order book views
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        self._order_book_initialization_times: Dict[str, float] = {}
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +92,25 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._routing_mode: OrderBookTrackerRoutingMode = routing_mode
+        self._shard_message_queues: List[asyncio.Queue] = (
+            [asyncio.Queue() for _ in range(shards_count)]
+            if routing_mode is OrderBookTrackerRoutingMode.SHARDED
+            else []
+        )
+        self._shard_tasks: List[asyncio.Task] = []
+        self._order_book_lags: Dict[str, float] = {}
+        self._view_depth: int = view_depth
+        self._order_book_views: Dict[str, OrderBookView] = {}
+        self._worker_order_books: Dict[str, OrderBook] = {}
+        self._worker_order_book_locks: Dict[str, threading.Lock] = {}
+        self._swapped_trading_pairs: Set[str] = set()
+        self._worker_message_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker_stop_event: threading.Event = threading.Event()
+        self._worker_thread: Optional[threading.Thread] = None
+        self._updated_trading_pairs: Set[str] = set()
+        self._updated_trading_pairs_lock: threading.Lock = threading.Lock()
+        self._order_books_sync_scheduled: bool = False
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +134,61 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order book is already initialized, even if the tracker as a whole is not ready yet
+        """
+        return [trading_pair for trading_pair, event in self._order_book_ready_events.items() if event.is_set()]
+
+    @property
+    def order_book_initialization_times(self) -> Dict[str, float]:
+        """
+        Seconds it took for each trading pair order book to be ready, measured from the start of the initialization
+        """
+        return self._order_book_initialization_times
+
+    @property
+    def routing_mode(self) -> OrderBookTrackerRoutingMode:
+        return self._routing_mode
+
+    @property
+    def message_queue_sizes(self) -> Dict[str, int]:
+        """
+        Number of messages waiting in each tracker queue: the diff and snapshot streams, and then each trading pair
+        queue (PER_PAIR routing), each shard queue (SHARDED routing) or the worker thread queue (THREADED routing)
+        """
+        queue_sizes = {
+            "diff_stream": self._order_book_diff_stream.qsize(),
+            "snapshot_stream": self._order_book_snapshot_stream.qsize(),
+        }
+        if self._routing_mode is OrderBookTrackerRoutingMode.PER_PAIR:
+            queue_sizes.update({trading_pair: queue.qsize()
+                                for trading_pair, queue in self._tracking_message_queues.items()})
+        elif self._routing_mode is OrderBookTrackerRoutingMode.THREADED:
+            queue_sizes["worker"] = self._worker_message_queue.qsize()
+        else:
+            queue_sizes.update({f"shard_{index}": queue.qsize()
+                                for index, queue in enumerate(self._shard_message_queues)})
+        return queue_sizes
+
+    @property
+    def order_book_lags(self) -> Dict[str, float]:
+        """
+        Seconds between the timestamp of the last message applied to each order book and the moment it was applied
+        """
+        return self._order_book_lags
+
+    def get_order_book_view(self, trading_pair: str) -> Optional[OrderBookView]:
+        """
+        Returns a consistent view of the top of the order book. In THREADED routing mode it is the view published by
+        the worker thread with its last batch of messages, in the other modes it is built from the current order book.
+        """
+        if self._routing_mode is OrderBookTrackerRoutingMode.THREADED:
+            return self._order_book_views.get(trading_pair)
+        order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+        return None if order_book is None else self._order_book_view(trading_pair, order_book)
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -104,6 +225,18 @@ class OrderBookTracker:
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
+        self._shard_tasks = [safe_ensure_future(self._track_shard(shard_queue))
+                             for shard_queue in self._shard_message_queues]
+        if self._routing_mode is OrderBookTrackerRoutingMode.THREADED:
+            self._worker_message_queue = queue.SimpleQueue()
+            self._worker_stop_event = threading.Event()
+            self._worker_thread = threading.Thread(
+                target=self._track_order_books_in_thread,
+                args=(self._worker_message_queue, self._worker_stop_event),
+                name="OrderBookTracker",
+                daemon=True,
+            )
+            self._worker_thread.start()
 
     def stop(self):
         if self._init_order_books_task is not None:
@@ -137,11 +270,29 @@ class OrderBookTracker:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._shard_tasks:
+            task.cancel()
+        self._shard_tasks.clear()
+        if self._worker_thread is not None:
+            self._worker_stop_event.set()
+            # Wakes the thread up if it is waiting for messages
+            self._worker_message_queue.put(None)
+            self._worker_thread = None
+        self._worker_order_books.clear()
+        self._swapped_trading_pairs.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_ready_events.values():
+            event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_book_ready_events and self._order_book_ready_events[trading_pair].is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_ready_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -174,16 +325,49 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books. Snapshots are requested concurrently (the connector throttler keeps them within the
+        exchange rate limits) and each order book is tracked and marked as ready as soon as its snapshot arrives.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        self._order_book_initialization_times.clear()
+        start_time = time.perf_counter()
+        snapshot_requests_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+        await safe_gather(*[
+            self._init_order_book(trading_pair=trading_pair,
+                                  snapshot_requests_semaphore=snapshot_requests_semaphore,
+                                  start_time=start_time)
+            for trading_pair in self._trading_pairs
+        ])
+        self._order_books_initialized.set()
+
+    async def _init_order_book(self, trading_pair: str, snapshot_requests_semaphore: asyncio.Semaphore, start_time: float):
+        async with snapshot_requests_semaphore:
+            order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+        self._order_books[trading_pair] = order_book
+        if self._routing_mode is OrderBookTrackerRoutingMode.PER_PAIR:
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
-        self._order_books_initialized.set()
+        elif self._routing_mode is OrderBookTrackerRoutingMode.THREADED:
+            worker_order_book: OrderBook = OrderBook()
+            worker_order_book.copy_from(order_book)
+            saved_messages = self._saved_message_queues[trading_pair]
+            while len(saved_messages) > 0:
+                self._apply_tracked_message(saved_messages.popleft(), worker_order_book)
+            order_book.copy_from(worker_order_book)
+            self._order_book_views[trading_pair] = self._order_book_view(trading_pair, worker_order_book)
+            self._worker_order_book_locks[trading_pair] = threading.Lock()
+            # Registered last, the worker thread only gets messages for the trading pair from now on
+            self._worker_order_books[trading_pair] = worker_order_book
+        else:
+            if self._routing_mode is OrderBookTrackerRoutingMode.SHARDED:
+                self._tracking_message_queues[trading_pair] = self._shard_message_queues[
+                    hash(trading_pair) % len(self._shard_message_queues)]
+            saved_messages = self._saved_message_queues[trading_pair]
+            while len(saved_messages) > 0:
+                self._apply_tracked_message(saved_messages.popleft())
+        self._order_book_initialization_times[trading_pair] = time.perf_counter() - start_time
+        self._order_book_ready_events[trading_pair].set()
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self._order_book_initialization_times)}/{len(self._trading_pairs)} completed.")
 
     async def _order_book_diff_router(self):
         """
@@ -197,22 +381,26 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
-
-                if trading_pair not in self._tracking_message_queues:
-                    messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-                await message_queue.put(ob_message)
-                messages_accepted += 1
+                batch_size: int = 1
+                while True:
+                    trading_pair: str = ob_message.trading_pair
+
+                    if not self._is_tracking(trading_pair):
+                        messages_queued += 1
+                        # Save diff messages received before snapshots are ready
+                        self._saved_message_queues[trading_pair].append(ob_message)
+                    # Check the order book's initial update ID. If it's larger, don't bother.
+                    elif self._order_books[trading_pair].snapshot_uid > ob_message.update_id:
+                        messages_rejected += 1
+                    else:
+                        await self._route_tracked_message(trading_pair, ob_message)
+                        messages_accepted += 1
+
+                    # Keep draining the messages already received, without going back to the event loop
+                    if batch_size >= self.MAX_MESSAGES_BATCH_SIZE or self._order_book_diff_stream.empty():
+                        break
+                    ob_message = self._order_book_diff_stream.get_nowait()
+                    batch_size += 1
 
                 # Log some statistics.
                 now: float = time.time()
@@ -243,21 +431,34 @@ class OrderBookTracker:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
                 trading_pair: str = ob_message.trading_pair
-                if trading_pair not in self._tracking_message_queues:
+                if not self._is_tracking(trading_pair):
                     continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                await message_queue.put(ob_message)
+                await self._route_tracked_message(trading_pair, ob_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
-    async def _track_single_book(self, trading_pair: str):
-        past_diffs_window = self._past_diffs_windows[trading_pair]
+    def _is_tracking(self, trading_pair: str) -> bool:
+        if self._routing_mode is OrderBookTrackerRoutingMode.INLINE:
+            return self.is_order_book_ready(trading_pair)
+        if self._routing_mode is OrderBookTrackerRoutingMode.THREADED:
+            return trading_pair in self._worker_order_books
+        return trading_pair in self._tracking_message_queues
+
+    async def _route_tracked_message(self, trading_pair: str, message: OrderBookMessage):
+        if self._routing_mode is OrderBookTrackerRoutingMode.PER_PAIR:
+            await self._tracking_message_queues[trading_pair].put(message)
+        elif self._routing_mode is OrderBookTrackerRoutingMode.SHARDED:
+            self._tracking_message_queues[trading_pair].put_nowait(message)
+        elif self._routing_mode is OrderBookTrackerRoutingMode.THREADED:
+            self._worker_message_queue.put(message)
+        else:
+            self._apply_tracked_message(message)
 
+    async def _track_single_book(self, trading_pair: str):
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
@@ -271,9 +472,8 @@ class OrderBookTracker:
                 else:
                     message = await message_queue.get()
 
+                self._apply_order_book_message(message)
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -282,9 +482,6 @@ class OrderBookTracker:
                         self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +492,136 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    async def _track_shard(self, message_queue: asyncio.Queue):
+        """
+        Applies the messages of all the trading pairs assigned to one shard (SHARDED routing mode).
+        """
+        while True:
+            message: OrderBookMessage = await message_queue.get()
+            self._apply_tracked_message(message)
+            batch_size: int = 1
+            while batch_size < self.MAX_MESSAGES_BATCH_SIZE and not message_queue.empty():
+                self._apply_tracked_message(message_queue.get_nowait())
+                batch_size += 1
+
+    def _track_order_books_in_thread(self, message_queue: queue.SimpleQueue, stop_event: threading.Event):
+        """
+        Worker thread of the THREADED routing mode. Applies the messages in batches to the worker order books, then
+        publishes the views of the updated order books and schedules their synchronization on the event loop.
+        """
+        while not stop_event.is_set():
+            messages: List[Optional[OrderBookMessage]] = [message_queue.get()]
+            while len(messages) < self.MAX_MESSAGES_BATCH_SIZE and not message_queue.empty():
+                messages.append(message_queue.get_nowait())
+            if stop_event.is_set():
+                break
+
+            updated_trading_pairs: Set[str] = set()
+            for message in messages:
+                if message is None:
+                    continue
+                trading_pair: str = message.trading_pair
+                worker_order_book: Optional[OrderBook] = self._worker_order_books.get(trading_pair)
+                if worker_order_book is None:
+                    continue
+                with self._worker_order_book_locks[trading_pair]:
+                    self._refresh_worker_order_book(trading_pair, worker_order_book)
+                    self._apply_tracked_message(message, worker_order_book)
+                updated_trading_pairs.add(trading_pair)
+
+            if len(updated_trading_pairs) > 0:
+                try:
+                    self._publish_worker_order_books(updated_trading_pairs)
+                except Exception:
+                    self.logger().error("Unexpected error publishing the order books.", exc_info=True)
+
+    def _publish_worker_order_books(self, trading_pairs: Set[str]):
+        for trading_pair in trading_pairs:
+            worker_order_book: Optional[OrderBook] = self._worker_order_books.get(trading_pair)
+            if worker_order_book is not None:
+                with self._worker_order_book_locks[trading_pair]:
+                    self._refresh_worker_order_book(trading_pair, worker_order_book)
+                    self._order_book_views[trading_pair] = self._order_book_view(trading_pair, worker_order_book)
+        with self._updated_trading_pairs_lock:
+            self._updated_trading_pairs.update(trading_pairs)
+            if self._order_books_sync_scheduled:
+                return
+            self._order_books_sync_scheduled = True
+        self._ev_loop.call_soon_threadsafe(self._sync_order_books)
+
+    def _sync_order_books(self):
+        """
+        Runs in the event loop. Swaps the worker order books updated since the last call with the tracker ones, the
+        worker thread brings the (now outdated) worker order books up to date before using them again.
+        """
+        with self._updated_trading_pairs_lock:
+            trading_pairs: Set[str] = self._updated_trading_pairs
+            self._updated_trading_pairs = set()
+            self._order_books_sync_scheduled = False
+        for trading_pair in trading_pairs:
+            worker_order_book: Optional[OrderBook] = self._worker_order_books.get(trading_pair)
+            if worker_order_book is None:
+                continue
+            lock: threading.Lock = self._worker_order_book_locks[trading_pair]
+            # If the worker thread is updating the order book it will publish it again, no need to wait for it
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                if trading_pair not in self._swapped_trading_pairs:
+                    self._order_books[trading_pair].swap_books(worker_order_book)
+                    self._swapped_trading_pairs.add(trading_pair)
+            finally:
+                lock.release()
+
+    def _refresh_worker_order_book(self, trading_pair: str, worker_order_book: OrderBook):
+        # Runs in the worker thread holding the order book lock. The copy releases the GIL.
+        if trading_pair in self._swapped_trading_pairs:
+            worker_order_book.copy_from(self._order_books[trading_pair])
+            self._swapped_trading_pairs.discard(trading_pair)
+
+    def _order_book_view(self, trading_pair: str, order_book: OrderBook) -> OrderBookView:
+        bids, asks = order_book.top_levels(self._view_depth)
+        return OrderBookView(
+            trading_pair=trading_pair,
+            update_id=max(order_book.snapshot_uid, order_book.last_diff_uid),
+            best_bid=float(bids[0, 0]) if len(bids) > 0 else float("nan"),
+            best_ask=float(asks[0, 0]) if len(asks) > 0 else float("nan"),
+            bids=bids,
+            asks=asks,
+            timestamp=time.time(),
+        )
+
+    def _apply_tracked_message(self, message: OrderBookMessage, order_book: Optional[OrderBook] = None):
+        # Errors are contained to the message, the other trading pairs sharing the task should not be delayed
+        try:
+            self._apply_order_book_message(message, order_book)
+        except Exception:
+            self.logger().network(
+                f"Unexpected error tracking order book for {message.trading_pair}.",
+                exc_info=True,
+                app_warning_msg="Unexpected error tracking order book."
+            )
+
+    def _apply_order_book_message(self, message: OrderBookMessage, order_book: Optional[OrderBook] = None):
+        trading_pair: str = message.trading_pair
+        order_book = self._order_books[trading_pair] if order_book is None else order_book
+        past_diffs_window: Deque[OrderBookMessage] = self._past_diffs_windows[trading_pair]
+        raw_levels: bool = self._data_source.RAW_ORDER_BOOK_LEVELS
+
+        if message.type is OrderBookMessageType.DIFF:
+            if raw_levels:
+                order_book.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
+            else:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+            past_diffs_window.append(message)
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+            order_book.restore_from_snapshot_and_diffs(message, past_diffs, raw_levels=raw_levels)
+        else:
+            return
+        if message.timestamp is not None:
+            self._order_book_lags[trading_pair] = time.time() - message.timestamp
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -5,6 +5,8 @@ from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional
 
+from hummingbot.core.api_throttler.async_throttler_base import throttler_priority
+from hummingbot.core.api_throttler.data_types import ThrottlePriority
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
@@ -13,6 +15,9 @@ from hummingbot.logger import HummingbotLogger
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # Data sources whose snapshot and diff messages keep the exchange levels as [price, amount, ...] sequences in
+    # content["bids"] / content["asks"] can enable this to have them parsed straight into the order book
+    RAW_ORDER_BOOK_LEVELS = False
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -62,9 +67,14 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
 
         :return: a local copy of the current order book in the exchange
         """
-        snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
+        with throttler_priority(ThrottlePriority.MARKET_DATA):
+            snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
         order_book: OrderBook = self.order_book_create_function()
-        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        if self.RAW_ORDER_BOOK_LEVELS:
+            order_book.apply_raw_snapshot(
+                snapshot_msg.content["bids"], snapshot_msg.content["asks"], snapshot_msg.update_id)
+        else:
+            order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
     async def listen_for_subscriptions(self):
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class PlaceOrderResult:
+    update_timestamp: float
+    client_order_id: str
+    exchange_order_id: Optional[str]
+    trading_pair: str
+    misc_updates: Dict[str, Any] = field(default_factory=lambda: {})
+    exception: Optional[Exception] = None
+
+
+@dataclass
+class CancelOrderResult:
+    client_order_id: str
+    trading_pair: str
+    misc_updates: Dict[str, Any] = field(default_factory=lambda: {})
+    not_found: bool = False
+    exception: Optional[Exception] = None
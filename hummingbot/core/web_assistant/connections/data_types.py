@@ -4,7 +4,8 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 import aiohttp
-import ujson
+
+from hummingbot.core.web_assistant.json_codec import json_dumps, json_loads
 
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
@@ -73,7 +74,7 @@ class EndpointRESTRequest(RESTRequest, ABC):
     def _ensure_data(self):
         if self.method == RESTMethod.POST:
             if self.data is not None:
-                self.data = ujson.dumps(self.data)
+                self.data = json_dumps(self.data)
         elif self.data is not None:
             raise ValueError("The `data` field should be used only for POST requests. Use `params` instead.")
 
@@ -109,7 +110,7 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=json_loads)
         return json_
 
     async def text(self) -> str:
@@ -7,6 +7,7 @@ import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.json_codec import json_dumps, json_loads
 
 
 class WSConnection:
@@ -133,7 +134,7 @@ class WSConnection:
         self._last_recv_time = time.time()
 
     async def _send_json(self, payload: Mapping[str, Any]):
-        await self._connection.send_json(payload)
+        await self._connection.send_json(payload, dumps=json_dumps)
 
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
@@ -147,7 +148,7 @@ class WSConnection:
             data = msg.data
         else:
             try:
-                data = msg.json()
+                data = msg.json(loads=json_loads)
             except JSONDecodeError:
                 data = msg.data
         response = WSResponse(data)
@@ -0,0 +1,103 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Type, Union
+
+import ujson
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, ujson is used instead
+    orjson = None
+
+
+class JSONCodec(ABC):
+    """
+    Encodes the request payloads and decodes the responses of the web assistants.
+    The codecs produce the same data as the standard library, only faster. Whatever the fast library rejects (i.e.
+    integers beyond 64 bits, NaN) is handled by the standard library, so the errors raised are its errors too
+    (TypeError when encoding, json.JSONDecodeError when decoding).
+    """
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        ...
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        ...
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class UJSONCodec(JSONCodec):
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return ujson.dumps(obj, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return ujson.loads(data)
+        except ValueError:
+            return json.loads(data)
+
+
+class ORJSONCodec(JSONCodec):
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+
+JSON_CODECS: Dict[str, Type[JSONCodec]] = {
+    codec.name: codec for codec in (StdlibJSONCodec, UJSONCodec, ORJSONCodec)
+}
+
+_json_codec: JSONCodec = ORJSONCodec() if orjson is not None else UJSONCodec()
+
+
+def get_json_codec() -> JSONCodec:
+    return _json_codec
+
+
+def set_json_codec(codec: Union[str, JSONCodec]):
+    """
+    Sets the codec used by the web assistants, either an instance or the name of one of the JSON_CODECS
+    """
+    global _json_codec
+    if isinstance(codec, str):
+        if codec not in JSON_CODECS:
+            raise ValueError(f"Unknown JSON codec {codec}. Available codecs: {', '.join(JSON_CODECS)}")
+        if codec == ORJSONCodec.name and orjson is None:
+            raise ValueError("The orjson codec requires the orjson package to be installed.")
+        codec = JSON_CODECS[codec]()
+    _json_codec = codec
+
+
+def json_dumps(obj: Any) -> str:
+    return _json_codec.dumps(obj)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    return _json_codec.loads(data)
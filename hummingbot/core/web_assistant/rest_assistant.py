@@ -1,12 +1,13 @@
 import json
 from asyncio import wait_for
-from copy import deepcopy
+from copy import copy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.json_codec import json_dumps, json_loads
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
@@ -58,7 +59,7 @@ class RESTAssistant:
         # response_json = await response.json()
         text = await response.text()
         try:
-            response_json = json.loads(text)
+            response_json = json_loads(text)
         except json.JSONDecodeError:
             print("Invalid JSON:", text)
             response_json = None
@@ -84,7 +85,7 @@ class RESTAssistant:
 
         local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        data = json_dumps(data) if data is not None else data
 
         request = RESTRequest(
             method=method,
@@ -108,13 +109,25 @@ class RESTAssistant:
             return response
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
+        if self._rest_pre_processors or (self._auth is not None and request.is_auth_required):
+            # The pre-processors and the auth update the request, the one of the caller is left untouched
+            request = self._copy_request(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         resp = await wait_for(self._connection.call(request), timeout)
         resp = await self._post_process_response(resp)
         return resp
 
+    @staticmethod
+    def _copy_request(request: RESTRequest) -> RESTRequest:
+        # The containers are the only mutable fields, the data is usually serialized already
+        request = copy(request)
+        request.params = copy(request.params)
+        request.headers = copy(request.headers)
+        if not isinstance(request.data, (str, bytes)):
+            request.data = copy(request.data)
+        return request
+
     async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
         for pre_processor in self._rest_pre_processors:
             request = await pre_processor.pre_process(request)
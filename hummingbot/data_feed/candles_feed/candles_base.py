@@ -15,6 +15,7 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
@@ -57,6 +58,7 @@ class CandlesBase(NetworkBase):
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         self._ws_candle_available = asyncio.Event()
         self._ping_timeout = None
+        self._candles_store: Optional[CandlesStore] = None
         if interval in self.intervals.keys():
             self.interval = interval
         else:
@@ -148,6 +150,16 @@ class CandlesBase(NetworkBase):
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
 
+    @property
+    def candles_store(self) -> Optional[CandlesStore]:
+        return self._candles_store
+
+    def set_candles_store(self, candles_store: Optional[CandlesStore]):
+        """
+        Sets the local store used to cache the historical candles, and to fill the candles at startup.
+        """
+        self._candles_store = candles_store
+
     def load_candles_from_csv(self, data_path: str):
         """
         This method loads the candles from a CSV file.
@@ -162,25 +174,15 @@ class CandlesBase(NetworkBase):
         self._candles.extendleft(df.values.tolist())
 
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
+        """
+        Returns the candles between the start and end times of the config. With a candles store, only the ranges
+        missing from the store are fetched, and the candles returned are a view of the stored ones.
+        """
         try:
             await self.initialize_exchange_data()
-            current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
-            current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                candles = await self.fetch_candles(start_time=current_start_time,
-                                                   end_time=current_end_time,
-                                                   limit=missing_records)
-                if len(candles) <= 1 or missing_records == 0:
-                    break
-                candles = candles[candles[:, 0] <= current_end_time]
-                current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
+            if self._candles_store is not None:
+                return await self._get_historical_candles_from_store(config)
+            candles_df = await self._fetch_historical_candles(config.start_time, config.end_time)
             candles_df = candles_df[
                 (candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
             return candles_df
@@ -191,6 +193,48 @@ class CandlesBase(NetworkBase):
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
             raise e
 
+    async def _fetch_historical_candles(self, start_time: int, end_time: int) -> pd.DataFrame:
+        candles_df = pd.DataFrame()
+        current_end_time = self._round_timestamp_to_interval_multiple(end_time)
+        current_start_time = self._round_timestamp_to_interval_multiple(start_time)
+        while current_end_time >= current_start_time:
+            missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
+            candles = await self.fetch_candles(start_time=current_start_time,
+                                               end_time=current_end_time,
+                                               limit=missing_records)
+            if len(candles) <= 1 or missing_records == 0:
+                break
+            candles = candles[candles[:, 0] <= current_end_time]
+            current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
+            fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
+            candles_df = pd.concat([fetched_candles_df, candles_df])
+            candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
+            candles_df.reset_index(drop=True, inplace=True)
+            self.check_candles_sorted_and_equidistant(candles_df.values)
+        return candles_df
+
+    async def _get_historical_candles_from_store(self, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        interval_in_seconds = self.interval_in_seconds
+        start_time = self._round_timestamp_to_interval_multiple(config.start_time)
+        end_time = self._round_timestamp_to_interval_multiple(config.end_time)
+        # The last candle is still open, it is fetched again the next time
+        last_closed_candle_time = self._round_timestamp_to_interval_multiple(self._time()) - interval_in_seconds
+        for missing_start, missing_end in self._candles_store.missing_ranges(
+                self.name, self.interval, interval_in_seconds, start_time, end_time):
+            # One more candle is requested before the range, the exchanges need at least two to fetch a range
+            candles_df = await self._fetch_historical_candles(missing_start - interval_in_seconds, missing_end)
+            candles = candles_df.values.astype(float) if len(candles_df) > 0 else np.empty((0, len(self.columns)))
+            fetched_range = (missing_start, min(missing_end, last_closed_candle_time))
+            if not self._are_candles_sorted_and_equidistant(candles):
+                self.logger().warning(f"The candles fetched for {self.name} between {missing_start} and {missing_end} "
+                                      f"are not sorted or not equidistant. They will be fetched again.")
+                fetched_range = None
+            self._candles_store.store_candles(self.name, self.interval, interval_in_seconds, candles, fetched_range)
+        candles = self._candles_store.get_candles(self.name, self.interval, config.start_time, config.end_time)
+        if len(candles) == 0:
+            return pd.DataFrame(columns=self.columns, dtype=float)
+        return pd.DataFrame(candles, columns=self.columns, copy=False)
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
@@ -210,6 +254,12 @@ class CandlesBase(NetworkBase):
             self._reset_candles()
             return
 
+    def _are_candles_sorted_and_equidistant(self, candles: np.ndarray) -> bool:
+        if len(candles) <= 1:
+            return True
+        timestamp_steps = np.diff(candles[:, 0])
+        return bool(np.all(timestamp_steps == self.interval_in_seconds))
+
     def _reset_candles(self):
         self._ws_candle_available.clear()
         self._candles.clear()
@@ -325,12 +375,18 @@ class CandlesBase(NetworkBase):
         while not self.ready:
             await self._ws_candle_available.wait()
             try:
+                if self._candles_store is not None:
+                    self._fill_historical_candles_from_store()
+                    if self.ready:
+                        break
                 end_time = self._round_timestamp_to_interval_multiple(self._candles[0][0])
                 missing_records = self._candles.maxlen - len(self._candles)
                 candles: np.ndarray = await self.fetch_candles(end_time=end_time, limit=missing_records)
                 candles = candles[candles[:, 0] < end_time]
                 records_to_add = min(missing_records, len(candles))
                 self._candles.extendleft(candles[-records_to_add:][::-1])
+                if self._candles_store is not None and self._are_candles_sorted_and_equidistant(candles):
+                    self._candles_store.store_candles(self.name, self.interval, self.interval_in_seconds, candles)
             except asyncio.CancelledError:
                 raise
             except ValueError:
@@ -342,6 +398,22 @@ class CandlesBase(NetworkBase):
                 await self._sleep(1.0)
         self.check_candles_sorted_and_equidistant(self._candles)
 
+    def _fill_historical_candles_from_store(self):
+        """
+        Adds the stored candles that directly precede the oldest candle of the _candles deque.
+        """
+        end_time = self._round_timestamp_to_interval_multiple(self._candles[0][0]) - self.interval_in_seconds
+        missing_records = self._candles.maxlen - len(self._candles)
+        start_time = end_time - (missing_records - 1) * self.interval_in_seconds
+        candles = self._candles_store.get_candles(self.name, self.interval, start_time, end_time)
+        if len(candles) == 0:
+            return
+        # Only the candles contiguous with the deque are used, the older ones are fetched after a gap
+        expected_timestamps = end_time - self.interval_in_seconds * np.arange(len(candles))[::-1]
+        mismatches = np.nonzero(candles[:, 0] != expected_timestamps)[0]
+        contiguous_candles = candles[mismatches[-1] + 1:] if len(mismatches) > 0 else candles
+        self._candles.extendleft(contiguous_candles[::-1].tolist())
+
     async def listen_for_subscriptions(self):
         """
         Connects to the candlestick websocket endpoint and listens to the messages sent by the
@@ -0,0 +1,161 @@
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+CANDLES_FILE_NAME = "candles.npy"
+RANGES_FILE_NAME = "ranges.json"
+
+
+class CandlesStore:
+    """
+    Persistent local cache of the candles fetched from the exchanges, shared by the backtests and the live candles
+    feeds.
+
+    The candles of each feed (e.g. binance_BTC-USDT) and interval are kept in a single array sorted by timestamp, saved
+    as a numpy file under <base_path>/<feed name>/<interval>/, and served as slices of the memory-mapped file, without
+    copying. The ranges of timestamps already fetched are saved with them, so that only the missing ranges are fetched
+    again (including the ranges where the exchange has no candles).
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    def __init__(self, base_path: Optional[str] = None):
+        self._base_path = base_path or os.path.join(data_path(), "candles")
+        self._candles: Dict[Tuple[str, str], np.ndarray] = {}
+        self._ranges: Dict[Tuple[str, str], List[List[int]]] = {}
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @property
+    def base_path(self) -> str:
+        return self._base_path
+
+    def get_candles(self, feed_name: str, interval: str, start_time: float, end_time: float) -> np.ndarray:
+        """
+        Returns the stored candles with a timestamp between start_time and end_time (both included), as a view of the
+        memory-mapped file. The file is mapped copy-on-write for each call: the caller can write into the candles, the
+        pages written are copied without changing the file or the candles returned to the other callers.
+        """
+        path = os.path.join(self._directory(feed_name, interval), CANDLES_FILE_NAME)
+        if not os.path.exists(path):
+            return np.empty((0, 0))
+        candles = np.load(path, mmap_mode="c")
+        timestamps = candles[:, 0]
+        first_index = np.searchsorted(timestamps, start_time, side="left")
+        last_index = np.searchsorted(timestamps, end_time, side="right")
+        return candles[first_index:last_index]
+
+    def missing_ranges(self,
+                       feed_name: str,
+                       interval: str,
+                       interval_in_seconds: int,
+                       start_time: int,
+                       end_time: int) -> List[Tuple[int, int]]:
+        """
+        Returns the ranges of candle timestamps between start_time and end_time (both included, multiples of the
+        interval) that were never fetched.
+        """
+        missing = []
+        current_start = start_time
+        for range_start, range_end in self._load_ranges(feed_name, interval):
+            if range_end < current_start:
+                continue
+            if range_start > end_time:
+                break
+            if range_start > current_start:
+                missing.append((current_start, range_start - interval_in_seconds))
+            current_start = max(current_start, range_end + interval_in_seconds)
+        if current_start <= end_time:
+            missing.append((current_start, end_time))
+        return missing
+
+    def store_candles(self,
+                      feed_name: str,
+                      interval: str,
+                      interval_in_seconds: int,
+                      candles: np.ndarray,
+                      fetched_range: Optional[Tuple[int, int]] = None):
+        """
+        Merges the candles with the stored ones (the new candles replace the stored candles with the same timestamp).
+
+        :param fetched_range: the range of timestamps the candles were fetched for, recorded as complete so that it is
+        not fetched again. None if the candles are not known to be complete for any range.
+        """
+        if len(candles) > 0:
+            stored_candles = self._load_candles(feed_name, interval)
+            if stored_candles is not None and len(stored_candles) > 0:
+                all_candles = np.concatenate([np.asarray(candles, dtype=np.float64), stored_candles])
+            else:
+                all_candles = np.asarray(candles, dtype=np.float64)
+            # np.unique keeps the first occurrence of each timestamp, i.e. the new candle, and sorts them
+            _, unique_indexes = np.unique(all_candles[:, 0], return_index=True)
+            self._write_candles(feed_name, interval, all_candles[unique_indexes])
+        if fetched_range is not None and fetched_range[0] <= fetched_range[1]:
+            ranges = self._load_ranges(feed_name, interval) + [list(fetched_range)]
+            self._write_ranges(feed_name, interval, self._merge_ranges(ranges, interval_in_seconds))
+
+    def _directory(self, feed_name: str, interval: str) -> str:
+        return os.path.join(self._base_path, feed_name, interval)
+
+    def _load_candles(self, feed_name: str, interval: str) -> Optional[np.ndarray]:
+        key = (feed_name, interval)
+        if key not in self._candles:
+            path = os.path.join(self._directory(feed_name, interval), CANDLES_FILE_NAME)
+            if not os.path.exists(path):
+                return None
+            self._candles[key] = np.load(path, mmap_mode="r")
+        return self._candles[key]
+
+    def _load_ranges(self, feed_name: str, interval: str) -> List[List[int]]:
+        key = (feed_name, interval)
+        if key not in self._ranges:
+            path = os.path.join(self._directory(feed_name, interval), RANGES_FILE_NAME)
+            ranges = []
+            if os.path.exists(path):
+                try:
+                    with open(path) as ranges_file:
+                        ranges = json.load(ranges_file)
+                except ValueError:
+                    self.logger().warning(f"The candles ranges file {path} is malformed. The ranges will be fetched "
+                                          f"again.")
+            self._ranges[key] = ranges
+        return list(self._ranges[key])
+
+    def _write_candles(self, feed_name: str, interval: str, candles: np.ndarray):
+        directory = self._directory(feed_name, interval)
+        os.makedirs(directory, exist_ok=True)
+        temp_path = os.path.join(directory, f".{CANDLES_FILE_NAME}")
+        with open(temp_path, "wb") as candles_file:
+            np.save(candles_file, candles)
+        # The arrays already mapped keep the previous file, the next reads map the new one
+        os.replace(temp_path, os.path.join(directory, CANDLES_FILE_NAME))
+        self._candles.pop((feed_name, interval), None)
+
+    def _write_ranges(self, feed_name: str, interval: str, ranges: List[List[int]]):
+        directory = self._directory(feed_name, interval)
+        os.makedirs(directory, exist_ok=True)
+        temp_path = os.path.join(directory, f".{RANGES_FILE_NAME}")
+        with open(temp_path, "w") as ranges_file:
+            json.dump(ranges, ranges_file)
+        os.replace(temp_path, os.path.join(directory, RANGES_FILE_NAME))
+        self._ranges[(feed_name, interval)] = ranges
+
+    @staticmethod
+    def _merge_ranges(ranges: List[List[int]], interval_in_seconds: int) -> List[List[int]]:
+        merged = []
+        for range_start, range_end in sorted(ranges):
+            if len(merged) > 0 and range_start <= merged[-1][1] + interval_in_seconds:
+                merged[-1][1] = max(merged[-1][1], range_end)
+            else:
+                merged.append([int(range_start), int(range_end)])
+        return merged
@@ -16,6 +16,7 @@ from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
@@ -30,8 +31,12 @@ class MarketDataProvider:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, connectors: Dict[str, ConnectorBase], rates_update_interval: int = 60):
+    def __init__(self,
+                 connectors: Dict[str, ConnectorBase],
+                 rates_update_interval: int = 60,
+                 candles_store: Optional[CandlesStore] = None):
         self.candles_feeds = {}  # Stores instances of candle feeds
+        self.candles_store = candles_store  # Local cache of the candles, used to fill the candle feeds at startup
         self.connectors = connectors  # Stores instances of connectors
         self._rates_update_task = None
         self._rates_update_interval = rates_update_interval
@@ -141,6 +146,7 @@ class MarketDataProvider:
         else:
             # Create a new feed or restart the existing one with updated max_records
             candle_feed = CandlesFactory.get_candle(config)
+            candle_feed.set_candles_store(self.candles_store)
             self.candles_feeds[key] = candle_feed
             if hasattr(candle_feed, 'start'):
                 candle_feed.start()
@@ -0,0 +1,227 @@
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.logger import HummingbotLogger
+
+BALANCES_PARTITION = "balances"
+CHUNK_EXTENSION = ".npz"
+
+
+def _partition_day(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _write_chunk(directory: str, columns: Dict[str, np.ndarray]):
+    os.makedirs(directory, exist_ok=True)
+    chunk_name = f"{int(columns['timestamp'][0] * 1e3)}"
+    temp_path = os.path.join(directory, f".{chunk_name}.tmp{CHUNK_EXTENSION}")
+    np.savez_compressed(temp_path, **columns)
+    # The chunk becomes visible to the loaders once it is complete
+    os.replace(temp_path, os.path.join(directory, f"{chunk_name}{CHUNK_EXTENSION}"))
+
+
+def _chunk_paths(directory: str, start_timestamp: Optional[float], end_timestamp: Optional[float]) -> Iterator[str]:
+    if not os.path.isdir(directory):
+        return
+    first_day = _partition_day(start_timestamp) if start_timestamp is not None else None
+    last_day = _partition_day(end_timestamp) if end_timestamp is not None else None
+    for day in sorted(os.listdir(directory)):
+        if (first_day is not None and day < first_day) or (last_day is not None and day > last_day):
+            continue
+        day_directory = os.path.join(directory, day)
+        chunk_names = [name for name in os.listdir(day_directory)
+                       if name.endswith(CHUNK_EXTENSION) and not name.startswith(".")]
+        for chunk_name in sorted(chunk_names, key=lambda name: int(name[:-len(CHUNK_EXTENSION)])):
+            yield os.path.join(day_directory, chunk_name)
+
+
+def _filter_by_time(data: pd.DataFrame, start_timestamp: Optional[float], end_timestamp: Optional[float]):
+    if start_timestamp is not None:
+        data = data[data["timestamp"] >= start_timestamp]
+    if end_timestamp is not None:
+        data = data[data["timestamp"] <= end_timestamp]
+    return data.reset_index(drop=True)
+
+
+class ColumnarMarketDataWriter:
+    """
+    Records market data snapshots in compressed columnar files, as an alternative to the `MarketData` table.
+
+    The snapshots are partitioned by exchange, trading pair and (UTC) day, and the balances by exchange and day:
+        <base_path>/<exchange>/<trading_pair>/<YYYY-MM-DD>/<first timestamp in ms>.npz
+        <base_path>/<exchange>/balances/<YYYY-MM-DD>/<first timestamp in ms>.npz
+    The rows are buffered in memory and written as a chunk (one numpy array per column) when `chunk_size` rows are
+    buffered for a partition, when the first row of the next day is appended (writing the previous day partitions),
+    and on `flush`.
+    The order book depth is stored as price and amount matrices of `depth` columns, padded with NaN when the book
+    has fewer levels.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    def __init__(self, base_path: str, depth: int, chunk_size: int = 60):
+        self._base_path = base_path
+        self._depth = depth
+        self._chunk_size = chunk_size
+        self._snapshot_rows: Dict[Tuple[str, str, str], List[tuple]] = defaultdict(list)
+        self._balance_rows: Dict[Tuple[str, str], List[Tuple[float, Dict[str, float]]]] = defaultdict(list)
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @property
+    def base_path(self) -> str:
+        return self._base_path
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def buffered_rows_count(self) -> int:
+        return (sum(len(rows) for rows in self._snapshot_rows.values())
+                + sum(len(rows) for rows in self._balance_rows.values()))
+
+    def append(self,
+               timestamp: float,
+               exchange: str,
+               trading_pair: str,
+               mid_price: float,
+               best_bid: float,
+               best_ask: float,
+               bid_entries: Iterable[OrderBookRow],
+               ask_entries: Iterable[OrderBookRow]):
+        """
+        Buffers a snapshot of the market. Only the first `depth` entries of each side of the book are read.
+        """
+        bids = self._depth_levels(bid_entries)
+        asks = self._depth_levels(ask_entries)
+        partition = (exchange, trading_pair, _partition_day(timestamp))
+        if partition not in self._snapshot_rows:
+            # First snapshot of the day, the previous days of the trading pair are complete
+            for previous_partition in [buffered for buffered in self._snapshot_rows
+                                       if buffered[:2] == partition[:2] and buffered[2] < partition[2]]:
+                self._write_snapshots(previous_partition)
+        self._snapshot_rows[partition].append((timestamp, mid_price, best_bid, best_ask, bids, asks))
+        if len(self._snapshot_rows[partition]) >= self._chunk_size:
+            self._write_snapshots(partition)
+
+    def append_balances(self, timestamp: float, exchange: str, balances: Dict[str, float]):
+        partition = (exchange, _partition_day(timestamp))
+        if partition not in self._balance_rows:
+            for previous_partition in [buffered for buffered in self._balance_rows
+                                       if buffered[0] == exchange and buffered[1] < partition[1]]:
+                self._write_balances(previous_partition)
+        self._balance_rows[partition].append((timestamp, {asset: float(amount) for asset, amount in balances.items()}))
+        if len(self._balance_rows[partition]) >= self._chunk_size:
+            self._write_balances(partition)
+
+    def flush(self):
+        """
+        Writes all the buffered rows.
+        """
+        for partition in list(self._snapshot_rows):
+            self._write_snapshots(partition)
+        for partition in list(self._balance_rows):
+            self._write_balances(partition)
+
+    def _depth_levels(self, entries: Iterable[OrderBookRow]) -> np.ndarray:
+        levels = np.full((2, self._depth), np.nan)
+        for level, entry in enumerate(islice(entries, self._depth)):
+            levels[0, level] = entry.price
+            levels[1, level] = entry.amount
+        return levels
+
+    def _write_snapshots(self, partition: Tuple[str, str, str]):
+        rows = self._snapshot_rows.pop(partition)
+        exchange, trading_pair, day = partition
+        bids = np.stack([row[4] for row in rows])
+        asks = np.stack([row[5] for row in rows])
+        columns = {
+            "timestamp": np.array([row[0] for row in rows], dtype=np.float64),
+            "mid_price": np.array([row[1] for row in rows], dtype=np.float64),
+            "best_bid": np.array([row[2] for row in rows], dtype=np.float64),
+            "best_ask": np.array([row[3] for row in rows], dtype=np.float64),
+            "bid_price": bids[:, 0, :],
+            "bid_amount": bids[:, 1, :],
+            "ask_price": asks[:, 0, :],
+            "ask_amount": asks[:, 1, :],
+        }
+        self._write(os.path.join(self._base_path, exchange, trading_pair, day), columns)
+
+    def _write_balances(self, partition: Tuple[str, str]):
+        rows = self._balance_rows.pop(partition)
+        exchange, day = partition
+        assets = sorted({asset for _, balances in rows for asset in balances})
+        columns = {
+            "timestamp": np.array([row[0] for row in rows], dtype=np.float64),
+            "assets": np.array(assets, dtype=np.str_),
+            "balances": np.array([[balances.get(asset, np.nan) for asset in assets] for _, balances in rows],
+                                 dtype=np.float64).reshape(len(rows), len(assets)),
+        }
+        self._write(os.path.join(self._base_path, exchange, BALANCES_PARTITION, day), columns)
+
+    def _write(self, directory: str, columns: Dict[str, np.ndarray]):
+        try:
+            _write_chunk(directory, columns)
+        except Exception:
+            self.logger().error(f"Error writing market data to {directory}.", exc_info=True)
+
+
+def load_market_data(base_path: str,
+                     exchange: str,
+                     trading_pair: str,
+                     start_timestamp: Optional[float] = None,
+                     end_timestamp: Optional[float] = None) -> pd.DataFrame:
+    """
+    Loads the market data snapshots recorded by `ColumnarMarketDataWriter` for a trading pair. Only the day partitions
+    in the time range are read.
+
+    :return: a DataFrame with the timestamp, mid_price, best_bid and best_ask columns, and the bid_price_<level>,
+    bid_amount_<level>, ask_price_<level> and ask_amount_<level> columns of the depth levels
+    """
+    chunks = []
+    for chunk_path in _chunk_paths(os.path.join(base_path, exchange, trading_pair), start_timestamp, end_timestamp):
+        with np.load(chunk_path) as chunk:
+            columns = {name: chunk[name] for name in ("timestamp", "mid_price", "best_bid", "best_ask")}
+            for side in ("bid", "ask"):
+                prices, amounts = chunk[f"{side}_price"], chunk[f"{side}_amount"]
+                for level in range(prices.shape[1]):
+                    columns[f"{side}_price_{level}"] = prices[:, level]
+                    columns[f"{side}_amount_{level}"] = amounts[:, level]
+        chunks.append(pd.DataFrame(columns))
+    if len(chunks) == 0:
+        return pd.DataFrame(columns=["timestamp", "mid_price", "best_bid", "best_ask"])
+    return _filter_by_time(pd.concat(chunks, ignore_index=True), start_timestamp, end_timestamp)
+
+
+def load_balances(base_path: str,
+                  exchange: str,
+                  start_timestamp: Optional[float] = None,
+                  end_timestamp: Optional[float] = None) -> pd.DataFrame:
+    """
+    Loads the balances recorded by `ColumnarMarketDataWriter` for an exchange.
+
+    :return: a DataFrame with the timestamp column and one column per asset
+    """
+    chunks = []
+    for chunk_path in _chunk_paths(os.path.join(base_path, exchange, BALANCES_PARTITION), start_timestamp,
+                                   end_timestamp):
+        with np.load(chunk_path) as chunk:
+            data = pd.DataFrame(chunk["balances"], columns=list(chunk["assets"]))
+            data.insert(0, "timestamp", chunk["timestamp"])
+        chunks.append(data)
+    if len(chunks) == 0:
+        return pd.DataFrame(columns=["timestamp"])
+    return _filter_by_time(pd.concat(chunks, ignore_index=True), start_timestamp, end_timestamp)
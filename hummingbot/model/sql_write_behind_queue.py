@@ -0,0 +1,193 @@
+import atexit
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Hashable, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+WriteOperation = Callable[[Session], None]
+
+
+class SQLWriteBehindQueue:
+    """
+    Writes the operations put in the queue to the database from a dedicated thread, in batches committed in a single
+    transaction. A batch is written when it reaches `max_batch_size` operations, or at most `flush_interval` seconds
+    after its first operation was queued. Operations put with a key replace the pending operation with the same key
+    (i.e. only the last state of a record is written).
+Operations can also be put with the models they write, so that a reader can wait for the pending writes of the
+records it reads only.
+    The operations are written in the order they were queued. If a batch fails, its operations are written again one
+    by one, so that a failing operation doesn't prevent the others from being recorded.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    def __init__(self,
+                 sql_manager: SQLConnectionManager,
+                 flush_interval: float = 1.0,
+                 max_batch_size: int = 500,
+                 max_latency_samples: int = 100):
+        self._sql_manager = sql_manager
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._condition = threading.Condition()
+        self._pending_operations: "OrderedDict[Hashable, WriteOperation]" = OrderedDict()
+        self._operation_ids = itertools.count()
+        self._queued_count = 0
+        self._written_count = 0
+        self._last_queued_count_by_model: Dict[type, int] = {}
+        self._flush_requested_count = 0
+        self._is_stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._commit_latencies: Deque[float] = deque(maxlen=max_latency_samples)
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Returns the number of operations waiting to be written
+        """
+        with self._condition:
+            return len(self._pending_operations)
+
+    @property
+    def commit_latency(self) -> Dict[str, float]:
+        """
+        Returns the number of batches measured, and the last, mean and max durations of their commits (in seconds)
+        """
+        latencies = list(self._commit_latencies)
+        if len(latencies) == 0:
+            return {}
+        return {
+            "batches": len(latencies),
+            "last": latencies[-1],
+            "mean": sum(latencies) / len(latencies),
+            "max": max(latencies),
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+        self._is_stopping = False
+        self._thread = threading.Thread(target=self._write_until_stopped, name="SQLWriteBehindQueue", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Writes the pending operations and stops the writer thread.
+        """
+        atexit.unregister(self.stop)
+        if self.is_running:
+            with self._condition:
+                self._is_stopping = True
+                self._condition.notify_all()
+            self._thread.join(timeout)
+        self._thread = None
+        # Operations queued while stopping, or when the queue was never started
+        self._write_pending_operations()
+
+    def put(self, operation: WriteOperation, key: Optional[Hashable] = None, models: Iterable[type] = ()):
+        """
+        Queues the operation, called with the session of the batch transaction from the writer thread.
+
+        :param operation: the write operation
+        :param key: replaces the pending operation queued with the same key, if any
+        :param models: the models of the records written by the operation, to flush them with `flush(models=...)`
+        """
+        with self._condition:
+            if key is None:
+                key = (SQLWriteBehindQueue, next(self._operation_ids))
+            else:
+                self._pending_operations.pop(key, None)
+            self._pending_operations[key] = operation
+            self._queued_count += 1
+            for model in models:
+                self._last_queued_count_by_model[model] = self._queued_count
+            if len(self._pending_operations) == 1 or len(self._pending_operations) >= self._max_batch_size:
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None, models: Optional[Iterable[type]] = None) -> bool:
+        """
+        Waits until the operations queued so far are written. This blocks the calling thread while the writer thread
+        commits them.
+
+        :param models: waits only for the operations queued so far with any of these models (and the operations
+            queued before them), or returns immediately if none is pending
+        :return: False if the operations were not written before the timeout
+        """
+        with self._condition:
+            if models is None:
+                target_count = self._queued_count
+            else:
+                target_count = max((self._last_queued_count_by_model.get(model, 0) for model in models), default=0)
+            if target_count <= self._written_count:
+                return True
+        if not self.is_running:
+            self._write_pending_operations()
+            return True
+        with self._condition:
+            self._flush_requested_count = max(self._flush_requested_count, target_count)
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._written_count >= target_count, timeout)
+
+    def _write_until_stopped(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: len(self._pending_operations) > 0 or self._is_stopping)
+                deadline = time.monotonic() + self._flush_interval
+                while (len(self._pending_operations) < self._max_batch_size
+                       and self._flush_requested_count <= self._written_count
+                       and not self._is_stopping):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._is_stopping and len(self._pending_operations) == 0:
+                    return
+            self._write_pending_operations()
+
+    def _write_pending_operations(self):
+        with self._condition:
+            operations: List[WriteOperation] = list(self._pending_operations.values())
+            self._pending_operations.clear()
+            batch_count = self._queued_count
+        if len(operations) > 0:
+            self._write_batch(operations)
+        with self._condition:
+            self._written_count = max(self._written_count, batch_count)
+            self._condition.notify_all()
+
+    def _write_batch(self, operations: List[WriteOperation]):
+        start = time.perf_counter()
+        try:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    for operation in operations:
+                        operation(session)
+        except Exception:
+            self.logger().warning(f"Failed to write a batch of {len(operations)} records. "
+                                  f"Writing them one by one.", exc_info=True)
+            for operation in operations:
+                try:
+                    with self._sql_manager.get_new_session() as session:
+                        with session.begin():
+                            operation(session)
+                except Exception:
+                    self.logger().error("Failed to write a record to the database.", exc_info=True)
+        self._commit_latencies.append(time.perf_counter() - start)
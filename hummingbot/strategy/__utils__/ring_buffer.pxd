@@ -8,13 +8,26 @@ cdef class RingBuffer:
         int64_t _delimiter
         int64_t _length
         bint _is_full
+        double _mean
+        double _sum_of_squared_deviations
+        double _sum_of_squared_diffs
+        int64_t _non_finite_count
+        bint _is_statistics_stale
 
+    cdef void c_reset(self, int64_t length)
     cdef void c_add_value(self, float val)
     cdef void c_increment_delimiter(self)
     cdef double c_get_last_value(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
+    cdef int64_t c_size(self)
+    cdef double c_sum(self)
+    cdef double c_sum_of_squared_deviations(self)
+    cdef double c_sum_of_squared_diffs(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
+    cdef void c_update_statistics(self, double value)
+    cdef void c_compute_statistics(self)
+    cdef tuple c_get_segments(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
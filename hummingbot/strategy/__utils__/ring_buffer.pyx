@@ -1,11 +1,18 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, NAN, sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last values added. The sum, the sum of squared deviations from the mean (Welford) and
+    the sum of squared differences between consecutive values are updated as values come and go, and computed again
+    from the values once per turn of the buffer to keep the rounding errors from accumulating.
+    """
+
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,18 +20,83 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int64_t length):
+        self.c_reset(length)
+
+    def __dealloc__(self):
+        self._buffer = None
+
+    cdef void c_reset(self, int64_t length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
-
-    def __dealloc__(self):
-        self._buffer = None
+        self._mean = 0
+        self._sum_of_squared_deviations = 0
+        self._sum_of_squared_diffs = 0
+        self._non_finite_count = 0
+        self._is_statistics_stale = False
 
     cdef void c_add_value(self, float val):
+        self.c_update_statistics(val)
         self._buffer[self._delimiter] = val
         self.c_increment_delimiter()
+        if self._is_full and self._delimiter == 0 and not self._is_statistics_stale:
+            self.c_compute_statistics()
+
+    cdef void c_update_statistics(self, double value):
+        cdef:
+            int64_t size = self.c_size()
+            double removed_value
+            double next_value
+            double last_value
+            double previous_mean
+
+        if not isfinite(value):
+            self._non_finite_count += 1
+            self._is_statistics_stale = True
+        if self._is_full:
+            removed_value = self._buffer[self._delimiter]
+            if not isfinite(removed_value):
+                self._non_finite_count -= 1
+                self._is_statistics_stale = True
+        if self._is_statistics_stale:
+            # Computed again from the values when needed
+            return
+
+        if size > 0:
+            last_value = self._buffer[(self._delimiter - 1) % self._length]
+        if not self._is_full:
+            if size > 0:
+                self._sum_of_squared_diffs += (value - last_value) ** 2
+            previous_mean = self._mean
+            self._mean += (value - previous_mean) / (size + 1)
+            self._sum_of_squared_deviations += (value - previous_mean) * (value - self._mean)
+        elif self._length > 1:
+            next_value = self._buffer[(self._delimiter + 1) % self._length]
+            self._sum_of_squared_diffs += (value - last_value) ** 2 - (next_value - removed_value) ** 2
+            previous_mean = self._mean
+            self._mean += (value - removed_value) / size
+            self._sum_of_squared_deviations += ((value - removed_value)
+                                                * (value - self._mean + removed_value - previous_mean))
+        else:
+            self._mean = value
+
+    cdef void c_compute_statistics(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_array()
+
+        self._non_finite_count = np.count_nonzero(~np.isfinite(values))
+        if self._non_finite_count > 0:
+            self._is_statistics_stale = True
+            return
+        if values.size == 0:
+            self._mean = 0
+            self._sum_of_squared_deviations = 0
+        else:
+            self._mean = values.mean()
+            self._sum_of_squared_deviations = np.square(values - self._mean).sum()
+        self._sum_of_squared_diffs = np.square(np.diff(values)).sum()
+        self._is_statistics_stale = False
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
@@ -42,39 +114,63 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum(self):
+        if self._is_statistics_stale:
+            self.c_compute_statistics()
+            if self._is_statistics_stale:
+                return NAN
+        return self._mean * self.c_size()
+
+    cdef double c_sum_of_squared_deviations(self):
+        if self._is_statistics_stale:
+            self.c_compute_statistics()
+            if self._is_statistics_stale:
+                return NAN
+        return max(self._sum_of_squared_deviations, 0)
+
+    cdef double c_sum_of_squared_diffs(self):
+        if self._is_statistics_stale:
+            self.c_compute_statistics()
+            if self._is_statistics_stale:
+                return NAN
+        return max(self._sum_of_squared_diffs, 0)
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_sum() / self._length
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_sum_of_squared_deviations() / self._length
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
-
+    cdef tuple c_get_segments(self):
+        """
+        The values as two views of the buffer, oldest first, without copying them.
+        """
+        values = np.asarray(self._buffer)
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return values[:self._delimiter], values[:0]
+        return values[self._delimiter:], values[:self._delimiter]
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        older_values, newer_values = self.c_get_segments()
+        return np.concatenate((older_values, newer_values))
 
     def __init__(self, length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(length)
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +178,9 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_segments(self):
+        return self.c_get_segments()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +188,22 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def sum(self) -> float:
+        return self.c_sum()
+
+    @property
+    def sum_of_squared_deviations(self) -> float:
+        return self.c_sum_of_squared_deviations()
+
+    @property
+    def sum_of_squared_diffs(self) -> float:
+        return self.c_sum_of_squared_diffs()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -109,10 +224,7 @@ cdef class RingBuffer:
     def length(self, value):
         data = self.get_as_numpy_array()
 
-        self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(value)
 
         for val in data[-value:]:
             self.add_value(val)
@@ -1,18 +1,35 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # The log returns between the consecutive prices of the sampling buffer
+        self._log_returns = RingBuffer(max(sampling_length - 1, 1))
+        self._last_price = np.nan
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        price = self._sampling_buffer.get_last_value()
+        if not np.isnan(self._last_price):
+            self._log_returns.add_value(np.log(price / self._last_price))
+        self._last_price = price
+        returns_count = min(self._log_returns.size, self._sampling_buffer.size - 1)
+        if returns_count > 0:
+            return self._log_returns.sum_of_squared_deviations / returns_count
+        return np.nan
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        size = self._processing_buffer.size
+        if size > 0:
+            total = self._processing_buffer.sum
+            if np.isnan(total):
+                # The first variances can be nan, counted as zero
+                total = np.sum(np.nan_to_num(self._processing_buffer.get_as_numpy_array()))
+            return np.sqrt(total / size)
+
+    @BaseTrailingIndicator.sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._log_returns.length = max(value - 1, 1)
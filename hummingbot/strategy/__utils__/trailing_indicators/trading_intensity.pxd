@@ -13,16 +13,26 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _sample_timestamps
+        dict _level_amounts
+        dict _level_counts
+        bint _is_sample_changed
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        object _quote_timestamps
+        object _quote_prices
         int _sampling_length
         int _samples_length
+        double _refit_tolerance
+        double _refit_linear_alpha
+        double _refit_linear_kappa
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_sample(self, double sample_timestamp, double price_level, double amount)
+    cdef c_remove_trade_sample(self, double sample_timestamp)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -2,6 +2,8 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from decimal import Decimal
 from typing import Tuple
 
@@ -9,6 +11,8 @@ import numpy as np
 from scipy.optimize import curve_fit
 from scipy.optimize import OptimizeWarning
 
+from libc.math cimport exp, fabs, isnan, NAN
+
 from hummingbot.core.data_type.common import (
     PriceType,
 )
@@ -25,12 +29,33 @@ cdef class TradesForwarder(EventListener):
         self._indicator.c_register_trade(arg)
 
 
+cdef inline bint c_is_within_tolerance(double value, double reference, double tolerance):
+    return fabs(value - reference) <= tolerance * fabs(reference)
+
+
 cdef class TradingIntensityIndicator:
 
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 refit_tolerance: float = 1e-4):
+        """
+        :param order_book: the order book the trades are sampled from
+        :param price_delegate: the mid price the trade price levels are measured from
+        :param sampling_length: the number of ticks with trades in the sample
+        :param refit_tolerance: the relative change of the log-linear estimate of alpha and kappa below which the
+        sample is considered unchanged, and the non-linear fit isn't run again (0 refits on every change)
+        """
         self._alpha = 0
         self._kappa = 0
+        # Trades, as (price level, amount) tuples, by sample timestamp
         self._trade_samples = {}
+        self._sample_timestamps = []
+        # Traded amount and number of trades by price level, over the whole sample
+        self._level_amounts = {}
+        self._level_counts = {}
+        self._is_sample_changed = False
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +63,12 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        # Ascending order of price-timestamp quotes
+        self._quote_timestamps = array("d")
+        self._quote_prices = array("d")
+        self._refit_tolerance = refit_tolerance
+        self._refit_linear_alpha = NAN
+        self._refit_linear_kappa = NAN
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +78,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -67,54 +97,57 @@ cdef class TradingIntensityIndicator:
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quote_timestamps = array("d", [quote["timestamp"] for quote in reversed(value)])
+        self._quote_prices = array("d", [float(quote["price"]) for quote in reversed(value)])
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
-        price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        cdef:
+            double price = float(self._price_delegate.get_price_by_type(PriceType.MidPrice))
+            double quote_timestamp = timestamp
+            int latest_processed_quote_idx = -1
+            int quote_idx
+
+        if len(self._quote_timestamps) == 0 or quote_timestamp >= self._quote_timestamps[-1]:
+            self._quote_timestamps.append(quote_timestamp)
+            self._quote_prices.append(price)
+        else:
+            quote_idx = bisect_right(self._quote_timestamps, quote_timestamp)
+            self._quote_timestamps.insert(quote_idx, quote_timestamp)
+            self._quote_prices.insert(quote_idx, price)
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
+            # The latest quote before the trade
+            quote_idx = bisect_left(self._quote_timestamps, trade.timestamp) - 1
+            if quote_idx < 0:
+                continue
+            latest_processed_quote_idx = max(latest_processed_quote_idx, quote_idx)
+            self.c_add_trade_sample(self._quote_timestamps[quote_idx] + 1,
+                                    fabs(float(trade.price) - self._quote_prices[quote_idx]),
+                                    float(trade.amount))
+
+        # There are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+        if latest_processed_quote_idx > 0:
+            del self._quote_timestamps[:latest_processed_quote_idx]
+            del self._quote_prices[:latest_processed_quote_idx]
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        while len(self._sample_timestamps) > self._sampling_length:
+            self.c_remove_trade_sample(self._sample_timestamps.pop(0))
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
-
-        if self.is_sampling_buffer_full:
+        if self.is_sampling_buffer_full and self._is_sample_changed:
             self.c_estimate_intensity()
+            self._is_sample_changed = False
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -123,44 +156,77 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trade_sample(self, double sample_timestamp, double price_level, double amount):
+        trades = self._trade_samples.get(sample_timestamp)
+        if trades is None:
+            trades = self._trade_samples[sample_timestamp] = []
+            insort(self._sample_timestamps, sample_timestamp)
+        trades.append((price_level, amount))
+        self._level_amounts[price_level] = self._level_amounts.get(price_level, 0) + amount
+        self._level_counts[price_level] = self._level_counts.get(price_level, 0) + 1
+        self._is_sample_changed = True
+
+    cdef c_remove_trade_sample(self, double sample_timestamp):
+        for price_level, amount in self._trade_samples.pop(sample_timestamp):
+            level_count = self._level_counts[price_level] - 1
+            if level_count == 0:
+                del self._level_counts[price_level]
+                del self._level_amounts[price_level]
+            else:
+                self._level_counts[price_level] = level_count
+                self._level_amounts[price_level] -= amount
+        self._is_sample_changed = True
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+            int levels_count = len(self._level_amounts)
+            double linear_alpha = NAN
+            double linear_kappa = NAN
+            double variance
+            double slope
+
+        if levels_count == 0:
+            return
+
+        # Trading intensities by descending price level
+        price_levels = np.fromiter(self._level_amounts.keys(), dtype=float, count=levels_count)
+        lambdas = np.fromiter(self._level_amounts.values(), dtype=float, count=levels_count)
+        descending_order = np.argsort(price_levels)[::-1]
+        price_levels = price_levels[descending_order]
+        lambdas = lambdas[descending_order]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas[lambdas <= 0] = 10**-10
+
+        # Closed-form least squares fit of log(lambda) = log(alpha) - kappa * price_level
+        if levels_count > 1:
+            log_lambdas = np.log(lambdas)
+            centered_price_levels = price_levels - price_levels.mean()
+            variance = centered_price_levels.dot(centered_price_levels)
+            if variance > 0:
+                slope = centered_price_levels.dot(log_lambdas) / variance
+                linear_kappa = -slope
+                linear_alpha = exp(log_lambdas.mean() - slope * price_levels.mean())
+
+        # The non-linear fit is only run again when the sample moved the log-linear estimate materially
+        if (not isnan(linear_alpha)
+                and not isnan(self._refit_linear_alpha)
+                and c_is_within_tolerance(linear_alpha, self._refit_linear_alpha, self._refit_tolerance)
+                and c_is_within_tolerance(linear_kappa, self._refit_linear_kappa, self._refit_tolerance)):
+            return
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
             params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
                                price_levels,
-                               lambdas_adj,
+                               lambdas,
                                p0=(self._alpha, self._kappa),
                                method='dogbox',
                                bounds=([0, 0], [np.inf, np.inf]))
 
             self._kappa = Decimal(str(params[0][1]))
             self._alpha = Decimal(str(params[0][0]))
+            self._refit_linear_alpha = linear_alpha
+            self._refit_linear_kappa = linear_kappa
         except (RuntimeError, ValueError) as e:
             pass
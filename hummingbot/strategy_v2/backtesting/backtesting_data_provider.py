@@ -1,7 +1,8 @@
 import logging
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -11,8 +12,10 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.strategy_v2.backtesting.trading_rules_cache import TradingRulesCache
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -26,23 +29,46 @@ class BacktestingDataProvider(MarketDataProvider):
                            "polkadex", "coinbase_advanced_trade", "kraken", "dydx_v4_perpetual", "hitbtc",
                            "hyperliquid"]
 
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
-        super().__init__(connectors)
+    def __init__(self,
+                 connectors: Dict[str, ConnectorBase],
+                 candles_store: Optional[CandlesStore] = None,
+                 trading_rules_cache: Optional[TradingRulesCache] = None):
+        """
+        :param connectors: connector instances to use, the other connectors are instantiated when they are first used
+        :param candles_store: the local cache of the historical candles (e.g. CandlesStore() for the one of the data
+        folder), only the candles missing from it are fetched from the exchanges. By default there is none, and all the
+        candles are fetched.
+        :param trading_rules_cache: the local cache of the trading rules, by default the one of the data folder
+        """
+        super().__init__(connectors, candles_store=candles_store)
         self.start_time = None
         self.end_time = None
         self.prices = {}
         self._time = None
         self.trading_rules = {}
+        self.trading_rules_cache = trading_rules_cache if trading_rules_cache is not None else TradingRulesCache()
         self.conn_settings = AllConnectorSettings.get_connector_settings()
-        self.connectors = {name: self.get_connector(name) for name, settings in self.conn_settings.items()
-                           if settings.type in self.CONNECTOR_TYPES and name not in self.EXCLUDED_CONNECTORS and
-                           "testnet" not in name}
 
     def get_connector(self, connector_name: str):
+        """
+        Returns the connector, instantiated (without trading) the first time it is used.
+        :param connector_name: str
+        :return: Connector instance.
+        """
+        connector = self.connectors.get(connector_name)
+        if connector is None:
+            connector = self._create_connector(connector_name)
+            self.connectors[connector_name] = connector
+        return connector
+
+    def _create_connector(self, connector_name: str):
         conn_setting = self.conn_settings.get(connector_name)
         if conn_setting is None:
             logger.error(f"Connector {connector_name} not found")
             raise ValueError(f"Connector {connector_name} not found")
+        if (conn_setting.type not in self.CONNECTOR_TYPES or connector_name in self.EXCLUDED_CONNECTORS
+                or "testnet" in connector_name):
+            raise ValueError(f"Connector {connector_name} is not supported for backtesting")
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
         init_params = conn_setting.conn_init_parameters(
@@ -72,10 +98,28 @@ class BacktestingDataProvider(MarketDataProvider):
         return self._time
 
     async def initialize_trading_rules(self, connector_name: str):
-        if len(self.trading_rules.get(connector_name, {})) == 0:
-            connector = self.connectors.get(connector_name)
-            await connector._update_trading_rules()
-            self.trading_rules[connector_name] = connector.trading_rules
+        """
+        Loads the trading rules of the connector from the cache, or fetches them if they are not cached or expired.
+        The expired trading rules are used if they can't be fetched, e.g. offline.
+        """
+        if len(self.trading_rules.get(connector_name, {})) > 0:
+            return
+        trading_rules = self.trading_rules_cache.get_trading_rules(connector_name)
+        if trading_rules is None:
+            try:
+                connector = self.get_connector(connector_name)
+                await connector._update_trading_rules()
+                trading_rules = dict(connector.trading_rules)
+                if len(trading_rules) == 0:
+                    raise ValueError(f"No trading rules fetched for {connector_name}")
+                self.trading_rules_cache.store_trading_rules(connector_name, trading_rules)
+            except Exception:
+                trading_rules = self.trading_rules_cache.get_trading_rules(connector_name, include_expired=True)
+                if trading_rules is None:
+                    raise
+                logger.warning(f"Could not fetch the trading rules of {connector_name}. Using the cached ones, "
+                               f"which are expired.", exc_info=True)
+        self.trading_rules[connector_name] = trading_rules
 
     async def initialize_candles_feed(self, config: CandlesConfig):
         await self.get_candles_feed(config)
@@ -102,6 +146,7 @@ class BacktestingDataProvider(MarketDataProvider):
                 return existing_feed
         # Create a new feed or restart the existing one with updated max_records
         candle_feed = CandlesFactory.get_candle(config)
+        candle_feed.set_candles_store(self.candles_store)
         candles_buffer = config.max_records * CandlesBase.interval_to_seconds[config.interval]
         candles_df = await candle_feed.get_historical_candles(config=HistoricalCandlesConfig(
             connector_name=config.connector,
@@ -123,7 +168,11 @@ class BacktestingDataProvider(MarketDataProvider):
         :return: Candles dataframe.
         """
         candles_df = self.candles_feeds.get(f"{connector_name}_{trading_pair}_{interval}")
-        return candles_df[(candles_df["timestamp"] >= self.start_time) & (candles_df["timestamp"] <= self.end_time)]
+        # The candles are sorted by timestamp, the slice is a view of them
+        timestamps = candles_df["timestamp"].values
+        first_index = np.searchsorted(timestamps, self.start_time, side="left")
+        last_index = np.searchsorted(timestamps, self.end_time, side="right")
+        return candles_df.iloc[first_index:last_index]
 
     def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType):
         """
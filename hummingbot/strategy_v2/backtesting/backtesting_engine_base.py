@@ -10,10 +10,11 @@ import yaml
 
 from hummingbot.client import settings
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.exceptions import InvalidController
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
-from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
 from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
 from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
@@ -30,10 +31,20 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class BacktestingEngineBase:
-    def __init__(self):
+    def __init__(self, vectorized: bool = True, candles_store: Optional[CandlesStore] = None):
+        """
+        :param vectorized: if True, the simulation loop iterates over the rows of the market data as plain tuples,
+        simulates the executors on the market data columns as numpy arrays, and updates the info of the active executors
+        incrementally. Otherwise, it iterates over the rows as Series, simulates each executor on the remaining market
+        data, and rebuilds the info of each active executor from its simulation at every timestamp. Both produce the
+        same results.
+        :param candles_store: the local cache of the historical candles used by the data provider, e.g. CandlesStore()
+        to keep them in the data folder and not download them again on the next backtests. None to fetch them all.
+        """
         self.controller = None
         self.backtesting_resolution = None
-        self.backtesting_data_provider = BacktestingDataProvider(connectors={})
+        self.vectorized = vectorized
+        self.backtesting_data_provider = BacktestingDataProvider(connectors={}, candles_store=candles_store)
         self.position_executor_simulator = PositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
 
@@ -120,13 +131,25 @@ class BacktestingEngineBase:
             List[ExecutorInfo]: List of executor information objects detailing the simulation results.
         """
         processed_features = self.prepare_market_data()
-        self.active_executor_simulations: List[ExecutorSimulation] = []
+        self.active_executor_simulations: Dict[str, ExecutorSimulation] = {}
         self.stopped_executors_info: List[ExecutorInfo] = []
-        for i, row in processed_features.iterrows():
+        if self.vectorized:
+            columns = list(processed_features.columns)
+            market_data_columns = ExecutorSimulatorBase.market_data_columns(processed_features)
+            rows = ((row[0], dict(zip(columns, row[1:])))
+                    for row in processed_features.itertuples(index=True, name=None))
+        else:
+            rows = processed_features.iterrows()
+        for position, (i, row) in enumerate(rows):
             await self.update_state(row)
             for action in self.controller.determine_executor_actions():
                 if isinstance(action, CreateExecutorAction):
-                    executor_simulation = self.simulate_executor(action.executor_config, processed_features.loc[i:], trade_cost)
+                    if self.vectorized:
+                        executor_simulation = self.simulate_executor_from_position(
+                            action.executor_config, processed_features, market_data_columns, position, trade_cost)
+                    else:
+                        executor_simulation = self.simulate_executor(action.executor_config,
+                                                                     processed_features.loc[i:], trade_cost)
                     if executor_simulation.close_type != CloseType.FAILED:
                         self.manage_active_executors(executor_simulation)
                 elif isinstance(action, StopExecutorAction):
@@ -134,24 +157,28 @@ class BacktestingEngineBase:
 
         return self.controller.executors_info
 
-    async def update_state(self, row):
+    async def update_state(self, row: Union[pd.Series, Dict]):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
         self.controller.market_data_provider._time = row["timestamp"]
-        self.controller.processed_data.update(row.to_dict())
+        self.controller.processed_data.update(row.to_dict() if isinstance(row, pd.Series) else row)
         self.update_executors_info(row["timestamp"])
 
     def update_executors_info(self, timestamp: float):
         active_executors_info = []
         simulations_to_remove = []
-        for executor in self.active_executor_simulations:
-            executor_info = executor.get_executor_info_at_timestamp(timestamp)
+        for executor_id, executor in self.active_executor_simulations.items():
+            if self.vectorized:
+                executor_info = executor.update_executor_info(timestamp)
+            else:
+                executor_info = executor.get_executor_info_at_timestamp(timestamp)
             if executor_info.status == RunnableStatus.TERMINATED:
                 self.stopped_executors_info.append(executor_info)
-                simulations_to_remove.append(executor.config.id)
+                simulations_to_remove.append(executor_id)
             else:
                 active_executors_info.append(executor_info)
-        self.active_executor_simulations = [es for es in self.active_executor_simulations if es.config.id not in simulations_to_remove]
+        for executor_id in simulations_to_remove:
+            del self.active_executor_simulations[executor_id]
         self.controller.executors_info = active_executors_info + self.stopped_executors_info
 
     async def update_processed_data(self, row: pd.Series):
@@ -194,6 +221,29 @@ class BacktestingEngineBase:
         self.controller.processed_data["features"] = backtesting_candles
         return backtesting_candles
 
+    def simulate_executor_from_position(self, config: Union[PositionExecutorConfig, DCAExecutorConfig],
+                                        df: pd.DataFrame, columns: Dict[str, np.ndarray], position: int,
+                                        trade_cost: float) -> Optional[ExecutorSimulation]:
+        """
+        Simulates the execution of an executor created at a position of the market data, reading the columns of the
+        market data as numpy arrays and only copying the rows the executor spans.
+
+        Args:
+            config (PositionExecutorConfig): The configuration of the executor.
+            df (pd.DataFrame): DataFrame containing the market data, sorted by timestamp.
+            columns (Dict[str, np.ndarray]): The market data columns of the simulators.
+            position (int): The position of the row where the executor is created.
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            ExecutorSimulation: The results of the simulation.
+        """
+        if isinstance(config, DCAExecutorConfig):
+            return self.dca_executor_simulator.simulate_from_position(df, columns, position, config, trade_cost)
+        elif isinstance(config, PositionExecutorConfig):
+            return self.position_executor_simulator.simulate_from_position(df, columns, position, config, trade_cost)
+        return None
+
     def simulate_executor(self, config: Union[PositionExecutorConfig, DCAExecutorConfig], df: pd.DataFrame,
                           trade_cost: float) -> Optional[ExecutorSimulation]:
         """
@@ -222,7 +272,7 @@ class BacktestingEngineBase:
             active_executors (list): The list of active executors.
         """
         if not simulation.executor_simulation.empty:
-            self.active_executor_simulations.append(simulation)
+            self.active_executor_simulations[simulation.config.id] = simulation
 
     def handle_stop_action(self, action: StopExecutorAction, timestamp: pd.Timestamp):
         """
@@ -233,15 +283,14 @@ class BacktestingEngineBase:
             active_executors (list): The list of active executors.
             timestamp (pd.Timestamp): The current timestamp.
         """
-        for executor in self.active_executor_simulations:
+        executor = self.active_executor_simulations.pop(action.executor_id, None)
+        if executor is not None:
             executor_info = executor.get_executor_info_at_timestamp(timestamp)
-            if executor_info.config.id == action.executor_id:
-                executor_info.status = RunnableStatus.TERMINATED
-                executor_info.close_type = CloseType.EARLY_STOP
-                executor_info.is_active = False
-                executor_info.close_timestamp = timestamp
-                self.stopped_executors_info.append(executor_info)
-                self.active_executor_simulations.remove(executor)
+            executor_info.status = RunnableStatus.TERMINATED
+            executor_info.close_type = CloseType.EARLY_STOP
+            executor_info.is_active = False
+            executor_info.close_timestamp = timestamp
+            self.stopped_executors_info.append(executor_info)
 
     @staticmethod
     def summarize_results(executors_info: List, total_amount_quote: float = 1000):
@@ -1,8 +1,9 @@
 from decimal import Decimal
-from typing import Union
+from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
@@ -15,6 +16,9 @@ class ExecutorSimulation(BaseModel):
     config: Union[PositionExecutorConfig, DCAExecutorConfig]
     executor_simulation: pd.DataFrame
     close_type: CloseType
+    _columns: Optional[Dict[str, np.ndarray]] = PrivateAttr(default=None)
+    _last_timestamp: Optional[float] = PrivateAttr(default=None)
+    _executor_info: Optional[ExecutorInfo] = PrivateAttr(default=None)
 
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types
@@ -63,7 +67,60 @@ class ExecutorSimulation(BaseModel):
             custom_info=self.get_custom_info(last_entry)
         )
 
-    def get_custom_info(self, last_entry: pd.Series) -> dict:
+    def update_executor_info(self, timestamp: float) -> ExecutorInfo:
+        """
+        Returns the same executor info as get_executor_info_at_timestamp, for timestamps that only increase (as in the
+        backtesting loop). The simulation row of the timestamp is found by binary search in the columns of the
+        simulation, and while the executor is active the same ExecutorInfo is updated instead of building a new one.
+        """
+        if self._columns is None:
+            self._columns = {
+                column: self.executor_simulation[column].to_numpy()
+                for column in ("timestamp", "net_pnl_pct", "net_pnl_quote", "cum_fees_quote", "filled_amount_quote",
+                               "close", "current_position_average_price")
+                if column in self.executor_simulation
+            }
+            self._last_timestamp = self._columns["timestamp"].max()
+        timestamps = self._columns["timestamp"]
+        position = int(np.searchsorted(timestamps, timestamp, side="right")) - 1
+        if position < 0:
+            return self.get_executor_info_at_timestamp(timestamp)
+
+        is_active = timestamps[position] < self._last_timestamp
+        filled_amount_quote = self._columns["filled_amount_quote"][position]
+        custom_info = self.get_custom_info({
+            column: self._columns[column][position]
+            for column in ("close", "current_position_average_price") if column in self._columns
+        })
+        if not is_active or self._executor_info is None:
+            self._executor_info = ExecutorInfo(
+                id=self.config.id,
+                timestamp=self.config.timestamp,
+                type=self.config.type,
+                close_timestamp=None if is_active else float(timestamps[position]),
+                close_type=None if is_active else self.close_type,
+                status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED,
+                config=self.config,
+                net_pnl_pct=Decimal(self._columns["net_pnl_pct"][position]),
+                net_pnl_quote=Decimal(self._columns["net_pnl_quote"][position]),
+                cum_fees_quote=Decimal(self._columns["cum_fees_quote"][position]),
+                filled_amount_quote=Decimal(filled_amount_quote),
+                is_active=is_active,
+                is_trading=filled_amount_quote > 0 and is_active,
+                custom_info=custom_info
+            )
+            return self._executor_info
+
+        executor_info = self._executor_info
+        executor_info.net_pnl_pct = Decimal(self._columns["net_pnl_pct"][position])
+        executor_info.net_pnl_quote = Decimal(self._columns["net_pnl_quote"][position])
+        executor_info.cum_fees_quote = Decimal(self._columns["cum_fees_quote"][position])
+        executor_info.filled_amount_quote = Decimal(filled_amount_quote)
+        executor_info.is_trading = bool(filled_amount_quote > 0)
+        executor_info.custom_info = custom_info
+        return executor_info
+
+    def get_custom_info(self, last_entry: Union[pd.Series, Dict]) -> dict:
         current_position_average_price = last_entry['current_position_average_price'] if "current_position_average_price" in last_entry else None
         return {
             "close_price": last_entry['close'],
@@ -77,5 +134,65 @@ class ExecutorSimulatorBase:
     """Base class for trading simulators."""
     def simulate(self, df: pd.DataFrame, config, trade_cost: float) -> ExecutorSimulation:
         """Simulates trading based on provided configuration and market data."""
-        # This method should be generic enough to handle various trading strategies.
+        return self.simulate_batch(df, [config], trade_cost, start_positions=[0])[0]
+
+    def simulate_batch(self, df: pd.DataFrame, configs: List, trade_cost: float,
+                       start_positions: Optional[List[int]] = None) -> List[ExecutorSimulation]:
+        """
+        Simulates several executors on the same market data, sorted by timestamp. Each executor gives the same result
+        as `simulate(df.iloc[start_position:], config, trade_cost)`, but the columns of the market data are read once
+        and each simulation only copies the rows its executor spans.
+
+        Args:
+            df (pd.DataFrame): The market data, sorted by timestamp.
+            configs (list): The configurations of the executors.
+            trade_cost (float): The cost per trade.
+            start_positions (list): The position of the row where each executor starts. By default, the row of the
+                timestamp of its configuration.
+
+        Returns:
+            List[ExecutorSimulation]: The simulations of the executors, in the order of the configurations.
+        """
+        columns = self.market_data_columns(df)
+        if start_positions is None:
+            start_positions = np.searchsorted(columns["timestamp"], [config.timestamp for config in configs])
+        return [self.simulate_from_position(df, columns, int(start_position), config, trade_cost)
+                for start_position, config in zip(start_positions, configs)]
+
+    @staticmethod
+    def market_data_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Returns the columns of the market data the simulations read, as numpy arrays."""
+        return {column: df[column].to_numpy(dtype=float) for column in ("timestamp", "close", "high", "low")
+                if column in df}
+
+    def simulate_from_position(self, df: pd.DataFrame, columns: Dict[str, np.ndarray], start_position: int, config,
+                               trade_cost: float) -> ExecutorSimulation:
+        """Simulates an executor on the market data from the start position, with its columns as numpy arrays."""
         raise NotImplementedError
+
+    @staticmethod
+    def cumulative_returns(close: np.ndarray) -> np.ndarray:
+        """Returns the compounded returns of the close prices since the first one (as pct_change().cumprod())."""
+        returns = np.zeros(len(close))
+        returns[1:] = close[1:] / close[:-1] - 1
+        return np.cumprod(1 + returns) - 1
+
+    @staticmethod
+    def first_position(condition: np.ndarray) -> int:
+        """Returns the position of the first True value of the condition, -1 if there is none."""
+        if len(condition) == 0:
+            return -1
+        position = int(np.argmax(condition))
+        return position if condition[position] else -1
+
+    @staticmethod
+    def float_at_most(value: Union[Decimal, float]) -> float:
+        """Returns the greatest float lower or equal to the value, so that comparing floats to it is exact."""
+        result = float(value)
+        return float(np.nextafter(result, -np.inf)) if Decimal(result) > value else result
+
+    @staticmethod
+    def float_at_least(value: Union[Decimal, float]) -> float:
+        """Returns the lowest float greater or equal to the value, so that comparing floats to it is exact."""
+        result = float(value)
+        return float(np.nextafter(result, np.inf)) if Decimal(result) < value else result
@@ -1,6 +1,7 @@
 from decimal import Decimal
-from typing import List
+from typing import Dict, List
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
@@ -17,12 +18,23 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
         total_quote = sum([amounts[i] * prices[i] for i in range(index + 1)])
         return total_quote / total_amount
 
-    def simulate(self, df: pd.DataFrame, config: DCAExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+    def crossed(self, prices: np.ndarray, price: Decimal, side: TradeType, reverse: bool = False) -> np.ndarray:
+        """
+        Returns where the prices reached the price: at or below it for a buy (at or above if reverse), at or above it
+        for a sell (at or below if reverse).
+        """
+        if (side == TradeType.BUY) != reverse:
+            return prices <= self.float_at_most(price)
+        return prices >= self.float_at_least(price)
+
+    def simulate_from_position(self, df: pd.DataFrame, columns: Dict[str, np.ndarray], start_position: int,
+                               config: DCAExecutorConfig, trade_cost: float) -> ExecutorSimulation:
         if config.mode == DCAMode.TAKER:
             raise NotImplementedError("Taker mode is not supported in DCAExecutorSimulator")
         potential_dca_stages = []
         side_multiplier = 1 if config.side == TradeType.BUY else -1
-        last_timestamp = df['timestamp'].max()
+        timestamps = columns["timestamp"][start_position:]
+        last_timestamp = timestamps[-1] if len(timestamps) > 0 else np.nan
         tl = config.time_limit if config.time_limit else None
         tl_timestamp = config.timestamp + tl if tl else last_timestamp
 
@@ -30,13 +42,10 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
         trailing_sl_trigger_pct = config.trailing_stop.activation_price if config.trailing_stop else None
         trailing_sl_delta_pct = config.trailing_stop.trailing_delta if config.trailing_stop else None
 
-        # Filter dataframe based on the conditions
-        df_filtered = df[df['timestamp'] <= tl_timestamp].copy()
-        df_filtered['net_pnl_pct'] = 0.0
-        df_filtered['net_pnl_quote'] = 0.0
-        df_filtered['cum_fees_quote'] = 0.0
-        df_filtered['filled_amount_quote'] = 0.0
-        df_filtered['current_position_average_price'] = float(config.prices[0])
+        # Only the rows up to the time limit are simulated
+        end = int(np.searchsorted(timestamps, tl_timestamp, side="right"))
+        timestamps = timestamps[:end]
+        close = columns["close"][start_position:start_position + end]
 
         for i in range(len(config.prices)):
             is_last_order = i == len(config.prices) - 1
@@ -44,13 +53,11 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
             amount = config.amounts_quote[i]
             break_even_price = DCAExecutorSimulator.break_even_price_at_index(config.prices, config.amounts_quote, i) if i > 0 else price
 
-            entry_condition = (df_filtered['close'] <= price) if config.side == TradeType.BUY else (df_filtered['close'] >= price)
-            entry_timestamp = df_filtered[entry_condition]['timestamp'].min()
-            if pd.isna(entry_timestamp):
+            entry = self.first_position(self.crossed(close, price, config.side))
+            if entry < 0:
                 break
-            returns_df = df_filtered[df_filtered['timestamp'] >= entry_timestamp]
-            returns = returns_df['close'].pct_change().fillna(0)
-            cumulative_returns = (((1 + returns).cumprod() - 1) * side_multiplier) - trade_cost
+            returns_close = close[entry:]
+            cumulative_returns = (self.cumulative_returns(returns_close) * side_multiplier) - trade_cost
             take_profit_timestamp = None
             stop_loss_timestamp = None
             trailing_sl_timestamp = None
@@ -59,33 +66,33 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
             # Trailing stop logic
             if trailing_sl_trigger_pct is not None and trailing_sl_delta_pct is not None:
                 trailing_stop_activation_price = break_even_price * (1 + trailing_sl_trigger_pct * side_multiplier)
-                trailing_stop_condition = None
-                if config.side == TradeType.BUY:
-                    ts_activated_condition = returns_df["close"] >= trailing_stop_activation_price
-                    if ts_activated_condition.any():
-                        ts_activated_condition = ts_activated_condition.cumsum() > 0
-                        returns_df.loc[ts_activated_condition, "ts_trigger_price"] = (returns_df[ts_activated_condition]["close"] * float(1 - trailing_sl_delta_pct)).cummax()
-                        trailing_stop_condition = returns_df['close'] <= returns_df['ts_trigger_price']
-                else:
-                    ts_activated_condition = returns_df["close"] <= trailing_stop_activation_price
-                    if ts_activated_condition.any():
-                        ts_activated_condition = ts_activated_condition.cumsum() > 0
-                        returns_df.loc[ts_activated_condition, "ts_trigger_price"] = (returns_df[ts_activated_condition]["close"] * float(1 + trailing_sl_delta_pct)).cummin()
-                        trailing_stop_condition = returns_df['close'] >= returns_df['ts_trigger_price']
-                trailing_sl_timestamp = returns_df[trailing_stop_condition]['timestamp'].min() if trailing_stop_condition is not None else None
+                activation = self.first_position(self.crossed(returns_close, trailing_stop_activation_price,
+                                                              config.side, reverse=True))
+                if activation >= 0:
+                    activated_close = returns_close[activation:]
+                    if config.side == TradeType.BUY:
+                        ts_trigger_price = np.maximum.accumulate(activated_close * float(1 - trailing_sl_delta_pct))
+                        trailing_stop_condition = activated_close <= ts_trigger_price
+                    else:
+                        ts_trigger_price = np.minimum.accumulate(activated_close * float(1 + trailing_sl_delta_pct))
+                        trailing_stop_condition = activated_close >= ts_trigger_price
+                    trailing_sl_timestamp = self._first_timestamp(timestamps[entry + activation:],
+                                                                  trailing_stop_condition)
 
             if config.take_profit:
                 take_profit_price = break_even_price * (1 + config.take_profit * side_multiplier)
-                take_profit_condition = returns_df['close'] >= take_profit_price if config.side == TradeType.BUY else returns_df['close'] <= take_profit_price
-                take_profit_timestamp = returns_df[take_profit_condition]['timestamp'].min()
+                take_profit_timestamp = self._first_timestamp(
+                    timestamps[entry:], self.crossed(returns_close, take_profit_price, config.side, reverse=True))
 
             if is_last_order and config.stop_loss:
                 stop_loss_price = break_even_price * (1 - config.stop_loss * side_multiplier)
-                stop_loss_condition = returns_df['low'] <= stop_loss_price if config.side == TradeType.BUY else returns_df['high'] >= stop_loss_price
-                stop_loss_timestamp = returns_df[stop_loss_condition]['timestamp'].min()
-            else:
-                next_order_condition = returns_df['close'] <= config.prices[i + 1] if config.side == TradeType.BUY else returns_df['close'] >= config.prices[i + 1]
-                next_order_timestamp = returns_df[next_order_condition]['timestamp'].min()
+                stop_loss_prices = columns["low" if config.side == TradeType.BUY else "high"][
+                    start_position + entry:start_position + end]
+                stop_loss_timestamp = self._first_timestamp(
+                    timestamps[entry:], self.crossed(stop_loss_prices, stop_loss_price, config.side))
+            elif not is_last_order:
+                next_order_timestamp = self._first_timestamp(
+                    timestamps[entry:], self.crossed(returns_close, config.prices[i + 1], config.side))
 
             close_timestamp = min([timestamp for timestamp in [take_profit_timestamp, stop_loss_timestamp,
                                                                trailing_sl_timestamp, last_timestamp, next_order_timestamp] if not pd.isna(timestamp)])
@@ -101,12 +108,9 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
             else:
                 close_type = CloseType.TIME_LIMIT
 
-            df_filtered[f'filled_amount_quote_{i}'] = 0.0
-            df_filtered[f'net_pnl_quote_{i}'] = 0.0
             potential_dca_stages.append({
                 'level': i,
-                'entry_timestamp': entry_timestamp,
-                'price': float(price),
+                'entry': entry,
                 'amount': float(amount),
                 'break_even_price': float(break_even_price),
                 'close_timestamp': close_timestamp,
@@ -115,29 +119,44 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
             })
 
         if len(potential_dca_stages) == 0:
-            return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.TIME_LIMIT)
+            executor_simulation = df.iloc[start_position:start_position + end].copy()
+            executor_simulation['net_pnl_pct'] = 0.0
+            executor_simulation['net_pnl_quote'] = 0.0
+            executor_simulation['cum_fees_quote'] = 0.0
+            executor_simulation['filled_amount_quote'] = 0.0
+            executor_simulation['current_position_average_price'] = float(config.prices[0])
+            return ExecutorSimulation(config=config, executor_simulation=executor_simulation, close_type=CloseType.TIME_LIMIT)
 
         close_type = None
-
+        current_position_average_price = np.full(end, float(config.prices[0]))
+        stages_filled_amount_quote = [np.zeros(end) for _ in potential_dca_stages]
+        stages_net_pnl_quote = [np.zeros(end) for _ in potential_dca_stages]
         for i, dca_stage in enumerate(potential_dca_stages):
-            if dca_stage['close_type'] is None:
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], f'filled_amount_quote_{i}'] = dca_stage['amount']
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], f'net_pnl_quote_{i}'] = dca_stage['cumulative_returns'] * dca_stage['amount']
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], 'current_position_average_price'] = dca_stage['break_even_price']
-            else:
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], f'filled_amount_quote_{i}'] = dca_stage['amount']
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], f'net_pnl_quote_{i}'] = dca_stage['cumulative_returns'] * dca_stage['amount']
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], 'current_position_average_price'] = dca_stage['break_even_price']
+            stages_filled_amount_quote[i][dca_stage['entry']:] = dca_stage['amount']
+            stages_net_pnl_quote[i][dca_stage['entry']:] = dca_stage['cumulative_returns'] * dca_stage['amount']
+            current_position_average_price[dca_stage['entry']:] = dca_stage['break_even_price']
+            if dca_stage['close_type'] is not None:
                 close_type = dca_stage['close_type']
                 last_timestamp = dca_stage['close_timestamp']
                 break
 
-        df_filtered = df_filtered[df_filtered['timestamp'] <= last_timestamp].copy()
-        df_filtered['filled_amount_quote'] = sum([df_filtered[f'filled_amount_quote_{i}'] for i in range(len(potential_dca_stages))])
-        df_filtered['net_pnl_quote'] = sum([df_filtered[f'net_pnl_quote_{i}'] for i in range(len(potential_dca_stages))])
-        df_filtered['cum_fees_quote'] = trade_cost * df_filtered['filled_amount_quote']
-        df_filtered.loc[df_filtered["filled_amount_quote"] > 0, "net_pnl_pct"] = df_filtered["net_pnl_quote"] / df_filtered["filled_amount_quote"]
-        df_filtered.loc[df_filtered.index[-1], "filled_amount_quote"] = df_filtered["filled_amount_quote"].iloc[-1] * 2
+        rows = int(np.searchsorted(timestamps, last_timestamp, side="right"))
+        filled_amount_quote = sum([stage_filled_amount_quote[:rows] for stage_filled_amount_quote in stages_filled_amount_quote])
+        net_pnl_quote = sum([stage_net_pnl_quote[:rows] for stage_net_pnl_quote in stages_net_pnl_quote])
+        net_pnl_pct = np.zeros(rows)
+        np.divide(net_pnl_quote, filled_amount_quote, out=net_pnl_pct, where=filled_amount_quote > 0)
+        cum_fees_quote = trade_cost * filled_amount_quote
+        filled_amount_quote[-1] = filled_amount_quote[-1] * 2
+
+        executor_simulation = df.iloc[start_position:start_position + rows].copy()
+        executor_simulation['net_pnl_pct'] = net_pnl_pct
+        executor_simulation['net_pnl_quote'] = net_pnl_quote
+        executor_simulation['cum_fees_quote'] = cum_fees_quote
+        executor_simulation['filled_amount_quote'] = filled_amount_quote
+        executor_simulation['current_position_average_price'] = current_position_average_price[:rows]
+        for i in range(len(potential_dca_stages)):
+            executor_simulation[f'filled_amount_quote_{i}'] = stages_filled_amount_quote[i][:rows]
+            executor_simulation[f'net_pnl_quote_{i}'] = stages_net_pnl_quote[i][:rows]
 
         if close_type is None:
             close_type = CloseType.FAILED
@@ -145,7 +164,12 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
         # Construct and return ExecutorSimulation object
         simulation = ExecutorSimulation(
             config=config,
-            executor_simulation=df_filtered,
+            executor_simulation=executor_simulation,
             close_type=close_type
         )
         return simulation
+
+    @staticmethod
+    def _first_timestamp(timestamps: np.ndarray, condition: np.ndarray) -> float:
+        position = ExecutorSimulatorBase.first_position(condition)
+        return timestamps[position] if position >= 0 else np.nan
@@ -1,3 +1,6 @@
+from typing import Dict
+
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
@@ -7,13 +10,11 @@ from hummingbot.strategy_v2.models.executors import CloseType
 
 
 class PositionExecutorSimulator(ExecutorSimulatorBase):
-    def simulate(self, df: pd.DataFrame, config: PositionExecutorConfig, trade_cost: float) -> ExecutorSimulation:
-        if config.triple_barrier_config.open_order_type.is_limit_type():
-            entry_condition = (df['close'] <= config.entry_price) if config.side == TradeType.BUY else (df['close'] >= config.entry_price)
-            start_timestamp = df[entry_condition]['timestamp'].min()
-        else:
-            start_timestamp = df['timestamp'].min()
-        last_timestamp = df['timestamp'].max()
+    def simulate_from_position(self, df: pd.DataFrame, columns: Dict[str, np.ndarray], start_position: int,
+                               config: PositionExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+        timestamps = columns["timestamp"][start_position:]
+        close = columns["close"][start_position:]
+        last_timestamp = timestamps[-1] if len(timestamps) > 0 else np.nan
 
         # Set up barriers
         tp = float(config.triple_barrier_config.take_profit) if config.triple_barrier_config.take_profit else None
@@ -25,43 +26,49 @@ class PositionExecutorSimulator(ExecutorSimulatorBase):
         tl = config.triple_barrier_config.time_limit if config.triple_barrier_config.time_limit else None
         tl_timestamp = config.timestamp + tl if tl else last_timestamp
 
-        # Filter dataframe based on the conditions
-        df_filtered = df[df['timestamp'] <= tl_timestamp].copy()
-        df_filtered['net_pnl_pct'] = 0.0
-        df_filtered['net_pnl_quote'] = 0.0
-        df_filtered['cum_fees_quote'] = 0.0
-        df_filtered['filled_amount_quote'] = 0.0
-        df_filtered["current_position_average_price"] = float(config.entry_price)
+        # Only the rows up to the time limit are simulated
+        end = int(np.searchsorted(timestamps, tl_timestamp, side="right"))
+        timestamps = timestamps[:end]
+        close = close[:end]
+        if config.triple_barrier_config.open_order_type.is_limit_type():
+            entry_condition = (close <= self.float_at_most(config.entry_price)) if config.side == TradeType.BUY else (
+                close >= self.float_at_least(config.entry_price))
+            entry = self.first_position(entry_condition)
+        else:
+            entry = 0 if end > 0 else -1
 
-        if pd.isna(start_timestamp):
-            return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.TIME_LIMIT)
+        net_pnl_pct = np.zeros(end)
+        filled_amount_quote = np.zeros(end)
+        # The order is not filled before the time limit
+        if entry < 0:
+            return self._executor_simulation(df, start_position, end, config, CloseType.TIME_LIMIT, net_pnl_pct,
+                                             np.zeros(end), np.zeros(end), filled_amount_quote)
 
-        entry_price = df.loc[df['timestamp'] == start_timestamp, 'close'].values[0]
+        entry_price = close[entry]
         side_multiplier = 1 if config.side == TradeType.BUY else -1
-
-        returns_df = df_filtered[df_filtered['timestamp'] >= start_timestamp]
-        returns = returns_df['close'].pct_change().fillna(0)
-        cumulative_returns = (((1 + returns).cumprod() - 1) * side_multiplier) - trade_cost
-        df_filtered.loc[df_filtered['timestamp'] >= start_timestamp, 'net_pnl_pct'] = cumulative_returns
-        df_filtered.loc[df_filtered['timestamp'] >= start_timestamp, 'filled_amount_quote'] = float(config.amount) * entry_price
-        df_filtered['net_pnl_quote'] = df_filtered['net_pnl_pct'] * df_filtered['filled_amount_quote']
-        df_filtered['cum_fees_quote'] = trade_cost * df_filtered['filled_amount_quote']
+        net_pnl_pct[entry:] = (self.cumulative_returns(close[entry:]) * side_multiplier) - trade_cost
+        filled_amount_quote[entry:] = float(config.amount) * entry_price
+        net_pnl_quote = net_pnl_pct * filled_amount_quote
+        cum_fees_quote = trade_cost * filled_amount_quote
 
         # Make sure the trailing stop pct rises linearly to the net p/l pct when above the trailing stop trigger pct (if any)
+        trailing_stop = None
         if trailing_sl_trigger_pct is not None and trailing_sl_delta_pct is not None:
-            df_filtered.loc[(df_filtered['net_pnl_pct'] > trailing_sl_trigger_pct).cummax(), 'ts'] = (
-                df_filtered['net_pnl_pct'] - float(trailing_sl_delta_pct)
-            ).cummax()
+            trailing_stop = np.where(np.maximum.accumulate(net_pnl_pct > trailing_sl_trigger_pct),
+                                     np.maximum.accumulate(net_pnl_pct - trailing_sl_delta_pct), np.nan)
 
         # Determine the earliest close event
-        first_tp_timestamp = df_filtered[df_filtered['net_pnl_pct'] > tp]['timestamp'].min() if tp else None
+        first_tp_timestamp = self._first_timestamp(timestamps, net_pnl_pct > tp) if tp else None
         first_sl_timestamp = None
         if config.triple_barrier_config.stop_loss:
             sl = float(config.triple_barrier_config.stop_loss)
             sl_price = entry_price * (1 - sl * side_multiplier)
-            sl_condition = df_filtered['low'] <= sl_price if config.side == TradeType.BUY else df_filtered['high'] >= sl_price
-            first_sl_timestamp = df_filtered[sl_condition]['timestamp'].min()
-        first_trailing_sl_timestamp = df_filtered[(~df_filtered['ts'].isna()) & (df_filtered['net_pnl_pct'] < df_filtered['ts'])]['timestamp'].min() if trailing_sl_delta_pct and trailing_sl_trigger_pct else None
+            sl_condition = columns["low"][start_position:start_position + end] <= sl_price \
+                if config.side == TradeType.BUY else columns["high"][start_position:start_position + end] >= sl_price
+            first_sl_timestamp = self._first_timestamp(timestamps, sl_condition)
+        first_trailing_sl_timestamp = self._first_timestamp(
+            timestamps, ~np.isnan(trailing_stop) & (net_pnl_pct < trailing_stop)) \
+            if trailing_sl_delta_pct and trailing_sl_trigger_pct else None
         close_timestamp = min([timestamp for timestamp in [first_tp_timestamp, first_sl_timestamp, tl_timestamp, first_trailing_sl_timestamp] if not pd.isna(timestamp)])
 
         # Determine the close type
@@ -74,14 +81,30 @@ class PositionExecutorSimulator(ExecutorSimulatorBase):
         else:
             close_type = CloseType.TIME_LIMIT
 
-        # Set the final state of the DataFrame
-        df_filtered = df_filtered[df_filtered['timestamp'] <= close_timestamp]
-        df_filtered.loc[df_filtered.index[-1], "filled_amount_quote"] = df_filtered["filled_amount_quote"].iloc[-1] * 2
+        # Set the final state of the simulation
+        close_end = int(np.searchsorted(timestamps, close_timestamp, side="right"))
+        filled_amount_quote = filled_amount_quote[:close_end].copy()
+        filled_amount_quote[-1] = filled_amount_quote[-1] * 2
+        return self._executor_simulation(df, start_position, close_end, config, close_type, net_pnl_pct[:close_end],
+                                         net_pnl_quote[:close_end], cum_fees_quote[:close_end], filled_amount_quote,
+                                         trailing_stop[:close_end] if trailing_stop is not None else None)
+
+    @staticmethod
+    def _first_timestamp(timestamps: np.ndarray, condition: np.ndarray) -> float:
+        position = ExecutorSimulatorBase.first_position(condition)
+        return timestamps[position] if position >= 0 else np.nan
 
-        # Construct and return ExecutorSimulation object
-        simulation = ExecutorSimulation(
-            config=config,
-            executor_simulation=df_filtered,
-            close_type=close_type
-        )
-        return simulation
+    @staticmethod
+    def _executor_simulation(df: pd.DataFrame, start_position: int, rows: int, config: PositionExecutorConfig,
+                             close_type: CloseType, net_pnl_pct: np.ndarray, net_pnl_quote: np.ndarray,
+                             cum_fees_quote: np.ndarray, filled_amount_quote: np.ndarray,
+                             trailing_stop: np.ndarray = None) -> ExecutorSimulation:
+        executor_simulation = df.iloc[start_position:start_position + rows].copy()
+        executor_simulation["net_pnl_pct"] = net_pnl_pct
+        executor_simulation["net_pnl_quote"] = net_pnl_quote
+        executor_simulation["cum_fees_quote"] = cum_fees_quote
+        executor_simulation["filled_amount_quote"] = filled_amount_quote
+        executor_simulation["current_position_average_price"] = float(config.entry_price)
+        if trailing_stop is not None:
+            executor_simulation["ts"] = trailing_stop
+        return ExecutorSimulation(config=config, executor_simulation=executor_simulation, close_type=close_type)
@@ -0,0 +1,366 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client import settings
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.models.executors import CloseType
+
+RESULT_METRICS = ["net_pnl", "net_pnl_quote", "total_executors", "total_executors_with_position", "total_volume",
+                  "total_long", "total_short", "accuracy_long", "accuracy_short", "total_positions", "accuracy",
+                  "max_drawdown_usd", "max_drawdown_pct", "sharpe_ratio", "profit_factor", "win_signals",
+                  "loss_signals"]
+CLOSE_TYPE_COLUMNS = [f"close_type_{close_type.name}" for close_type in CloseType]
+
+
+class ParameterGrid:
+    """
+    All the combinations of the values of the parameters, e.g.
+        ParameterGrid({"stop_loss": [0.01, 0.02], "take_profit": [0.02, 0.03]})
+    yields the 4 parameter sets.
+    """
+
+    def __init__(self, parameters: Dict[str, Sequence[Any]]):
+        self._parameters = parameters
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        names = list(self._parameters)
+        for values in itertools.product(*(self._parameters[name] for name in names)):
+            yield dict(zip(names, values))
+
+    def __len__(self) -> int:
+        return int(np.prod([len(values) for values in self._parameters.values()]))
+
+
+class RandomSearch:
+    """
+    Parameter sets sampled at random. Each parameter is sampled from a list of values, or uniformly from a
+    (low, high) tuple (an integer between them, both included, if both are integers).
+    """
+
+    def __init__(self,
+                 parameters: Dict[str, Union[Sequence[Any], Tuple[Any, Any]]],
+                 samples: int,
+                 seed: Optional[int] = None):
+        self._parameters = parameters
+        self._samples = samples
+        self._seed = seed
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        rng = random.Random(self._seed)
+        for _ in range(self._samples):
+            yield {name: self._sample(rng, values) for name, values in self._parameters.items()}
+
+    def __len__(self) -> int:
+        return self._samples
+
+    @staticmethod
+    def _sample(rng: random.Random, values: Union[Sequence[Any], Tuple[Any, Any]]) -> Any:
+        if isinstance(values, tuple):
+            low, high = values
+            if isinstance(low, int) and isinstance(high, int):
+                return rng.randint(low, high)
+            return rng.uniform(float(low), float(high))
+        return rng.choice(values)
+
+
+class SharedCandlesHandle(NamedTuple):
+    shared_memory_name: str
+    columns: List[str]
+    rows: int
+
+
+class SharedCandles:
+    """
+    Copies candles DataFrames once to shared memory blocks, so that the processes of a sweep read the same candles
+    without copying or pickling them. Each DataFrame is stored as a float64 matrix of one row per column, which
+    `attach` wraps in a DataFrame without copying it.
+    """
+
+    def __init__(self, candles: Dict[str, pd.DataFrame]):
+        self._shared_memories: List[SharedMemory] = []
+        self._handles: Dict[str, SharedCandlesHandle] = {}
+        for key, candles_df in candles.items():
+            values = candles_df.to_numpy(dtype=np.float64).T
+            shared_memory = SharedMemory(create=True, size=max(values.nbytes, 1))
+            self._shared_memories.append(shared_memory)
+            np.ndarray(values.shape, dtype=np.float64, buffer=shared_memory.buf)[:] = values
+            self._handles[key] = SharedCandlesHandle(shared_memory.name, list(candles_df.columns), len(candles_df))
+
+    @property
+    def handles(self) -> Dict[str, SharedCandlesHandle]:
+        return self._handles
+
+    @staticmethod
+    def attach(handles: Dict[str, SharedCandlesHandle]) -> Tuple[Dict[str, pd.DataFrame], List[SharedMemory]]:
+        """
+        Returns read-only DataFrames backed by the shared memory blocks, and the blocks, which must be kept open while
+        the DataFrames are used.
+        """
+        candles = {}
+        shared_memories = []
+        for key, handle in handles.items():
+            shared_memory = SharedMemory(name=handle.shared_memory_name)
+            shared_memories.append(shared_memory)
+            values = np.ndarray((len(handle.columns), handle.rows), dtype=np.float64, buffer=shared_memory.buf)
+            values.flags.writeable = False
+            candles[key] = pd.DataFrame(values.T, columns=handle.columns, copy=False)
+        return candles, shared_memories
+
+    def close(self):
+        for shared_memory in self._shared_memories:
+            shared_memory.close()
+            shared_memory.unlink()
+        self._shared_memories.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def set_config_parameter(config_data: Dict[str, Any], name: str, value: Any):
+    """
+    Sets a parameter of a controller configuration, where the parameters of nested configurations are named with
+    their path, e.g. triple_barrier_config.stop_loss.
+    """
+    *path, field = name.split(".")
+    for key in path:
+        config_data = config_data.setdefault(key, {})
+    config_data[field] = value
+
+
+def _config_data_with_parameters(config_data: Dict[str, Any], parameters: Dict[str, Any]) -> Dict[str, Any]:
+    config_data = _copy_config_data(config_data)
+    for name, value in parameters.items():
+        set_config_parameter(config_data, name, value)
+    return config_data
+
+
+def _copy_config_data(config_data: Any) -> Any:
+    if isinstance(config_data, dict):
+        return {key: _copy_config_data(value) for key, value in config_data.items()}
+    if isinstance(config_data, list):
+        return [_copy_config_data(value) for value in config_data]
+    return config_data
+
+
+def required_candles_configs(controller_config: Dict[str, Any],
+                             parameters: Iterable[Dict[str, Any]],
+                             backtesting_resolution: str = "1m",
+                             controllers_module: str = settings.CONTROLLERS_MODULE) -> List[CandlesConfig]:
+    """
+    Returns the candles the backtests of the parameter sets need: the candles of the backtesting resolution and the
+    candles configured in the controller, for each trading pair of the parameter sets.
+    """
+    candles_configs = {}
+    for run_parameters in parameters:
+        config = BacktestingEngineBase.get_controller_config_instance_from_dict(
+            _config_data_with_parameters(controller_config, run_parameters), controllers_module)
+        backtesting_config = CandlesConfig(connector=config.connector_name, trading_pair=config.trading_pair,
+                                           interval=backtesting_resolution)
+        for candles_config in [backtesting_config] + list(config.candles_config):
+            candles_configs[MarketDataProvider._generate_candle_feed_key(candles_config)] = candles_config
+    return list(candles_configs.values())
+
+
+def load_candles_from_csv(data_path: str, config: CandlesConfig) -> pd.DataFrame:
+    """
+    Loads the candles saved in the data path with the file name of `CandlesBase.load_candles_from_csv`.
+    """
+    file_path = os.path.join(data_path, f"candles_{config.connector}_{config.trading_pair}_{config.interval}.csv")
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File '{file_path}' does not exist.")
+    candles_df = pd.read_csv(file_path)
+    return candles_df.sort_values(by="timestamp").drop_duplicates(subset=["timestamp"]).reset_index(drop=True)
+
+
+def load_candles_from_store(candles_store: CandlesStore,
+                            config: CandlesConfig,
+                            start_time: float,
+                            end_time: float) -> pd.DataFrame:
+    candles = candles_store.get_candles(f"{config.connector}_{config.trading_pair}", config.interval, start_time,
+                                        end_time)
+    if len(candles) == 0:
+        return pd.DataFrame(columns=CandlesBase.columns, dtype=float)
+    return pd.DataFrame(candles, columns=CandlesBase.columns)
+
+
+class _SweepWorker:
+    """
+    The state of a sweep process: the shared candles and a backtesting engine reused by all the runs of the process.
+    """
+
+    def __init__(self,
+                 controller_config: Dict[str, Any],
+                 candles_handles: Dict[str, SharedCandlesHandle],
+                 trading_rules: Dict[str, Dict[str, TradingRule]],
+                 start: int,
+                 end: int,
+                 backtesting_resolution: str,
+                 trade_cost: float,
+                 controllers_module: str):
+        self.controller_config = controller_config
+        self.candles, self.shared_memories = SharedCandles.attach(candles_handles)
+        self.trading_rules = trading_rules
+        self.start = start
+        self.end = end
+        self.backtesting_resolution = backtesting_resolution
+        self.trade_cost = trade_cost
+        self.controllers_module = controllers_module
+        self.engine = BacktestingEngineBase()
+        self.loop = asyncio.new_event_loop()
+
+    def run(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        config = BacktestingEngineBase.get_controller_config_instance_from_dict(
+            _config_data_with_parameters(self.controller_config, parameters), self.controllers_module)
+        data_provider = self.engine.backtesting_data_provider
+        # The feeds cover the whole backtest, so the data provider doesn't fetch any candles or trading rules
+        data_provider.candles_feeds.update(self.candles)
+        data_provider.trading_rules.update(self.trading_rules)
+        backtesting_result = self.loop.run_until_complete(self.engine.run_backtesting(
+            controller_config=config,
+            start=self.start,
+            end=self.end,
+            backtesting_resolution=self.backtesting_resolution,
+            trade_cost=self.trade_cost,
+        ))
+        return backtesting_result["results"]
+
+
+_worker: Optional[_SweepWorker] = None
+
+
+def _initialize_worker(*args):
+    global _worker
+    _worker = _SweepWorker(*args)
+
+
+def _run_in_worker(run_index: int, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return _result_row(run_index, parameters, _worker.run(parameters))
+    except Exception as e:
+        return _result_row(run_index, parameters, None, error=f"{type(e).__name__}: {e}")
+
+
+def _result_row(run_index: int,
+                parameters: Dict[str, Any],
+                results: Optional[Dict[str, Any]],
+                error: Optional[str] = None) -> Dict[str, Any]:
+    row = {"run": run_index, **parameters}
+    results = results or {}
+    for metric in RESULT_METRICS:
+        row[metric] = results.get(metric, np.nan)
+    close_types = results.get("close_types") or {}
+    for close_type in CloseType:
+        row[f"close_type_{close_type.name}"] = close_types.get(close_type.name, 0)
+    row["error"] = error
+    return row
+
+
+class BacktestingSweep:
+    """
+    Runs the backtest of a controller configuration for many parameter sets, in a pool of processes.
+
+    The candles are loaded by the caller (e.g. with `load_candles_from_csv` or `load_candles_from_store`) and copied
+    once to shared memory, and each process keeps a single backtesting engine for all its runs, so the runs don't
+    fetch anything from the exchanges. The candles are keyed as the candles feeds of the data provider
+    (<connector>_<trading pair>_<interval>) and must cover the backtesting period.
+    A run that fails is reported with its error instead of the metrics.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 controller_config: Dict[str, Any],
+                 candles: Dict[str, pd.DataFrame],
+                 trading_rules: Dict[str, Dict[str, TradingRule]],
+                 start: int,
+                 end: int,
+                 backtesting_resolution: str = "1m",
+                 trade_cost: float = 0.0006,
+                 controllers_module: str = settings.CONTROLLERS_MODULE,
+                 max_workers: Optional[int] = None,
+                 mp_context: Optional[multiprocessing.context.BaseContext] = None):
+        """
+        :param controller_config: the controller configuration, as loaded from its yml file
+        :param candles: the candles of the backtests, by candles feed key
+        :param trading_rules: the trading rules of the trading pairs, by connector name
+        :param max_workers: the number of processes, by default the number of CPUs
+        """
+        self._controller_config = controller_config
+        self._candles = candles
+        self._trading_rules = trading_rules
+        self._start = start
+        self._end = end
+        self._backtesting_resolution = backtesting_resolution
+        self._trade_cost = trade_cost
+        self._controllers_module = controllers_module
+        self._max_workers = max_workers or os.cpu_count()
+        self._mp_context = mp_context
+
+    def iter_results(self, parameters: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yields a row with the parameters and the metrics of `BacktestingEngineBase.summarize_results` (with a column per
+        close type) for each parameter set, as the runs complete.
+        """
+        parameters = list(parameters)
+        with SharedCandles(self._candles) as shared_candles:
+            with ProcessPoolExecutor(
+                    max_workers=min(self._max_workers, max(len(parameters), 1)),
+                    mp_context=self._mp_context,
+                    initializer=_initialize_worker,
+                    initargs=(self._controller_config, shared_candles.handles, self._trading_rules, self._start,
+                              self._end, self._backtesting_resolution, self._trade_cost,
+                              self._controllers_module)) as executor:
+                futures = [executor.submit(_run_in_worker, run_index, run_parameters)
+                           for run_index, run_parameters in enumerate(parameters)]
+                for future in as_completed(futures):
+                    row = future.result()
+                    if row["error"] is not None:
+                        self.logger().warning(f"Backtest {row['run']} failed ({row['error']}).")
+                    yield row
+
+    def run(self, parameters: Iterable[Dict[str, Any]], output_path: Optional[str] = None) -> pd.DataFrame:
+        """
+        Runs the backtests of the parameter sets and returns their results, sorted by run.
+
+        :param output_path: a CSV file the rows are appended to as the runs complete, or a Parquet file (.parquet)
+        written when all the runs are complete
+        """
+        parameters = list(parameters)
+        parameter_names = list(dict.fromkeys(name for run_parameters in parameters for name in run_parameters))
+        columns = ["run"] + parameter_names + RESULT_METRICS + CLOSE_TYPE_COLUMNS + ["error"]
+        stream_path = output_path if output_path is not None and not output_path.endswith(".parquet") else None
+        if stream_path is not None:
+            pd.DataFrame(columns=columns).to_csv(stream_path, index=False)
+        rows = []
+        for row in self.iter_results(parameters):
+            rows.append(row)
+            if stream_path is not None:
+                pd.DataFrame([row], columns=columns).to_csv(stream_path, mode="a", header=False, index=False)
+        results = pd.DataFrame(rows, columns=columns).sort_values("run").reset_index(drop=True)
+        if output_path is not None and stream_path is None:
+            results.to_parquet(output_path, index=False)
+        return results
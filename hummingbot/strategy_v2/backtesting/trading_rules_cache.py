@@ -0,0 +1,90 @@
+import json
+import logging
+import os
+import time
+from decimal import Decimal
+from typing import Dict, Optional
+
+from hummingbot import data_path
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.logger import HummingbotLogger
+
+DECIMAL_FIELDS = ["min_order_size", "max_order_size", "min_price_increment", "min_base_amount_increment",
+                  "min_quote_amount_increment", "min_notional_size", "min_order_value", "max_price_significant_digits"]
+OTHER_FIELDS = ["supports_limit_orders", "supports_market_orders", "buy_order_collateral_token",
+                "sell_order_collateral_token"]
+
+
+class TradingRulesCache:
+    """
+    Local cache of the trading rules fetched from the exchanges for the backtests, saved as a JSON file per connector
+    under <base_path>/<connector name>.json. The trading rules are fresh for `ttl` seconds after they are fetched.
+    Expired trading rules are still available, to run backtests offline.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    def __init__(self, base_path: Optional[str] = None, ttl: float = 24 * 60 * 60):
+        self._base_path = base_path or os.path.join(data_path(), "trading_rules")
+        self._ttl = ttl
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @property
+    def base_path(self) -> str:
+        return self._base_path
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def get_trading_rules(self, connector_name: str, include_expired: bool = False) -> Optional[Dict[str, TradingRule]]:
+        """
+        Returns the cached trading rules of the connector by trading pair, or None if they are not cached or expired.
+        """
+        path = self._path(connector_name)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as cache_file:
+                cached = json.load(cache_file)
+            if not include_expired and time.time() - cached["timestamp"] > self._ttl:
+                return None
+            return {trading_pair: self._trading_rule_from_json(trading_pair, trading_rule)
+                    for trading_pair, trading_rule in cached["trading_rules"].items()}
+        except (ValueError, KeyError, TypeError):
+            self.logger().warning(f"The trading rules cache file {path} is malformed. The trading rules will be fetched "
+                                  f"again.")
+            return None
+
+    def store_trading_rules(self, connector_name: str, trading_rules: Dict[str, TradingRule]):
+        os.makedirs(self._base_path, exist_ok=True)
+        cached = {
+            "timestamp": time.time(),
+            "trading_rules": {trading_pair: self._trading_rule_to_json(trading_rule)
+                              for trading_pair, trading_rule in trading_rules.items()},
+        }
+        path = self._path(connector_name)
+        temp_path = os.path.join(self._base_path, f".{connector_name}.json")
+        with open(temp_path, "w") as cache_file:
+            json.dump(cached, cache_file)
+        os.replace(temp_path, path)
+
+    def _path(self, connector_name: str) -> str:
+        return os.path.join(self._base_path, f"{connector_name}.json")
+
+    @staticmethod
+    def _trading_rule_to_json(trading_rule: TradingRule) -> Dict:
+        trading_rule_json = {field: str(getattr(trading_rule, field)) for field in DECIMAL_FIELDS}
+        trading_rule_json.update({field: getattr(trading_rule, field) for field in OTHER_FIELDS})
+        return trading_rule_json
+
+    @staticmethod
+    def _trading_rule_from_json(trading_pair: str, trading_rule_json: Dict) -> TradingRule:
+        fields = {field: Decimal(trading_rule_json[field]) for field in DECIMAL_FIELDS}
+        fields.update({field: trading_rule_json[field] for field in OTHER_FIELDS})
+        return TradingRule(trading_pair=trading_pair, **fields)
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -25,6 +25,9 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
 
 class ExecutorBase(RunnableBase):
     """
@@ -47,14 +50,24 @@ class ExecutorBase(RunnableBase):
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
+        # Ids of the orders placed by the executor, an event on one of them wakes the executor up when scheduled
+        self._order_ids: Set[str] = set()
+
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(
+            self._order_event_handler(self.process_order_created_event))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(
+            self._order_event_handler(self.process_order_created_event))
+        self._fill_order_forwarder = SourceInfoEventForwarder(
+            self._order_event_handler(self.process_order_filled_event))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(
+            self._order_event_handler(self.process_order_completed_event))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(
+            self._order_event_handler(self.process_order_completed_event))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(
+            self._order_event_handler(self.process_order_canceled_event))
+        self._failed_order_forwarder = SourceInfoEventForwarder(
+            self._order_event_handler(self.process_order_failed_event))
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -154,11 +167,13 @@ class ExecutorBase(RunnableBase):
             AllConnectorSettings.get_gateway_amm_connector_names()
         )
 
-    def start(self):
+    def start(self, scheduler: Optional["RunnableScheduler"] = None):
         """
         Starts the executor and registers the events.
+
+        :param scheduler: The scheduler that runs the control task of the executor, if any.
         """
-        super().start()
+        super().start(scheduler)
         self.register_events()
 
     def stop(self):
@@ -242,6 +257,17 @@ class ExecutorBase(RunnableBase):
         """
         return self.connectors[connector_name]._order_tracker.fetch_order(client_order_id=order_id)
 
+    def _order_event_handler(self, process_order_event: Callable) -> Callable:
+        """
+        Returns the handler of an order event, that processes it and wakes the executor up if the order is one of its
+        orders.
+        """
+        def handle_order_event(event_tag: int, market: ConnectorBase, event):
+            process_order_event(event_tag, market, event)
+            if event.order_id in self._order_ids:
+                self.wake()
+        return handle_order_event
+
     def register_events(self):
         """
         Registers the events with the connectors.
@@ -286,9 +312,11 @@ class ExecutorBase(RunnableBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        self._order_ids.add(order_id)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
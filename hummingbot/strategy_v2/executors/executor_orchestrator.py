@@ -1,7 +1,7 @@
 import logging
 from copy import deepcopy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import TradeType
@@ -26,6 +26,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
     StoreExecutorAction,
 )
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler, RunnableStats
 
 
 class ExecutorOrchestrator:
@@ -40,9 +41,18 @@ class ExecutorOrchestrator:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0):
+    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0,
+                 use_scheduler: bool = True):
+        """
+        :param strategy: The strategy the executors trade for.
+        :param executors_update_interval: The interval at which the executors are updated, in seconds.
+        :param use_scheduler: Whether the executors are run by a scheduler shared by all of them, that skips the idle
+        ones, instead of a control loop each.
+        """
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
+        self.scheduler: Optional[RunnableScheduler] = RunnableScheduler(
+            strategy, tick_interval=executors_update_interval) if use_scheduler else None
         self.active_executors = {}
         self.archived_executors = {}
         self.cached_performance = {}
@@ -136,7 +146,7 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
-        executor.start()
+        executor.start(scheduler=self.scheduler)
         self.active_executors[controller_id].append(executor)
         self.logger().debug(f"Created {type(executor).__name__} for controller {controller_id}")
 
@@ -189,6 +199,19 @@ class ExecutorOrchestrator:
             report[controller_id] = [executor.executor_info for executor in executors_list if executor]
         return report
 
+    def get_executors_stats(self) -> Dict[str, RunnableStats]:
+        """
+        Get the runs, idle skips and CPU time of the active executors run by the scheduler, by executor ID.
+        """
+        stats = {}
+        if self.scheduler is not None:
+            for executors_list in self.active_executors.values():
+                for executor in executors_list:
+                    executor_stats = self.scheduler.get_stats(executor)
+                    if executor_stats is not None:
+                        stats[executor.config.id] = executor_stats
+        return stats
+
     def generate_performance_report(self, controller_id: str) -> PerformanceReport:
         # Start with a deep copy of the cached performance for this controller
         report = deepcopy(self.cached_performance.get(controller_id, PerformanceReport()))
@@ -19,7 +19,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
-from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.base import IdleConditions, RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType, TrackedOrder
 
 
@@ -360,6 +360,62 @@ class PositionExecutor(ExecutorBase):
         else:
             self.place_close_order_and_cancel_open_orders(close_type=self.close_type)
 
+    def get_idle_conditions(self) -> Optional[IdleConditions]:
+        """
+        This method is responsible for telling when the control task has nothing to do: while the open order is placed
+        but not filled, or once it is filled, while the market price stays between the prices at which the stop loss,
+        take profit or trailing stop would act, until the time limit. With activation bounds, the orders depend on the
+        mid price at every update, so the executor is never idle.
+
+        :return: The idle conditions, or None if the executor can't be skipped.
+        """
+        if self.status != RunnableStatus.RUNNING or not self._open_order or self.config.activation_bounds:
+            return None
+        if not (self._open_order.is_filled and self.open_filled_amount >= self.trading_rules.min_order_size
+                and self.open_filled_amount_quote >= self.trading_rules.min_notional_size):
+            return IdleConditions(until_timestamp=self.end_time)
+
+        # Net pnl pcts at which a barrier acts, when going down and up
+        lower_net_pnl_pcts = []
+        upper_net_pnl_pcts = []
+        triple_barrier_config = self.config.triple_barrier_config
+        if triple_barrier_config.stop_loss:
+            lower_net_pnl_pcts.append(-triple_barrier_config.stop_loss)
+        if triple_barrier_config.take_profit:
+            if not triple_barrier_config.take_profit_order_type.is_limit_type():
+                upper_net_pnl_pcts.append(triple_barrier_config.take_profit)
+            elif not self._take_profit_limit_order:
+                return None
+        if triple_barrier_config.trailing_stop:
+            if not self._trailing_stop_trigger_pct:
+                upper_net_pnl_pcts.append(triple_barrier_config.trailing_stop.activation_price)
+            else:
+                lower_net_pnl_pcts.append(self._trailing_stop_trigger_pct)
+                upper_net_pnl_pcts.append(self._trailing_stop_trigger_pct +
+                                          triple_barrier_config.trailing_stop.trailing_delta)
+
+        # The net pnl pct is the trade pnl pct minus the fees paid per unit of quote filled
+        fees_pct = self.cum_fees_quote / self.open_filled_amount_quote
+        lower_price = upper_price = None
+        if self.config.side == TradeType.BUY:
+            if lower_net_pnl_pcts:
+                lower_price = self.entry_price * (1 + max(lower_net_pnl_pcts) + fees_pct)
+            if upper_net_pnl_pcts:
+                upper_price = self.entry_price * (1 + min(upper_net_pnl_pcts) + fees_pct)
+        else:
+            if upper_net_pnl_pcts:
+                lower_price = self.entry_price * (1 - min(upper_net_pnl_pcts) - fees_pct)
+            if lower_net_pnl_pcts:
+                upper_price = self.entry_price * (1 - max(lower_net_pnl_pcts) - fees_pct)
+        return IdleConditions(
+            connector_name=self.config.connector_name,
+            trading_pair=self.config.trading_pair,
+            price_type=PriceType.BestBid if self.config.side == TradeType.BUY else PriceType.BestAsk,
+            lower_price=lower_price,
+            upper_price=upper_price,
+            until_timestamp=self.end_time,
+        )
+
     def evaluate_max_retries(self):
         """
         This method is responsible for evaluating the maximum number of retries to place an order and stop the executor
@@ -617,6 +673,8 @@ class PositionExecutor(ExecutorBase):
         :return: None
         """
         self.place_close_order_and_cancel_open_orders(close_type=CloseType.EARLY_STOP)
+        # Called from outside the control task, which a scheduler may be skipping on the idle conditions
+        self.wake()
 
     def update_tracked_orders_with_order_id(self, order_id: str):
         """
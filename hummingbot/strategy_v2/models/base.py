@@ -1,4 +1,8 @@
+from decimal import Decimal
 from enum import Enum
+from typing import NamedTuple, Optional
+
+from hummingbot.core.data_type.common import PriceType
 
 
 class RunnableStatus(Enum):
@@ -6,3 +10,17 @@ class RunnableStatus(Enum):
     RUNNING = 2
     SHUTTING_DOWN = 3
     TERMINATED = 4
+
+
+class IdleConditions(NamedTuple):
+    """
+    Conditions under which a runnable has nothing to do: while the price of the trading pair stays strictly between the
+    lower and upper prices (a missing price is unbounded) and until the timestamp of the strategy clock (never if
+    missing), as long as none of its orders gets an event.
+    """
+    connector_name: Optional[str] = None
+    trading_pair: Optional[str] = None
+    price_type: PriceType = PriceType.MidPrice
+    lower_price: Optional[Decimal] = None
+    upper_price: Optional[Decimal] = None
+    until_timestamp: Optional[float] = None
@@ -1,10 +1,14 @@
 import asyncio
 import logging
 from abc import ABC
+from typing import TYPE_CHECKING, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
-from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.base import IdleConditions, RunnableStatus
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
 
 
 class RunnableBase(ABC):
@@ -29,6 +33,7 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        self._scheduler: Optional["RunnableScheduler"] = None
 
     @property
     def status(self):
@@ -39,15 +44,22 @@ class RunnableBase(ABC):
         """
         return self._status
 
-    def start(self):
+    def start(self, scheduler: Optional["RunnableScheduler"] = None):
         """
         Start the control loop of the smart component.
-        If the component is not already started, it will start the control loop.
+        If the component is not already started, it will start the control loop, or register the component with the
+        scheduler if one is given, which will run its control task instead.
+
+        :param scheduler: The scheduler that runs the control task of the component, if any.
         """
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            if scheduler is not None:
+                self._scheduler = scheduler
+                scheduler.register(self)
+            else:
+                safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
@@ -57,6 +69,23 @@ class RunnableBase(ABC):
         if self._status != RunnableStatus.TERMINATED:
             self._status = RunnableStatus.TERMINATED
             self.terminated.set()
+            self.wake()
+
+    def wake(self):
+        """
+        Ask the scheduler of the smart component, if any, to run its control task as soon as possible.
+        """
+        if self._scheduler is not None:
+            self._scheduler.wake(self)
+
+    def get_idle_conditions(self) -> Optional[IdleConditions]:
+        """
+        Get the conditions under which the control task has nothing to do, so that a scheduler can skip it.
+        This method should be overridden in subclasses that can tell, by default the control task is always run.
+
+        :return: The idle conditions of the smart component, or None if it can't be skipped.
+        """
+        return None
 
     async def control_loop(self):
         """
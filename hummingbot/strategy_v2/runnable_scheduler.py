@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import time
+from decimal import Decimal
+from typing import Any, Awaitable, Dict, Generator, List, NamedTuple, Optional, Set, Tuple
+
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.models.base import IdleConditions
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class RunnableStats(NamedTuple):
+    runs: int
+    idle_skips: int
+    cpu_time: float
+
+
+class _ScheduledRunnable:
+    __slots__ = ("runnable", "started", "last_run", "idle_conditions", "task", "runs", "idle_skips", "cpu_time")
+
+    def __init__(self, runnable: RunnableBase):
+        self.runnable = runnable
+        self.started = False
+        self.last_run = float("-inf")
+        self.idle_conditions: Optional[IdleConditions] = None
+        self.task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.idle_skips = 0
+        self.cpu_time = 0.0
+
+
+class _TimedSteps:
+    """
+    Awaits an awaitable, adding the CPU time of each of its steps (from the moment it is resumed until it suspends) to
+    the stats of a scheduled runnable. The coroutines run while it is suspended are not counted.
+    """
+    __slots__ = ("_awaitable", "_scheduled")
+
+    def __init__(self, awaitable: Awaitable, scheduled: _ScheduledRunnable):
+        self._awaitable = awaitable
+        self._scheduled = scheduled
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        iterator = self._awaitable.__await__()
+        value, error = None, None
+        while True:
+            start = time.thread_time()
+            try:
+                future = iterator.send(value) if error is None else iterator.throw(error)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self._scheduled.cpu_time += time.thread_time() - start
+            try:
+                value, error = (yield future), None
+            except GeneratorExit:
+                iterator.close()
+                raise
+            except BaseException as e:
+                value, error = None, e
+
+
+class RunnableScheduler:
+    """
+    Runs the control tasks of many runnables from a single task, instead of a control loop (and a timer) each.
+    Every tick, the runnables due are run in batches, yielding to the event loop between batches. A runnable is due
+    when its update interval has elapsed since the tick that started its last run, unless it is idle according to the
+    conditions it gave after its last run (see RunnableBase.get_idle_conditions): it is then skipped until the price
+    moves past its bounds, its time limit is reached or max_idle_interval has elapsed. A runnable that is woken up (by
+    an event on one of its orders, or when it stops) is run right away.
+    The CPU time of a runnable only counts the steps of its own on_start and control tasks, not the coroutines run on
+    the event loop while they await.
+    """
+    _logger = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, strategy: ScriptStrategyBase, tick_interval: float = 0.5, batch_size: int = 50,
+                 max_idle_interval: float = 10.0):
+        """
+        :param strategy: The strategy whose connectors give the prices to check the idle conditions against.
+        :param tick_interval: The interval at which the runnables due are looked for, in seconds.
+        :param batch_size: The number of control tasks started before yielding to the event loop.
+        :param max_idle_interval: The maximum time an idle runnable is skipped for, in seconds.
+        """
+        self._strategy = strategy
+        self._tick_interval = tick_interval
+        self._batch_size = batch_size
+        self._max_idle_interval = max_idle_interval
+        # Absorbs the jitter of the ticks, so a runnable whose update interval is the tick interval runs every tick
+        self._due_tolerance = tick_interval / 10
+        self._scheduled: Dict[RunnableBase, _ScheduledRunnable] = {}
+        self._woken: Set[RunnableBase] = set()
+        self._wake_event = asyncio.Event()
+        self._scheduler_task: Optional[asyncio.Task] = None
+
+    @property
+    def runnables(self) -> List[RunnableBase]:
+        return list(self._scheduled)
+
+    def register(self, runnable: RunnableBase):
+        """
+        Schedule the control task of the runnable. Its first run starts it (on_start), and it is unregistered once it
+        is terminated, after on_stop.
+        """
+        if runnable in self._scheduled:
+            return
+        self._scheduled[runnable] = _ScheduledRunnable(runnable)
+        self.wake(runnable)
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = safe_ensure_future(self._scheduler_loop())
+
+    def wake(self, runnable: RunnableBase):
+        if runnable in self._scheduled:
+            self._woken.add(runnable)
+            self._wake_event.set()
+
+    def get_stats(self, runnable: RunnableBase) -> Optional[RunnableStats]:
+        """
+        Returns the number of runs of the control task of the runnable, the number of ticks it was skipped for being
+        idle, and the CPU time of its runs (in seconds, only the steps of its own tasks), or None if the runnable is not
+        scheduled.
+        """
+        scheduled = self._scheduled.get(runnable)
+        if scheduled is None:
+            return None
+        return RunnableStats(scheduled.runs, scheduled.idle_skips, scheduled.cpu_time)
+
+    async def _scheduler_loop(self):
+        next_tick = self._time()
+        while len(self._scheduled) > 0:
+            try:
+                # A wake up between two ticks only runs the runnables woken up
+                await self.tick(woken_only=self._time() < next_tick)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger().error(f"Error running the scheduled runnables: {e}", exc_info=True)
+            if self._time() >= next_tick:
+                next_tick = self._time() + self._tick_interval
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=max(next_tick - self._time(), 0))
+            except asyncio.TimeoutError:
+                pass
+            self._wake_event.clear()
+
+    async def tick(self, woken_only: bool = False):
+        """
+        Runs the control tasks of the runnables due, in batches.
+
+        :param woken_only: Whether to only run the runnables woken up since the last tick.
+        """
+        now = self._time()
+        timestamp = self._strategy.current_timestamp
+        prices: Dict[Tuple[str, str, PriceType], Decimal] = {}
+        due = []
+        for runnable in (list(self._woken) if woken_only else list(self._scheduled)):
+            scheduled = self._scheduled.get(runnable)
+            if scheduled is None or (scheduled.task is not None and not scheduled.task.done()):
+                continue
+            if runnable in self._woken:
+                self._woken.discard(runnable)
+                due.append(scheduled)
+            elif now - scheduled.last_run < runnable.update_interval - self._due_tolerance:
+                continue
+            elif self._is_idle(scheduled, now, timestamp, prices):
+                scheduled.idle_skips += 1
+            else:
+                due.append(scheduled)
+        for i in range(0, len(due), self._batch_size):
+            for scheduled in due[i:i + self._batch_size]:
+                # The runs are timed from the tick that starts them, as the next ticks are
+                scheduled.last_run = now
+                scheduled.task = safe_ensure_future(self._run(scheduled))
+            await asyncio.sleep(0)
+
+    def _is_idle(self, scheduled: _ScheduledRunnable, now: float, timestamp: float,
+                 prices: Dict[Tuple[str, str, PriceType], Decimal]) -> bool:
+        conditions = scheduled.idle_conditions
+        if conditions is None or now - scheduled.last_run >= self._max_idle_interval:
+            return False
+        if conditions.until_timestamp is not None and timestamp >= conditions.until_timestamp:
+            return False
+        if conditions.lower_price is None and conditions.upper_price is None:
+            return True
+        key = (conditions.connector_name, conditions.trading_pair, conditions.price_type)
+        try:
+            price = prices.get(key)
+            if price is None:
+                price = self._strategy.connectors[conditions.connector_name].get_price_by_type(
+                    conditions.trading_pair, conditions.price_type)
+                prices[key] = price
+            return (conditions.lower_price is None or price > conditions.lower_price) and \
+                (conditions.upper_price is None or price < conditions.upper_price)
+        except Exception:
+            # Without a valid price the runnable is run, as it would be without a scheduler
+            return False
+
+    async def _run(self, scheduled: _ScheduledRunnable):
+        runnable = scheduled.runnable
+        try:
+            if not scheduled.started:
+                scheduled.started = True
+                try:
+                    await _TimedSteps(runnable.on_start(), scheduled)
+                except Exception as e:
+                    # As with a control loop, a runnable failing to start is never run
+                    runnable.logger().error(e, exc_info=True)
+                    self._unregister(runnable)
+                    return
+            if not runnable.terminated.is_set():
+                await _TimedSteps(runnable.control_task(), scheduled)
+        except Exception as e:
+            runnable.logger().error(e, exc_info=True)
+        finally:
+            scheduled.runs += 1
+        if runnable.terminated.is_set():
+            self._unregister(runnable)
+            runnable.on_stop()
+            return
+        try:
+            scheduled.idle_conditions = runnable.get_idle_conditions()
+        except Exception as e:
+            self.logger().debug(f"Error getting the idle conditions of {runnable}: {e}")
+            scheduled.idle_conditions = None
+
+    def _unregister(self, runnable: RunnableBase):
+        self._scheduled.pop(runnable, None)
+        self._woken.discard(runnable)
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Measures AsyncThrottler throughput with thousands of requests queued at once.
+ - unsaturated: the limits are never reached, it measures the cost of checking and logging each request
+ - saturated: the requests have to wait for capacity, the elapsed time is compared with the time the limits allow
+ - cancel latency: cancels issued while polling requests saturate the limits, with and without priorities
+ - shared budget: the unsaturated requests through a SharedAsyncThrottler, whose logs are shared with other processes
+
+    python test/benchmark/async_throttler_benchmark.py --requests 5000
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import List
+
+from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, ThrottlePriority
+from hummingbot.core.api_throttler.shared_async_throttler import SharedAsyncThrottler
+
+
+def rate_limits(request_weight_limit: int, interval: float) -> List[RateLimit]:
+    # Similar to exchanges with a shared weight pool plus raw request and per endpoint limits
+    return [
+        RateLimit(limit_id="REQUEST_WEIGHT", limit=request_weight_limit, time_interval=interval),
+        RateLimit(limit_id="RAW_REQUESTS", limit=request_weight_limit * 5, time_interval=interval),
+        RateLimit(limit_id="/api/v3/order", limit=request_weight_limit, time_interval=interval, linked_limits=[
+            LinkedLimitWeightPair("REQUEST_WEIGHT", 1),
+            LinkedLimitWeightPair("RAW_REQUESTS", 1),
+        ]),
+    ]
+
+
+async def run_requests(throttler: AsyncThrottler, requests: int) -> float:
+    async def request():
+        async with throttler.execute_task(limit_id="/api/v3/order"):
+            pass
+
+    start = time.perf_counter()
+    await asyncio.gather(*[request() for _ in range(requests)])
+    return time.perf_counter() - start
+
+
+async def run_cancels_while_polling(
+        throttler: AsyncThrottler, requests: int, cancels: int, use_priority: bool) -> List[float]:
+    async def request(priority: ThrottlePriority):
+        async with throttler.execute_task(limit_id="/api/v3/order",
+                                          priority=priority if use_priority else ThrottlePriority.USER_DATA):
+            pass
+
+    polling = [asyncio.ensure_future(request(ThrottlePriority.USER_DATA)) for _ in range(requests)]
+    cancel_latencies = []
+    for _ in range(cancels):
+        start = time.perf_counter()
+        await request(ThrottlePriority.CANCEL)
+        cancel_latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.05)
+    for task in polling:
+        task.cancel()
+    await asyncio.gather(*polling, return_exceptions=True)
+    return cancel_latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--saturated-limit", type=int, default=1000, help="requests allowed per second")
+    args = parser.parse_args()
+
+    throttler = AsyncThrottler(rate_limits=rate_limits(args.requests * 10, 60), safety_margin_pct=0)
+    elapsed = asyncio.run(run_requests(throttler, args.requests))
+    print(f"unsaturated: {args.requests} requests in {elapsed:.3f}s, {elapsed / args.requests * 1e6:.1f} us/request")
+
+    # The capacity warning is notified through the client application, not running in this script
+    AsyncRequestContextBase._last_max_cap_warning_ts = float("inf")
+    throttler = AsyncThrottler(rate_limits=rate_limits(args.saturated_limit, 1), safety_margin_pct=0)
+    elapsed = asyncio.run(run_requests(throttler, args.requests))
+    ideal = (args.requests - 1) // args.saturated_limit
+    print(f"saturated:   {args.requests} requests at {args.saturated_limit}/s in {elapsed:.3f}s "
+          f"(limits allow {ideal:.3f}s), {args.requests / elapsed:.0f} requests/s")
+
+    for use_priority in (False, True):
+        throttler = AsyncThrottler(rate_limits=rate_limits(args.saturated_limit, 1), safety_margin_pct=0,
+                                   priority_reserves={ThrottlePriority.CANCEL: 0.05})
+        latencies = asyncio.run(run_cancels_while_polling(throttler, args.requests, 20, use_priority))
+        print(f"cancels {'with' if use_priority else 'without'} priority while polling: "
+              f"mean {sum(latencies) / len(latencies) * 1e3:.1f}ms, max {max(latencies) * 1e3:.1f}ms")
+
+    with tempfile.TemporaryDirectory() as budget_directory:
+        throttler = SharedAsyncThrottler(rate_limits=rate_limits(args.requests * 10, 60), safety_margin_pct=0,
+                                         budget_name="benchmark", budget_directory=budget_directory)
+        elapsed = asyncio.run(run_requests(throttler, args.requests))
+    print(f"shared budget: {args.requests} requests in {elapsed:.3f}s, "
+          f"{elapsed / args.requests * 1e6:.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""
+Measures the startup of BacktestingDataProvider, i.e. the creation of a backtesting engine, and the memory it
+allocates.
+ - eager: every connector supported for backtesting instantiated at startup, as the data provider used to do
+ - lazy: only the connector of the backtest instantiated, when its trading rules are first needed
+
+    python test/benchmark/backtesting_data_provider_benchmark.py --connector binance
+"""
+import argparse
+import time
+import tracemalloc
+
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+
+
+def start_provider(eager: bool, connector_name: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    data_provider = BacktestingDataProvider(connectors={})
+    if eager:
+        for name, settings in data_provider.conn_settings.items():
+            if (settings.type in data_provider.CONNECTOR_TYPES and name not in data_provider.EXCLUDED_CONNECTORS
+                    and "testnet" not in name):
+                data_provider.get_connector(name)
+    else:
+        data_provider.get_connector(connector_name)
+    duration = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak_memory, len(data_provider.connectors)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connector", type=str, default="binance")
+    args = parser.parse_args()
+
+    # Imports and one-time initializations shared by both modes
+    start_provider(eager=False, connector_name=args.connector)
+    for eager in (True, False):
+        duration, peak_memory, connectors_count = start_provider(eager, args.connector)
+        print(f"{'eager' if eager else 'lazy':>6}: {duration * 1e3:8.1f} ms, {peak_memory / 2 ** 20:6.1f} MB, "
+              f"{connectors_count} connectors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Measures the simulation loop of BacktestingEngineBase on 1m candles, with a controller that keeps up to
+--max-executors position executors open and stops the ones losing too much.
+ - by rows: the rows iterated as Series and the info of every active executor rebuilt from its simulation at each
+   timestamp (vectorized=False)
+ - vectorized: the rows iterated as tuples, the executors simulated on the market data columns as numpy arrays, and
+   the info of the active executors updated incrementally
+The summaries of both runs are checked to be identical.
+
+    python test/benchmark/backtesting_engine_benchmark.py --days 365
+"""
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+
+
+class BenchmarkController:
+
+    def __init__(self, market_data_provider, max_executors: int):
+        self.config = SimpleNamespace(connector_name="binance", trading_pair="BTC-USDT", candles_config=[])
+        self.market_data_provider = market_data_provider
+        self.max_executors = max_executors
+        self.processed_data = {}
+        self.executors_info = []
+        self.executors_count = 0
+
+    def determine_executor_actions(self):
+        actions = []
+        active_executors = [executor for executor in self.executors_info if executor.is_active]
+        for executor in active_executors:
+            if executor.net_pnl_pct < Decimal("-0.004"):
+                actions.append(StopExecutorAction(controller_id="main", executor_id=executor.id))
+        if len(active_executors) < self.max_executors and int(self.processed_data["timestamp"] / 60) % 5 == 0:
+            self.executors_count += 1
+            actions.append(CreateExecutorAction(controller_id="main", executor_config=PositionExecutorConfig(
+                id=f"executor-{self.executors_count}",
+                timestamp=self.processed_data["timestamp"],
+                connector_name=self.config.connector_name,
+                trading_pair=self.config.trading_pair,
+                side=TradeType.BUY if self.executors_count % 2 == 0 else TradeType.SELL,
+                entry_price=Decimal(str(self.processed_data["close"])),
+                amount=Decimal("1"),
+                triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.006"), stop_loss=Decimal("0.008"),
+                                                          time_limit=3 * 3600, open_order_type=OrderType.MARKET),
+            )))
+        return actions
+
+
+def candles(rows: int) -> pd.DataFrame:
+    random = np.random.default_rng(7)
+    close = 30000 * np.exp(np.cumsum(random.normal(0, 0.001, rows)))
+    return pd.DataFrame({
+        "timestamp": 1672531200.0 + 60 * np.arange(rows),
+        "open": np.roll(close, 1),
+        "high": close * (1 + np.abs(random.normal(0, 0.0005, rows))),
+        "low": close * (1 - np.abs(random.normal(0, 0.0005, rows))),
+        "close": close,
+        "volume": random.uniform(1, 10, rows),
+    })
+
+
+def run(vectorized: bool, candles_df: pd.DataFrame, max_executors: int):
+    with patch("hummingbot.strategy_v2.backtesting.backtesting_engine_base.BacktestingDataProvider"):
+        engine = BacktestingEngineBase(vectorized=vectorized)
+    engine.backtesting_resolution = "1m"
+    market_data_provider = MagicMock()
+    market_data_provider.get_candles_df.return_value = candles_df.copy()
+    engine.controller = BenchmarkController(market_data_provider, max_executors)
+    start = time.perf_counter()
+    executors_info = asyncio.get_event_loop().run_until_complete(engine.simulate_execution(trade_cost=0.0006))
+    duration = time.perf_counter() - start
+    return duration, engine.summarize_results(executors_info, 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=float, default=365)
+    parser.add_argument("--max-executors", type=int, default=5)
+    parser.add_argument("--skip-by-rows", action="store_true", help="only run the vectorized loop")
+    args = parser.parse_args()
+
+    candles_df = candles(int(args.days * 1440))
+    print(f"{len(candles_df)} candles, up to {args.max_executors} active executors")
+    vectorized_duration, vectorized_results = run(True, candles_df, args.max_executors)
+    print(f"vectorized: {vectorized_duration:.1f} s, {vectorized_results['total_executors']} executors")
+    if not args.skip_by_rows:
+        by_rows_duration, by_rows_results = run(False, candles_df, args.max_executors)
+        print(f"by rows:    {by_rows_duration:.1f} s, identical results: {by_rows_results == vectorized_results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+"""
+Measures the handling of user stream fill events by the order tracker of a connector, against the number of orders
+tracked. Each event looks the order up by client order id and by exchange order id, as the connectors do, and then
+processes the trade update.
+ - baseline: the fillable / updatable orders rebuilt as dicts on every property access, and the orders found by
+   exchange order id with a scan (previous implementation)
+ - indexed: read-only views over the tracker collections and the exchange order id index
+
+    python test/benchmark/client_order_tracker_benchmark.py --orders 10 100 1000 5000 --events 2000
+"""
+import argparse
+import logging
+import time
+from decimal import Decimal
+from itertools import chain
+from typing import Dict, Optional
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+
+
+class BenchmarkExchange(ExchangeBase):
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return dict()
+
+
+class BaselineClientOrderTracker(ClientOrderTracker):
+    """The previous implementation of the ClientOrderTracker properties and order lookups."""
+
+    @property
+    def cached_orders(self) -> Dict[str, InFlightOrder]:
+        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+
+    @property
+    def all_orders(self) -> Dict[str, InFlightOrder]:
+        return {**self.active_orders, **self.cached_orders}
+
+    @property
+    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+
+    @property
+    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+        return {
+            order.exchange_order_id: order
+            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
+        }
+
+    @property
+    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+        return {**self.active_orders, **self.lost_orders}
+
+    @property
+    def lost_orders(self) -> Dict[str, InFlightOrder]:
+        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+
+    def fetch_order(self, client_order_id: Optional[str] = None,
+                    exchange_order_id: Optional[str] = None) -> Optional[InFlightOrder]:
+        found_order = None
+        if client_order_id in self.all_orders:
+            found_order = self.all_orders[client_order_id]
+        elif exchange_order_id is not None:
+            found_order = next(
+                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
+            )
+        return found_order
+
+    def process_trade_update(self, trade_update: TradeUpdate):
+        tracked_order = self.all_fillable_orders.get(trade_update.client_order_id)
+        if tracked_order:
+            previous_executed_amount_base = tracked_order.executed_amount_base
+            if tracked_order.update_with_trade_update(trade_update):
+                self._trigger_order_fills(
+                    tracked_order=tracked_order,
+                    prev_executed_amount_base=previous_executed_amount_base,
+                    fill_amount=trade_update.fill_base_amount,
+                    fill_price=trade_update.fill_price,
+                    fill_fee=trade_update.fee,
+                    trade_id=trade_update.trade_id,
+                    exchange_order_id=trade_update.exchange_order_id,
+                )
+
+
+def build_tracker(tracker_class, active_orders: int, cached_orders: int) -> ClientOrderTracker:
+    connector = BenchmarkExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    connector._set_current_timestamp(1640000000.0)
+    tracker = tracker_class(connector=connector)
+    for index in range(active_orders + cached_orders):
+        tracker.start_tracking_order(InFlightOrder(
+            client_order_id=f"OID{index}",
+            exchange_order_id=f"EOID{index}",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000000"),
+            creation_timestamp=1640000000.0,
+            price=Decimal("100"),
+            initial_state=OrderState.OPEN,
+        ))
+    for index in range(active_orders, active_orders + cached_orders):
+        tracker.stop_tracking_order(f"OID{index}")
+    return tracker
+
+
+def handle_fill_events(tracker: ClientOrderTracker, active_orders: int, events: int) -> float:
+    fee = AddedToCostTradeFee(flat_fees=[TokenAmount("HBOT", Decimal("0.01"))])
+    start = time.perf_counter()
+    for index in range(events):
+        order_index = index % active_orders
+        client_order_id = f"OID{order_index}"
+        exchange_order_id = f"EOID{order_index}"
+        fillable_order = tracker.all_fillable_orders.get(client_order_id)
+        tracker.all_updatable_orders.get(client_order_id)
+        if fillable_order is None:
+            fillable_order = tracker.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
+        tracker.fetch_order(exchange_order_id=exchange_order_id)
+        tracker.process_trade_update(TradeUpdate(
+            trade_id=str(index),
+            client_order_id=fillable_order.client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=fillable_order.trading_pair,
+            fill_timestamp=1640000000.0,
+            fill_price=Decimal("100"),
+            fill_base_amount=Decimal("1"),
+            fill_quote_amount=Decimal("100"),
+            fee=fee,
+        ))
+    return (time.perf_counter() - start) / events
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, nargs="+", default=[10, 100, 1000, 5000],
+                        help="active orders tracked")
+    parser.add_argument("--cached-orders", type=int, default=ClientOrderTracker.MAX_CACHE_SIZE)
+    parser.add_argument("--events", type=int, default=2000)
+    args = parser.parse_args()
+
+    ClientOrderTracker.logger().setLevel(logging.WARNING)
+    print(f"{args.events} fill events, {args.cached_orders} cached orders")
+    print(f"{'active orders':>13} {'baseline (us)':>14} {'indexed (us)':>13}")
+    for active_orders in args.orders:
+        durations = [
+            handle_fill_events(build_tracker(tracker_class, active_orders, args.cached_orders), active_orders,
+                               args.events)
+            for tracker_class in (BaselineClientOrderTracker, ClientOrderTracker)
+        ]
+        print(f"{active_orders:>13} {durations[0] * 1e6:14.2f} {durations[1] * 1e6:13.2f}")
+
+
+if __name__ == "__main__":
+    main()
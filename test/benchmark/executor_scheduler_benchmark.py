@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+"""
+Measures the CPU time spent running --executors position executors with filled open orders, for --duration seconds
+while the price random walks (the same walk in both runs).
+ - loops: each executor runs its own control loop, as when started without a scheduler
+ - scheduler: the executors are run by the RunnableScheduler of the ExecutorOrchestrator, that skips them while the
+   price stays between their barriers
+Both runs report the control tasks run and the positions closed by the barriers.
+
+    python test/benchmark/executor_scheduler_benchmark.py --executors 300 --duration 10
+"""
+import argparse
+import asyncio
+import random
+import time
+from decimal import Decimal
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
+from hummingbot.strategy_v2.models.executors import CloseType, TrackedOrder
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
+TRADING_PAIR = "ETH-USDT"
+
+
+class BenchmarkConnector:
+    def __init__(self):
+        self.price = Decimal("100")
+        self.trading_rules = {TRADING_PAIR: TradingRule(TRADING_PAIR)}
+
+    def get_price_by_type(self, trading_pair, price_type):
+        return self.price
+
+    def quantize_order_amount(self, trading_pair, amount):
+        return amount
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+
+class BenchmarkStrategy:
+    def __init__(self):
+        self.connectors = {"binance": BenchmarkConnector()}
+        self.orders_count = 0
+
+    @property
+    def current_timestamp(self):
+        return time.time()
+
+    def buy(self, *args, **kwargs):
+        self.orders_count += 1
+        return f"OID-{self.orders_count}"
+
+    sell = buy
+
+    def cancel(self, *args, **kwargs):
+        pass
+
+
+class BenchmarkPositionExecutor(PositionExecutor):
+    control_tasks = 0
+
+    async def validate_sufficient_balance(self):
+        pass
+
+    async def control_task(self):
+        BenchmarkPositionExecutor.control_tasks += 1
+        await super().control_task()
+
+    def place_close_order_and_cancel_open_orders(self, close_type: CloseType, price: Decimal = Decimal("NaN")):
+        # The close orders are not simulated, the position is closed right away
+        self.close_type = close_type
+        self.stop()
+
+
+def create_executor(strategy: BenchmarkStrategy, index: int) -> BenchmarkPositionExecutor:
+    side = TradeType.BUY if index % 2 == 0 else TradeType.SELL
+    config = PositionExecutorConfig(
+        id=f"executor-{index}", timestamp=time.time(), trading_pair=TRADING_PAIR, connector_name="binance",
+        side=side, entry_price=Decimal("100"), amount=Decimal("1"),
+        triple_barrier_config=TripleBarrierConfig(
+            stop_loss=Decimal("0.03") + Decimal(index % 10) / 1000, take_profit=Decimal("0.03"), time_limit=3600,
+            take_profit_order_type=OrderType.MARKET))
+    executor = BenchmarkPositionExecutor(strategy, config, update_interval=0.5)
+    executor._open_order = TrackedOrder(order_id=f"OID-OPEN-{index}")
+    executor._open_order.order = InFlightOrder(
+        client_order_id=f"OID-OPEN-{index}", exchange_order_id=f"EOID-{index}", trading_pair=TRADING_PAIR,
+        order_type=OrderType.MARKET, trade_type=side, amount=config.amount, price=config.entry_price, creation_timestamp=config.timestamp,
+        initial_state=OrderState.FILLED)
+    executor._open_order.order.update_with_trade_update(TradeUpdate(
+        trade_id="1", client_order_id=f"OID-OPEN-{index}", exchange_order_id=f"EOID-{index}",
+        trading_pair=TRADING_PAIR, fill_price=config.entry_price, fill_base_amount=config.amount,
+        fill_quote_amount=config.amount * config.entry_price,
+        fee=AddedToCostTradeFee(flat_fees=[TokenAmount(token="USDT", amount=Decimal("0.02"))]),
+        fill_timestamp=config.timestamp))
+    return executor
+
+
+async def run(mode: str, executors_count: int, duration: float, seed: int):
+    strategy = BenchmarkStrategy()
+    connector = strategy.connectors["binance"]
+    scheduler = RunnableScheduler(strategy, tick_interval=0.5) if mode == "scheduler" else None
+    BenchmarkPositionExecutor.control_tasks = 0
+    executors = [create_executor(strategy, i) for i in range(executors_count)]
+    random_generator = random.Random(seed)
+
+    start_cpu_time = time.process_time()
+    for executor in executors:
+        executor.start(scheduler=scheduler)
+    end = time.time() + duration
+    while time.time() < end:
+        # Price updates of the order book, drifting past the barriers of some executors
+        connector.price += Decimal(str(round(random_generator.gauss(0, 0.3), 2)))
+        await asyncio.sleep(0.1)
+    cpu_time = time.process_time() - start_cpu_time
+
+    closed = sum(1 for executor in executors if executor.close_type is not None)
+    for executor in executors:
+        executor.stop()
+    await asyncio.sleep(0.5)
+    return cpu_time, BenchmarkPositionExecutor.control_tasks, closed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--executors", type=int, default=300)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for mode in ("loops", "scheduler"):
+        cpu_time, control_tasks, closed = asyncio.run(run(mode, args.executors, args.duration, args.seed))
+        print(f"{mode:>9}: {cpu_time:6.2f} s CPU ({cpu_time / args.duration * 100:5.1f}% of a core), "
+              f"{control_tasks} control tasks, {closed} positions closed")
+
+
+if __name__ == "__main__":
+    main()
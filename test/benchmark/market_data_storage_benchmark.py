@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""
+Compares the storage of the market data collected by the MarketsRecorder, for a day of snapshots of a few pairs.
+ - sql: one MarketData row per pair and snapshot, with the order book levels and the balances as JSON
+ - columnar: the compressed columnar chunks of ColumnarMarketDataWriter, partitioned by pair and day
+It reports the size on disk, the recording time per snapshot, and the time to load the snapshots of one pair as a
+DataFrame with a column per depth level.
+
+    python test/benchmark/market_data_storage_benchmark.py --snapshots 1440 --pairs 5 --depth 20
+"""
+import argparse
+import os
+import tempfile
+import time
+from decimal import Decimal
+from typing import List
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.model import HummingbotBase
+from hummingbot.model.columnar_market_data import ColumnarMarketDataWriter, load_market_data
+from hummingbot.model.market_data import MarketData
+
+EXCHANGE = "binance"
+START_TIMESTAMP = 1641081600
+BALANCES = {f"ASSET{index}": Decimal("1000.123456") for index in range(20)}
+
+
+def book_side(mid_price: float, depth: int, direction: int) -> List[OrderBookRow]:
+    # A book deeper than the depth recorded, as the recorder reads it from a full order book
+    return [OrderBookRow(mid_price + direction * (level + 1) * 0.01, 1.5 + level, 1) for level in range(depth * 10)]
+
+
+def record_sql(path: str, pairs: List[str], snapshots: int, depth: int) -> float:
+    engine = create_engine(f"sqlite:///{path}")
+    HummingbotBase.metadata.create_all(engine, tables=[MarketData.__table__])
+    session_factory = sessionmaker(bind=engine)
+    start = time.perf_counter()
+    for snapshot in range(snapshots):
+        with session_factory() as session:
+            with session.begin():
+                for pair_index, trading_pair in enumerate(pairs):
+                    mid_price = 100 + snapshot * 0.01
+                    session.add(MarketData(
+                        # The timestamp is the primary key, the recorder takes a new one for each pair
+                        timestamp=(START_TIMESTAMP + snapshot * 60) * 1e3 + pair_index,
+                        exchange=EXCHANGE,
+                        trading_pair=trading_pair,
+                        mid_price=mid_price,
+                        best_bid=mid_price - 0.01,
+                        best_ask=mid_price + 0.01,
+                        order_book={
+                            "bid": book_side(mid_price, depth, -1)[:depth],
+                            "ask": book_side(mid_price, depth, 1)[:depth],
+                        },
+                        balance={asset: round(float(amount), 2) for asset, amount in BALANCES.items()},
+                    ))
+    return (time.perf_counter() - start) / snapshots
+
+
+def load_sql(path: str, trading_pair: str) -> pd.DataFrame:
+    engine = create_engine(f"sqlite:///{path}")
+    with sessionmaker(bind=engine)() as session:
+        rows = session.query(MarketData).filter(MarketData.trading_pair == trading_pair).all()
+        records = []
+        for row in rows:
+            record = {"timestamp": float(row.timestamp) // 1e3, "mid_price": float(row.mid_price),
+                      "best_bid": float(row.best_bid), "best_ask": float(row.best_ask)}
+            for side in ("bid", "ask"):
+                for level, (price, amount, _) in enumerate(row.order_book[side]):
+                    record[f"{side}_price_{level}"] = price
+                    record[f"{side}_amount_{level}"] = amount
+            records.append(record)
+    return pd.DataFrame(records)
+
+
+def record_columnar(path: str, pairs: List[str], snapshots: int, depth: int) -> float:
+    writer = ColumnarMarketDataWriter(base_path=path, depth=depth)
+    start = time.perf_counter()
+    for snapshot in range(snapshots):
+        timestamp = START_TIMESTAMP + snapshot * 60
+        for trading_pair in pairs:
+            mid_price = 100 + snapshot * 0.01
+            writer.append(timestamp, EXCHANGE, trading_pair, mid_price, mid_price - 0.01, mid_price + 0.01,
+                          iter(book_side(mid_price, depth, -1)), iter(book_side(mid_price, depth, 1)))
+        writer.append_balances(timestamp, EXCHANGE, BALANCES)
+    writer.flush()
+    return (time.perf_counter() - start) / snapshots
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--snapshots", type=int, default=1440)
+    parser.add_argument("--pairs", type=int, default=5)
+    parser.add_argument("--depth", type=int, default=20)
+    args = parser.parse_args()
+
+    pairs = [f"COIN{index}-HBOT" for index in range(args.pairs)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sql_path = os.path.join(temp_dir, "market_data.sqlite")
+        columnar_path = os.path.join(temp_dir, "market_data")
+        sql_record = record_sql(sql_path, pairs, args.snapshots, args.depth)
+        columnar_record = record_columnar(columnar_path, pairs, args.snapshots, args.depth)
+
+        start = time.perf_counter()
+        sql_data = load_sql(sql_path, pairs[0])
+        sql_load = time.perf_counter() - start
+        start = time.perf_counter()
+        columnar_data = load_market_data(columnar_path, EXCHANGE, pairs[0])
+        columnar_load = time.perf_counter() - start
+        assert len(sql_data) == len(columnar_data) == args.snapshots
+
+        print(f"{args.snapshots} snapshots of {args.pairs} pairs, depth {args.depth}")
+        print(f"{'storage':>8} {'size (KB)':>10} {'record (ms/snapshot)':>21} {'load pair (ms)':>15}")
+        print(f"{'sql':>8} {os.path.getsize(sql_path) / 1024:10.0f} {sql_record * 1e3:21.3f} {sql_load * 1e3:15.1f}")
+        print(f"{'columnar':>8} {directory_size(columnar_path) / 1024:10.0f} {columnar_record * 1e3:21.3f} "
+              f"{columnar_load * 1e3:15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Compares the native OrderBook depth queries (with and without the prefix sum cache) against the previous
+implementation, which walked the book through the bid_entries() / ask_entries() generators.
+
+    python test/benchmark/order_book_depth_benchmark.py --levels 500 --queries 20000
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def generator_price_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    cumulative_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return float("nan")
+
+
+def generator_vwap_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    total_cost = 0
+    total_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        if total_volume + row.amount >= volume:
+            total_cost += (volume - total_volume) * row.price
+            return total_cost / volume
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+    return float("nan")
+
+
+def build_order_book(levels: int, depth_cache: bool) -> OrderBook:
+    rng = np.random.default_rng(42)
+    bid_prices = 100 - np.arange(1, levels + 1) * 0.01
+    ask_prices = 100 + np.arange(1, levels + 1) * 0.01
+    bids = np.column_stack([bid_prices, rng.uniform(0.1, 10, levels), np.ones(levels)])
+    asks = np.column_stack([ask_prices, rng.uniform(0.1, 10, levels), np.ones(levels)])
+    order_book = OrderBook(depth_cache=depth_cache)
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=20000)
+    args = parser.parse_args()
+
+    order_book = build_order_book(args.levels, depth_cache=False)
+    cached_order_book = build_order_book(args.levels, depth_cache=True)
+    # Queries reaching roughly a quarter of the book depth
+    volume = float(order_book.get_volume_for_price(True, float("inf")).result_volume) / 4
+
+    cases = {
+        "price_for_volume generator": lambda: generator_price_for_volume(order_book, True, volume),
+        "price_for_volume native": lambda: order_book.get_price_for_volume(True, volume),
+        "price_for_volume cached": lambda: cached_order_book.get_price_for_volume(True, volume),
+        "vwap_for_volume generator": lambda: generator_vwap_for_volume(order_book, False, volume),
+        "vwap_for_volume native": lambda: order_book.get_vwap_for_volume(False, volume),
+        "vwap_for_volume cached": lambda: cached_order_book.get_vwap_for_volume(False, volume),
+    }
+    print(f"{args.levels} levels per side, {args.queries} queries, volume {volume:.2f}")
+    for name, case in cases.items():
+        elapsed = timeit.timeit(case, number=args.queries)
+        print(f"{name:<30} {elapsed / args.queries * 1e6:10.2f} us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""
+Compares applying exchange depth diffs through OrderBookMessage.bids / .asks and OrderBook.apply_diffs against
+loading the raw exchange levels with OrderBook.apply_raw_diffs.
+
+    python test/benchmark/order_book_diff_ingestion_benchmark.py --levels 20 --messages 20000
+"""
+import argparse
+import random
+import time
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+def build_messages(levels: int, count: int):
+    rng = random.Random(42)
+    messages = []
+    for update_id in range(1, count + 1):
+        bids = [[f"{100 - rng.randint(1, 500) * 0.01:.2f}", f"{rng.uniform(0, 10):.4f}"] for _ in range(levels)]
+        asks = [[f"{100 + rng.randint(1, 500) * 0.01:.2f}", f"{rng.uniform(0, 10):.4f}"] for _ in range(levels)]
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=float(update_id)))
+    return messages
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", type=int, default=20)
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+
+    messages = build_messages(args.levels, args.messages)
+
+    order_book = OrderBook()
+    start = time.perf_counter()
+    for message in messages:
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+    rows_elapsed = time.perf_counter() - start
+
+    raw_order_book = OrderBook()
+    start = time.perf_counter()
+    for message in messages:
+        raw_order_book.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
+    raw_elapsed = time.perf_counter() - start
+
+    assert list(order_book.bid_entries()) == list(raw_order_book.bid_entries())
+    assert list(order_book.ask_entries()) == list(raw_order_book.ask_entries())
+
+    print(f"{args.messages} diffs with {args.levels} levels per side")
+    print(f"{'apply_diffs(message.bids, ...)':<36} {rows_elapsed / args.messages * 1e6:10.2f} us/diff")
+    print(f"{'apply_raw_diffs(content[...], ...)':<36} {raw_elapsed / args.messages * 1e6:10.2f} us/diff")
+
+
+if __name__ == "__main__":
+    main()
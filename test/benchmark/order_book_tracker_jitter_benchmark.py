@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Measures how late a strategy-like 10ms tick runs while an OrderBookTracker applies a synthetic stream of order book
+diffs, for each routing mode. The tick reads the top of every order book, as strategies do.
+
+    python test/benchmark/order_book_tracker_jitter_benchmark.py --rate 10000 --seconds 5 --pairs 20
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker, OrderBookTrackerRoutingMode
+
+TICK_INTERVAL = 0.01
+
+
+class SyntheticDataSource:
+    RAW_ORDER_BOOK_LEVELS = True
+
+    def __init__(self, trading_pairs: List[str], rate: int, seconds: float, levels: int):
+        self._trading_pairs = trading_pairs
+        self._rate = rate
+        self._messages = self._build_messages(trading_pairs, int(rate * seconds), levels)
+
+    @staticmethod
+    def _build_messages(trading_pairs: List[str], count: int, levels: int) -> List[OrderBookMessage]:
+        rng = random.Random(42)
+        messages = []
+        for update_id in range(2, count + 2):
+            bids = [[f"{100 - rng.randint(1, 500) * 0.01:.2f}", f"{rng.uniform(0, 10):.4f}"] for _ in range(levels)]
+            asks = [[f"{100 + rng.randint(1, 500) * 0.01:.2f}", f"{rng.uniform(0, 10):.4f}"] for _ in range(levels)]
+            messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": trading_pairs[update_id % len(trading_pairs)],
+                "update_id": update_id,
+                "bids": bids,
+                "asks": asks,
+            }, timestamp=None))
+        return messages
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["99", "1"]], [["101", "1"]], 1)
+        return order_book
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain=None) -> Dict[str, float]:
+        return {trading_pair: 100.0 for trading_pair in trading_pairs}
+
+    async def listen_for_order_book_diffs(self, ev_loop, output: asyncio.Queue):
+        per_interval = max(1, int(self._rate * TICK_INTERVAL))
+        for start in range(0, len(self._messages), per_interval):
+            for message in self._messages[start:start + per_interval]:
+                message.timestamp = time.time()
+                output.put_nowait(message)
+            await asyncio.sleep(TICK_INTERVAL)
+
+    async def listen_for_trades(self, ev_loop, output: asyncio.Queue):
+        await asyncio.Event().wait()
+
+    async def listen_for_order_book_snapshots(self, ev_loop, output: asyncio.Queue):
+        await asyncio.Event().wait()
+
+    async def listen_for_subscriptions(self):
+        await asyncio.Event().wait()
+
+
+async def measure(routing_mode: OrderBookTrackerRoutingMode, args) -> np.ndarray:
+    trading_pairs = [f"COIN{index}-USDT" for index in range(args.pairs)]
+    data_source = SyntheticDataSource(trading_pairs, args.rate, args.seconds, args.levels)
+    tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs, routing_mode=routing_mode)
+    tracker.start()
+    await tracker.wait_ready()
+
+    lateness = []
+    next_tick = time.perf_counter() + TICK_INTERVAL
+    end = next_tick + args.seconds
+    while next_tick < end:
+        await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+        lateness.append(time.perf_counter() - next_tick)
+        for trading_pair in trading_pairs:
+            if routing_mode is OrderBookTrackerRoutingMode.THREADED:
+                view = tracker.get_order_book_view(trading_pair)
+                view.best_bid, view.best_ask
+            else:
+                order_book = tracker.order_books[trading_pair]
+                order_book.get_price(False), order_book.get_price(True)
+        next_tick += TICK_INTERVAL
+    tracker.stop()
+    return np.array(lateness) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=int, default=10000, help="diff messages per second")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--pairs", type=int, default=20)
+    parser.add_argument("--levels", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.rate} diffs/s with {args.levels} levels per side over {args.pairs} trading pairs, "
+          f"tick lateness in ms")
+    print(f"{'routing mode':<14} {'p50':>8} {'p99':>8} {'max':>8}")
+    for routing_mode in OrderBookTrackerRoutingMode:
+        lateness = asyncio.run(measure(routing_mode, args))
+        print(f"{routing_mode.name:<14} {np.percentile(lateness, 50):8.3f} {np.percentile(lateness, 99):8.3f} "
+              f"{lateness.max():8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Measures the available balance lookups of the paper trade exchange with many resting limit orders, and a pure market
+making strategy refreshing its order levels on every tick in paper trade mode.
+ - baseline: the on hold balances rebuilt from the limit orders on every lookup (previous implementation)
+ - ledger: the on hold balances maintained as the limit orders are created, filled and cancelled
+
+    python test/benchmark/paper_trade_balance_benchmark.py --resting-orders 500 --levels 20
+"""
+import argparse
+import time
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+TRADING_PAIR = "HBOT-ETH"
+OTHER_TRADING_PAIR = "COINALPHA-ETH"
+
+
+class RebuildingPaperExchange(MockPaperExchange):
+    """
+    Computes the available balances the way the paper trade exchange did before keeping the on hold ledger.
+    Only the Python entry points are replaced, which is what the budget checker calls.
+    """
+
+    @property
+    def on_hold_balances(self) -> Dict[str, Decimal]:
+        on_hold_balances = defaultdict(Decimal)
+        for limit_order in self.limit_orders:
+            if limit_order.is_buy:
+                on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+            else:
+                on_hold_balances[limit_order.base_currency] += limit_order.quantity
+        return on_hold_balances
+
+    @property
+    def available_balances(self) -> Dict[str, Decimal]:
+        available_balances = self.get_all_balances().copy()
+        for currency in available_balances:
+            available_balances[currency] -= self.on_hold_balances[currency]
+        return available_balances
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        return self.available_balances.get(currency.upper(), Decimal("0"))
+
+
+class RebuildingPureMarketMakingStrategy(PureMarketMakingStrategy):
+    """
+    Goes through the Python available balance of the exchange for the budget constraint, so the baseline exchange
+    lookups are the ones measured (the strategy calls the Cython ones otherwise).
+    """
+
+    def adjusted_available_balance_for_orders_budget_constrain(self):
+        market = self.market_info.market
+        base_balance = market.get_available_balance(self.base_asset)
+        quote_balance = market.get_available_balance(self.quote_asset)
+        for order in self.active_non_hanging_orders:
+            if order.is_buy:
+                quote_balance += order.quantity * order.price
+            else:
+                base_balance += order.quantity
+        return base_balance, quote_balance
+
+
+def build_exchange(exchange_class, resting_orders: int) -> MockPaperExchange:
+    exchange = exchange_class(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    for trading_pair in (TRADING_PAIR, OTHER_TRADING_PAIR):
+        exchange.set_balanced_order_book(trading_pair, mid_price=100, min_price=1, max_price=200,
+                                         price_step_size=1, volume_step_size=10)
+        exchange.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+    for currency in ("HBOT", "COINALPHA", "ETH", "USDT", "BTC"):
+        exchange.set_balance(currency, Decimal("1000000"))
+    # Orders resting away from the book, i.e. placed by other strategies sharing the account
+    for index in range(resting_orders // 2):
+        exchange.buy(OTHER_TRADING_PAIR, Decimal("1"), OrderType.LIMIT, Decimal(10 + index % 50))
+        exchange.sell(OTHER_TRADING_PAIR, Decimal("1"), OrderType.LIMIT, Decimal(190 - index % 50))
+    return exchange
+
+
+def measure_lookups(exchange: MockPaperExchange, lookups: int) -> float:
+    start = time.perf_counter()
+    for _ in range(lookups):
+        exchange.get_available_balance("ETH")
+    return (time.perf_counter() - start) / lookups
+
+
+def measure_pmm(exchange: MockPaperExchange, strategy_class, levels: int, ticks: int) -> float:
+    start_timestamp = 1_600_000_000.0
+    clock = Clock(ClockMode.BACKTEST, 1.0, start_timestamp, start_timestamp + ticks + 1)
+    clock.add_iterator(exchange)
+    strategy = strategy_class()
+    strategy.init_params(
+        MarketTradingPairTuple(exchange, TRADING_PAIR, *TRADING_PAIR.split("-")),
+        bid_spread=Decimal("0.05"),
+        ask_spread=Decimal("0.05"),
+        order_amount=Decimal("1"),
+        order_levels=levels,
+        order_level_spread=Decimal("0.001"),
+        order_refresh_time=1.0,
+        order_refresh_tolerance_pct=-1,
+        minimum_spread=-1,
+    )
+    clock.add_iterator(strategy)
+    clock.backtest_til(start_timestamp + 1)
+    start = time.perf_counter()
+    clock.backtest_til(start_timestamp + ticks + 1)
+    return (time.perf_counter() - start) / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resting-orders", type=int, default=500, help="limit orders resting on the other pair")
+    parser.add_argument("--levels", type=int, default=20, help="order levels per side of the strategy")
+    parser.add_argument("--ticks", type=int, default=50)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.resting_orders} resting orders, {args.levels} strategy levels per side")
+    print(f"{'mode':<10} {'lookup (us)':>12} {'pmm tick (ms)':>14}")
+    modes = (("baseline", RebuildingPaperExchange, RebuildingPureMarketMakingStrategy),
+             ("ledger", MockPaperExchange, PureMarketMakingStrategy))
+    for mode, exchange_class, strategy_class in modes:
+        lookup = measure_lookups(build_exchange(exchange_class, args.resting_orders), args.lookups)
+        tick = measure_pmm(build_exchange(exchange_class, args.resting_orders), strategy_class, args.levels, args.ticks)
+        print(f"{mode:<10} {lookup * 1e6:12.1f} {tick * 1e3:14.2f}")
+
+
+if __name__ == "__main__":
+    main()
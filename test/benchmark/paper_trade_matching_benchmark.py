@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Measures the cost of the queue position matching engine of the paper trade exchange over many trading pairs: the
+diffs applied to the order books (with and without resting paper orders being tracked), the trades matched and the
+exchange ticks.
+
+    python test/benchmark/paper_trade_matching_benchmark.py --pairs 300 --diffs 200
+"""
+import argparse
+import time
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.matching_engine import QueuePositionMatchingEngine
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+def build_exchange(pairs: int, orders_per_side: int, with_engine: bool):
+    exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    if with_engine:
+        exchange.set_matching_engine(QueuePositionMatchingEngine(order_entry_latency=0.05, cancel_latency=0.05))
+    trading_pairs = [f"COIN{index}-HBOT" for index in range(pairs)]
+    for trading_pair in trading_pairs:
+        exchange.set_balanced_order_book(trading_pair, mid_price=100, min_price=50, max_price=150,
+                                         price_step_size=0.5, volume_step_size=1)
+        exchange.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+        exchange.set_balance(trading_pair.split("-")[0], Decimal("1000000"))
+    exchange.set_balance("HBOT", Decimal("1000000000"))
+
+    clock = Clock(ClockMode.BACKTEST, 1.0, 1000.0, 1000000.0)
+    clock.add_iterator(exchange)
+    clock.backtest_til(1001.0)
+    for trading_pair in trading_pairs:
+        for level in range(orders_per_side):
+            exchange.buy(trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.75") - Decimal("0.5") * level)
+            exchange.sell(trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100.25") + Decimal("0.5") * level)
+    clock.backtest_til(1002.0)
+    return exchange, clock, trading_pairs
+
+
+def random_diffs(rng: np.random.Generator, messages: int, levels_per_message: int):
+    # Levels around the mid price, on the grid of the book and of the paper orders
+    offsets = rng.integers(0, 20, size=(messages, 2, levels_per_message)) * 0.25
+    amounts = rng.integers(0, 50, size=(messages, 2, levels_per_message)).astype(float)
+    return [([[99.75 - offsets[index, 0, level], amounts[index, 0, level]] for level in range(levels_per_message)],
+             [[100.25 + offsets[index, 1, level], amounts[index, 1, level]] for level in range(levels_per_message)])
+            for index in range(messages)]
+
+
+def measure(pairs: int, orders_per_side: int, diffs_per_pair: int, with_engine: bool):
+    exchange, clock, trading_pairs = build_exchange(pairs, orders_per_side, with_engine)
+    order_books = [exchange.get_order_book(trading_pair) for trading_pair in trading_pairs]
+    messages = random_diffs(np.random.default_rng(42), diffs_per_pair, 10)
+
+    start = time.perf_counter()
+    update_id = 10
+    for bids, asks in messages:
+        update_id += 1
+        for order_book in order_books:
+            order_book.apply_raw_diffs(bids, asks, update_id)
+    diff_time = (time.perf_counter() - start) / (diffs_per_pair * pairs)
+
+    trades = [OrderBookTradeEvent(trading_pair, 1002.0, TradeType.SELL if index % 2 else TradeType.BUY,
+                                  99.75 if index % 2 else 100.25, 0.5)
+              for index, trading_pair in enumerate(trading_pairs)]
+    start = time.perf_counter()
+    for order_book, trade in zip(order_books, trades):
+        order_book.apply_trade(trade)
+    trade_time = (time.perf_counter() - start) / pairs
+
+    start = time.perf_counter()
+    ticks = 20
+    clock.backtest_til(clock.current_timestamp + ticks)
+    tick_time = (time.perf_counter() - start) / ticks
+    return diff_time, trade_time, tick_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=300)
+    parser.add_argument("--orders-per-side", type=int, default=3)
+    parser.add_argument("--diffs", type=int, default=200, help="diff messages per pair, 10 levels per side each")
+    args = parser.parse_args()
+
+    print(f"{args.pairs} pairs, {args.orders_per_side} paper orders per side and pair")
+    print(f"{'mode':<16} {'diff (us)':>10} {'trade (us)':>11} {'tick (ms)':>10}")
+    for mode, with_engine in (("immediate fills", False), ("queue position", True)):
+        diff_time, trade_time, tick_time = measure(args.pairs, args.orders_per_side, args.diffs, with_engine)
+        print(f"{mode:<16} {diff_time * 1e6:10.2f} {trade_time * 1e6:11.2f} {tick_time * 1e3:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Measures the end-to-end overhead of RESTAssistant requests against the local mock web server, for a large public
+response (order book snapshot) and a small authenticated order creation.
+ - baseline: every request deep copied before processing and the JSON handled by the standard library
+ - fast: requests copied only when pre-processed or authenticated, and the JSON handled by the default codec
+
+    python test/benchmark/rest_assistant_benchmark.py --requests 500
+"""
+import argparse
+import asyncio
+import hashlib
+import hmac
+import time
+from copy import deepcopy
+from typing import Optional
+
+import aiohttp
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+from hummingbot.core.web_assistant import json_codec
+from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+HOST = "api.exchange.com"
+DEPTH_PATH = "/api/v3/depth"
+ORDER_PATH = "/api/v3/order"
+
+
+class HMACAuth(AuthBase):
+    async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+        signature = hmac.new(b"secret", (request.data or "").encode(), hashlib.sha256).hexdigest()
+        request.headers = {**(request.headers or {}), "X-API-KEY": "key", "X-SIGNATURE": signature}
+        return request
+
+    async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+        return request
+
+
+class DeepCopyRESTAssistant(RESTAssistant):
+    async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
+        return await super().call(deepcopy(request), timeout)
+
+
+async def run_requests(assistant: RESTAssistant, url: str, method: RESTMethod, requests: int) -> float:
+    data = {"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", "quantity": "0.01", "price": "30000.00"}
+    start = time.perf_counter()
+    for _ in range(requests):
+        await assistant.execute_request(
+            url=url,
+            throttler_limit_id=url,
+            data=data if method == RESTMethod.POST else None,
+            method=method,
+            is_auth_required=method == RESTMethod.POST)
+    return time.perf_counter() - start
+
+
+async def measure(assistant_class, base_url: str, requests: int):
+    async with aiohttp.ClientSession() as session:
+        throttler = AsyncThrottler(rate_limits=[
+            RateLimit(limit_id=f"{base_url}{path}", limit=requests * 10, time_interval=60)
+            for path in (DEPTH_PATH, ORDER_PATH)])
+        assistant = assistant_class(connection=RESTConnection(session), throttler=throttler, auth=HMACAuth())
+        # Warm up the connection pool
+        await run_requests(assistant, f"{base_url}{DEPTH_PATH}", RESTMethod.GET, 5)
+        depth = await run_requests(assistant, f"{base_url}{DEPTH_PATH}", RESTMethod.GET, requests)
+        order = await run_requests(assistant, f"{base_url}{ORDER_PATH}", RESTMethod.POST, requests)
+    return depth / requests, order / requests
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--levels", type=int, default=1000, help="levels per side of the order book snapshot")
+    parser.add_argument("--rounds", type=int, default=3, help="the best round of each mode is reported")
+    args = parser.parse_args()
+
+    server = MockWebServer.get_instance()
+    server.start()
+    while not server.started:
+        time.sleep(0.1)
+    server.update_response("get", HOST, DEPTH_PATH, {
+        "lastUpdateId": 1027024,
+        "bids": [[f"{30000 - index * 0.01:.2f}", f"{index % 7 + 0.5:.8f}"] for index in range(args.levels)],
+        "asks": [[f"{30000 + index * 0.01:.2f}", f"{index % 7 + 0.5:.8f}"] for index in range(args.levels)],
+    })
+    server.update_response("post", HOST, ORDER_PATH, {
+        "symbol": "BTCUSDT", "orderId": 28, "clientOrderId": "6gCrw2kRUAF9CvJDGP16IP", "transactTime": 1507725176595,
+        "price": "30000.00", "origQty": "0.01", "executedQty": "0.00", "status": "NEW", "type": "LIMIT", "side": "BUY",
+    })
+    base_url = f"http://{server.host}:{server.port}/{HOST}"
+
+    modes = (("baseline", DeepCopyRESTAssistant, "json"),
+             ("fast", RESTAssistant, json_codec.get_json_codec().name))
+    results = {mode: (float("inf"), float("inf")) for mode, _, _ in modes}
+    for _ in range(args.rounds):
+        for mode, assistant_class, codec in modes:
+            json_codec.set_json_codec(codec)
+            depth, order = asyncio.run(measure(assistant_class, base_url, args.requests))
+            results[mode] = (min(results[mode][0], depth), min(results[mode][1], order))
+
+    print(f"{args.requests} requests each, {args.levels} levels per side in the snapshot, us/request")
+    print(f"{'mode':<10} {'codec':<8} {'snapshot':>10} {'order':>10}")
+    for mode, _, codec in modes:
+        depth, order = results[mode]
+        print(f"{mode:<10} {codec:<8} {depth * 1e6:10.1f} {order * 1e6:10.1f}")
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
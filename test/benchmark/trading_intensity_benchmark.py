@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+Measures the ticks of the trading intensity indicator of the Avellaneda strategy on an active pair, and compares the
+alpha and kappa estimated by both implementations.
+ - baseline: quotes as a list of dicts scanned for every trade, the trade samples consolidated and the curve fitted
+   on every tick (previous implementation)
+ - incremental: quotes as arrays matched with bisect, amounts aggregated by price level as the samples come and go,
+   and the curve fitted again only when the sample moved the log-linear estimate
+
+    python test/benchmark/trading_intensity_benchmark.py --ticks 1000 --trades-per-tick 20 --buffer-size 200
+"""
+import argparse
+import time
+from decimal import Decimal
+
+import numpy as np
+from scipy.optimize import curve_fit
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+
+
+class StaticPriceDelegate:
+    def __init__(self):
+        self.price = Decimal("100")
+
+    def get_price_by_type(self, _):
+        return self.price
+
+
+class BaselineTradingIntensityIndicator:
+    """The previous implementation of TradingIntensityIndicator.c_calculate and c_estimate_intensity."""
+
+    def __init__(self, price_delegate, sampling_length: int):
+        self._alpha = 0
+        self._kappa = 0
+        self._trade_samples = {}
+        self._current_trade_sample = []
+        self._price_delegate = price_delegate
+        self._sampling_length = sampling_length
+        self._last_quotes = []
+
+    @property
+    def current_value(self):
+        return self._alpha, self._kappa
+
+    def register_trade(self, trade):
+        self._current_trade_sample.append(trade)
+
+    def calculate(self, timestamp):
+        price = self._price_delegate.get_price_by_type(None)
+        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+
+        latest_processed_quote_idx = None
+        for trade in self._current_trade_sample:
+            for i, quote in enumerate(self._last_quotes):
+                if quote["timestamp"] < trade.timestamp:
+                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
+                        latest_processed_quote_idx = i
+                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
+                        self._trade_samples[quote["timestamp"] + 1] = []
+                    self._trade_samples[quote["timestamp"] + 1] += [trade]
+                    break
+
+        self._current_trade_sample = []
+        if latest_processed_quote_idx is not None:
+            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+
+        if len(self._trade_samples.keys()) > self._sampling_length:
+            timestamps = sorted(self._trade_samples.keys())[-self._sampling_length:]
+            self._trade_samples = {timestamp: self._trade_samples[timestamp] for timestamp in timestamps}
+
+        if len(self._trade_samples.keys()) == self._sampling_length:
+            self.estimate_intensity()
+
+    def estimate_intensity(self):
+        trades_consolidated = {}
+        price_levels = []
+        for timestamp in self._trade_samples.keys():
+            for trade in self._trade_samples[timestamp]:
+                if trade['price_level'] not in trades_consolidated.keys():
+                    trades_consolidated[trade['price_level']] = 0
+                    price_levels += [trade['price_level']]
+                trades_consolidated[trade['price_level']] += trade['amount']
+        price_levels = sorted(price_levels, reverse=True)
+        lambdas = [trades_consolidated[price_level] for price_level in price_levels]
+        lambdas_adj = [10**-10 if x == 0 else x for x in lambdas]
+        try:
+            params = curve_fit(lambda t, a, b: a * np.exp(-b * t),
+                               price_levels,
+                               lambdas_adj,
+                               p0=(self._alpha, self._kappa),
+                               method='dogbox',
+                               bounds=([0, 0], [np.inf, np.inf]))
+            self._kappa = Decimal(str(params[0][1]))
+            self._alpha = Decimal(str(params[0][0]))
+        except (RuntimeError, ValueError):
+            pass
+
+
+def make_ticks(ticks: int, trades_per_tick: int, seed: int):
+    """Trades at distances from the mid price following an exponential intensity, on a 0.01 price grid."""
+    rng = np.random.default_rng(seed)
+    mids = 100 + np.cumsum(rng.normal(0, 0.02, ticks))
+    result = []
+    for index, mid in enumerate(mids):
+        distances = np.round(rng.exponential(0.1, trades_per_tick), 2)
+        sides = rng.integers(0, 2, trades_per_tick)
+        amounts = rng.exponential(1.0, trades_per_tick)
+        timestamp = 1000.0 + index
+        result.append((timestamp, Decimal(str(round(mid, 2))), [
+            OrderBookTradeEvent("COINALPHA-HBOT", timestamp + 0.5, TradeType.BUY if side else TradeType.SELL,
+                                float(round(mid, 2)) + (distance if side else -distance), amount)
+            for distance, side, amount in zip(distances, sides, amounts)]))
+    return result
+
+
+def run(indicator, price_delegate, ticks):
+    durations = []
+    for timestamp, mid, trades in ticks:
+        price_delegate.price = mid
+        for trade in trades:
+            indicator.register_trade(trade)
+        start = time.perf_counter()
+        indicator.calculate(timestamp)
+        durations.append(time.perf_counter() - start)
+    return np.array(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--trades-per-tick", type=int, default=20)
+    parser.add_argument("--buffer-size", type=int, default=200)
+    parser.add_argument("--refit-tolerance", type=float, default=1e-4)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    ticks = make_ticks(args.ticks, args.trades_per_tick, args.seed)
+    print(f"{args.ticks} ticks, {args.trades_per_tick} trades per tick, buffer size {args.buffer_size}")
+    print(f"{'mode':<12} {'mean (ms)':>10} {'p99 (ms)':>10} {'alpha':>14} {'kappa':>14}")
+
+    price_delegate = StaticPriceDelegate()
+    baseline = BaselineTradingIntensityIndicator(price_delegate, args.buffer_size)
+    incremental = TradingIntensityIndicator(OrderBook(), price_delegate, args.buffer_size,
+                                            refit_tolerance=args.refit_tolerance)
+    for mode, indicator in (("baseline", baseline), ("incremental", incremental)):
+        durations = run(indicator, price_delegate, ticks)
+        alpha, kappa = indicator.current_value
+        print(f"{mode:<12} {durations.mean() * 1e3:10.3f} {np.percentile(durations, 99) * 1e3:10.3f} "
+              f"{float(alpha):14.6f} {float(kappa):14.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Measures the samples added to the volatility indicators of the Avellaneda and cross exchange mining strategies.
+ - baseline: the sampling buffer copied with an index array and the statistics computed from it on every sample
+   (previous implementation)
+ - running: the statistics kept up to date by the ring buffer as samples come and go
+
+    python test/benchmark/trailing_indicators_benchmark.py --buffer-size 3000 --samples 20000
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.trailing_indicators.historical_volatility import HistoricalVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+
+
+def copy_buffer(ring_buffer) -> np.ndarray:
+    """RingBuffer.get_as_numpy_array as it was, with int64 indexes as int16 ones overflow past 32767 samples."""
+    values = np.asarray(ring_buffer.get_segments()[0].base)
+    if not ring_buffer.is_full:
+        indexes = np.arange(0, stop=ring_buffer.size, dtype=np.int64)
+    else:
+        delimiter = ring_buffer.length - ring_buffer.get_segments()[0].size
+        indexes = np.arange(delimiter, stop=delimiter + ring_buffer.length, dtype=np.int64) % ring_buffer.length
+    return values[indexes]
+
+
+class BaselineInstantVolatilityIndicator(InstantVolatilityIndicator):
+    def _indicator_calculation(self) -> float:
+        np_sampling_buffer = copy_buffer(self._sampling_buffer)
+        return np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+
+
+class BaselineHistoricalVolatilityIndicator(HistoricalVolatilityIndicator):
+    def _indicator_calculation(self) -> float:
+        prices = copy_buffer(self._sampling_buffer)
+        if prices.size > 0:
+            return np.var(np.diff(np.log(prices)))
+
+    def _processing_calculation(self) -> float:
+        processing_array = copy_buffer(self._processing_buffer)
+        if processing_array.size > 0:
+            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+
+
+def measure(indicator, samples) -> float:
+    start = time.perf_counter()
+    for sample in samples:
+        indicator.add_sample(sample)
+        indicator.current_value
+    return (time.perf_counter() - start) / len(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--buffer-size", type=int, default=3000)
+    parser.add_argument("--samples", type=int, default=20000)
+    args = parser.parse_args()
+
+    # The baseline computes the variance of empty arrays on the first samples
+    warnings.simplefilter("ignore", RuntimeWarning)
+    rng = np.random.default_rng(42)
+    samples = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, args.samples)))
+    print(f"{args.samples} samples, buffer size {args.buffer_size}")
+    print(f"{'indicator':<24} {'baseline (us)':>14} {'running (us)':>13} {'value diff':>11}")
+    for name, baseline_class, indicator_class in (
+            ("instant volatility", BaselineInstantVolatilityIndicator, InstantVolatilityIndicator),
+            ("historical volatility", BaselineHistoricalVolatilityIndicator, HistoricalVolatilityIndicator)):
+        baseline = baseline_class(args.buffer_size, 15)
+        indicator = indicator_class(args.buffer_size, 15)
+        baseline_time = measure(baseline, samples)
+        running_time = measure(indicator, samples)
+        value_diff = abs(indicator.current_value / baseline.current_value - 1)
+        print(f"{name:<24} {baseline_time * 1e6:14.2f} {running_time * 1e6:13.2f} {value_diff:11.2e}")
+
+
+if __name__ == "__main__":
+    main()
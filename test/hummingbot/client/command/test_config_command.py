@@ -90,6 +90,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ global_token_name               | USDT                 |\n"
                            "    | ∟ global_token_symbol             | $                    |\n"
                            "    | rate_limits_share_pct             | 100                  |\n"
+                           "    | rate_limits_budget_name           |                      |\n"
                            "    | commands_timeout                  |                      |\n"
                            "    | ∟ create_command_timeout          | 10                   |\n"
                            "    | ∟ other_commands_timeout          | 30                   |\n"
@@ -99,6 +100,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ market_data_collection_enabled  | False                |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | ∟ market_data_collection_storage  | sql                  |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
@@ -25,7 +25,7 @@ class NdaxWebSocketAdaptorTests(TestCase):
         sent_messages = []
         throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS)
         mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
-        mock_ws.return_value.send_json.side_effect = lambda sent_message: sent_messages.append(sent_message)
+        mock_ws.return_value.send_json.side_effect = lambda sent_message, **kwargs: sent_messages.append(sent_message)
 
         adaptor = NdaxWebSocketAdaptor(throttler, websocket=mock_ws.return_value)
         payload = {}
@@ -51,7 +51,7 @@ class NdaxWebSocketAdaptorTests(TestCase):
         sent_messages = []
         throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS)
         mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
-        mock_ws.return_value.send_json.side_effect = lambda sent_message: sent_messages.append(sent_message)
+        mock_ws.return_value.send_json.side_effect = lambda sent_message, **kwargs: sent_messages.append(sent_message)
 
         adaptor = NdaxWebSocketAdaptor(throttler, websocket=mock_ws.return_value)
         payload = {"TestElement1": "Value1", "TestElement2": "Value2"}
@@ -3,10 +3,10 @@ import json
 import re
 from decimal import Decimal
 from typing import Any, Callable, List, Optional, Tuple
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from aioresponses import aioresponses
-from aioresponses.core import RequestCall
+from aioresponses.core import CallbackResult, RequestCall
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -15,7 +15,9 @@ from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import BuyOrderCreatedEvent, OrderCancelledEvent, OrderType, TradeType
 
@@ -1283,3 +1285,126 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
                 f"{Decimal('100.000000')} {self.trading_pair} at {Decimal('10000')}."
             )
         )
+
+    def _batch_response_callback(self, requests_orders: List[List[str]], failing_order_ids: List[str]):
+        def callback(url, **kwargs):
+            orders_data = json.loads(kwargs["data"])
+            requests_orders.append([order_data["clOrdId"] for order_data in orders_data])
+            return CallbackResult(payload={
+                "code": "0",
+                "msg": "",
+                "data": [
+                    {
+                        "clOrdId": order_data["clOrdId"],
+                        "ordId": "" if order_data["clOrdId"] in failing_order_ids else f"EOID-{order_data['clOrdId']}",
+                        "tag": "",
+                        "sCode": "51000" if order_data["clOrdId"] in failing_order_ids else "0",
+                        "sMsg": "Parameter error" if order_data["clOrdId"] in failing_order_ids else "",
+                    }
+                    for order_data in orders_data
+                ]
+            })
+        return callback
+
+    def _run_scheduled_coroutine(self, method: Callable, **kwargs):
+        with patch("hummingbot.connector.exchange_py_base.safe_ensure_future") as safe_ensure_future_mock:
+            result = method(**kwargs)
+        scheduled_result = self.async_run_with_timeout(safe_ensure_future_mock.call_args[0][0])
+        return result, scheduled_result
+
+    def _limit_orders_to_create(self, count: int) -> List[LimitOrder]:
+        return [
+            LimitOrder(
+                client_order_id="",
+                trading_pair=self.trading_pair,
+                is_buy=index % 2 == 0,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal("10000") + index,
+                quantity=Decimal("1"),
+            )
+            for index in range(count)
+        ]
+
+    @aioresponses()
+    def test_batch_order_create_in_chunks_of_the_exchange_limit(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_PLACE_ORDER_PATH)
+        requests_orders = []
+        failing_order_ids = []
+        mock_api.post(url, callback=self._batch_response_callback(requests_orders, failing_order_ids), repeat=True)
+
+        with patch("hummingbot.connector.exchange_py_base.safe_ensure_future") as safe_ensure_future_mock:
+            created_orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create(25))
+        failing_order_ids.append(created_orders[3].client_order_id)
+        self.async_run_with_timeout(safe_ensure_future_mock.call_args[0][0])
+
+        self.assertEqual([20, 5], sorted((len(orders) for orders in requests_orders), reverse=True))
+        batch_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(batch_request)
+        first_order_data = json.loads(batch_request.kwargs["data"])[0]
+        self.assertEqual(created_orders[0].client_order_id, first_order_data["clOrdId"])
+        self.assertEqual("limit", first_order_data["ordType"])
+        self.assertEqual("buy", first_order_data["side"])
+        self.assertEqual(Decimal("10000"), Decimal(first_order_data["px"]))
+
+        self.assertEqual(24, len(self.buy_order_created_logger.event_log) + len(self.sell_order_created_logger.event_log))
+        for created_order in created_orders:
+            if created_order.client_order_id in failing_order_ids:
+                self.assertNotIn(created_order.client_order_id, self.exchange.in_flight_orders)
+            else:
+                in_flight_order = self.exchange.in_flight_orders[created_order.client_order_id]
+                self.assertTrue(in_flight_order.is_open)
+                self.assertEqual(f"EOID-{created_order.client_order_id}", in_flight_order.exchange_order_id)
+        self.assertEqual(created_orders[3].client_order_id, self.order_failure_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_batch_order_create_falls_back_to_single_orders(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        mock_api.post(self.order_creation_url,
+                      body=json.dumps(self.order_creation_request_successful_mock_response),
+                      repeat=True)
+
+        with patch.object(OkxExchange, "_place_orders_batch", AsyncMock(side_effect=NotImplementedError)):
+            created_orders, _ = self._run_scheduled_coroutine(
+                self.exchange.batch_order_create, orders_to_create=self._limit_orders_to_create(2))
+
+        self.assertEqual(2, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+        for created_order in created_orders:
+            self.assertTrue(self.exchange.in_flight_orders[created_order.client_order_id].is_open)
+
+    @aioresponses()
+    def test_batch_order_cancel(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for index in range(3):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{index}",
+                exchange_order_id=f"EOID{index}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        requests_orders = []
+        mock_api.post(url, callback=self._batch_response_callback(requests_orders, failing_order_ids=["OID2"]))
+
+        orders_to_cancel = self.exchange.limit_orders + self._limit_orders_to_create(1)
+        _, cancelation_results = self._run_scheduled_coroutine(
+            self.exchange.batch_order_cancel, orders_to_cancel=orders_to_cancel)
+
+        self.assertEqual([["OID0", "OID1", "OID2"]], requests_orders)
+        self.validate_auth_credentials_present(self._all_executed_requests(mock_api, url)[0])
+        self.assertEqual(
+            [CancellationResult("", False),
+             CancellationResult("OID0", True),
+             CancellationResult("OID1", True),
+             CancellationResult("OID2", False)],
+            cancelation_results)
+        self.assertTrue(self.exchange.in_flight_orders["OID0"].is_pending_cancel_confirmation)
+        self.assertTrue(self.exchange.in_flight_orders["OID1"].is_pending_cancel_confirmation)
+        self.assertTrue(self.exchange.in_flight_orders["OID2"].is_open)
+        self.assertTrue(self.is_logged("ERROR", "Failed to cancel order OID2"))
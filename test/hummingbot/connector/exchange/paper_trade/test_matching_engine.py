@@ -0,0 +1,175 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.matching_engine import QueuePositionMatchingEngine
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
+
+
+class QueuePositionMatchingEngineTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1000.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        # Levels every 1.0 from 99.5 down and 100.5 up, 10 more at each level away from the mid price
+        self.exchange.set_balanced_order_book(self.trading_pair, mid_price=100, min_price=90, max_price=110,
+                                              price_step_size=1, volume_step_size=10)
+        self.exchange.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.exchange.set_balance("COINALPHA", Decimal("100"))
+        self.exchange.set_balance("HBOT", Decimal("10000"))
+        self.order_book = self.exchange.get_order_book(self.trading_pair)
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 100)
+        self.clock.add_iterator(self.exchange)
+
+        self.fill_logger = EventLogger()
+        self.buy_completed_logger = EventLogger()
+        self.cancel_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.exchange.add_listener(MarketEvent.BuyOrderCompleted, self.buy_completed_logger)
+        self.exchange.add_listener(MarketEvent.OrderCancelled, self.cancel_logger)
+
+    def set_engine(self, **kwargs) -> QueuePositionMatchingEngine:
+        engine = QueuePositionMatchingEngine(**kwargs)
+        self.exchange.set_matching_engine(engine)
+        return engine
+
+    def tick(self, seconds: float = 1.0):
+        self.clock.backtest_til(self.clock.current_timestamp + seconds)
+
+    def trade(self, trade_type: TradeType, price: float, amount: float):
+        self.order_book.apply_trade(OrderBookTradeEvent(
+            self.trading_pair, self.clock.current_timestamp, trade_type, price, amount))
+
+    def test_order_waits_for_the_queue_ahead_before_filling(self):
+        engine = self.set_engine()
+        self.tick()
+        order_id = self.exchange.buy(self.trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+        self.tick()
+
+        order = engine.get_order(order_id)
+        self.assertTrue(order.is_live)
+        self.assertEqual(10, order.queue_ahead)
+
+        # Cancels ahead of the order, seen in the diffs of its level
+        self.order_book.apply_diffs([OrderBookRow(99.5, 4, 2)], [], 2)
+        self.assertEqual(4, order.queue_ahead)
+        # Growing levels don't move the order back
+        self.order_book.apply_diffs([OrderBookRow(99.5, 8, 3)], [], 3)
+        self.assertEqual(4, order.queue_ahead)
+
+        self.trade(TradeType.SELL, 99.5, 3)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+        self.assertEqual(1, order.queue_ahead)
+
+        self.trade(TradeType.SELL, 99.5, 3)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("2"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(Decimal("3"), order.remaining_amount)
+        limit_order = self.exchange.limit_orders[0]
+        self.assertEqual(Decimal("2"), limit_order.filled_quantity)
+        self.assertEqual(Decimal("3") * Decimal("99.5"), self.exchange.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal("10000") - Decimal("2") * Decimal("99.5"), self.exchange.get_balance("HBOT"))
+
+        # Trades through the price fill the rest
+        self.trade(TradeType.SELL, 98.5, 10)
+        self.assertEqual(2, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("3"), self.fill_logger.event_log[1].amount)
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertIsNone(engine.get_order(order_id))
+        self.assertNotIn("HBOT", self.exchange.on_hold_balances)
+        completed_event = self.buy_completed_logger.event_log[0]
+        self.assertEqual(Decimal("5"), completed_event.base_asset_amount)
+        self.assertEqual(Decimal("497.5"), completed_event.quote_asset_amount)
+        self.assertEqual(Decimal("105"), self.exchange.get_balance("COINALPHA"))
+
+    def test_trade_amount_shared_by_the_orders_it_goes_through(self):
+        self.set_engine()
+        self.tick()
+        first_order_id = self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.9"))
+        second_order_id = self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.8"))
+        self.tick()
+
+        self.trade(TradeType.SELL, 99.5, 3)
+
+        self.assertEqual([(first_order_id, Decimal("2")), (second_order_id, Decimal("1"))],
+                         [(event.order_id, event.amount) for event in self.fill_logger.event_log])
+
+    def test_order_entry_latency(self):
+        engine = self.set_engine(order_entry_latency=2.0)
+        self.tick()
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.9"))
+        self.tick()
+
+        self.trade(TradeType.SELL, 99.5, 10)
+        self.assertFalse(engine.get_order(order_id).is_live)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self.tick()
+        self.trade(TradeType.SELL, 99.5, 10)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+
+    def test_orders_fill_while_the_cancel_is_in_flight(self):
+        engine = self.set_engine(cancel_latency=2.0)
+        self.tick()
+        order_id = self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.9"))
+        self.tick()
+
+        self.exchange.cancel(self.trading_pair, order_id)
+        self.assertEqual(1, len(self.exchange.limit_orders))
+        self.assertEqual(0, len(self.cancel_logger.event_log))
+
+        self.trade(TradeType.SELL, 99.5, 1)
+        self.assertEqual(Decimal("1"), engine.get_order(order_id).remaining_amount)
+
+        self.tick()
+        self.assertEqual(1, len(self.exchange.limit_orders))
+        self.tick()
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertEqual(order_id, self.cancel_logger.event_log[0].order_id)
+        self.assertIsNone(engine.get_order(order_id))
+        self.assertEqual({}, dict(self.exchange.on_hold_balances))
+
+    def test_crossed_depth_fills_the_orders_once(self):
+        fee_schema = TradeFeeSchema(maker_percent_fee_decimal=Decimal("0.001"),
+                                    taker_percent_fee_decimal=Decimal("0.002"))
+        engine = self.set_engine(trade_fee_schema=fee_schema)
+        self.tick()
+        # Takes the 10 available at 100.5, the rest rests
+        taker_order_id = self.exchange.buy(self.trading_pair, Decimal("15"), OrderType.LIMIT, Decimal("100.5"))
+        self.tick()
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        taker_fill = self.fill_logger.event_log[0]
+        self.assertEqual(Decimal("10"), taker_fill.amount)
+        self.assertEqual(Decimal("0.002"), taker_fill.trade_fee.percent)
+        self.assertEqual(Decimal("5"), engine.get_order(taker_order_id).remaining_amount)
+
+        # The same depth doesn't fill the order again
+        self.tick()
+        self.assertEqual(1, len(self.fill_logger.event_log))
+
+        # New asks crossing the resting order fill it as maker
+        self.order_book.apply_diffs([], [OrderBookRow(100.5, 12, 2)], 2)
+        self.tick()
+        self.assertEqual(2, len(self.fill_logger.event_log))
+        maker_fill = self.fill_logger.event_log[1]
+        self.assertEqual(Decimal("2"), maker_fill.amount)
+        self.assertEqual(Decimal("0.001"), maker_fill.trade_fee.percent)
+        self.assertEqual(Decimal("3"), engine.get_order(taker_order_id).remaining_amount)
+
+    def test_matching_engine_cant_change_with_resting_orders(self):
+        self.tick()
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+
+        with self.assertRaises(ValueError):
+            self.set_engine()
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest import TestCase
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -5,6 +6,10 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
 
@@ -29,3 +34,47 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+    def _paper_exchange(self) -> MockPaperExchange:
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange.set_balanced_order_book("COINALPHA-HBOT", mid_price=100, min_price=1, max_price=200,
+                                         price_step_size=1, volume_step_size=10)
+        exchange.set_quantization_param(QuantizationParams("COINALPHA-HBOT", 6, 6, 6, 6))
+        exchange.set_balance("COINALPHA", Decimal("10"))
+        exchange.set_balance("HBOT", Decimal("1000"))
+        return exchange
+
+    def test_available_balances_account_for_resting_limit_orders(self):
+        exchange = self._paper_exchange()
+
+        buy_ids = [exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal(price)) for price in (90, 95)]
+        sell_id = exchange.sell("COINALPHA-HBOT", Decimal("2.5"), OrderType.LIMIT, Decimal("110"))
+
+        self.assertEqual(Decimal("185"), exchange.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal("2.5"), exchange.on_hold_balances["COINALPHA"])
+        self.assertEqual(Decimal("815"), exchange.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("7.5"), exchange.get_available_balance("coinalpha"))
+        self.assertEqual({"COINALPHA": Decimal("7.5"), "HBOT": Decimal("815")}, exchange.available_balances)
+        self.assertEqual(Decimal("0"), exchange.get_available_balance("ETH"))
+
+        exchange.cancel("COINALPHA-HBOT", buy_ids[0])
+        exchange.cancel("COINALPHA-HBOT", sell_id)
+
+        self.assertEqual(Decimal("905"), exchange.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("10"), exchange.get_available_balance("COINALPHA"))
+        self.assertNotIn("COINALPHA", exchange.on_hold_balances)
+
+    def test_available_balances_released_when_limit_orders_fill(self):
+        exchange = self._paper_exchange()
+        clock = Clock(ClockMode.BACKTEST, 1.0, 1000.0, 1010.0)
+        clock.add_iterator(exchange)
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("90"))
+        # Crosses the ask side of the book, filled on the next tick
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("150"))
+        self.assertEqual(Decimal("760"), exchange.get_available_balance("HBOT"))
+
+        clock.backtest_til(1001.0)
+
+        self.assertEqual(1, len(exchange.limit_orders))
+        self.assertEqual(Decimal("90"), exchange.on_hold_balances["HBOT"])
+        self.assertEqual(exchange.get_balance("HBOT") - Decimal("90"), exchange.get_available_balance("HBOT"))
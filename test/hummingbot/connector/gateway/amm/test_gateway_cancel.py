@@ -80,7 +80,14 @@ class GatewayCancelUnitTest(unittest.TestCase):
         cls._patch_stack.close()
 
     def tearDown(self) -> None:
-        self._connector._order_tracker.all_orders.clear()
+        # all_orders is a read-only view, the collections and indexes of the tracker are cleared instead
+        order_tracker = self._connector._order_tracker
+        order_tracker._in_flight_orders.clear()
+        order_tracker._cached_orders.clear()
+        order_tracker._lost_orders.clear()
+        order_tracker._orders_by_exchange_order_id.clear()
+        order_tracker._active_orders_by_trading_pair.clear()
+        order_tracker._active_orders_by_state.clear()
 
     @classmethod
     async def wait_til_ready(cls):
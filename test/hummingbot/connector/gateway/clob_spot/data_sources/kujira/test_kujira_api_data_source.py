@@ -479,7 +479,7 @@ class KujiraAPIDataSourceTest(AbstractGatewayCLOBAPIDataSourceTests.GatewayCLOBA
             amount=self.expected_sell_order_size,
             exchange_order_id=self.expected_sell_exchange_order_id,
         )
-        self.data_source.gateway_order_tracker.active_orders[in_flight_order.client_order_id] = in_flight_order
+        self.data_source.gateway_order_tracker.start_tracking_order(in_flight_order)
         self.enqueue_order_status_response(
             timestamp=self.initial_timestamp + 1,
             trading_pair=in_flight_order.trading_pair,
@@ -549,7 +549,7 @@ class KujiraAPIDataSourceTest(AbstractGatewayCLOBAPIDataSourceTests.GatewayCLOBA
             creation_transaction_hash=creation_transaction_hash,
             exchange_order_id=self.expected_buy_exchange_order_id,
         )
-        self.data_source.gateway_order_tracker.active_orders[in_flight_order.client_order_id] = in_flight_order
+        self.data_source.gateway_order_tracker.start_tracking_order(in_flight_order)
         self.enqueue_order_status_response(
             timestamp=self.initial_timestamp + 1,
             trading_pair=in_flight_order.trading_pair,
@@ -612,7 +612,7 @@ class KujiraAPIDataSourceTest(AbstractGatewayCLOBAPIDataSourceTests.GatewayCLOBA
             creation_transaction_hash=creation_transaction_hash,
             exchange_order_id=self.expected_buy_exchange_order_id,
         )
-        self.data_source.gateway_order_tracker.active_orders[in_flight_order.client_order_id] = in_flight_order
+        self.data_source.gateway_order_tracker.start_tracking_order(in_flight_order)
         self.enqueue_order_status_response(
             timestamp=self.initial_timestamp + 1,
             trading_pair=in_flight_order.trading_pair,
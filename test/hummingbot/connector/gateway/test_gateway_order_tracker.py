@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from decimal import Decimal
 
@@ -8,6 +9,7 @@ from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlight
 from hummingbot.connector.gateway.gateway_order_tracker import GatewayOrderTracker
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import OrderState
 
 
 class MockExchange(ExchangeBase):
@@ -81,3 +83,27 @@ class GatewayOrderTrackerTest(unittest.TestCase):
         self.assertIn(first_creation_hash, orders_by_hashes)
         self.assertIn(second_creation_hash, orders_by_hashes)
         self.assertIn(cancelation_hash, orders_by_hashes)
+
+    def test_lost_orders_returned_in_all_fillable_orders_by_hash(self):
+        self.tracker.lost_order_count_limit = 1
+        order = GatewayInFlightOrder(
+            client_order_id="1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            creation_timestamp=1231233123,
+            price=Decimal("1"),
+            amount=Decimal("2"),
+            exchange_order_id="asdf",
+            creation_transaction_hash="someHash",
+            initial_state=OrderState.OPEN,
+        )
+        self.tracker.start_tracking_order(order)
+
+        for _ in range(2):
+            asyncio.get_event_loop().run_until_complete(self.tracker.process_order_not_found(order.client_order_id))
+
+        self.assertIn(order.client_order_id, self.tracker.lost_orders)
+        self.assertIn(order.client_order_id, self.tracker.all_fillable_orders)
+        self.assertIn(order.client_order_id, self.tracker.all_updatable_orders)
+        self.assertIs(order, self.tracker.get_fillable_order_by_hash("someHash"))
@@ -1,7 +1,8 @@
 import asyncio
+import copy
 import unittest
 from decimal import Decimal
-from typing import Awaitable, Dict
+from typing import Awaitable, Dict, Optional
 from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -1132,3 +1133,101 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def _limit_order(self, client_order_id: str, trading_pair: Optional[str] = None) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            trading_pair=trading_pair or self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+    def test_orders_by_exchange_order_id_follow_the_order_updates(self):
+        order = self._limit_order("someClientOrderId")
+        self.tracker.start_tracking_order(order)
+
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_updatable_orders_by_exchange_order_id)
+
+        self.async_run_with_timeout(self.tracker.process_order_update(OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )))
+
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["someExchangeOrderId"])
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id.get("someExchangeOrderId"))
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        self.async_run_with_timeout(self.tracker.process_order_update(OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.CANCELED,
+        )))
+
+        # Cached orders can still be filled, but don't receive status updates
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_updatable_orders_by_exchange_order_id)
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id["someExchangeOrderId"])
+        self.assertEqual({"someExchangeOrderId": order}, self.tracker.all_fillable_orders_by_exchange_order_id)
+
+        del self.tracker._cached_orders[order.client_order_id]
+
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+    def test_copies_of_tracked_orders_are_not_indexed(self):
+        order = self._limit_order("someClientOrderId")
+        self.tracker.start_tracking_order(order)
+
+        order_copy = copy.copy(order)
+        order_copy.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_fillable_orders_by_exchange_order_id)
+
+    def test_active_orders_by_trading_pair_and_state(self):
+        first_order = self._limit_order("OID1")
+        second_order = self._limit_order("OID2", trading_pair="COINBETA-HBOT")
+        self.tracker.start_tracking_order(first_order)
+        self.tracker.start_tracking_order(second_order)
+
+        self.assertEqual({"OID1": first_order}, self.tracker.active_orders_by_trading_pair(self.trading_pair))
+        self.assertEqual({"OID2": second_order}, self.tracker.active_orders_by_trading_pair("COINBETA-HBOT"))
+        self.assertEqual({}, self.tracker.active_orders_by_trading_pair("COINGAMMA-HBOT"))
+        self.assertEqual({"OID1": first_order, "OID2": second_order},
+                         self.tracker.active_orders_by_state(OrderState.PENDING_CREATE))
+
+        first_order.current_state = OrderState.OPEN
+
+        self.assertEqual({"OID2": second_order}, self.tracker.active_orders_by_state(OrderState.PENDING_CREATE))
+        self.assertEqual({"OID1": first_order}, self.tracker.active_orders_by_state(OrderState.OPEN))
+
+        self.tracker.stop_tracking_order("OID1")
+
+        self.assertEqual({}, self.tracker.active_orders_by_trading_pair(self.trading_pair))
+        self.assertEqual({}, self.tracker.active_orders_by_state(OrderState.OPEN))
+
+        # Orders that are no longer active are not indexed by state
+        first_order.current_state = OrderState.PENDING_CREATE
+        self.assertEqual({"OID2": second_order}, self.tracker.active_orders_by_state(OrderState.PENDING_CREATE))
+
+    def test_order_views_are_read_only_and_iterated_over_a_snapshot(self):
+        for index in range(3):
+            self.tracker.start_tracking_order(self._limit_order(f"OID{index}"))
+
+        all_orders = self.tracker.all_orders
+        with self.assertRaises(TypeError):
+            all_orders["OID3"] = self._limit_order("OID3")
+
+        for client_order_id in all_orders:
+            self.tracker.stop_tracking_order(client_order_id)
+
+        self.assertEqual(0, len(self.tracker.active_orders))
+        self.assertEqual(3, len(all_orders))
+        self.assertEqual(["OID0", "OID1", "OID2"], list(self.tracker.cached_orders))
+        self.assertEqual(["OID0", "OID1", "OID2"], list(all_orders.copy()))
@@ -0,0 +1,288 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.status_polling_metrics import StatusPollingMetrics
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
+from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+
+
+class MockExchange(ExchangePyBase):
+    """
+    Exchange without API, the requests of the tests are patched
+    """
+
+    @property
+    def name(self) -> str:
+        return "mock_exchange"
+
+    @property
+    def authenticator(self) -> Optional[AuthBase]:
+        return None
+
+    @property
+    def rate_limits_rules(self) -> List[RateLimit]:
+        return []
+
+    @property
+    def domain(self) -> str:
+        return ""
+
+    @property
+    def client_order_id_max_length(self) -> int:
+        return 32
+
+    @property
+    def client_order_id_prefix(self) -> str:
+        return ""
+
+    @property
+    def trading_rules_request_path(self) -> str:
+        return ""
+
+    @property
+    def trading_pairs_request_path(self) -> str:
+        return ""
+
+    @property
+    def check_network_request_path(self) -> str:
+        return ""
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return ["COINALPHA-HBOT"]
+
+    @property
+    def is_cancel_request_in_exchange_synchronous(self) -> bool:
+        return True
+
+    @property
+    def is_trading_required(self) -> bool:
+        return True
+
+    def supported_order_types(self) -> List[OrderType]:
+        return [OrderType.LIMIT]
+
+    def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception) -> bool:
+        return False
+
+    def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
+        return False
+
+    def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
+        return False
+
+    async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
+        raise NotImplementedError
+
+    async def _place_order(self, order_id: str, trading_pair: str, amount: Decimal, trade_type: TradeType,
+                           order_type: OrderType, price: Decimal, **kwargs) -> Tuple[str, float]:
+        raise NotImplementedError
+
+    def _get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side: TradeType,
+                 amount: Decimal, price: Decimal = Decimal("NaN"), is_maker: Optional[bool] = None) -> TradeFeeBase:
+        return AddedToCostTradeFee()
+
+    async def _update_trading_fees(self):
+        pass
+
+    async def _user_stream_event_listener(self):
+        pass
+
+    async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
+        return []
+
+    async def _update_balances(self):
+        pass
+
+    async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
+        raise NotImplementedError
+
+    async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
+        raise NotImplementedError
+
+    def _create_web_assistants_factory(self) -> WebAssistantsFactory:
+        return WebAssistantsFactory(throttler=self._throttler)
+
+    def _create_order_book_data_source(self) -> OrderBookTrackerDataSource:
+        return MagicMock(spec=OrderBookTrackerDataSource)
+
+    def _create_user_stream_data_source(self) -> UserStreamTrackerDataSource:
+        return MagicMock(spec=UserStreamTrackerDataSource)
+
+    def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
+        pass
+
+
+class ExchangePyBaseStatusPollingTests(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = MockExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.set_loggers(loggers=[self.exchange.logger()])
+        self.order_filled_logger = EventLogger()
+        self.order_cancelled_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.order_filled_logger)
+        self.exchange.add_listener(MarketEvent.OrderCancelled, self.order_cancelled_logger)
+
+    def track_orders(self, count: int):
+        for index in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{index}",
+                exchange_order_id=f"EOID{index}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+
+    def order_update(self, client_order_id: str, new_state: OrderState) -> OrderUpdate:
+        return OrderUpdate(
+            client_order_id=client_order_id,
+            exchange_order_id=f"E{client_order_id}",
+            trading_pair=self.trading_pair,
+            update_timestamp=self.exchange.current_timestamp,
+            new_state=new_state,
+        )
+
+    def trade_update(self, trade_id: str, client_order_id: str, amount: Decimal) -> TradeUpdate:
+        return TradeUpdate(
+            trade_id=trade_id,
+            client_order_id=client_order_id,
+            exchange_order_id=f"E{client_order_id}",
+            trading_pair=self.trading_pair,
+            fill_timestamp=self.exchange.current_timestamp,
+            fill_price=Decimal("10000"),
+            fill_base_amount=amount,
+            fill_quote_amount=amount * Decimal("10000"),
+            fee=AddedToCostTradeFee(flat_fees=[TokenAmount("HBOT", Decimal("1"))]),
+        )
+
+    async def test_update_order_status_with_bounded_concurrency(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.track_orders(5)
+        self.exchange.ORDER_STATUS_UPDATE_CONCURRENCY = 2
+        requests_in_flight = []
+        max_requests_in_flight = []
+
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            requests_in_flight.append(tracked_order.client_order_id)
+            max_requests_in_flight.append(len(requests_in_flight))
+            await asyncio.sleep(0.01)
+            requests_in_flight.remove(tracked_order.client_order_id)
+            return self.order_update(tracked_order.client_order_id, OrderState.CANCELED)
+
+        with patch.object(MockExchange, "_all_trade_updates_for_order", AsyncMock(return_value=[])) as fills_mock, \
+                patch.object(MockExchange, "_request_order_status", side_effect=request_order_status):
+            await self.exchange._update_order_status()
+
+        self.assertEqual(5, fills_mock.call_count)
+        self.assertEqual(2, max(max_requests_in_flight))
+        self.assertEqual(0, len(self.exchange.in_flight_orders))
+        self.assertEqual(5, len(self.order_cancelled_logger.event_log))
+        for kind in (StatusPollingMetrics.ORDER_FILLS, StatusPollingMetrics.ORDER_STATUS):
+            polling_pass = self.exchange.status_polling_metrics.last_pass(kind)
+            self.assertEqual(5, polling_pass.orders_count)
+            self.assertEqual(1640780000, polling_pass.timestamp)
+
+    async def test_update_order_status_with_bulk_endpoints(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.track_orders(2)
+        self.exchange._set_current_timestamp(1640780010)
+        trades_mock = AsyncMock(return_value=[self.trade_update("1", "OID0", Decimal("0.4"))])
+        open_orders_mock = AsyncMock(return_value=[self.order_update("OID0", OrderState.PARTIALLY_FILLED)])
+        order_fills_mock = AsyncMock(return_value=[])
+        order_status_mock = AsyncMock(return_value=self.order_update("OID1", OrderState.CANCELED))
+
+        with patch.object(MockExchange, "_all_trade_updates_since", trades_mock), \
+                patch.object(MockExchange, "_request_all_open_order_updates", open_orders_mock), \
+                patch.object(MockExchange, "_all_trade_updates_for_order", order_fills_mock), \
+                patch.object(MockExchange, "_request_order_status", order_status_mock):
+            await self.exchange._update_order_status()
+            # The trades already seen are not processed again, and the cursor moves to the previous pass
+            self.exchange._set_current_timestamp(1640780020)
+            await self.exchange._update_order_status()
+
+        self.assertEqual([1640780000, 1640780010], [call.kwargs["timestamp"] for call in trades_mock.call_args_list])
+        order_fills_mock.assert_not_called()
+        order_status_mock.assert_called_once()
+        self.assertEqual("OID1", order_status_mock.call_args.kwargs["tracked_order"].client_order_id)
+        self.assertEqual(1, len(self.order_filled_logger.event_log))
+        self.assertEqual(Decimal("0.4"), self.exchange.in_flight_orders["OID0"].executed_amount_base)
+        self.assertEqual(OrderState.PARTIALLY_FILLED, self.exchange.in_flight_orders["OID0"].current_state)
+        self.assertNotIn("OID1", self.exchange.in_flight_orders)
+
+    async def test_lost_orders_pass_keeps_the_fills_cursor_of_the_active_orders(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.track_orders(3)
+        self.exchange._order_tracker.lost_order_count_limit = 1
+        for _ in range(2):
+            await self.exchange._order_tracker.process_order_not_found("OID2")
+        trades_mock = AsyncMock(return_value=[])
+        order_status_mock = AsyncMock(side_effect=lambda tracked_order: self.order_update(
+            tracked_order.client_order_id, OrderState.OPEN))
+
+        with patch.object(MockExchange, "_all_trade_updates_since", trades_mock), \
+                patch.object(MockExchange, "_request_order_status", order_status_mock):
+            for timestamp, update_status in [(1640780010, self.exchange._update_order_status),
+                                             (1640780020, self.exchange._update_lost_orders_status),
+                                             (1640780030, self.exchange._update_order_status)]:
+                self.exchange._set_current_timestamp(timestamp)
+                await update_status()
+
+        self.assertIn("OID2", self.exchange._order_tracker.lost_orders)
+        # The last pass does not go back to the creation of the active orders
+        self.assertEqual([1640780000, 1640780010, 1640780020],
+                         [call.kwargs["timestamp"] for call in trades_mock.call_args_list])
+        self.assertEqual({"OID0", "OID1", "OID2"}, self.exchange._fills_cursor_order_ids)
+
+    async def test_update_order_status_falls_back_to_each_order_when_bulk_requests_fail(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.track_orders(2)
+        order_fills_mock = AsyncMock(return_value=[])
+        order_status_mock = AsyncMock(side_effect=lambda tracked_order: self.order_update(
+            tracked_order.client_order_id, OrderState.OPEN))
+
+        with patch.object(MockExchange, "_all_trade_updates_since", AsyncMock(side_effect=IOError("Timeout"))), \
+                patch.object(MockExchange, "_request_all_open_order_updates",
+                             AsyncMock(side_effect=IOError("Timeout"))), \
+                patch.object(MockExchange, "_all_trade_updates_for_order", order_fills_mock), \
+                patch.object(MockExchange, "_request_order_status", order_status_mock):
+            await self.exchange._update_order_status()
+
+        self.assertEqual(2, order_fills_mock.call_count)
+        self.assertEqual(2, order_status_mock.call_count)
+        self.assertTrue(self.is_logged("WARNING", "Failed to fetch the trade updates since 1640780000.0. Error: Timeout"))
+        self.assertTrue(self.is_logged("WARNING", "Failed to fetch the open orders. Error: Timeout"))
+
+    async def test_update_order_status_without_bulk_endpoints(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.track_orders(2)
+        order_fills_mock = AsyncMock(return_value=[])
+        order_status_mock = AsyncMock(side_effect=lambda tracked_order: self.order_update(
+            tracked_order.client_order_id, OrderState.OPEN))
+
+        with patch.object(MockExchange, "_all_trade_updates_for_order", order_fills_mock), \
+                patch.object(MockExchange, "_request_order_status", order_status_mock):
+            await self.exchange._update_order_status()
+
+        self.assertEqual(2, order_fills_mock.call_count)
+        self.assertEqual(2, order_status_mock.call_count)
+        self.assertFalse(self.is_logged("WARNING", "Failed to fetch the open orders."))
@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from typing import Awaitable
@@ -22,7 +24,9 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.columnar_market_data import load_balances, load_market_data
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -85,6 +89,12 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -394,6 +404,167 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
 
+    def build_write_behind_recorder(self, flush_interval: float = 60) -> MarketsRecorder:
+        # The writer thread needs a database shared between connections, the in-memory one is per connection
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        with patch("hummingbot.model.sql_connection_manager.create_engine") as engine_mock:
+            engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(temp_dir.name, 'test_DB.sqlite')}")
+            self.manager = SQLConnectionManager(
+                ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+            )
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            write_behind=True,
+            write_flush_interval=flush_interval,
+        )
+        self.addCleanup(recorder.stop)
+        return recorder
+
+    def test_write_behind_writes_records_in_batches(self):
+        recorder = self.build_write_behind_recorder()
+        recorder.start()
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642010100,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=create_event.price,
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TRADE1",
+        )
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        self.assertEqual(2, recorder.write_queue_depth)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(Order).count())
+
+        trades = recorder.get_trades_for_config(self.config_file_path)
+
+        self.assertEqual(0, recorder.write_queue_depth)
+        self.assertEqual(1, len(trades))
+        self.assertEqual("TRADE1", trades[0].exchange_trade_id)
+        with self.manager.get_new_session() as session:
+            order = session.query(Order).one()
+            self.assertEqual(MarketEvent.OrderFilled.name, order.last_status)
+            self.assertEqual(2, len(order.status))
+            # The market states are not read by the trades query, they are saved with the next flush
+            self.assertEqual(0, session.query(MarketState).count())
+        latency = recorder.write_commit_latency
+        self.assertEqual(1, latency["batches"])
+        self.assertGreater(latency["max"], 0)
+
+    def test_write_behind_reads_wait_only_for_the_records_they_read(self):
+        recorder = self.build_write_behind_recorder()
+        recorder.start()
+
+        recorder._did_create_order(
+            MarketEvent.BuyOrderCreated.value,
+            self,
+            BuyOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id="OID1",
+                creation_timestamp=1640001112.223,
+                exchange_order_id="EOID1",
+            ),
+        )
+
+        trades = recorder.get_trades_for_config(self.config_file_path)
+
+        self.assertEqual(0, len(trades))
+        self.assertEqual(1, recorder.write_queue_depth)
+        self.assertEqual({}, recorder.write_commit_latency)
+
+        orders = recorder.get_orders_for_config_and_market(self.config_file_path, self)
+
+        self.assertEqual(0, recorder.write_queue_depth)
+        self.assertEqual(["OID1"], [order.id for order in orders])
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(MarketState).count())
+
+    def test_write_behind_coalesces_market_states(self):
+        recorder = self.build_write_behind_recorder()
+
+        for order_number in range(3):
+            self.tracking_states = {"orders": order_number}
+            recorder._did_create_order(
+                MarketEvent.BuyOrderCreated.value,
+                self,
+                BuyOrderCreatedEvent(
+                    timestamp=1642010000,
+                    type=OrderType.LIMIT,
+                    trading_pair=self.trading_pair,
+                    amount=Decimal(1),
+                    price=Decimal(1000),
+                    order_id=f"OID{order_number}",
+                    creation_timestamp=1640001112.223,
+                    exchange_order_id=f"EOID{order_number}",
+                ),
+            )
+            recorder._save_unsaved_market_states()
+
+        # The three orders and a single market state
+        self.assertEqual(4, recorder.write_queue_depth)
+
+        recorder.flush()
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(3, session.query(Order).count())
+            market_state = session.query(MarketState).one()
+            self.assertEqual({"orders": 2}, market_state.saved_state)
+
+    def test_write_behind_stop_writes_pending_records(self):
+        recorder = self.build_write_behind_recorder()
+        recorder.start()
+
+        self.tracking_states = {"orders": 1}
+        recorder._did_create_order(
+            MarketEvent.SellOrderCreated.value,
+            self,
+            SellOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id="OID1",
+                creation_timestamp=1640001112.223,
+                exchange_order_id="EOID1",
+            ),
+        )
+        recorder.stop()
+
+        self.assertEqual(0, recorder.write_queue_depth)
+        with self.manager.get_new_session() as session:
+            self.assertEqual("OID1", session.query(Order).one().id)
+            self.assertEqual({"orders": 1}, session.query(MarketState).one().saved_state)
+
     @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
     def test_market_data_collection_enabled(self, sleep_mock):
         sleep_mock.side_effect = [0.1, asyncio.CancelledError]
@@ -434,3 +605,42 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+
+    def test_market_data_collection_in_columnar_files(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=temp_dir.name):
+            recorder = MarketsRecorder(
+                sql=self.manager,
+                markets=[self],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                market_data_collection=MarketDataCollectionConfigMap(
+                    market_data_collection_enabled=True,
+                    market_data_collection_interval=1,
+                    market_data_collection_depth=2,
+                    market_data_collection_storage="columnar",
+                ),
+            )
+        prices = {PriceType.MidPrice: Decimal("100"), PriceType.BestBid: Decimal("99"), PriceType.BestAsk: Decimal("101")}
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(
+            np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64),
+            np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64),
+        )
+        with patch.object(self, "get_price_by_type", side_effect=lambda trading_pair, price_type: prices[price_type]), \
+                patch.object(self, "get_order_book", return_value=order_book), \
+                patch.object(self, "get_all_balances", create=True, return_value={"HBOT": Decimal("10")}):
+            recorder._record_market_data_in_files()
+            recorder._record_market_data_in_files()
+        recorder.stop()
+
+        base_path = os.path.join(temp_dir.name, "market_data")
+        market_data = load_market_data(base_path, self.display_name, self.trading_pair)
+        self.assertEqual(2, len(market_data))
+        self.assertEqual(101.0, market_data["best_ask"][0])
+        self.assertEqual([99.0, 98.0], [market_data["bid_price_0"][0], market_data["bid_price_1"][0]])
+        self.assertNotIn("bid_price_2", market_data.columns)
+        self.assertEqual([10.0, 10.0], list(load_balances(base_path, self.display_name)["HBOT"]))
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(MarketData).count())
@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+from hummingbot.connector.status_polling_metrics import StatusPollingMetrics, StatusPollingPass
+
+
+class StatusPollingMetricsTests(TestCase):
+
+    def test_summary_of_the_last_passes(self):
+        metrics = StatusPollingMetrics(max_passes=3)
+        for index, duration in enumerate([10.0, 0.1, 0.2, 0.6]):
+            metrics.record_pass(kind=StatusPollingMetrics.ORDER_STATUS, timestamp=1000 + index, duration=duration,
+                                orders_count=index)
+
+        self.assertEqual(StatusPollingPass(1003, 0.6, 3), metrics.last_pass(StatusPollingMetrics.ORDER_STATUS))
+        summary = metrics.summary(StatusPollingMetrics.ORDER_STATUS)
+        self.assertEqual(3, summary["passes"])
+        self.assertAlmostEqual(0.6, summary["last"])
+        self.assertAlmostEqual(0.3, summary["mean"])
+        self.assertAlmostEqual(0.6, summary["max"])
+        self.assertAlmostEqual(0.56, summary["p95"])
+
+    def test_kinds_without_passes(self):
+        metrics = StatusPollingMetrics()
+        metrics.record_pass(kind=StatusPollingMetrics.ORDER_FILLS, timestamp=1000, duration=0.5, orders_count=2)
+
+        self.assertIsNone(metrics.last_pass(StatusPollingMetrics.ORDER_STATUS))
+        self.assertEqual({}, metrics.summary(StatusPollingMetrics.ORDER_STATUS))
+        self.assertEqual([StatusPollingMetrics.ORDER_FILLS], list(metrics.to_dict()))
@@ -11,7 +11,14 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.async_throttler_base import throttler_priority
+from hummingbot.core.api_throttler.data_types import (
+    LinkedLimitWeightPair,
+    RateLimit,
+    TaskLog,
+    TaskLogs,
+    ThrottlePriority,
+)
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -105,10 +112,10 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_flush_only_elapsed_tasks_are_flushed(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
+        self.throttler._task_logs = TaskLogs([
             TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+            TaskLog(timestamp=time.monotonic(), rate_limit=rate_limit, weight=rate_limit.weight)
+        ])
 
         self.assertEqual(2, len(self.throttler._task_logs))
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -122,7 +129,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_within_capacity_singular_non_weighted_task_returns_false(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
         self.throttler._task_logs.append(
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
+            TaskLog(timestamp=time.monotonic(), rate_limit=rate_limit, weight=rate_limit.weight))
 
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
@@ -144,7 +151,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
 
         for linked_limit, weight in related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._task_logs.append(TaskLog(timestamp=time.monotonic(), rate_limit=linked_limit, weight=weight))
 
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
@@ -168,10 +175,10 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
         # Simulate Weighted Task 1 and Task 2 already in task logs, resulting in a used capacity of 6/10
         for linked_limit, weight in task_1_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._task_logs.append(TaskLog(timestamp=time.monotonic(), rate_limit=linked_limit, weight=weight))
         task_2, task_2_related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_2_ID)
         for linked_limit, weight in task_2_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._task_logs.append(TaskLog(timestamp=time.monotonic(), rate_limit=linked_limit, weight=weight))
 
         # Another Task 1(weight=5) will exceed the capacity(11/10)
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -214,7 +221,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
         self.throttler._task_logs.append(
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
+            TaskLog(timestamp=time.monotonic(), rate_limit=rate_limit, weight=rate_limit.weight))
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
@@ -240,7 +247,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         ])
 
         # Scenario where one specific task was executed at 0 milliseconds
-        tasks_log = []
+        tasks_log = TaskLogs()
         tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1))
         tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1))
 
@@ -275,3 +282,154 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_task_logs_keep_capacity_used_per_limit(self):
+        per_second_limit = RateLimit(limit_id="per_second", limit=10, time_interval=1)
+        per_minute_limit = RateLimit(limit_id="per_minute", limit=100, time_interval=60)
+        task_logs = TaskLogs([
+            TaskLog(timestamp=100.0, rate_limit=per_second_limit, weight=2),
+            TaskLog(timestamp=100.5, rate_limit=per_second_limit, weight=3),
+            TaskLog(timestamp=100.0, rate_limit=per_minute_limit, weight=5),
+        ])
+
+        self.assertEqual(3, len(task_logs))
+        self.assertEqual(5, task_logs.capacity_used("per_second"))
+        self.assertEqual(5, task_logs.capacity_used("per_minute"))
+        self.assertEqual(0, task_logs.capacity_used("unknown"))
+
+        # Capacity for 7 more needs the first task to expire, for 9 more both of them
+        self.assertEqual(0.0, task_logs.release_time("per_second", 5, 10, 0))
+        self.assertEqual(101.0, task_logs.release_time("per_second", 7, 10, 0))
+        self.assertEqual(101.5, task_logs.release_time("per_second", 9, 10, 0))
+        self.assertIsNone(task_logs.release_time("per_second", 11, 10, 0))
+
+        task_logs.flush_all(now=101.2, safety_margin_pct=0)
+        self.assertEqual(2, len(task_logs))
+        self.assertEqual(3, task_logs.capacity_used("per_second"))
+        self.assertEqual(5, task_logs.capacity_used("per_minute"))
+
+    def test_seconds_until_capacity_waits_for_the_limiting_task(self):
+        rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=related_limits,
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=0)
+        now = time.monotonic()
+        self.throttler._task_logs.append(TaskLog(timestamp=now - 4, rate_limit=related_limits[0][0], weight=5))
+        self.throttler._task_logs.append(TaskLog(timestamp=now - 1, rate_limit=related_limits[0][0], weight=5))
+
+        self.assertFalse(context.within_capacity())
+        # The pool (5 per task, 10 per 5 seconds) frees up when the oldest task expires
+        self.assertAlmostEqual(1, context.seconds_until_capacity(), delta=0.1)
+
+    def test_acquire_wakes_up_when_capacity_frees_up(self):
+        rate_limit = RateLimit(limit_id="fast", limit=1, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], retry_interval=10, safety_margin_pct=0)
+
+        async def acquire_twice():
+            async with throttler.execute_task(limit_id="fast"):
+                pass
+            start = time.monotonic()
+            async with throttler.execute_task(limit_id="fast"):
+                pass
+            return time.monotonic() - start
+
+        elapsed = self.ev_loop.run_until_complete(asyncio.wait_for(acquire_twice(), 2))
+        # Not waiting for the (10 seconds) retry interval
+        self.assertGreaterEqual(elapsed, 0.19)
+        self.assertLess(elapsed, 1)
+
+    def test_task_priority_resolution(self):
+        rate_limit = RateLimit(limit_id="orders", limit=10, time_interval=1, priority=ThrottlePriority.CREATE)
+        throttler = AsyncThrottler(rate_limits=[rate_limit])
+
+        self.assertEqual(ThrottlePriority.CREATE, throttler.execute_task("orders")._priority)
+        self.assertEqual(ThrottlePriority.USER_DATA, throttler.execute_task("unknown")._priority)
+        with throttler_priority(ThrottlePriority.CANCEL):
+            self.assertEqual(ThrottlePriority.CANCEL, throttler.execute_task("orders")._priority)
+            self.assertEqual(ThrottlePriority.HOUSEKEEPING,
+                             throttler.execute_task("orders", priority=ThrottlePriority.HOUSEKEEPING)._priority)
+        self.assertEqual(ThrottlePriority.CREATE, throttler.execute_task("orders")._priority)
+
+    def test_capacity_reserved_to_more_urgent_priorities(self):
+        rate_limit = RateLimit(limit_id="orders", limit=10, time_interval=5)
+        throttler = AsyncThrottler(rate_limits=[rate_limit],
+                                   priority_reserves={ThrottlePriority.CANCEL: 0.2, ThrottlePriority.CREATE: 0.1})
+        limit = throttler._id_to_limit_map["orders"]
+        throttler._task_logs.append(TaskLog(timestamp=time.monotonic(), rate_limit=limit, weight=7))
+
+        # 7 used, 3 reserved to cancels and creations
+        self.assertFalse(throttler.execute_task("orders", priority=ThrottlePriority.MARKET_DATA).within_capacity())
+        self.assertTrue(throttler.execute_task("orders", priority=ThrottlePriority.CREATE).within_capacity())
+        self.assertTrue(throttler.execute_task("orders", priority=ThrottlePriority.CANCEL).within_capacity())
+
+        throttler._task_logs.append(TaskLog(timestamp=time.monotonic(), rate_limit=limit, weight=2))
+        self.assertFalse(throttler.execute_task("orders", priority=ThrottlePriority.CREATE).within_capacity())
+        self.assertTrue(throttler.execute_task("orders", priority=ThrottlePriority.CANCEL).within_capacity())
+
+    def test_reserves_of_small_limits_do_not_starve_less_urgent_priorities(self):
+        rate_limit = RateLimit(limit_id="orders", limit=1, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0,
+                                   priority_reserves={ThrottlePriority.CANCEL: 0.5})
+        limit = throttler._id_to_limit_map["orders"]
+
+        # Less than a whole request is reserved, so the limit is not reduced
+        self.assertTrue(throttler.execute_task("orders", priority=ThrottlePriority.USER_DATA).within_capacity())
+        throttler._task_logs.append(TaskLog(timestamp=time.monotonic(), rate_limit=limit, weight=1))
+        self.assertFalse(throttler.execute_task("orders", priority=ThrottlePriority.USER_DATA).within_capacity())
+
+        async def request():
+            async with throttler.execute_task("orders", priority=ThrottlePriority.USER_DATA):
+                pass
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(request(), 1))
+
+    def test_reserve_never_lowers_the_capacity_under_the_task_weight(self):
+        rate_limit = RateLimit(limit_id="orders", limit=2, time_interval=5)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], priority_reserves={ThrottlePriority.CANCEL: 0.9})
+        limit = throttler._id_to_limit_map["orders"]
+        context = throttler.execute_task("orders", priority=ThrottlePriority.USER_DATA)
+
+        self.assertEqual(1.0, context._available_capacity(limit, 1))
+        self.assertEqual(2.0, context._available_capacity(limit, 2))
+        self.assertTrue(context.within_capacity())
+
+    def test_waiting_urgent_tasks_keep_capacity_from_less_urgent_ones(self):
+        rate_limit = RateLimit(limit_id="orders", limit=2, time_interval=5)
+        throttler = AsyncThrottler(rate_limits=[rate_limit])
+        throttler._task_logs.append(TaskLog(timestamp=time.monotonic(), rate_limit=rate_limit, weight=1))
+        throttler._task_logs.add_pending("orders", ThrottlePriority.CANCEL, 1)
+
+        self.assertFalse(throttler.execute_task("orders", priority=ThrottlePriority.USER_DATA).within_capacity())
+        self.assertTrue(throttler.execute_task("orders", priority=ThrottlePriority.CANCEL).within_capacity())
+
+        throttler._task_logs.remove_pending("orders", ThrottlePriority.CANCEL, 1)
+        self.assertTrue(throttler.execute_task("orders", priority=ThrottlePriority.USER_DATA).within_capacity())
+
+    def test_cancel_served_before_queued_polling_requests(self):
+        rate_limit = RateLimit(limit_id="orders", limit=2, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0)
+        acquired: List[ThrottlePriority] = []
+
+        async def request(priority: ThrottlePriority):
+            async with throttler.execute_task("orders", priority=priority):
+                acquired.append(priority)
+
+        async def run():
+            polling = [asyncio.ensure_future(request(ThrottlePriority.USER_DATA)) for _ in range(6)]
+            await asyncio.sleep(0.05)
+            await asyncio.gather(request(ThrottlePriority.CANCEL), *polling)
+
+        # The capacity warning is notified through the client application
+        with patch("hummingbot.core.api_throttler.async_request_context_base.AsyncRequestContextBase.logger"):
+            self.ev_loop.run_until_complete(asyncio.wait_for(run(), 3))
+
+        # The cancel gets capacity in the second window, the polling requests queued before it wait for later ones
+        self.assertIn(ThrottlePriority.CANCEL, acquired[2:4])
+        stats = throttler.wait_time_stats()
+        self.assertEqual(1, stats[ThrottlePriority.CANCEL]["count"])
+        self.assertEqual(6, stats[ThrottlePriority.USER_DATA]["count"])
+        # The cancel waited for the first window only
+        self.assertLess(stats[ThrottlePriority.CANCEL]["max"], 0.3)
+        self.assertGreater(stats[ThrottlePriority.USER_DATA]["max"], 0.4)
@@ -0,0 +1,150 @@
+import asyncio
+import fcntl
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.shared_async_throttler import SharedAsyncThrottler, SharedTaskLogs
+
+TEST_POOL_ID = "TEST"
+TEST_PATH_URL = "/api/v3/order"
+
+
+def rate_limits(limit: int, interval: float) -> List[RateLimit]:
+    return [
+        RateLimit(limit_id=TEST_POOL_ID, limit=limit, time_interval=interval),
+        RateLimit(limit_id=TEST_PATH_URL, limit=limit * 10, time_interval=interval,
+                  linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID, 1)]),
+    ]
+
+
+def run_requests_in_process(budget_directory: str, limit: int, interval: float, requests: int, results):
+    async def run_requests():
+        throttler = SharedAsyncThrottler(
+            rate_limits=rate_limits(limit, interval), budget_name="test", budget_directory=budget_directory)
+        timestamps = []
+        for _ in range(requests):
+            async with throttler.execute_task(limit_id=TEST_PATH_URL):
+                timestamps.append(time.monotonic())
+        return timestamps
+
+    results.extend(asyncio.run(run_requests()))
+
+
+class SharedAsyncThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.budget_directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.budget_directory.cleanup()
+        super().tearDown()
+
+    def throttler(self, limit: int = 10, interval: float = 60.0) -> SharedAsyncThrottler:
+        return SharedAsyncThrottler(
+            rate_limits=rate_limits(limit, interval), budget_name="test", budget_directory=self.budget_directory.name)
+
+    async def execute_requests(self, throttler: SharedAsyncThrottler, requests: int):
+        for _ in range(requests):
+            async with throttler.execute_task(limit_id=TEST_PATH_URL):
+                pass
+
+    def test_throttlers_with_the_same_budget_share_the_capacity_used(self):
+        first_throttler = self.throttler()
+        second_throttler = self.throttler()
+
+        self.ev_loop.run_until_complete(self.execute_requests(first_throttler, 4))
+
+        self.assertEqual(4, second_throttler._task_logs.capacity_used(TEST_POOL_ID))
+        self.assertEqual(8, len(second_throttler._task_logs))
+        context = second_throttler.execute_task(limit_id=TEST_PATH_URL)
+        self.assertTrue(context.within_capacity())
+
+        self.ev_loop.run_until_complete(self.execute_requests(second_throttler, 6))
+
+        self.assertEqual(10, first_throttler._task_logs.capacity_used(TEST_POOL_ID))
+        self.assertFalse(first_throttler.execute_task(limit_id=TEST_PATH_URL).within_capacity())
+
+    def test_shared_logs_expire_and_report_release_time(self):
+        task_logs = SharedTaskLogs(self.budget_directory.name, rate_limits(3, 1.0))
+        pool_limit = rate_limits(3, 1.0)[0]
+        for timestamp in (10.0, 10.5, 11.0):
+            task_logs.append(TaskLog(timestamp=timestamp, rate_limit=pool_limit, weight=1))
+
+        self.assertEqual(3, task_logs.capacity_used(TEST_POOL_ID))
+        self.assertEqual(11.5, task_logs.release_time(TEST_POOL_ID, 2, 3, 0.0))
+        self.assertIsNone(task_logs.release_time(TEST_POOL_ID, 4, 3, 0.0))
+
+        task_logs.flush(TEST_POOL_ID, 11.6, 0.0)
+
+        self.assertEqual(1, task_logs.capacity_used(TEST_POOL_ID))
+        self.assertEqual([11.0], [task.timestamp for task in task_logs])
+        task_logs.close()
+
+    def test_full_log_forgets_the_oldest_tasks(self):
+        pool_limit = RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=60.0)
+        task_logs = SharedTaskLogs(self.budget_directory.name, [pool_limit])
+        capacity = len(task_logs._limit_logs[TEST_POOL_ID]._timestamps)
+        for index in range(capacity + 5):
+            task_logs.append(TaskLog(timestamp=float(index), rate_limit=pool_limit, weight=2))
+
+        self.assertEqual(capacity, len(task_logs))
+        self.assertEqual(capacity * 2, task_logs.capacity_used(TEST_POOL_ID))
+        self.assertEqual(5.0, next(iter(task_logs)).timestamp)
+        task_logs.close()
+
+    def test_task_waits_for_the_lock_of_another_process_without_blocking_the_event_loop(self):
+        throttler = self.throttler()
+        # flock locks are held by open file descriptions, another one behaves as another process
+        other_process_fd = os.open(os.path.join(throttler._budget_path, "budget.lock"), os.O_RDWR)
+        fcntl.flock(other_process_fd, fcntl.LOCK_EX)
+
+        async def run():
+            request_task = asyncio.ensure_future(self.execute_requests(throttler, 1))
+            # A blocking wait for the lock would never let this coroutine resume to release it
+            await asyncio.sleep(0.05)
+            self.assertFalse(request_task.done())
+            fcntl.flock(other_process_fd, fcntl.LOCK_UN)
+            await asyncio.wait_for(request_task, 1)
+
+        try:
+            self.ev_loop.run_until_complete(asyncio.wait_for(run(), 5))
+        finally:
+            os.close(other_process_fd)
+
+        self.assertEqual(1, throttler._task_logs.capacity_used(TEST_POOL_ID))
+
+    @patch("hummingbot.core.api_throttler.shared_async_throttler.fcntl", None)
+    def test_shared_budget_not_supported_without_file_locks(self):
+        with self.assertRaises(NotImplementedError):
+            self.throttler()
+
+    def test_processes_sharing_a_budget_stay_within_the_limits(self):
+        limit, interval, requests = 5, 1.0, 6
+        with multiprocessing.Manager() as manager:
+            results = manager.list()
+            processes = [
+                multiprocessing.Process(target=run_requests_in_process,
+                                        args=(self.budget_directory.name, limit, interval, requests, results))
+                for _ in range(2)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join(timeout=30)
+            timestamps = sorted(results)
+
+        self.assertEqual(requests * 2, len(timestamps))
+        # No more than `limit` requests of both processes together within any interval
+        for index in range(len(timestamps) - limit):
+            self.assertGreaterEqual(timestamps[index + limit] - timestamps[index], interval)
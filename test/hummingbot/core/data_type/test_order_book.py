@@ -50,6 +50,115 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_raw_diffs_and_snapshot(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["10", "1"], ["9.5", "2", "0", "3"]], [("11", "1.5")], 5)
+        self.assertEqual([(10, 1, 5), (9.5, 2, 5)], list(order_book.bid_entries()))
+        self.assertEqual([(11, 1.5, 5)], list(order_book.ask_entries()))
+        self.assertEqual(5, order_book.snapshot_uid)
+
+        order_book.apply_raw_diffs([["10", "0"], [9.75, 4]], [["11", "0.5"], ["12", "3"]], 6)
+        self.assertEqual([(9.75, 4, 6), (9.5, 2, 5)], list(order_book.bid_entries()))
+        self.assertEqual([(11, 0.5, 6), (12, 3, 6)], list(order_book.ask_entries()))
+        self.assertEqual(6, order_book.last_diff_uid)
+        self.assertEqual(9.75, order_book.get_price(False))
+
+    def test_copy_from_and_top_levels(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["10", "1"], ["9.5", "2"], ["9", "3"]], [["11", "1.5"]], 5)
+        order_book.apply_raw_diffs([], [["12", "3"]], 6)
+        order_book.last_trade_price = 10.5
+
+        copy = OrderBook()
+        copy.copy_from(order_book)
+        self.assertEqual(list(order_book.bid_entries()), list(copy.bid_entries()))
+        self.assertEqual(list(order_book.ask_entries()), list(copy.ask_entries()))
+        self.assertEqual(5, copy.snapshot_uid)
+        self.assertEqual(6, copy.last_diff_uid)
+        self.assertEqual(11, copy.get_price(True))
+        self.assertTrue(np.isnan(copy.last_trade_price))
+
+        order_book.apply_raw_diffs([["10", "0"]], [], 7)
+        self.assertEqual(10, copy.get_price(False))
+
+        bids, asks = copy.top_levels(2)
+        self.assertEqual([[10, 1], [9.5, 2]], bids.tolist())
+        self.assertEqual([[11, 1.5], [12, 3]], asks.tolist())
+        bids, asks = copy.top_levels(0)
+        self.assertEqual((0, 2), bids.shape)
+        self.assertEqual((0, 2), asks.shape)
+
+    def _depth_order_books(self):
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1]], dtype=np.float64)
+        order_books = [OrderBook(), OrderBook(depth_cache=True)]
+        for order_book in order_books:
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+        return order_books
+
+    def test_depth_queries_with_and_without_cache(self):
+        for order_book in self._depth_order_books():
+            result = order_book.get_price_for_volume(True, 2)
+            self.assertEqual(12, result.result_price)
+            self.assertEqual(2, result.result_volume)
+            result = order_book.get_price_for_volume(False, 3)
+            self.assertEqual(9, result.result_price)
+            self.assertEqual(3, result.result_volume)
+            result = order_book.get_price_for_volume(True, 100)
+            self.assertTrue(np.isnan(result.result_price))
+            self.assertEqual(6, result.result_volume)
+
+            result = order_book.get_vwap_for_volume(True, 2)
+            self.assertAlmostEqual((11 + 12) / 2, result.result_price)
+            self.assertEqual(2, result.result_volume)
+            result = order_book.get_vwap_for_volume(False, 4)
+            self.assertAlmostEqual((10 + 9 * 2 + 8) / 4, result.result_price)
+            result = order_book.get_vwap_for_volume(False, 7)
+            self.assertTrue(np.isnan(result.result_price))
+            self.assertEqual(6, result.result_volume)
+
+            result = order_book.get_price_for_quote_volume(True, 30)
+            self.assertEqual(12, result.result_price)
+            self.assertEqual(30, result.result_volume)
+
+            result = order_book.get_quote_volume_for_base_amount(True, 2)
+            self.assertEqual(23, result.result_volume)
+            result = order_book.get_quote_volume_for_base_amount(False, 100)
+            self.assertEqual(10 + 18 + 24, result.result_volume)
+
+            result = order_book.get_volume_for_price(True, 12.5)
+            self.assertEqual(12, result.result_price)
+            self.assertEqual(3, result.result_volume)
+            result = order_book.get_volume_for_price(False, 8)
+            self.assertEqual(8, result.result_price)
+            self.assertEqual(6, result.result_volume)
+            result = order_book.get_volume_for_price(True, 10)
+            self.assertTrue(np.isnan(result.result_price))
+            self.assertEqual(0, result.result_volume)
+
+            result = order_book.get_quote_volume_for_price(False, 9)
+            self.assertEqual(9, result.result_price)
+            self.assertEqual(28, result.result_volume)
+
+            self.assertEqual([(11, 1, 1), (12, 1.5, 1)], order_book.simulate_buy(2.5))
+            self.assertEqual([(10, 1, 1), (9, 2, 1), (8, 3, 1)], order_book.simulate_sell(10))
+
+    def test_depth_cache_invalidated_by_diffs(self):
+        order_book = OrderBook(depth_cache=True)
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1]], dtype=np.float64))
+        self.assertEqual(1, order_book.get_volume_for_price(True, 20).result_volume)
+
+        order_book.apply_numpy_diffs(np.array([[9, 5, 2]], dtype=np.float64),
+                                     np.array([[12, 2, 2], [11, 0, 2]], dtype=np.float64))
+        self.assertEqual(2, order_book.get_volume_for_price(True, 20).result_volume)
+        self.assertEqual(12, order_book.get_price_for_volume(True, 1).result_price)
+        self.assertEqual(6, order_book.get_volume_for_price(False, 0).result_volume)
+
+        order_book.depth_cache_enabled = False
+        self.assertFalse(order_book.depth_cache_enabled)
+        self.assertEqual(12, order_book.get_price_for_volume(True, 1).result_price)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -1,6 +1,10 @@
+import bisect
+import pickle
 import time
 import unittest
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -248,3 +252,43 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_diffs_with_different_update_ids_are_not_equal(self):
+        diff1 = OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 1}, timestamp=1)
+        diff2 = OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 2}, timestamp=1)
+
+        self.assertNotEqual(diff1, diff2)
+        self.assertTrue(diff1 < diff2)
+        self.assertFalse(diff2 < diff1)
+        self.assertEqual(2, len({diff1, diff2, OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 1})}))
+
+    def test_snapshot_replay_position(self):
+        diffs = [OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": update_id}, timestamp=update_id)
+                 for update_id in range(1, 6)]
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {"update_id": 3}, timestamp=10)
+
+        self.assertEqual(3, bisect.bisect_right(diffs, snapshot))
+
+    def test_levels_are_parsed_once(self):
+        content = {
+            "trading_pair": "BTC-USDT",
+            "update_id": 1,
+            "bids": [["5.5", "6", "extra"], ["7", "8", "extra"]],
+            "asks": [],
+        }
+        msg = OrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=1)
+
+        np.testing.assert_array_equal(np.array([[5.5, 6], [7, 8]]), msg.bids_array)
+        self.assertEqual((0, 2), msg.asks_array.shape)
+        self.assertEqual([], msg.asks)
+        self.assertIs(msg.bids, msg.bids)
+        self.assertEqual(OrderBookRow(5.5, 6, 1), msg.bids[0])
+        self.assertEqual("BTC-USDT", msg.trading_pair)
+
+    def test_pickle(self):
+        msg = OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 1, "bids": [], "asks": []}, timestamp=1)
+        restored = pickle.loads(pickle.dumps(msg))
+
+        self.assertEqual(msg, restored)
+        self.assertEqual(msg.content, restored.content)
+        self.assertEqual(msg.timestamp, restored.timestamp)
@@ -0,0 +1,212 @@
+import asyncio
+import threading
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker, OrderBookTrackerRoutingMode
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.trading_pairs = ["COINALPHA-HBOT", "BTC-USDT", "ETH-USDT"]
+        self.data_source = MagicMock()
+        self.data_source.RAW_ORDER_BOOK_LEVELS = False
+        self.snapshot_release_events: Dict[str, asyncio.Event] = {
+            trading_pair: asyncio.Event() for trading_pair in self.trading_pairs
+        }
+        self.requested_snapshots: List[str] = []
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self._get_new_order_book)
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    async def _get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requested_snapshots.append(trading_pair)
+        await self.snapshot_release_events[trading_pair].wait()
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 1)
+        return order_book
+
+    async def test_order_books_are_initialized_concurrently_and_ready_individually(self):
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.trading_pairs, self.requested_snapshots)
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+        self.snapshot_release_events["BTC-USDT"].set()
+        await asyncio.wait_for(self.tracker.wait_order_book_ready("BTC-USDT"), timeout=1)
+
+        self.assertTrue(self.tracker.is_order_book_ready("BTC-USDT"))
+        self.assertFalse(self.tracker.is_order_book_ready("ETH-USDT"))
+        self.assertEqual(["BTC-USDT"], self.tracker.ready_trading_pairs)
+        self.assertIn("BTC-USDT", self.tracker.order_books)
+        self.assertIn("BTC-USDT", self.tracker.order_book_initialization_times)
+        self.assertFalse(self.tracker.ready)
+
+        for event in self.snapshot_release_events.values():
+            event.set()
+        await asyncio.wait_for(init_task, timeout=1)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_book_initialization_times))
+        self.assertTrue(all(elapsed >= 0 for elapsed in self.tracker.order_book_initialization_times.values()))
+
+    async def test_concurrent_snapshot_requests_are_bounded(self):
+        self.tracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS = 2
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.trading_pairs[:2], self.requested_snapshots)
+
+        self.snapshot_release_events["COINALPHA-HBOT"].set()
+        await asyncio.wait_for(self.tracker.wait_order_book_ready("COINALPHA-HBOT"), timeout=1)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.trading_pairs, self.requested_snapshots)
+
+        for event in self.snapshot_release_events.values():
+            event.set()
+        await asyncio.wait_for(init_task, timeout=1)
+
+    async def test_stop_clears_ready_order_books(self):
+        for event in self.snapshot_release_events.values():
+            event.set()
+        await self.tracker._init_order_books()
+        self.assertTrue(self.tracker.is_order_book_ready("ETH-USDT"))
+
+        self.tracker.stop()
+
+        self.assertFalse(self.tracker.ready)
+        self.assertFalse(self.tracker.is_order_book_ready("ETH-USDT"))
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+    async def test_diff_messages_applied_with_raw_levels(self):
+        self.data_source.RAW_ORDER_BOOK_LEVELS = True
+        for event in self.snapshot_release_events.values():
+            event.set()
+        await self.tracker._init_order_books()
+
+        self.tracker._tracking_message_queues["BTC-USDT"].put_nowait(OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "BTC-USDT", "update_id": 2, "bids": [["10", "1"]], "asks": [["11", "2"]]},
+            timestamp=1,
+        ))
+        await asyncio.sleep(0.1)
+
+        order_book = self.tracker.order_books["BTC-USDT"]
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def _diff_message(self, trading_pair: str, update_id: int, bid_price: str) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": trading_pair, "update_id": update_id, "bids": [[bid_price, "1"]], "asks": []},
+            timestamp=time.time(),
+        )
+
+    async def _test_diffs_routed_in_mode(self, routing_mode: OrderBookTrackerRoutingMode):
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=self.trading_pairs,
+                                        routing_mode=routing_mode,
+                                        shards_count=2)
+        for event in self.snapshot_release_events.values():
+            event.set()
+        # Received before the order book is initialized
+        self.tracker._saved_message_queues["BTC-USDT"].append(self._diff_message("BTC-USDT", 2, "9"))
+        self.tracker._shard_tasks = [asyncio.get_event_loop().create_task(self.tracker._track_shard(queue))
+                                     for queue in self.tracker._shard_message_queues]
+        if routing_mode is OrderBookTrackerRoutingMode.THREADED:
+            self.tracker._worker_thread = threading.Thread(
+                target=self.tracker._track_order_books_in_thread,
+                args=(self.tracker._worker_message_queue, self.tracker._worker_stop_event),
+                daemon=True,
+            )
+            self.tracker._worker_thread.start()
+        await self.tracker._init_order_books()
+        router_task = asyncio.get_event_loop().create_task(self.tracker._order_book_diff_router())
+
+        for update_id, trading_pair in enumerate(self.trading_pairs, start=3):
+            self.tracker._order_book_diff_stream.put_nowait(self._diff_message(trading_pair, update_id, "10"))
+        self.tracker._order_book_diff_stream.put_nowait(self._diff_message("BTC-USDT", 10, "11"))
+        await asyncio.sleep(0.1)
+        router_task.cancel()
+
+        self.assertEqual({}, self.tracker._tracking_tasks)
+        self.assertEqual(11, self.tracker.order_books["BTC-USDT"].get_price(False))
+        self.assertEqual(10, self.tracker.order_books["BTC-USDT"].last_diff_uid)
+        self.assertEqual(3, len(list(self.tracker.order_books["BTC-USDT"].bid_entries())))
+        self.assertEqual(10, self.tracker.order_books["ETH-USDT"].get_price(False))
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_book_lags))
+        self.assertTrue(all(size == 0 for size in self.tracker.message_queue_sizes.values()))
+
+    async def test_diffs_applied_inline_by_router(self):
+        await self._test_diffs_routed_in_mode(OrderBookTrackerRoutingMode.INLINE)
+        self.assertEqual(["diff_stream", "snapshot_stream"], list(self.tracker.message_queue_sizes))
+
+    async def test_diffs_applied_by_shard_tasks(self):
+        await self._test_diffs_routed_in_mode(OrderBookTrackerRoutingMode.SHARDED)
+        self.assertEqual(["diff_stream", "snapshot_stream", "shard_0", "shard_1"],
+                         list(self.tracker.message_queue_sizes))
+        for trading_pair in self.trading_pairs:
+            self.assertIn(self.tracker._tracking_message_queues[trading_pair], self.tracker._shard_message_queues)
+
+    async def test_diffs_applied_by_worker_thread(self):
+        await self._test_diffs_routed_in_mode(OrderBookTrackerRoutingMode.THREADED)
+        self.assertEqual(["diff_stream", "snapshot_stream", "worker"], list(self.tracker.message_queue_sizes))
+
+        view = self.tracker.get_order_book_view("BTC-USDT")
+        self.assertEqual(10, view.update_id)
+        self.assertEqual(11, view.best_bid)
+        self.assertTrue(view.best_ask != view.best_ask)
+        self.assertEqual([[11, 1], [10, 1], [9, 1]], view.bids.tolist())
+        self.assertEqual((0, 2), view.asks.shape)
+        # The tracker order books are copies, updated on the event loop
+        self.assertIsNot(self.tracker._worker_order_books["BTC-USDT"], self.tracker.order_books["BTC-USDT"])
+
+        self.tracker.stop()
+        self.assertEqual({}, self.tracker._worker_order_books)
+
+    async def test_order_book_view_built_from_order_book(self):
+        for event in self.snapshot_release_events.values():
+            event.set()
+        await self.tracker._init_order_books()
+        self.tracker.order_books["ETH-USDT"].apply_diffs([OrderBookRow(10, 1, 2)], [OrderBookRow(11, 2, 2)], 2)
+
+        view = self.tracker.get_order_book_view("ETH-USDT")
+        self.assertEqual("ETH-USDT", view.trading_pair)
+        self.assertEqual(2, view.update_id)
+        self.assertEqual(10, view.best_bid)
+        self.assertEqual(11, view.best_ask)
+        self.assertEqual([[11, 2]], view.asks.tolist())
+        self.assertIsNone(self.tracker.get_order_book_view("XRP-USDT"))
+
+    async def test_per_pair_queue_sizes(self):
+        for event in self.snapshot_release_events.values():
+            event.set()
+        await self.tracker._init_order_books()
+        for task in self.tracker._tracking_tasks.values():
+            task.cancel()
+        self.tracker._tracking_message_queues["ETH-USDT"].put_nowait(self._diff_message("ETH-USDT", 2, "10"))
+
+        queue_sizes = self.tracker.message_queue_sizes
+        self.assertEqual(1, queue_sizes["ETH-USDT"])
+        self.assertEqual(0, queue_sizes["BTC-USDT"])
@@ -0,0 +1,47 @@
+import json
+import unittest
+
+from hummingbot.core.web_assistant import json_codec
+from hummingbot.core.web_assistant.json_codec import JSON_CODECS, json_dumps, json_loads, set_json_codec
+
+
+class JSONCodecTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.default_codec = json_codec.get_json_codec()
+
+    def tearDown(self) -> None:
+        set_json_codec(self.default_codec)
+        super().tearDown()
+
+    def test_codecs_produce_the_same_data_as_the_standard_library(self):
+        payload = {"symbol": "BTC/USDT", "price": 0.1, "ids": [1, 2 ** 70], "nested": {"1": None, "ok": True},
+                   "text": "café"}
+        for codec_class in JSON_CODECS.values():
+            if codec_class is json_codec.ORJSONCodec and json_codec.orjson is None:
+                continue
+            codec = codec_class()
+            self.assertEqual(payload, json.loads(codec.dumps(payload)), codec.name)
+            self.assertEqual(payload, codec.loads(json.dumps(payload)), codec.name)
+            self.assertEqual(payload, codec.loads(json.dumps(payload).encode()), codec.name)
+
+    def test_codecs_raise_the_standard_library_errors(self):
+        for codec_class in JSON_CODECS.values():
+            if codec_class is json_codec.ORJSONCodec and json_codec.orjson is None:
+                continue
+            codec = codec_class()
+            with self.assertRaises(json.JSONDecodeError):
+                codec.loads("<html>Bad Gateway</html>")
+            with self.assertRaises(TypeError):
+                codec.dumps({"value": object()})
+
+    def test_set_json_codec(self):
+        set_json_codec("json")
+
+        self.assertIsInstance(json_codec.get_json_codec(), json_codec.StdlibJSONCodec)
+        self.assertEqual('{"a": 1}', json_dumps({"a": 1}))
+        self.assertEqual({"a": 1}, json_loads('{"a": 1}'))
+
+        with self.assertRaises(ValueError):
+            set_json_codec("unknown")
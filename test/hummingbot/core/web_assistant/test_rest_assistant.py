@@ -100,3 +100,38 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_copies_the_request_only_when_processed(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_requests = []
+
+        async def register_request_and_return(request: RESTRequest):
+            call_requests.append(request)
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "SIGNATURE"
+                request.headers["X-KEY"] = "KEY"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        req = RESTRequest(method=RESTMethod.GET, url=url, params={"one": 1}, headers={})
+        auth_req = RESTRequest(method=RESTMethod.GET, url=url, params={"one": 1}, headers={}, is_auth_required=True)
+
+        self.async_run_with_timeout(assistant.call(req))
+        self.async_run_with_timeout(assistant.call(auth_req))
+
+        self.assertIs(req, call_requests[0])
+        self.assertIsNot(auth_req, call_requests[1])
+        self.assertEqual({"one": 1, "signature": "SIGNATURE"}, call_requests[1].params)
+        self.assertEqual({"X-KEY": "KEY"}, call_requests[1].headers)
+        self.assertEqual({"one": 1}, auth_req.params)
+        self.assertEqual({}, auth_req.headers)
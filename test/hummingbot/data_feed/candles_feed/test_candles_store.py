@@ -0,0 +1,153 @@
+import asyncio
+import tempfile
+import unittest
+from typing import Awaitable, Optional
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+
+class CandlesStoreTests(unittest.TestCase):
+    interval = "1m"
+    interval_in_seconds = 60
+    start_time = 1672981200
+
+    def setUp(self) -> None:
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.base_path = temp_dir.name
+        self.store = CandlesStore(base_path=self.base_path)
+        self.fetch_calls = []
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def candles(self, first_time: int, count: int) -> np.ndarray:
+        timestamps = first_time + self.interval_in_seconds * np.arange(count, dtype=float)
+        candles = np.zeros((count, 10))
+        candles[:, 0] = timestamps
+        candles[:, 4] = timestamps / 1e6
+        return candles
+
+    async def fetch_candles(self,
+                            start_time: Optional[int] = None,
+                            end_time: Optional[int] = None,
+                            limit: Optional[int] = None):
+        # Returns up to 100 candles ending at end_time, as the exchanges do
+        self.fetch_calls.append((start_time, end_time))
+        count = min(limit or 100, 100) + 1
+        return self.candles(end_time - self.interval_in_seconds * (count - 1), count)
+
+    def test_missing_ranges(self):
+        self.assertEqual([(self.start_time, self.start_time + 600)],
+                         self.store.missing_ranges("binance_BTC-USDT", self.interval, 60, self.start_time,
+                                                   self.start_time + 600))
+
+        self.store.store_candles("binance_BTC-USDT", self.interval, 60, self.candles(self.start_time + 120, 3),
+                                 (self.start_time + 120, self.start_time + 240))
+        self.store.store_candles("binance_BTC-USDT", self.interval, 60, self.candles(self.start_time + 420, 1),
+                                 (self.start_time + 420, self.start_time + 420))
+
+        self.assertEqual(
+            [(self.start_time, self.start_time + 60), (self.start_time + 300, self.start_time + 360),
+             (self.start_time + 480, self.start_time + 600)],
+            self.store.missing_ranges("binance_BTC-USDT", self.interval, 60, self.start_time, self.start_time + 600))
+        self.assertEqual([], self.store.missing_ranges("binance_BTC-USDT", self.interval, 60, self.start_time + 180,
+                                                       self.start_time + 240))
+
+        # The adjacent ranges are merged
+        self.store.store_candles("binance_BTC-USDT", self.interval, 60, self.candles(self.start_time + 300, 2),
+                                 (self.start_time + 300, self.start_time + 360))
+        self.assertEqual([[self.start_time + 120, self.start_time + 420]],
+                         self.store._load_ranges("binance_BTC-USDT", self.interval))
+
+    def test_store_candles_merged_sorted_and_persisted(self):
+        self.store.store_candles("binance_BTC-USDT", self.interval, 60, self.candles(self.start_time + 180, 3))
+        new_candles = self.candles(self.start_time, 4)
+        new_candles[3, 4] = 42
+        self.store.store_candles("binance_BTC-USDT", self.interval, 60, new_candles)
+
+        reopened_store = CandlesStore(base_path=self.base_path)
+        candles = reopened_store.get_candles("binance_BTC-USDT", self.interval, self.start_time, self.start_time + 600)
+
+        self.assertIsInstance(candles, np.memmap)
+        self.assertEqual(list(self.start_time + 60 * np.arange(6)), list(candles[:, 0]))
+        # The candle fetched last replaces the stored one
+        self.assertEqual(42, candles[3, 4])
+        candles = self.store.get_candles("binance_BTC-USDT", self.interval, self.start_time + 60, self.start_time + 120)
+        self.assertEqual(2, len(candles))
+        self.assertEqual(0, len(self.store.get_candles("binance_ETH-USDT", self.interval, self.start_time,
+                                                       self.start_time + 600)))
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase._time", return_value=1672981200 + 86400)
+    def test_historical_candles_fetched_only_for_missing_ranges(self, _):
+        data_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval=self.interval)
+        data_feed.set_candles_store(self.store)
+        config = HistoricalCandlesConfig(connector_name="binance", trading_pair="BTC-USDT", interval=self.interval,
+                                         start_time=self.start_time, end_time=self.start_time + 3000)
+
+        with patch.object(data_feed, "fetch_candles", side_effect=self.fetch_candles):
+            candles_df = self.async_run_with_timeout(data_feed.get_historical_candles(config))
+            fetch_calls_count = len(self.fetch_calls)
+            self.assertGreater(fetch_calls_count, 0)
+
+            cached_candles_df = self.async_run_with_timeout(data_feed.get_historical_candles(config))
+            self.assertEqual(fetch_calls_count, len(self.fetch_calls))
+
+            config.end_time = self.start_time + 6000
+            extended_candles_df = self.async_run_with_timeout(data_feed.get_historical_candles(config))
+
+        self.assertEqual(51, len(candles_df))
+        self.assertEqual(list(candles_df["timestamp"]), list(cached_candles_df["timestamp"]))
+        self.assertEqual(list(self.start_time + 60 * np.arange(101)), list(extended_candles_df["timestamp"]))
+        # Only the extension was fetched
+        self.assertTrue(all(end_time >= self.start_time + 3000 for _, end_time in self.fetch_calls[fetch_calls_count:]))
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase._time", return_value=1672981200 + 86400)
+    def test_stored_candles_frames_are_writable(self, _):
+        data_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval=self.interval)
+        data_feed.set_candles_store(self.store)
+        self.store.store_candles(data_feed.name, self.interval, 60, self.candles(self.start_time, 5),
+                                 (self.start_time - 60, self.start_time + 240))
+        config = HistoricalCandlesConfig(connector_name="binance", trading_pair="BTC-USDT", interval=self.interval,
+                                         start_time=self.start_time, end_time=self.start_time + 240)
+
+        candles_df = self.async_run_with_timeout(data_feed.get_historical_candles(config))
+        candles_df.loc[0, "close"] = 1.0
+        candles_df["volume"] += 1
+        # As the slices of the backtesting data provider
+        candles_slice = candles_df.iloc[1:3]
+        with pd.option_context("mode.chained_assignment", None):
+            candles_slice.loc[1, "close"] = 2.0
+            candles_slice["volume"] *= 2
+
+        self.assertEqual([1.0, 2.0], list(candles_df["close"][:2]))
+        self.assertEqual(2.0, candles_slice["volume"][1])
+        # Neither the stored candles nor the candles of the other callers change
+        for store in (self.store, CandlesStore(base_path=self.base_path)):
+            stored_candles = store.get_candles(data_feed.name, self.interval, self.start_time, self.start_time + 240)
+            np.testing.assert_array_equal(self.candles(self.start_time, 5), stored_candles)
+
+    def test_fill_historical_candles_from_store(self):
+        data_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval=self.interval, max_records=5)
+        data_feed.set_candles_store(self.store)
+        # A gap before the last four candles stored, only these are used
+        self.store.store_candles(data_feed.name, self.interval, 60, self.candles(self.start_time, 2))
+        self.store.store_candles(data_feed.name, self.interval, 60, self.candles(self.start_time + 180, 4))
+        data_feed._candles.append(self.candles(self.start_time + 420, 1)[0])
+        data_feed._ws_candle_available.set()
+
+        with patch.object(data_feed, "fetch_candles", side_effect=self.fetch_candles):
+            self.async_run_with_timeout(data_feed.fill_historical_candles())
+
+        self.assertEqual([], self.fetch_calls)
+        self.assertTrue(data_feed.ready)
+        self.assertEqual(list(self.start_time + 60 * np.arange(3, 8)), list(data_feed.candles_df["timestamp"]))
@@ -0,0 +1,108 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.model.columnar_market_data import ColumnarMarketDataWriter, load_balances, load_market_data
+
+
+class ColumnarMarketDataTests(TestCase):
+    # 2022-01-01 23:59:00 UTC
+    start_timestamp = 1641081540
+
+    def setUp(self) -> None:
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.base_path = temp_dir.name
+        self.exchange = "binance"
+        self.trading_pair = "COINALPHA-HBOT"
+
+    @staticmethod
+    def book_side(prices):
+        return iter([OrderBookRow(price, price / 10, 1) for price in prices])
+
+    def append_snapshot(self, writer: ColumnarMarketDataWriter, timestamp: float, levels: int = 3):
+        writer.append(
+            timestamp=timestamp,
+            exchange=self.exchange,
+            trading_pair=self.trading_pair,
+            mid_price=100.0,
+            best_bid=99.0,
+            best_ask=101.0,
+            bid_entries=self.book_side([99.0 - level for level in range(levels)]),
+            ask_entries=self.book_side([101.0 + level for level in range(levels)]),
+        )
+
+    def test_snapshots_written_by_chunk_and_day(self):
+        writer = ColumnarMarketDataWriter(base_path=self.base_path, depth=2, chunk_size=2)
+
+        for minute in range(4):
+            self.append_snapshot(writer, self.start_timestamp + minute * 60)
+
+        # The first snapshot is alone in its day, written with the first snapshot of the next day, the two next ones
+        # fill a chunk
+        self.assertEqual(1, writer.buffered_rows_count)
+        self.assertEqual(["2022-01-01", "2022-01-02"],
+                         sorted(os.listdir(os.path.join(self.base_path, self.exchange, self.trading_pair))))
+
+        writer.flush()
+
+        self.assertEqual(0, writer.buffered_rows_count)
+        data = load_market_data(self.base_path, self.exchange, self.trading_pair)
+        self.assertEqual([self.start_timestamp + minute * 60 for minute in range(4)], list(data["timestamp"]))
+        self.assertEqual([99.0, 98.0], [data["bid_price_0"][0], data["bid_price_1"][0]])
+        self.assertEqual([10.1, 10.2], [data["ask_amount_0"][0], data["ask_amount_1"][0]])
+        self.assertNotIn("bid_price_2", data.columns)
+
+    def test_previous_day_written_when_the_day_changes(self):
+        writer = ColumnarMarketDataWriter(base_path=self.base_path, depth=1)
+
+        self.append_snapshot(writer, self.start_timestamp)
+        writer.append_balances(self.start_timestamp, self.exchange, {"HBOT": 10})
+        self.assertEqual(0, len(load_market_data(self.base_path, self.exchange, self.trading_pair)))
+
+        self.append_snapshot(writer, self.start_timestamp + 60)
+        writer.append_balances(self.start_timestamp + 60, self.exchange, {"HBOT": 5})
+
+        # Only the rows of the new day stay buffered
+        self.assertEqual(2, writer.buffered_rows_count)
+        self.assertEqual([self.start_timestamp],
+                         list(load_market_data(self.base_path, self.exchange, self.trading_pair)["timestamp"]))
+        self.assertEqual([10.0], list(load_balances(self.base_path, self.exchange)["HBOT"]))
+
+    def test_depth_padded_when_book_is_shallow(self):
+        writer = ColumnarMarketDataWriter(base_path=self.base_path, depth=3)
+
+        self.append_snapshot(writer, self.start_timestamp, levels=2)
+        writer.flush()
+
+        data = load_market_data(self.base_path, self.exchange, self.trading_pair)
+        self.assertEqual(98.0, data["bid_price_1"][0])
+        self.assertTrue(np.isnan(data["bid_price_2"][0]))
+        self.assertTrue(np.isnan(data["ask_amount_2"][0]))
+
+    def test_load_market_data_in_time_range(self):
+        writer = ColumnarMarketDataWriter(base_path=self.base_path, depth=1)
+        for minute in range(4):
+            self.append_snapshot(writer, self.start_timestamp + minute * 60)
+        writer.flush()
+
+        data = load_market_data(self.base_path, self.exchange, self.trading_pair,
+                                start_timestamp=self.start_timestamp + 60, end_timestamp=self.start_timestamp + 120)
+
+        self.assertEqual([self.start_timestamp + 60, self.start_timestamp + 120], list(data["timestamp"]))
+        self.assertEqual(0, len(load_market_data(self.base_path, self.exchange, "OTHER-PAIR")))
+
+    def test_balances_with_assets_changing(self):
+        writer = ColumnarMarketDataWriter(base_path=self.base_path, depth=1, chunk_size=1)
+
+        writer.append_balances(self.start_timestamp + 120, self.exchange, {"HBOT": 10})
+        writer.append_balances(self.start_timestamp + 180, self.exchange, {"HBOT": 5, "COINALPHA": 1})
+
+        balances = load_balances(self.base_path, self.exchange)
+        self.assertEqual([10.0, 5.0], list(balances["HBOT"]))
+        self.assertTrue(np.isnan(balances["COINALPHA"][0]))
+        self.assertEqual(1.0, balances["COINALPHA"][1])
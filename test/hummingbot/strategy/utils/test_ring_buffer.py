@@ -107,3 +107,70 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_numpy_array_of_large_buffer(self):
+        length = 40000
+        buffer = RingBuffer(length)
+
+        for i in range(length + 5):
+            buffer.add_value(i)
+
+        values = buffer.get_as_numpy_array()
+        self.assertEqual(length, values.size)
+        self.assertEqual(5, values[0])
+        self.assertEqual(length + 4, values[-1])
+
+    def test_segments_are_views_of_the_buffer(self):
+        buffer = RingBuffer(4)
+        for i in range(3):
+            buffer.add_value(i)
+        older_values, newer_values = buffer.get_segments()
+        self.assertTrue(np.array_equal(older_values, np.array([0, 1, 2])))
+        self.assertEqual(0, newer_values.size)
+
+        for i in range(3, 6):
+            buffer.add_value(i)
+        older_values, newer_values = buffer.get_segments()
+        self.assertTrue(np.array_equal(older_values, np.array([2, 3])))
+        self.assertTrue(np.array_equal(newer_values, np.array([4, 5])))
+        self.assertTrue(np.shares_memory(older_values, newer_values.base))
+
+    def test_running_statistics(self):
+        np.random.seed(123456789)
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 5 + 7)
+
+        for sample in samples:
+            self.buffer.add_value(sample)
+            values = self.buffer.get_as_numpy_array()
+            self.assertEqual(values.size, self.buffer.size)
+            self.assertAlmostEqual(np.sum(values), self.buffer.sum, 8)
+            self.assertAlmostEqual(np.sum(np.square(values - np.mean(values))),
+                                   self.buffer.sum_of_squared_deviations, 8)
+            self.assertAlmostEqual(np.sum(np.square(np.diff(values))), self.buffer.sum_of_squared_diffs, 8)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.mean(values), self.buffer.mean_value, 10)
+                self.assertAlmostEqual(np.var(values), self.buffer.variance, 8)
+
+    def test_running_statistics_with_nan_values(self):
+        self.fill_buffer_with_zeros()
+        self.buffer.add_value(np.nan)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+        self.assertTrue(np.isnan(self.buffer.sum_of_squared_diffs))
+
+        # Back to finite values once the nan leaves the buffer
+        for i in range(self.BUFFER_LENGTH - 1):
+            self.buffer.add_value(1)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+        self.buffer.add_value(1)
+        self.assertEqual(1, self.buffer.mean_value)
+        self.assertEqual(0, self.buffer.variance)
+        self.assertEqual(0, self.buffer.sum_of_squared_diffs)
+
+    def test_length_change_keeps_statistics(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+        self.buffer.length = 10
+
+        self.assertTrue(self.buffer.is_full)
+        self.assertEqual(np.mean(np.arange(20, 30)), self.buffer.mean_value)
+        self.assertEqual(9, self.buffer.sum_of_squared_diffs)
@@ -9,7 +9,7 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
-from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.common import PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
@@ -259,3 +259,34 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_trades_leaving_the_sample_are_removed_from_the_estimate(self):
+        def curve_fn(t_, a_, b_):
+            return a_ * np.exp(-b_ * t_)
+
+        mid_price = float(self.price_delegate.get_price_by_type(PriceType.MidPrice))
+        trade_price_levels = [1, 2, 3, 4]
+        timestamp = self.start_timestamp
+
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": mid_price}]
+
+        for a, b in ((5, 0.3), (2, 0.1)):
+            timestamp += 1
+            for p in trade_price_levels:
+                trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT",
+                    timestamp=timestamp,
+                    price=mid_price + p,
+                    amount=curve_fn(p, a, b),
+                    type=TradeType.BUY,
+                ))
+            trading_intensity_indicator.calculate(timestamp)
+
+        alpha, kappa = trading_intensity_indicator.current_value
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)
+
+        # Ticks without trades leave the estimate as it is
+        trading_intensity_indicator.calculate(timestamp + 1)
+        self.assertEqual((alpha, kappa), trading_intensity_indicator.current_value)
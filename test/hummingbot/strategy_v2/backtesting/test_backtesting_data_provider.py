@@ -0,0 +1,100 @@
+import tempfile
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.trading_rules_cache import TradingRulesCache
+
+
+class TestBacktestingDataProvider(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        gateway_patch = patch("hummingbot.data_feed.market_data_provider.GatewayHttpClient")
+        gateway_patch.start()
+        self.addCleanup(gateway_patch.stop)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.trading_rules_cache = TradingRulesCache(base_path=self.temp_dir.name)
+        self.provider = BacktestingDataProvider(connectors={}, trading_rules_cache=self.trading_rules_cache)
+        self.trading_rule = TradingRule("BTC-USDT", min_price_increment=Decimal("0.01"),
+                                        min_base_amount_increment=Decimal("0.00001"))
+
+    def mock_connector(self, trading_rules=None, update_error=None) -> MagicMock:
+        connector = MagicMock()
+        connector.trading_rules = trading_rules if trading_rules is not None else {"BTC-USDT": self.trading_rule}
+        connector._update_trading_rules = AsyncMock(side_effect=update_error)
+        return connector
+
+    def test_no_connector_created_at_initialization(self):
+        self.assertEqual({}, self.provider.connectors)
+
+    def test_candles_stored_only_with_a_candles_store(self):
+        self.assertIsNone(self.provider.candles_store)
+        candles_store = CandlesStore(base_path=self.temp_dir.name)
+
+        provider = BacktestingDataProvider(connectors={}, candles_store=candles_store,
+                                           trading_rules_cache=self.trading_rules_cache)
+
+        self.assertIs(candles_store, provider.candles_store)
+
+    def test_connector_created_on_first_use(self):
+        connector = self.mock_connector()
+        with patch.object(BacktestingDataProvider, "_create_connector", return_value=connector) as create_connector:
+            self.assertIs(connector, self.provider.get_connector("binance"))
+            self.assertIs(connector, self.provider.get_connector("binance"))
+
+        create_connector.assert_called_once_with("binance")
+        self.assertEqual({"binance": connector}, self.provider.connectors)
+
+    def test_get_connector_not_found_or_not_supported(self):
+        with self.assertRaises(ValueError):
+            self.provider.get_connector("binance_invalid")
+        with self.assertRaises(ValueError):
+            self.provider.get_connector("kraken")
+
+    async def test_initialize_trading_rules_fetches_and_caches_them(self):
+        connector = self.mock_connector()
+        self.provider.connectors["binance"] = connector
+
+        await self.provider.initialize_trading_rules("binance")
+        await self.provider.initialize_trading_rules("binance")
+
+        connector._update_trading_rules.assert_awaited_once()
+        self.assertEqual(self.trading_rule.min_price_increment,
+                         self.provider.get_trading_rules("binance", "BTC-USDT").min_price_increment)
+        self.assertIn("BTC-USDT", self.trading_rules_cache.get_trading_rules("binance"))
+
+    async def test_initialize_trading_rules_from_cache(self):
+        self.trading_rules_cache.store_trading_rules("binance", {"BTC-USDT": self.trading_rule})
+        connector = self.mock_connector()
+        self.provider.connectors["binance"] = connector
+
+        await self.provider.initialize_trading_rules("binance")
+
+        connector._update_trading_rules.assert_not_awaited()
+        self.assertEqual(self.trading_rule.min_base_amount_increment,
+                         self.provider.get_trading_rules("binance", "BTC-USDT").min_base_amount_increment)
+
+    async def test_initialize_trading_rules_uses_expired_cache_when_fetch_fails(self):
+        expired_cache = TradingRulesCache(base_path=self.temp_dir.name, ttl=-1)
+        expired_cache.store_trading_rules("binance", {"BTC-USDT": self.trading_rule})
+        provider = BacktestingDataProvider(connectors={"binance": self.mock_connector(update_error=IOError("offline"))},
+                                           trading_rules_cache=expired_cache)
+
+        await provider.initialize_trading_rules("binance")
+
+        self.assertEqual(self.trading_rule.min_price_increment,
+                         provider.get_trading_rules("binance", "BTC-USDT").min_price_increment)
+
+    async def test_initialize_trading_rules_raises_when_fetch_fails_without_cache(self):
+        self.provider.connectors["binance"] = self.mock_connector(update_error=IOError("offline"))
+
+        with self.assertRaises(IOError):
+            await self.provider.initialize_trading_rules("binance")
+
+        self.provider.connectors["binance"] = self.mock_connector(trading_rules={})
+        with self.assertRaises(ValueError):
+            await self.provider.initialize_trading_rules("binance")
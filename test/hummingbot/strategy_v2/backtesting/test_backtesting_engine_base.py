@@ -0,0 +1,131 @@
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Awaitable
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class ScriptedController:
+    """Opens position executors at regular intervals and stops the ones losing too much, like a directional
+    controller."""
+
+    def __init__(self, market_data_provider):
+        self.config = SimpleNamespace(connector_name="binance", trading_pair="BTC-USDT", candles_config=[],
+                                      total_amount_quote=Decimal("1000"))
+        self.market_data_provider = market_data_provider
+        self.processed_data = {}
+        self.executors_info = []
+        self.executors_count = 0
+
+    def determine_executor_actions(self):
+        actions = []
+        timestamp = self.processed_data["timestamp"]
+        active_executors = [executor for executor in self.executors_info if executor.is_active]
+        for executor in active_executors:
+            if executor.net_pnl_pct < Decimal("-0.004"):
+                actions.append(StopExecutorAction(controller_id="main", executor_id=executor.id))
+        if len(active_executors) < 3 and int(timestamp / 60) % 7 == 0:
+            self.executors_count += 1
+            side = TradeType.BUY if self.executors_count % 2 == 0 else TradeType.SELL
+            close = Decimal(str(self.processed_data["close"]))
+            actions.append(CreateExecutorAction(controller_id="main", executor_config=PositionExecutorConfig(
+                id=f"executor-{self.executors_count}",
+                timestamp=timestamp,
+                connector_name=self.config.connector_name,
+                trading_pair=self.config.trading_pair,
+                side=side,
+                entry_price=close * (Decimal("0.999") if side == TradeType.BUY else Decimal("1.001")),
+                amount=Decimal("1"),
+                triple_barrier_config=TripleBarrierConfig(
+                    take_profit=Decimal("0.006"),
+                    stop_loss=Decimal("0.008"),
+                    time_limit=3600,
+                    trailing_stop=TrailingStop(activation_price=Decimal("0.003"), trailing_delta=Decimal("0.001"))
+                    if self.executors_count % 3 == 0 else None,
+                    open_order_type=OrderType.MARKET,
+                ),
+            )))
+        return actions
+
+
+class BacktestingEngineBaseTests(TestCase):
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 60):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def candles(rows: int) -> pd.DataFrame:
+        random = np.random.default_rng(7)
+        close = 30000 * np.exp(np.cumsum(random.normal(0, 0.001, rows)))
+        return pd.DataFrame({
+            "timestamp": 1672531200.0 + 60 * np.arange(rows),
+            "open": np.roll(close, 1),
+            "high": close * (1 + np.abs(random.normal(0, 0.0005, rows))),
+            "low": close * (1 - np.abs(random.normal(0, 0.0005, rows))),
+            "close": close,
+            "volume": random.uniform(1, 10, rows),
+        })
+
+    def run_simulation(self, vectorized: bool):
+        with patch("hummingbot.strategy_v2.backtesting.backtesting_engine_base.BacktestingDataProvider"):
+            engine = BacktestingEngineBase(vectorized=vectorized)
+        engine.backtesting_resolution = "1m"
+        market_data_provider = MagicMock()
+        market_data_provider.get_candles_df.return_value = self.candles(3000)
+        engine.controller = ScriptedController(market_data_provider)
+        executors_info = self.async_run_with_timeout(engine.simulate_execution(trade_cost=0.0006))
+        return executors_info, engine.summarize_results(executors_info, 1000)
+
+    def test_vectorized_simulation_produces_same_results(self):
+        executors_info, results = self.run_simulation(vectorized=False)
+        vectorized_executors_info, vectorized_results = self.run_simulation(vectorized=True)
+
+        self.assertGreater(results["total_executors"], 20)
+        self.assertIn("EARLY_STOP", results["close_types"])
+        self.assertEqual(results, vectorized_results)
+        self.assertEqual([executor_info.to_dict() for executor_info in executors_info],
+                         [executor_info.to_dict() for executor_info in vectorized_executors_info])
+
+    def test_update_executor_info_matches_executor_info_at_timestamp(self):
+        candles = self.candles(200)
+        config = PositionExecutorConfig(
+            id="executor-1", timestamp=candles["timestamp"][0], connector_name="binance", trading_pair="BTC-USDT",
+            side=TradeType.BUY, entry_price=Decimal(str(candles["close"][0])), amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(time_limit=6000, open_order_type=OrderType.MARKET),
+        )
+        simulation = PositionExecutorSimulator().simulate(candles, config, trade_cost=0.0006)
+
+        for timestamp in candles["timestamp"][:120]:
+            self.assertEqual(simulation.get_executor_info_at_timestamp(timestamp),
+                             simulation.update_executor_info(timestamp))
+
+    def test_limit_order_filled_after_time_limit_is_not_executed(self):
+        candles = self.candles(100)
+        config = PositionExecutorConfig(
+            id="executor-1", timestamp=candles["timestamp"][0], connector_name="binance", trading_pair="BTC-USDT",
+            side=TradeType.BUY, entry_price=Decimal(str(candles["close"].iloc[:50].min() - 1)), amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(time_limit=30 * 60, open_order_type=OrderType.LIMIT),
+        )
+        candles.loc[60, "close"] = float(config.entry_price) - 1
+
+        simulation = PositionExecutorSimulator().simulate(candles, config, trade_cost=0.0006)
+
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(0, simulation.executor_simulation["filled_amount_quote"].sum())
@@ -0,0 +1,130 @@
+from decimal import Decimal
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulatorBase
+from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class ExecutorSimulatorsTests(TestCase):
+
+    @staticmethod
+    def market_data(close) -> pd.DataFrame:
+        close = np.asarray(close, dtype=float)
+        return pd.DataFrame({
+            "timestamp": 1672531200.0 + 60 * np.arange(len(close)),
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": 1.0,
+        })
+
+    def position_config(self, df: pd.DataFrame, position: int, **kwargs) -> PositionExecutorConfig:
+        open_order_type = kwargs.pop("open_order_type", OrderType.MARKET)
+        return PositionExecutorConfig(
+            id=f"position-{position}", timestamp=df["timestamp"][position], connector_name="binance",
+            trading_pair="BTC-USDT", side=kwargs.pop("side", TradeType.BUY),
+            entry_price=kwargs.pop("entry_price", Decimal(str(df["close"][position]))), amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(open_order_type=open_order_type, **kwargs))
+
+    def test_float_bounds_compare_exactly_to_decimals(self):
+        self.assertEqual(1.1, ExecutorSimulatorBase.float_at_least(Decimal("1.1")))
+        self.assertLess(ExecutorSimulatorBase.float_at_most(Decimal("1.1")), 1.1)
+        self.assertEqual(1.5, ExecutorSimulatorBase.float_at_most(Decimal("1.5")))
+        self.assertEqual(1.5, ExecutorSimulatorBase.float_at_least(Decimal("1.5")))
+
+    def test_position_take_profit_and_stop_loss(self):
+        df = self.market_data([100, 100.5, 101, 101.6, 102, 99, 98])
+        simulator = PositionExecutorSimulator()
+
+        take_profit = simulator.simulate(df, self.position_config(df, 0, take_profit=Decimal("0.015"),
+                                                                  stop_loss=Decimal("0.01")), trade_cost=0.0)
+        stop_loss = simulator.simulate(df.iloc[4:], self.position_config(df, 4, stop_loss=Decimal("0.02")),
+                                       trade_cost=0.0)
+
+        self.assertEqual(CloseType.TAKE_PROFIT, take_profit.close_type)
+        self.assertEqual(4, len(take_profit.executor_simulation))
+        self.assertAlmostEqual(0.016, take_profit.executor_simulation["net_pnl_pct"].iloc[-1])
+        self.assertEqual(200, take_profit.executor_simulation["filled_amount_quote"].iloc[-1])
+        self.assertEqual(CloseType.STOP_LOSS, stop_loss.close_type)
+        self.assertEqual([4, 5], list(stop_loss.executor_simulation.index))
+
+    def test_position_limit_order_filled_after_time_limit_is_not_filled(self):
+        df = self.market_data([100, 100, 100, 100, 98, 97])
+        config = self.position_config(df, 0, open_order_type=OrderType.LIMIT, entry_price=Decimal("98.5"),
+                                      take_profit=Decimal("0.01"), time_limit=120)
+        simulator = PositionExecutorSimulator()
+
+        simulation = simulator.simulate(df, config, trade_cost=0.0)
+        batch_simulation = simulator.simulate_batch(df, [config], trade_cost=0.0)[0]
+
+        # The price only reaches the entry price two minutes after the time limit
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(0, simulation.executor_simulation["filled_amount_quote"].abs().sum())
+        self.assertEqual(0, simulation.executor_simulation["net_pnl_quote"].abs().sum())
+        self.assertEqual(CloseType.TIME_LIMIT, batch_simulation.close_type)
+        pd.testing.assert_frame_equal(simulation.executor_simulation, batch_simulation.executor_simulation)
+
+    def test_position_simulate_batch_matches_simulate(self):
+        random = np.random.default_rng(3)
+        df = self.market_data(100 * np.exp(np.cumsum(random.normal(0, 0.002, 500))))
+        configs = []
+        for position in range(0, 450, 15):
+            side = TradeType.BUY if position % 2 == 0 else TradeType.SELL
+            configs.append(self.position_config(
+                df, position, side=side, take_profit=Decimal("0.01"), stop_loss=Decimal("0.01"), time_limit=3600,
+                open_order_type=OrderType.LIMIT if position % 3 == 0 else OrderType.MARKET,
+                entry_price=Decimal(str(df["close"][position] * (0.998 if side == TradeType.BUY else 1.002))),
+                trailing_stop=TrailingStop(activation_price=Decimal("0.004"), trailing_delta=Decimal("0.001"))
+                if position % 5 == 0 else None))
+        simulator = PositionExecutorSimulator()
+
+        simulations = simulator.simulate_batch(df, configs, trade_cost=0.0006)
+
+        self.assertEqual({CloseType.TAKE_PROFIT, CloseType.STOP_LOSS, CloseType.TIME_LIMIT, CloseType.TRAILING_STOP},
+                         {simulation.close_type for simulation in simulations})
+        for config, simulation in zip(configs, simulations):
+            position = int(np.searchsorted(df["timestamp"], config.timestamp))
+            expected = simulator.simulate(df.iloc[position:], config, trade_cost=0.0006)
+            self.assertEqual(expected.close_type, simulation.close_type)
+            pd.testing.assert_frame_equal(expected.executor_simulation, simulation.executor_simulation)
+
+    def test_dca_take_profit_after_second_level(self):
+        df = self.market_data([100, 99.5, 99, 98.5, 98, 99, 100, 101])
+        config = DCAExecutorConfig(
+            id="dca", timestamp=df["timestamp"][0], connector_name="binance", trading_pair="BTC-USDT",
+            side=TradeType.BUY, amounts_quote=[Decimal("100"), Decimal("100")], prices=[Decimal("99"), Decimal("98")],
+            take_profit=Decimal("0.01"), stop_loss=Decimal("0.05"))
+
+        simulation = DCAExecutorSimulator().simulate(df, config, trade_cost=0.0)
+        executor_simulation = simulation.executor_simulation
+
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        self.assertEqual(df["timestamp"][6], executor_simulation["timestamp"].iloc[-1])
+        self.assertEqual([0, 0, 100, 100, 200, 200, 400], list(executor_simulation["filled_amount_quote"]))
+        self.assertAlmostEqual(98.5, executor_simulation["current_position_average_price"].iloc[-1])
+        self.assertAlmostEqual(100 / 99 + 100 / 98 - 2, executor_simulation["net_pnl_quote"].iloc[-1] / 100)
+
+    def test_dca_last_level_without_stop_loss(self):
+        df = self.market_data([100, 99, 98, 97, 96])
+        config = DCAExecutorConfig(
+            id="dca", timestamp=df["timestamp"][0], connector_name="binance", trading_pair="BTC-USDT",
+            side=TradeType.BUY, amounts_quote=[Decimal("100"), Decimal("100")], prices=[Decimal("99"), Decimal("98")],
+            take_profit=Decimal("0.01"), time_limit=180)
+
+        simulation = DCAExecutorSimulator().simulate(df, config, trade_cost=0.0)
+
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(4, len(simulation.executor_simulation))
@@ -0,0 +1,135 @@
+import multiprocessing
+import os
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.parameter_sweep import (
+    BacktestingSweep,
+    ParameterGrid,
+    RandomSearch,
+    SharedCandles,
+    load_candles_from_csv,
+    set_config_parameter,
+)
+
+
+class ParameterSweepTests(TestCase):
+
+    @staticmethod
+    def candles(rows: int) -> pd.DataFrame:
+        random = np.random.default_rng(7)
+        close = 30000 * np.exp(np.cumsum(random.normal(0, 0.001, rows)))
+        return pd.DataFrame({
+            "timestamp": 1672531200.0 + 60 * np.arange(rows),
+            "open": np.roll(close, 1),
+            "high": close * (1 + np.abs(random.normal(0, 0.0005, rows))),
+            "low": close * (1 - np.abs(random.normal(0, 0.0005, rows))),
+            "close": close,
+            "volume": random.uniform(1, 10, rows),
+        })
+
+    def test_parameter_grid(self):
+        grid = ParameterGrid({"stop_loss": [0.01, 0.02], "take_profit": [0.02, 0.03, 0.04]})
+
+        parameters = list(grid)
+
+        self.assertEqual(6, len(grid))
+        self.assertEqual(6, len(parameters))
+        self.assertEqual({"stop_loss": 0.01, "take_profit": 0.02}, parameters[0])
+        self.assertEqual({"stop_loss": 0.02, "take_profit": 0.04}, parameters[-1])
+
+    def test_random_search(self):
+        search = RandomSearch({"stop_loss": (0.01, 0.05), "time_limit": (60, 600), "side": ["BUY", "SELL"]},
+                              samples=20, seed=3)
+
+        parameters = list(search)
+
+        self.assertEqual(20, len(parameters))
+        self.assertEqual(parameters, list(search))
+        for run_parameters in parameters:
+            self.assertTrue(0.01 <= run_parameters["stop_loss"] <= 0.05)
+            self.assertIsInstance(run_parameters["time_limit"], int)
+            self.assertTrue(60 <= run_parameters["time_limit"] <= 600)
+            self.assertIn(run_parameters["side"], ["BUY", "SELL"])
+
+    def test_set_config_parameter(self):
+        config_data = {"stop_loss": 0.01, "triple_barrier_config": {"stop_loss": 0.01}}
+
+        set_config_parameter(config_data, "stop_loss", 0.02)
+        set_config_parameter(config_data, "triple_barrier_config.take_profit", 0.03)
+
+        self.assertEqual({"stop_loss": 0.02, "triple_barrier_config": {"stop_loss": 0.01, "take_profit": 0.03}},
+                         config_data)
+
+    def test_shared_candles(self):
+        candles = self.candles(100)
+
+        with SharedCandles({"binance_BTC-USDT_1m": candles}) as shared_candles:
+            attached_candles, shared_memories = SharedCandles.attach(shared_candles.handles)
+            candles_df = attached_candles["binance_BTC-USDT_1m"]
+
+            pd.testing.assert_frame_equal(candles, candles_df)
+            self.assertFalse(candles_df["close"].values.flags.writeable)
+            with self.assertRaises(ValueError):
+                candles_df["close"].values[0] = 0
+            del attached_candles, candles_df
+            for shared_memory in shared_memories:
+                shared_memory.close()
+
+    def test_load_candles_from_csv(self):
+        candles = self.candles(10)
+        with tempfile.TemporaryDirectory() as data_path:
+            candles.iloc[::-1].to_csv(os.path.join(data_path, "candles_binance_BTC-USDT_1m.csv"), index=False)
+
+            candles_df = load_candles_from_csv(data_path, CandlesConfig(connector="binance", trading_pair="BTC-USDT",
+                                                                        interval="1m"))
+            with self.assertRaises(FileNotFoundError):
+                load_candles_from_csv(data_path, CandlesConfig(connector="binance", trading_pair="ETH-USDT",
+                                                               interval="1m"))
+
+        pd.testing.assert_frame_equal(candles, candles_df)
+
+    @patch("hummingbot.data_feed.market_data_provider.MarketDataProvider.get_non_trading_connector")
+    @patch("hummingbot.strategy_v2.backtesting.backtesting_data_provider.BacktestingDataProvider.get_connector")
+    @patch("hummingbot.data_feed.market_data_provider.GatewayHttpClient")
+    def test_sweep_runs_backtests_in_processes(self, *_):
+        candles = self.candles(600)
+        controller_config = {
+            "id": "pmm", "controller_name": "pmm_simple", "controller_type": "market_making",
+            "connector_name": "binance", "trading_pair": "BTC-USDT", "total_amount_quote": 1000,
+            "buy_spreads": [0.002], "sell_spreads": [0.002], "stop_loss": 0.03, "take_profit": 0.02,
+            "time_limit": 3600, "executor_refresh_time": 300,
+        }
+        trading_rules = {"binance": {"BTC-USDT": TradingRule("BTC-USDT",
+                                                             min_base_amount_increment=Decimal("0.00001"),
+                                                             min_price_increment=Decimal("0.01"))}}
+        sweep = BacktestingSweep(controller_config=controller_config,
+                                 candles={"binance_BTC-USDT_1m": candles},
+                                 trading_rules=trading_rules,
+                                 start=int(candles["timestamp"].iloc[0]),
+                                 end=int(candles["timestamp"].iloc[-1]),
+                                 max_workers=2,
+                                 mp_context=multiprocessing.get_context("fork"))
+        parameters = ParameterGrid({"stop_loss": [0.001, 0.03], "executor_refresh_time": [300, 300]})
+
+        with tempfile.TemporaryDirectory() as output_path:
+            output_file = os.path.join(output_path, "results.csv")
+            results = sweep.run(parameters, output_path=output_file)
+            streamed_results = pd.read_csv(output_file)
+
+        self.assertEqual([0, 1, 2, 3], list(results["run"]))
+        self.assertEqual([0.001, 0.001, 0.03, 0.03], list(results["stop_loss"]))
+        self.assertTrue(results["error"].isna().all())
+        self.assertTrue((results["total_executors"] > 0).all())
+        self.assertGreater(results["close_type_STOP_LOSS"][0], results["close_type_STOP_LOSS"][2])
+        # The runs of the same parameters give the same results, whatever the process that ran them
+        pd.testing.assert_series_equal(results.iloc[0].drop("run"), results.iloc[1].drop("run"), check_names=False)
+        self.assertEqual(sorted(streamed_results["run"]), [0, 1, 2, 3])
+        self.assertEqual(list(results.columns), list(streamed_results.columns))
@@ -0,0 +1,47 @@
+import os
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.strategy_v2.backtesting.trading_rules_cache import TradingRulesCache
+
+
+class TradingRulesCacheTests(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.trading_rule = TradingRule("ETH-BTC",
+                                        min_order_size=Decimal("0.001"),
+                                        min_price_increment=Decimal("0.000001"),
+                                        min_base_amount_increment=Decimal("0.0001"),
+                                        min_notional_size=Decimal("0.0001"),
+                                        supports_market_orders=False,
+                                        buy_order_collateral_token="USDT")
+
+    def test_store_and_get_trading_rules(self):
+        cache = TradingRulesCache(base_path=self.temp_dir.name)
+
+        self.assertIsNone(cache.get_trading_rules("binance"))
+        cache.store_trading_rules("binance", {"ETH-BTC": self.trading_rule})
+        trading_rules = TradingRulesCache(base_path=self.temp_dir.name).get_trading_rules("binance")
+
+        self.assertEqual(["ETH-BTC"], list(trading_rules))
+        self.assertEqual(repr(self.trading_rule), repr(trading_rules["ETH-BTC"]))
+
+    def test_expired_trading_rules(self):
+        cache = TradingRulesCache(base_path=self.temp_dir.name, ttl=-1)
+        cache.store_trading_rules("binance", {"ETH-BTC": self.trading_rule})
+
+        self.assertIsNone(cache.get_trading_rules("binance"))
+        self.assertIn("ETH-BTC", cache.get_trading_rules("binance", include_expired=True))
+
+    def test_malformed_cache_file(self):
+        cache = TradingRulesCache(base_path=self.temp_dir.name)
+        with open(os.path.join(self.temp_dir.name, "binance.json"), "w") as cache_file:
+            cache_file.write("{\"timestamp\": ")
+
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(cache.get_trading_rules("binance", include_expired=True))
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
@@ -13,7 +13,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
-from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.base import IdleConditions, RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType, TrackedOrder
 
 
@@ -726,3 +726,93 @@ class TestPositionExecutor(IsolatedAsyncioWrapperTestCase):
         executor_info = position_executor.executor_info
         self.assertEqual(executor_info.close_type, CloseType.FAILED)
         self.assertEqual(executor_info.net_pnl_pct, Decimal("0"))
+
+    def get_position_executor_with_filled_open_order(self, position_config):
+        position_executor = self.get_position_executor_running_from_config(position_config)
+        position_executor._open_order = TrackedOrder(order_id="OID-1")
+        position_executor._open_order.order = InFlightOrder(
+            client_order_id="OID-1",
+            exchange_order_id="EOID1",
+            trading_pair=position_config.trading_pair,
+            order_type=position_config.triple_barrier_config.open_order_type,
+            trade_type=position_config.side,
+            amount=position_config.amount,
+            price=position_config.entry_price,
+            creation_timestamp=1640001112.223,
+            initial_state=OrderState.FILLED
+        )
+        position_executor._open_order.order.update_with_trade_update(
+            TradeUpdate(
+                trade_id="1",
+                client_order_id="OID-1",
+                exchange_order_id="EOID1",
+                trading_pair=position_config.trading_pair,
+                fill_price=position_config.entry_price,
+                fill_base_amount=position_config.amount,
+                fill_quote_amount=position_config.amount * position_config.entry_price,
+                fee=AddedToCostTradeFee(flat_fees=[TokenAmount(token="USDT", amount=Decimal("0.2"))]),
+                fill_timestamp=10,
+            )
+        )
+        self.strategy.connectors["binance"].quantize_order_amount.return_value = position_config.amount
+        return position_executor
+
+    @patch.object(PositionExecutor, "get_trading_rules")
+    def test_idle_conditions_with_open_order_not_filled(self, trading_rules_mock):
+        position_config = self.get_position_config_market_long()
+        position_executor = self.get_position_executor_running_from_config(position_config)
+        self.assertIsNone(position_executor.get_idle_conditions())
+
+        position_executor._open_order = TrackedOrder(order_id="OID-BUY-1")
+        self.assertEqual(IdleConditions(until_timestamp=1234567890 + 60), position_executor.get_idle_conditions())
+
+        position_config.activation_bounds = [Decimal("0.001"), Decimal("0.01")]
+        self.assertIsNone(position_executor.get_idle_conditions())
+
+    @patch.object(PositionExecutor, "get_trading_rules")
+    def test_early_stop_wakes_up_the_scheduler(self, trading_rules_mock):
+        trading_rules = MagicMock(spec=TradingRule)
+        trading_rules.min_order_size = Decimal("0.1")
+        trading_rules.min_notional_size = Decimal("1")
+        trading_rules_mock.return_value = trading_rules
+        position_config = self.get_position_config_market_long()
+        position_executor = self.get_position_executor_running_from_config(position_config)
+        position_executor._scheduler = MagicMock()
+
+        position_executor.early_stop()
+
+        self.assertEqual(RunnableStatus.SHUTTING_DOWN, position_executor.status)
+        position_executor._scheduler.wake.assert_called_once_with(position_executor)
+
+    @patch.object(PositionExecutor, "get_trading_rules")
+    async def test_idle_conditions_are_the_barriers_prices(self, trading_rules_mock):
+        trading_rules = MagicMock(spec=TradingRule)
+        trading_rules.min_order_size = Decimal("0.1")
+        trading_rules.min_notional_size = Decimal("1")
+        trading_rules_mock.return_value = trading_rules
+        self.strategy.buy.side_effect = None
+        self.strategy.sell.side_effect = None
+        short_config = PositionExecutorConfig(
+            id="test-short", timestamp=1234567890, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.SELL, entry_price=Decimal("100"), amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(stop_loss=Decimal("0.05"), take_profit=Decimal("0.1"),
+                                                      time_limit=60))
+        # The fees of the open order are 0.2% of the position
+        for position_config, price_type, lower_price, lower_close_type, upper_price, upper_close_type in [
+            (self.get_position_config_market_long_tp_market(), PriceType.BestBid,
+             Decimal("95.2"), CloseType.STOP_LOSS, Decimal("110.2"), CloseType.TAKE_PROFIT),
+            (short_config, PriceType.BestAsk,
+             Decimal("89.8"), CloseType.TAKE_PROFIT, Decimal("104.8"), CloseType.STOP_LOSS),
+        ]:
+            position_executor = self.get_position_executor_with_filled_open_order(position_config)
+
+            self.assertEqual(IdleConditions(connector_name="binance", trading_pair="ETH-USDT", price_type=price_type,
+                                            lower_price=lower_price, upper_price=upper_price,
+                                            until_timestamp=1234567890 + 60),
+                             position_executor.get_idle_conditions())
+            # The barriers act right at the prices of the idle conditions
+            for price, close_type in [(lower_price, lower_close_type), (upper_price, upper_close_type)]:
+                position_executor = self.get_position_executor_with_filled_open_order(position_config)
+                with patch.object(PositionExecutor, "get_price", return_value=price):
+                    await position_executor.control_task()
+                self.assertEqual(close_type, position_executor.close_type)
@@ -19,6 +19,7 @@ from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
 from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
 
 
 class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
@@ -152,6 +153,19 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.stop()
         self.assertEqual(RunnableStatus.TERMINATED, self.component.status)
 
+    def test_events_of_own_orders_wake_the_executor_up(self):
+        scheduler = MagicMock(spec=RunnableScheduler)
+        self.component.start(scheduler=scheduler)
+        scheduler.register.assert_called_once_with(self.component)
+        self.component.place_order(connector_name="connector1", trading_pair="ETH-USDT", order_type=OrderType.LIMIT,
+                                   side=TradeType.BUY, price=Decimal("1000.0"), amount=Decimal("1.0"))
+
+        for order_id in ["OID-OTHER-1", "OID-BUY-1"]:
+            self.component._failed_order_forwarder(
+                MarketOrderFailureEvent(timestamp=1234567890, order_id=order_id, order_type=OrderType.LIMIT))
+
+        scheduler.wake.assert_called_once_with(self.component)
+
     @patch.object(ExecutorBase, "get_net_pnl_pct")
     @patch.object(ExecutorBase, "get_net_pnl_quote")
     @patch.object(ExecutorBase, "get_cum_fees_quote")
@@ -21,6 +21,7 @@ from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StoreExecutorAction
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+from hummingbot.strategy_v2.runnable_scheduler import RunnableStats
 
 
 class TestExecutorOrchestrator(unittest.TestCase):
@@ -79,6 +80,20 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 4)
 
+    @patch.object(PositionExecutor, "start")
+    def test_executors_run_by_the_scheduler(self, position_start_mock: MagicMock):
+        position_executor_config = PositionExecutorConfig(
+            id="test-position", timestamp=1234, connector_name="binance",
+            trading_pair="ETH-USDT", side=TradeType.BUY, entry_price=Decimal(100), amount=Decimal(10))
+        self.orchestrator.execute_action(
+            CreateExecutorAction(executor_config=position_executor_config, controller_id="test"))
+        position_start_mock.assert_called_once_with(scheduler=self.orchestrator.scheduler)
+
+        executor = self.orchestrator.active_executors["test"][0]
+        self.orchestrator.scheduler.get_stats = MagicMock(return_value=RunnableStats(3, 1, 0.002))
+        self.assertEqual({"test-position": RunnableStats(3, 1, 0.002)}, self.orchestrator.get_executors_stats())
+        self.orchestrator.scheduler.get_stats.assert_called_once_with(executor)
+
     def test_execute_actions_store_executor_active(self):
         position_executor = MagicMock(spec=PositionExecutor)
         position_executor.is_active = True
@@ -0,0 +1,237 @@
+import asyncio
+import time
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.models.base import IdleConditions, RunnableStatus
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
+
+class CountingRunnable(RunnableBase):
+    def __init__(self, update_interval: float = 0.0, idle_conditions: Optional[IdleConditions] = None):
+        super().__init__(update_interval=update_interval)
+        self.idle_conditions = idle_conditions
+        self.starts = 0
+        self.control_tasks = 0
+        self.stops = 0
+
+    async def on_start(self):
+        self.starts += 1
+
+    async def control_task(self):
+        self.control_tasks += 1
+
+    def on_stop(self):
+        self.stops += 1
+
+    def get_idle_conditions(self) -> Optional[IdleConditions]:
+        return self.idle_conditions
+
+
+class TestRunnableScheduler(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+    def setUp(self):
+        super().setUp()
+        self.timestamp = 1000
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        type(self.strategy).current_timestamp = PropertyMock(side_effect=lambda: self.timestamp)
+        self.connector = MagicMock(spec=ExchangePyBase)
+        self.connector.get_price_by_type.return_value = Decimal("100")
+        self.strategy.connectors = {"binance": self.connector}
+        self.scheduler = RunnableScheduler(self.strategy, tick_interval=0.01, batch_size=2)
+        self.set_loggers(loggers=[RunnableBase.logger()])
+
+    def start_runnables(self, *runnables: RunnableBase, scheduler: Optional[RunnableScheduler] = None):
+        """
+        Starts the runnables with the scheduler, whose ticks are then run by the test
+        """
+        scheduler = scheduler or self.scheduler
+        with patch.object(scheduler, "_scheduler_loop", AsyncMock()):
+            for runnable in runnables:
+                runnable.start(scheduler=scheduler)
+
+    async def run_tick(self, woken_only: bool = False):
+        await self.scheduler.tick(woken_only=woken_only)
+        # Let the last batch of control tasks complete
+        await asyncio.sleep(0)
+
+    @staticmethod
+    async def wait_until(condition, timeout: float = 5):
+        """
+        Waits for the scheduler loop to meet the condition, without depending on the speed of the machine
+        """
+        async def wait():
+            while not condition():
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(wait(), timeout)
+
+    async def test_runnables_run_until_stopped(self):
+        runnables = [CountingRunnable(update_interval=0.01) for _ in range(5)]
+        for runnable in runnables:
+            runnable.start(scheduler=self.scheduler)
+        self.assertEqual(RunnableStatus.RUNNING, runnables[0].status)
+
+        await self.wait_until(lambda: all(runnable.control_tasks > 1 for runnable in runnables))
+        for runnable in runnables:
+            self.assertEqual(1, runnable.starts)
+            runnable.stop()
+        await self.wait_until(lambda: self.scheduler._scheduler_task.done())
+
+        self.assertEqual([1] * 5, [runnable.stops for runnable in runnables])
+        self.assertEqual([], self.scheduler.runnables)
+        self.assertTrue(self.scheduler._scheduler_task.done())
+
+    async def test_runnables_run_in_batches_at_their_update_interval(self):
+        runnables = [CountingRunnable(update_interval=60) for _ in range(5)]
+        self.start_runnables(*runnables)
+
+        await self.run_tick()
+        await self.run_tick()
+
+        self.assertEqual([1] * 5, [runnable.control_tasks for runnable in runnables])
+        self.assertEqual([1] * 5, [self.scheduler.get_stats(runnable).runs for runnable in runnables])
+
+    async def test_awaiting_runnable_runs_every_tick_of_its_update_interval(self):
+        scheduler = RunnableScheduler(self.strategy, tick_interval=0.05)
+        runnable = CountingRunnable(update_interval=0.05)
+
+        async def awaiting_control_task():
+            runnable.control_tasks += 1
+            await asyncio.sleep(0.02)
+        runnable.control_task = awaiting_control_task
+        runnable.start(scheduler=scheduler)
+
+        await asyncio.sleep(0.5)
+        runnable.stop()
+        await asyncio.sleep(0.05)
+
+        # Not every other tick, as when the interval was counted from the end of the previous run
+        self.assertGreaterEqual(runnable.control_tasks, 8)
+
+    async def test_woken_runnable_runs_before_its_update_interval(self):
+        runnable, other_runnable = CountingRunnable(update_interval=60), CountingRunnable(update_interval=0)
+        self.start_runnables(runnable, other_runnable)
+        await self.run_tick()
+
+        runnable.wake()
+        await self.run_tick(woken_only=True)
+
+        self.assertEqual(2, runnable.control_tasks)
+        self.assertEqual(1, other_runnable.control_tasks)
+
+    async def test_idle_runnable_skipped_until_price_or_time_limit_reached(self):
+        runnable = CountingRunnable(idle_conditions=IdleConditions(
+            connector_name="binance", trading_pair="ETH-USDT", price_type=PriceType.BestBid,
+            lower_price=Decimal("95"), upper_price=Decimal("110"), until_timestamp=1060))
+        other_runnable = CountingRunnable(idle_conditions=IdleConditions(
+            connector_name="binance", trading_pair="ETH-USDT", price_type=PriceType.BestBid,
+            lower_price=Decimal("90")))
+        self.start_runnables(runnable, other_runnable)
+        await self.run_tick()
+
+        await self.run_tick()
+        await self.run_tick()
+        self.assertEqual(1, runnable.control_tasks)
+        self.assertEqual(2, self.scheduler.get_stats(runnable).idle_skips)
+        # The price is fetched once per tick for all the runnables
+        self.assertEqual(2, self.connector.get_price_by_type.call_count)
+        self.connector.get_price_by_type.assert_called_with("ETH-USDT", PriceType.BestBid)
+
+        self.connector.get_price_by_type.return_value = Decimal("110")
+        await self.run_tick()
+        self.assertEqual(2, runnable.control_tasks)
+        self.assertEqual(1, other_runnable.control_tasks)
+
+        self.connector.get_price_by_type.return_value = Decimal("100")
+        self.timestamp = 1060
+        await self.run_tick()
+        self.assertEqual(3, runnable.control_tasks)
+
+        self.connector.get_price_by_type.side_effect = Exception("No order book")
+        await self.run_tick()
+        self.assertEqual(2, other_runnable.control_tasks)
+
+    async def test_idle_runnable_run_after_max_idle_interval(self):
+        scheduler = RunnableScheduler(self.strategy, max_idle_interval=0.01)
+        runnable = CountingRunnable(idle_conditions=IdleConditions())
+        self.start_runnables(runnable, scheduler=scheduler)
+        now = 100
+        with patch.object(scheduler, "_time", side_effect=lambda: now):
+            await scheduler.tick()
+            await asyncio.sleep(0)
+
+            now += 0.005
+            await scheduler.tick()
+            now += 0.01
+            await scheduler.tick()
+            await asyncio.sleep(0)
+
+        self.assertEqual(2, runnable.control_tasks)
+        self.assertEqual(1, scheduler.get_stats(runnable).idle_skips)
+
+    async def test_cpu_time_of_runs(self):
+        runnable = CountingRunnable()
+
+        async def busy_control_task():
+            start = time.thread_time()
+            while time.thread_time() - start < 0.01:
+                pass
+        runnable.control_task = busy_control_task
+        self.start_runnables(runnable)
+
+        await self.run_tick()
+
+        stats = self.scheduler.get_stats(runnable)
+        self.assertEqual(1, stats.runs)
+        self.assertGreaterEqual(stats.cpu_time, 0.01)
+
+    async def test_cpu_time_excludes_coroutines_run_while_awaiting(self):
+        runnable = CountingRunnable()
+
+        async def busy_coroutine():
+            start = time.thread_time()
+            while time.thread_time() - start < 0.05:
+                pass
+
+        async def awaiting_control_task():
+            await asyncio.sleep(0)
+            await asyncio.sleep(0.01)
+            return runnable
+        runnable.control_task = awaiting_control_task
+        self.start_runnables(runnable)
+
+        await self.scheduler.tick()
+        await busy_coroutine()
+        await self.wait_until(lambda: self.scheduler.get_stats(runnable).runs > 0)
+
+        stats = self.scheduler.get_stats(runnable)
+        self.assertEqual(1, stats.runs)
+        self.assertLess(stats.cpu_time, 0.01)
+
+    async def test_control_task_exception_is_logged(self):
+        runnable = CountingRunnable()
+        runnable.control_task = MagicMock(side_effect=Exception("Test"))
+        self.start_runnables(runnable)
+
+        await self.run_tick()
+        await self.run_tick()
+
+        self.assertTrue(self.is_logged("ERROR", "Test"))
+        self.assertEqual(2, self.scheduler.get_stats(runnable).runs)
+
+    async def test_runnable_failing_to_start_is_unregistered(self):
+        runnable = CountingRunnable()
+        runnable.on_start = MagicMock(side_effect=Exception("Start failed"))
+        self.start_runnables(runnable)
+
+        await self.run_tick()
+
+        self.assertTrue(self.is_logged("ERROR", "Start failed"))
+        self.assertEqual(0, runnable.control_tasks)
+        self.assertIsNone(self.scheduler.get_stats(runnable))